@@ -0,0 +1,266 @@
+"""
+Benchmarks of the params and helper hot paths, over grid sizes and LayerStack depths.
+Each benchmark is timed without tracing, then run again under tracemalloc to measure its peak memory
+and the memory blocks it leaves allocated. Results are written as JSON, and can be compared against a baseline.
+The committed baseline (benchmarks/baseline.json) was recorded with "--max-size 10000"; run from the repository root:
+
+    python -m benchmarks.paramsBenchmark --max-size 10000 --baseline benchmarks/baseline.json --output results.json
+
+The process exits with status 1 if any benchmark regressed beyond the tolerance. Timings depend on the machine,
+so the baseline is refreshed, on the machine the comparisons run on, by omitting "--baseline":
+
+    python -m benchmarks.paramsBenchmark --max-size 10000 --output benchmarks/baseline.json
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+import keras
+
+from source.libs.helper import Helper
+from source.libs.paramsManager import ParamsManager
+from source.misc.utils import Validation
+from source.structs.customTypes import DateRange
+from source.structs.params import TrainingParamsCombinations as TrainParamsCombs, LayerParamsCombinations
+
+SIZES = tuple(10 ** exponent for exponent in range(2, 7))
+DEPTHS = (1, 4, 16)
+FACTOR_LENGTH = 10
+BASELINE_PATH = Path(__file__).with_name('baseline.json')
+
+
+@dataclass
+class BenchmarkResult:
+    Benchmark: str
+    Size: int
+    Depth: int
+    WallTime: float
+    TimePerCombination: float
+    PeakMemory: int
+    PeakMemoryPerCombination: float
+    AllocatedBlocks: int
+    BlocksPerCombination: float
+
+
+@dataclass
+class Regression:
+    Benchmark: str
+    Size: int
+    Depth: int
+    Metric: str
+    Baseline: float
+    Current: float
+    Ratio: float
+
+
+class ParamsBenchmark:
+    """
+    Builds the inputs of every benchmark, and measures them.
+    Grids of 10 ** n combinations are made of n factors with ten values each,
+    while every layer of the LayerStack holds a single combination, so that depth does not change the grid size.
+    """
+
+    FACTOR_NAMES = ('WindowWidth', 'FitMaxEpochs', 'FitPatience', 'DatasetBatchSize', 'ColumnToPredict',
+                    'DatasetTimeFilter')
+
+    def __init__(self, repeat: int = 3):
+        """
+        :param repeat: The amount of timed runs per benchmark; the fastest one is kept.
+        """
+        self.__repeat = repeat
+
+    @staticmethod
+    def build_time_filters(amount: int) -> list[DateRange]:
+        start = datetime(2000, 1, 1)
+        return [DateRange(fm=start + timedelta(days=offset), to=start + timedelta(days=offset + 365))
+                for offset in range(amount)]
+
+    @staticmethod
+    def build_combinations(size: int, depth: int) -> TrainParamsCombs:
+        """
+        Builds a TrainParamsCombs instance unfolding into the given amount of combinations.
+        :param size: The amount of combinations, a power of ten no greater than 10 ** 6.
+        :param depth: The amount of layers in the LayerStack.
+        :return: A TrainParamsCombs instance.
+        """
+        factors = len(str(size)) - 1
+        if 10 ** factors != size or factors > len(ParamsBenchmark.FACTOR_NAMES):
+            raise ValueError(f'Size ({size}) must be a power of ten, up to 10 ** {len(ParamsBenchmark.FACTOR_NAMES)}.')
+        values = {'WindowWidth': [5], 'FitMaxEpochs': [100], 'FitPatience': [10], 'DatasetBatchSize': [32],
+                  'ColumnToPredict': ['Close'], 'DatasetTimeFilter': [DateRange()]}
+        for name in ParamsBenchmark.FACTOR_NAMES[:factors]:
+            match name:
+                case 'ColumnToPredict':
+                    values[name] = [f'Column{index}' for index in range(FACTOR_LENGTH)]
+                case 'DatasetTimeFilter':
+                    values[name] = ParamsBenchmark.build_time_filters(FACTOR_LENGTH)
+                case _:
+                    values[name] = list(range(1, FACTOR_LENGTH + 1))
+        layer_stack = {index: LayerParamsCombinations(Units=[32], Activation=[keras.activations.relu])
+                       for index in range(depth)}
+        return TrainParamsCombs(SetTrainingFlag=[False], UseResidualWrapper=[True], PrependBatchNormLayer=[True],
+                                CompileLossFunction=[keras.losses.MeanAbsoluteError],
+                                CompileOptimizer=[keras.optimizers.Adam], LayerStack=[layer_stack],
+                                DatasetPath=[Path('dataset.csv')], DatasetShuffle=[False], **values)
+
+    @staticmethod
+    def iterate_plain_params(size: int, depth: int) -> Iterator[dict[str, Any]]:
+        """
+        Yields plain TrainParams dictionaries, as hashed by ParamsManager, differing in their WindowWidth.
+        :param size: The amount of dictionaries.
+        :param depth: The amount of layers in the LayerStack.
+        :return: An iterator over the dictionaries.
+        """
+        template = dataclasses.asdict(ParamsBenchmark.build_combinations(1, depth))
+        template = {name: values[0] for name, values in template.items()}
+        template['LayerStack'] = {index: {name: values[0] for name, values in layer.items() if values is not None}
+                                  for index, layer in template['LayerStack'].items()}
+        for index in range(size):
+            yield dict(template, WindowWidth=index)
+
+    def get_benchmarks(self, size: int, depth: int,
+                       depth_independent: bool = True) -> dict[str, Callable[[], Any]]:
+        """
+        Builds the benchmarks for the given grid size and depth.
+        :param size: The amount of combinations.
+        :param depth: The amount of layers in the LayerStack.
+        :param depth_independent: If True, the benchmarks whose inputs do not depend on depth are built too.
+        :return: A dictionary mapping benchmark names to callables running them.
+        """
+        combinations = self.build_combinations(size, depth)
+        benchmarks = {
+            'ParamsManager.unfold': lambda: ParamsManager().unfold(combinations),
+            'Helper.generate_hash': lambda: [Helper.generate_hash(plain_params)
+                                             for plain_params in self.iterate_plain_params(size, depth)],
+            'Helper.stringify_objects': lambda: [Helper.stringify_objects(plain_params)
+                                                 for plain_params in self.iterate_plain_params(size, depth)],
+        }
+        if depth_independent:
+            validations = {'type': {'expected_type': dict}, 'length': {'expected_range': (1, None)}}
+            start = datetime(2000, 1, 1)
+            benchmarks['Validation.iterate'] = lambda: Validation().iterate(self.iterate_plain_params(size, depth),
+                                                                            validations)
+            benchmarks['DateRange'] = lambda: [DateRange(fm=start, to=start + timedelta(seconds=index))
+                                               for index in range(size)]
+        return benchmarks
+
+    def measure(self, name: str, run: Callable[[], Any], size: int, depth: int) -> BenchmarkResult:
+        """
+        Times a benchmark, keeping its fastest run, then measures its memory under tracemalloc.
+        :param name: The name of the benchmark.
+        :param run: A callable running the benchmark.
+        :param size: The amount of combinations.
+        :param depth: The amount of layers in the LayerStack.
+        :return: A BenchmarkResult.
+        """
+        wall_times = []
+        for _ in range(self.__repeat):
+            gc.collect()
+            start = time.perf_counter()
+            run()
+            wall_times.append(time.perf_counter() - start)
+        gc.collect()
+        tracemalloc.start()
+        baseline_snapshot = tracemalloc.take_snapshot()
+        output = run()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del output
+        allocated_blocks = sum(statistic.count_diff for statistic in snapshot.compare_to(baseline_snapshot, 'filename'))
+        wall_time = min(wall_times)
+        return BenchmarkResult(Benchmark=name, Size=size, Depth=depth, WallTime=wall_time,
+                               TimePerCombination=wall_time / size, PeakMemory=peak_memory,
+                               PeakMemoryPerCombination=peak_memory / size, AllocatedBlocks=allocated_blocks,
+                               BlocksPerCombination=allocated_blocks / size)
+
+    def run(self, sizes: tuple[int, ...] = SIZES, depths: tuple[int, ...] = DEPTHS,
+            names: Optional[list[str]] = None) -> Iterator[BenchmarkResult]:
+        """
+        Runs every benchmark over every size and depth.
+        :param sizes: The grid sizes.
+        :param depths: The LayerStack depths.
+        :param names: The names of the benchmarks to run; if None, every benchmark is run.
+        :return: An iterator over the results, as they become available.
+        """
+        for depth in depths:
+            for size in sizes:
+                for name, run in self.get_benchmarks(size, depth, depth == depths[0]).items():
+                    if names is None or name in names:
+                        yield self.measure(name, run, size, depth)
+
+
+def compare(results: list[BenchmarkResult], baseline: list[dict[str, Any]], tolerance: float) -> list[Regression]:
+    """
+    Compares results against a baseline, matching them by benchmark, size and depth.
+    :param results: The current results.
+    :param baseline: The "Results" of a previous output file.
+    :param tolerance: The ratio over the baseline above which a metric is considered to have regressed.
+    :return: A list of Regression, one per regressed metric.
+    """
+    baseline_results = {(result['Benchmark'], result['Size'], result['Depth']): result for result in baseline}
+    regressions = []
+    for result in results:
+        baseline_result = baseline_results.get((result.Benchmark, result.Size, result.Depth))
+        if baseline_result is None:
+            continue
+        for metric in ('TimePerCombination', 'PeakMemoryPerCombination', 'BlocksPerCombination'):
+            current, previous = getattr(result, metric), baseline_result[metric]
+            if previous > 0 and current / previous > tolerance:
+                regressions.append(Regression(Benchmark=result.Benchmark, Size=result.Size, Depth=result.Depth,
+                                              Metric=metric, Baseline=previous, Current=current,
+                                              Ratio=current / previous))
+    return regressions
+
+
+def main(arguments: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmarks the params and helper hot paths.')
+    parser.add_argument('--output', type=Path, default=Path('benchmark-results.json'))
+    parser.add_argument('--baseline', type=Path, help='A previous output file to compare against.')
+    parser.add_argument('--tolerance', type=float, default=1.25,
+                        help='The ratio over the baseline above which a metric is considered to have regressed.')
+    parser.add_argument('--max-size', type=int, default=max(SIZES))
+    parser.add_argument('--depths', type=int, nargs='+', default=list(DEPTHS))
+    parser.add_argument('--benchmarks', nargs='+', help='The names of the benchmarks to run.')
+    parser.add_argument('--repeat', type=int, default=3)
+    parsed_arguments = parser.parse_args(arguments)
+
+    benchmark = ParamsBenchmark(repeat=parsed_arguments.repeat)
+    results = []
+    sizes = tuple(size for size in SIZES if size <= parsed_arguments.max_size)
+    for result in benchmark.run(sizes, tuple(parsed_arguments.depths), parsed_arguments.benchmarks):
+        print(f'{result.Benchmark:<26} size={result.Size:<8} depth={result.Depth:<3} '
+              f'{result.TimePerCombination * 1e6:10.2f} us/comb {result.PeakMemoryPerCombination:10.1f} B/comb '
+              f'{result.BlocksPerCombination:8.2f} blocks/comb', flush=True)
+        results.append(result)
+
+    output = {'Environment': {'Python': sys.version, 'Platform': platform.platform(),
+                              'Timestamp': datetime.now().isoformat()},
+              'Results': [dataclasses.asdict(result) for result in results]}
+    regressions = []
+    if parsed_arguments.baseline is not None:
+        baseline = json.loads(parsed_arguments.baseline.read_text())
+        regressions = compare(results, baseline['Results'], parsed_arguments.tolerance)
+        output['Baseline'] = str(parsed_arguments.baseline)
+        output['Regressions'] = [dataclasses.asdict(regression) for regression in regressions]
+        for regression in regressions:
+            print(f'REGRESSION {regression.Benchmark} size={regression.Size} depth={regression.Depth} '
+                  f'{regression.Metric}: {regression.Baseline:.4g} -> {regression.Current:.4g} '
+                  f'({regression.Ratio:.2f}x)')
+    parsed_arguments.output.write_text(json.dumps(output, indent=2))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,6 @@
+import sys
+
+from source.libs.commandLine import CommandLine
+
+if __name__ == '__main__':
+    sys.exit(CommandLine().run())
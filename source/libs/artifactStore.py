@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional
+
+import keras
+import numpy
+
+
+class MissingArtifactException(Exception):
+    pass
+
+
+class ArtifactStore:
+    """
+    A content-addressed store of trained models, keyed by the Hash of their TrainingParams.
+    Each weight array is saved once as a ".npy" blob named after the SHA-256 of its contents, so identical weights
+    (e.g. untrained layers, or models differing only in fit settings that converged alike) are stored only once.
+    Each model gets a manifest holding its architecture, the blobs of its weights, and free-form metadata.
+    Blobs are loaded memory-mapped: nothing is deserialized, and processes loading the same blobs share pages.
+    """
+
+    BLOBS_DIRECTORY_NAME = 'blobs'
+    MODELS_DIRECTORY_NAME = 'models'
+    MANIFEST_FILE_NAME = 'manifest.json'
+
+    def __init__(self, root: Path):
+        """
+        :param root: The directory holding every artifact.
+        """
+        self.__root = root
+        self.__blobs_directory = root / self.BLOBS_DIRECTORY_NAME
+        self.__models_directory = root / self.MODELS_DIRECTORY_NAME
+        self.__blobs_directory.mkdir(parents=True, exist_ok=True)
+        self.__models_directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def root(self) -> Path:
+        return self.__root
+
+    def __contains__(self, hash_value: str) -> bool:
+        return self.get_manifest_path(hash_value).is_file()
+
+    def hashes(self) -> list[str]:
+        return sorted(path.parent.name for path in self.__models_directory.glob(f'*/{self.MANIFEST_FILE_NAME}'))
+
+    def get_model_directory(self, hash_value: str) -> Path:
+        return self.__models_directory / hash_value
+
+    def get_manifest_path(self, hash_value: str) -> Path:
+        return self.get_model_directory(hash_value) / self.MANIFEST_FILE_NAME
+
+    def get_blob_path(self, digest: str) -> Path:
+        return self.__blobs_directory / f'{digest}.npy'
+
+    @staticmethod
+    def get_digest(array: numpy.ndarray) -> str:
+        """
+        Computes the content address of an array, covering its dtype and shape along with its data.
+        :param array: A numpy array.
+        :return: A SHA-256 hash string.
+        """
+        contiguous_array = numpy.ascontiguousarray(array)
+        sha256_hasher = hashlib.sha256(f'{contiguous_array.dtype.str}{contiguous_array.shape}'.encode())
+        sha256_hasher.update(contiguous_array.data)
+        return sha256_hasher.hexdigest()
+
+    @staticmethod
+    def __write_atomically(path: Path, write: Callable[[Any], Any]):
+        """
+        Writes a file through a temporary file in the same directory, so that readers never observe partial contents.
+        :param path: The path to the file.
+        :param write: A callable writing the contents into the given file object.
+        """
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}-')
+        with os.fdopen(file_descriptor, 'wb') as file:
+            write(file)
+        os.replace(temporary_path, path)
+
+    def put_blob(self, array: numpy.ndarray) -> str:
+        """
+        Stores an array, unless an identical one is already stored.
+        :param array: A numpy array.
+        :return: The content address of the array.
+        """
+        digest = self.get_digest(array)
+        blob_path = self.get_blob_path(digest)
+        if not blob_path.is_file():
+            self.__write_atomically(blob_path, lambda file: numpy.save(file, numpy.ascontiguousarray(array)))
+        return digest
+
+    def get_blob(self, digest: str) -> numpy.ndarray:
+        """
+        Loads an array, memory-mapped and read-only.
+        :param digest: The content address of the array.
+        :return: A read-only numpy memmap.
+        """
+        return numpy.load(self.get_blob_path(digest), mmap_mode='r')
+
+    def save(self, hash_value: str, model: keras.Model, metadata: Optional[dict[str, Any]] = None):
+        """
+        Stores a model under the given Hash, replacing any model previously stored under it.
+        :param hash_value: The Hash of the TrainingParams the model was trained with.
+        :param model: A Keras model.
+        :param metadata: JSON-serializable data stored along with the model, such as its TrainingResult.
+        """
+        manifest = {'Hash': hash_value,
+                    'Architecture': json.loads(model.to_json()),
+                    'Weights': [self.put_blob(weights) for weights in model.get_weights()],
+                    'Metadata': metadata or {}}
+        manifest_path = self.get_manifest_path(hash_value)
+        manifest_path.parent.mkdir(exist_ok=True)
+        self.__write_atomically(manifest_path, lambda file: file.write(json.dumps(manifest).encode()))
+
+    def load_manifest(self, hash_value: str) -> dict[str, Any]:
+        """
+        Reads the manifest of a model.
+        :param hash_value: The Hash of the TrainingParams the model was trained with.
+        :return: A dictionary holding the "Hash", "Architecture", "Weights" and "Metadata" of the model.
+        """
+        manifest_path = self.get_manifest_path(hash_value)
+        if not manifest_path.is_file():
+            raise MissingArtifactException(f'No model is stored under "{hash_value}".')
+        return json.loads(manifest_path.read_text())
+
+    def load_metadata(self, hash_value: str) -> dict[str, Any]:
+        return self.load_manifest(hash_value)['Metadata']
+
+    def load_weights(self, hash_value: str) -> list[numpy.ndarray]:
+        """
+        Loads the weights of a model, memory-mapped and read-only.
+        :param hash_value: The Hash of the TrainingParams the model was trained with.
+        :return: A list of read-only numpy memmaps, in model.get_weights order.
+        """
+        return [self.get_blob(digest) for digest in self.load_manifest(hash_value)['Weights']]
+
+    def load_model(self, hash_value: str) -> keras.Model:
+        """
+        Rebuilds a model out of its architecture and its memory-mapped weights.
+        The model is not compiled, which is enough for predictions.
+        :param hash_value: The Hash of the TrainingParams the model was trained with.
+        :return: A Keras model.
+        """
+        manifest = self.load_manifest(hash_value)
+        model = keras.models.model_from_json(json.dumps(manifest['Architecture']))
+        model.set_weights([self.get_blob(digest) for digest in manifest['Weights']])
+        return model
+
+    def remove(self, hash_value: str):
+        shutil.rmtree(self.get_model_directory(hash_value), ignore_errors=True)
+
+    def collect_garbage(self) -> int:
+        """
+        Deletes the blobs no stored model refers to.
+        :return: The amount of deleted blobs.
+        """
+        referenced_digests = {digest for hash_value in self.hashes()
+                              for digest in self.load_manifest(hash_value)['Weights']}
+        deleted_blobs = 0
+        for blob_path in self.__blobs_directory.glob('*.npy'):
+            if blob_path.stem not in referenced_digests:
+                blob_path.unlink()
+                deleted_blobs += 1
+        return deleted_blobs
@@ -1,17 +1,66 @@
 import dataclasses
-from typing import Optional, Type
+from collections.abc import Callable
+from typing import Any, Optional, Type
+
+
+class Lazy:
+    """
+    A test case value built by a factory on first access, and memoized afterwards.
+    Meant for heavy inputs and expected outputs, so that collecting large case tables stays cheap,
+    and only the cases actually run (e.g. when selecting a subset with "-k") pay for building their values.
+    A single instance can be shared by several cases, in which case its factory still runs once per session.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        """
+        :param factory: A callable without arguments, returning the value.
+        """
+        self.__factory = factory
+        self.__built = False
+        self.__value = None
+
+    @property
+    def built(self) -> bool:
+        return self.__built
+
+    def get(self) -> Any:
+        """
+        Builds the value on first call, and returns the same value on every later call.
+        :return: The value returned by the factory.
+        """
+        if not self.__built:
+            self.__value = self.__factory()
+            self.__built = True
+            self.__factory = None
+        return self.__value
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.__value!r})' if self.__built else f'{self.__class__.__name__}(...)'
 
 
 @dataclasses.dataclass(kw_only=True)
 class BaseTestCase:
     """
     Base class for test cases.
+    Any field can be given a Lazy value, which is transparently built on first access.
     """
 
     __id: Optional[str] = dataclasses.field(default=None, repr=False)
     id: Optional[str] = dataclasses.field(default=None)
     expected_exception: Optional[Type[Exception]] = None
 
+    def __getattribute__(self, name: str) -> Any:
+        """
+        Retrieves an attribute, building it first if it holds a Lazy value, and replacing it with the built value.
+        :param name: The name of the attribute.
+        :return: The value of the attribute.
+        """
+        value = object.__getattribute__(self, name)
+        if isinstance(value, Lazy):
+            value = value.get()
+            object.__setattr__(self, name, value)
+        return value
+
     @property
     def id(self) -> str | None:
         """
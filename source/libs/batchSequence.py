@@ -0,0 +1,106 @@
+import math
+import os
+from collections.abc import Sequence
+from typing import Any, Optional
+
+import keras
+import numpy
+
+from source.libs.slidingWindows import SlidingWindows
+from source.structs.params import TrainingParams
+
+
+class BatchSequence(keras.utils.PyDataset):
+    """
+    An input pipeline feeding windowed samples to Keras models.
+    Shuffling permutes sample positions instead of data, and batches are assembled on demand
+    by a bounded pool of background threads (see keras.utils.PyDataset), so that the model never waits
+    for Python-side batch assembly between steps. Shuffling is seeded, and thus deterministic.
+    Keras only starts the background threads with more than one worker, hence the default of at least two.
+    """
+
+    DEFAULT_WORKERS = max(2, min(4, os.cpu_count() or 1))
+
+    def __init__(self, windows: SlidingWindows, batch_size: int, shuffle: bool = False, seed: Optional[int] = None,
+                 workers: int = DEFAULT_WORKERS, max_queue_size: int = 10, output_names: Optional[Sequence[str]] = None):
+        """
+        :param windows: The windowed samples to feed.
+        :param batch_size: The amount of samples per batch.
+        :param shuffle: If True, samples are shuffled at the beginning of every epoch.
+        :param seed: The seed of the shuffling permutations.
+        :param workers: The amount of threads assembling batches in the background;
+        with a single worker, batches are assembled on demand, without prefetching.
+        :param max_queue_size: The maximum amount of batches assembled ahead of time.
+        :param output_names: The names of the outputs of a packed model; if set, every output is fed the same targets.
+        """
+        super().__init__(workers=workers, use_multiprocessing=False, max_queue_size=max_queue_size)
+        self.__windows = windows
+        self.__batch_size = batch_size
+        self.__shuffle = shuffle
+        self.__random_generator = numpy.random.default_rng(seed)
+        self.__order = numpy.arange(len(windows))
+        self.__output_names = output_names
+        self.__shuffle_order()
+
+    @classmethod
+    def from_params(cls, windows: SlidingWindows, training_params: TrainingParams, **kwargs) -> 'BatchSequence':
+        """
+        Builds a pipeline using the batch size and shuffling flag of the given TrainingParams.
+        :param windows: The windowed samples to feed.
+        :param training_params: A TrainingParams instance.
+        :param kwargs: Any other BatchSequence argument.
+        :return: A new BatchSequence.
+        """
+        return cls(windows, training_params.DatasetBatchSize, training_params.DatasetShuffle, **kwargs)
+
+    def __shuffle_order(self):
+        """
+        Permutes sample positions in place, if shuffling is enabled.
+        """
+        if self.__shuffle:
+            self.__random_generator.shuffle(self.__order)
+
+    def get_state(self) -> dict[str, Any]:
+        """
+        Captures the shuffling state, so that an interrupted run can be resumed with the same batch compositions.
+        :return: A dictionary holding the state of the random generator and the current sample order.
+        """
+        return {'RandomState': self.__random_generator.bit_generator.state, 'Order': self.__order.copy()}
+
+    def set_state(self, state: dict[str, Any]):
+        """
+        Restores a shuffling state captured through BatchSequence.get_state.
+        :param state: A dictionary holding the state of the random generator and the sample order.
+        """
+        self.__random_generator.bit_generator.state = state['RandomState']
+        self.__order = numpy.array(state['Order'])
+
+    @property
+    def windows(self) -> SlidingWindows:
+        return self.__windows
+
+    @property
+    def num_batches(self) -> int:
+        return math.ceil(len(self.__order) / self.__batch_size)
+
+    def __len__(self) -> int:
+        return self.num_batches
+
+    def __getitem__(self, index: int) -> tuple[numpy.ndarray, numpy.ndarray | dict[str, numpy.ndarray]]:
+        """
+        Assembles one batch.
+        Positions are sorted within each batch, which keeps reads sequential without altering batch composition.
+        :param index: The position of the batch within the epoch.
+        :return: A tuple with the features and the targets of the batch;
+        targets are keyed by output name if output names are set.
+        """
+        if not 0 <= index < self.num_batches:
+            raise IndexError(f'Batch index ({index}) is out of range ({self.num_batches} batches).')
+        positions = self.__order[index * self.__batch_size:(index + 1) * self.__batch_size]
+        features, targets = self.__windows.get_batch(numpy.sort(positions))
+        if self.__output_names is not None:
+            return features, {output_name: targets for output_name in self.__output_names}
+        return features, targets
+
+    def on_epoch_end(self):
+        self.__shuffle_order()
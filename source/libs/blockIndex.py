@@ -0,0 +1,334 @@
+import bisect
+import dataclasses
+import json
+import os
+import tempfile
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+import numpy
+
+from source.libs.datasetLoader import DatasetLoader
+from source.structs.customTypes import DateRange
+from source.structs.dataset import Dataset, BlockStatistics, ColumnStatistics
+from source.structs.params import TrainingParams
+
+
+class EmptyWindowException(Exception):
+    pass
+
+
+class BlockIndex:
+    """
+    A small index splitting a dataset into fixed time blocks, aligned to the Unix epoch.
+    Each block records its row offset, its amount of rows, and the minimum, maximum, mean and count of each column,
+    so that time filters can be resolved into row ranges, and statistics for any DateRange can be combined,
+    without reading the dataset again. Row counts and row ranges are computed at block granularity by default:
+    every block overlapping the filter is included as a whole. Statistics, and row ranges if the dataset is given,
+    are exact: the precomputed statistics of fully covered blocks are combined with those of the rows within
+    the filter in the partially covered first and last blocks, which are the only rows read.
+    """
+
+    SIDECAR_SUFFIX = '.blocks.json'
+
+    def __init__(self, blocks: list[BlockStatistics], span: timedelta, fingerprint: Optional[str] = None):
+        self.__blocks = blocks
+        self.__block_ids = [block.Id for block in blocks]
+        self.__span = span
+        self.__span_ns = self.__to_nanoseconds(span)
+        self.__fingerprint = fingerprint
+
+    @property
+    def blocks(self) -> list[BlockStatistics]:
+        return self.__blocks
+
+    @property
+    def span(self) -> timedelta:
+        return self.__span
+
+    @property
+    def fingerprint(self) -> Optional[str]:
+        return self.__fingerprint
+
+    @staticmethod
+    def __to_nanoseconds(span: timedelta) -> int:
+        return span // timedelta(microseconds=1) * 1000
+
+    @staticmethod
+    def combine_statistics(statistics: Iterable[ColumnStatistics]) -> ColumnStatistics:
+        """
+        Combines the statistics of several sets of values into those of their union.
+        :param statistics: The statistics to combine.
+        :return: A new ColumnStatistics instance.
+        """
+        statistics = [item for item in statistics if item.Count > 0]
+        count = sum(item.Count for item in statistics)
+        if count == 0:
+            return ColumnStatistics(Min=None, Max=None, Mean=None, Count=0)
+        return ColumnStatistics(Min=min(item.Min for item in statistics),
+                                Max=max(item.Max for item in statistics),
+                                Mean=sum(item.Mean * item.Count for item in statistics) / count,
+                                Count=count)
+
+    @staticmethod
+    def __normalize_columns(block: BlockStatistics, column_names: Iterable[str]) -> BlockStatistics:
+        """
+        Gives a block the statistics of every given column, in the given order.
+        Columns the block has no statistics of (e.g. not numeric within some chunk) are given empty statistics.
+        :param block: A BlockStatistics instance.
+        :param column_names: The names of the columns.
+        :return: A new BlockStatistics instance.
+        """
+        return BlockStatistics(Id=block.Id, FirstRow=block.FirstRow, Rows=block.Rows,
+                               Columns={name: block.Columns.get(name, ColumnStatistics(Min=None, Max=None, Mean=None,
+                                                                                       Count=0))
+                                        for name in column_names})
+
+    @staticmethod
+    def __merge_blocks(first: BlockStatistics, second: BlockStatistics) -> BlockStatistics:
+        """
+        Merges two consecutive pieces of the same block, which may hold statistics of different columns.
+        :param first: The leading piece.
+        :param second: The trailing piece.
+        :return: A new BlockStatistics instance.
+        """
+        column_names = list(dict.fromkeys([*first.Columns, *second.Columns]))
+        first = BlockIndex.__normalize_columns(first, column_names)
+        second = BlockIndex.__normalize_columns(second, column_names)
+        return BlockStatistics(Id=first.Id, FirstRow=first.FirstRow, Rows=first.Rows + second.Rows,
+                               Columns={name: BlockIndex.combine_statistics([statistics, second.Columns[name]])
+                                        for name, statistics in first.Columns.items()})
+
+    @staticmethod
+    def __summarize(dataset: Dataset, span_ns: int, first_row: int) -> list[BlockStatistics]:
+        """
+        Computes the statistics of every block within a sorted dataset.
+        :param dataset: The dataset to summarize.
+        :param span_ns: The length of each block, in nanoseconds.
+        :param first_row: The position of the first dataset row within the whole file.
+        :return: A list of BlockStatistics, sorted by block.
+        """
+        if len(dataset.Index) == 0:
+            return []
+        ids = dataset.Index.astype('int64') // span_ns
+        starts = numpy.concatenate([[0], numpy.flatnonzero(numpy.diff(ids)) + 1])
+        rows = numpy.diff(numpy.concatenate([starts, [len(ids)]]))
+        columns = {}
+        for name, values in dataset.Columns.items():
+            values = numpy.asarray(values, dtype=numpy.float64)
+            valid = ~numpy.isnan(values)
+            counts = numpy.add.reduceat(valid.astype(numpy.int64), starts)
+            sums = numpy.add.reduceat(numpy.where(valid, values, 0.0), starts)
+            minimums = numpy.fmin.reduceat(values, starts)
+            maximums = numpy.fmax.reduceat(values, starts)
+            columns[name] = [ColumnStatistics(Min=float(minimum), Max=float(maximum), Mean=float(total / count),
+                                              Count=int(count)) if count > 0 else
+                             ColumnStatistics(Min=None, Max=None, Mean=None, Count=0)
+                             for minimum, maximum, total, count in zip(minimums, maximums, sums, counts)]
+        return [BlockStatistics(Id=int(ids[start]), FirstRow=first_row + int(start), Rows=int(block_rows),
+                                Columns={name: statistics[position] for name, statistics in columns.items()})
+                for position, (start, block_rows) in enumerate(zip(starts, rows))]
+
+    @classmethod
+    def from_dataset(cls, dataset: Dataset, span: timedelta = timedelta(days=1)) -> 'BlockIndex':
+        """
+        Builds an index out of an in-memory dataset.
+        :param dataset: A dataset sorted by timestamp.
+        :param span: The length of each block.
+        :return: A new BlockIndex.
+        """
+        return cls(cls.__summarize(dataset, cls.__to_nanoseconds(span), 0), span)
+
+    @classmethod
+    def build(cls, dataset_path: Path, span: timedelta = timedelta(days=1), loader: Optional[DatasetLoader] = None,
+              chunk_rows: int = 2 ** 16) -> 'BlockIndex':
+        """
+        Builds an index by reading a dataset chunk by chunk, so that it never needs to fit in memory.
+        Every block is given the statistics of every column found in any chunk, since chunks of a CSV file
+        are parsed on their own, and a column may not be numeric within all of them.
+        :param dataset_path: The path to a dataset file sorted by timestamp.
+        :param span: The length of each block.
+        :param loader: The loader used to read chunks; either a DatasetLoader (CSV) or a ColumnarStore.
+        :param chunk_rows: The amount of rows read at once.
+        :return: A new BlockIndex.
+        """
+        loader = loader or DatasetLoader()
+        span_ns = cls.__to_nanoseconds(span)
+        blocks: list[BlockStatistics] = []
+        column_names: dict[str, None] = {}
+        first_row = 0
+        for chunk in loader.read_chunks(dataset_path, chunk_rows):
+            chunk_blocks = cls.__summarize(chunk, span_ns, first_row)
+            if len(blocks) > 0 and len(chunk_blocks) > 0 and blocks[-1].Id == chunk_blocks[0].Id:
+                blocks[-1] = cls.__merge_blocks(blocks[-1], chunk_blocks.pop(0))
+            blocks.extend(chunk_blocks)
+            column_names.update(dict.fromkeys(chunk.Columns))
+            first_row += len(chunk.Index)
+        blocks = [cls.__normalize_columns(block, column_names) for block in blocks]
+        return cls(blocks, span, loader.fingerprint(dataset_path))
+
+    @classmethod
+    def get_sidecar_path(cls, dataset_path: Path) -> Path:
+        return dataset_path.with_name(dataset_path.name + cls.SIDECAR_SUFFIX)
+
+    def save(self, path: Path):
+        """
+        Writes the index into a JSON file, through a temporary file replacing it atomically,
+        so that concurrent readers never observe partial contents.
+        :param path: The path to the file.
+        """
+        contents = {'Fingerprint': self.__fingerprint,
+                    'SpanSeconds': self.__span.total_seconds(),
+                    'Blocks': [dataclasses.asdict(block) for block in self.__blocks]}
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+        with os.fdopen(file_descriptor, 'w') as index_file:
+            index_file.write(json.dumps(contents))
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> 'BlockIndex':
+        """
+        Reads an index from a JSON file.
+        :param path: The path to the file.
+        :return: A new BlockIndex.
+        """
+        contents = json.loads(path.read_text())
+        blocks = [BlockStatistics(Id=block['Id'], FirstRow=block['FirstRow'], Rows=block['Rows'],
+                                  Columns={name: ColumnStatistics(**statistics)
+                                           for name, statistics in block['Columns'].items()})
+                  for block in contents['Blocks']]
+        return cls(blocks, timedelta(seconds=contents['SpanSeconds']), contents['Fingerprint'])
+
+    @classmethod
+    def load_or_build(cls, dataset_path: Path, span: timedelta = timedelta(days=1),
+                      loader: Optional[DatasetLoader] = None, chunk_rows: int = 2 ** 16) -> 'BlockIndex':
+        """
+        Reads the sidecar index of a dataset, rebuilding it if missing, outdated, or built with another span.
+        :param dataset_path: The path to a dataset file sorted by timestamp.
+        :param span: The length of each block.
+        :param loader: The loader used to read chunks and compute content fingerprints.
+        :param chunk_rows: The amount of rows read at once.
+        :return: A BlockIndex matching the current contents of the dataset.
+        """
+        loader = loader or DatasetLoader()
+        sidecar_path = cls.get_sidecar_path(dataset_path)
+        if sidecar_path.is_file():
+            index = cls.load(sidecar_path)
+            if index.fingerprint == loader.fingerprint(dataset_path) and index.span == span:
+                return index
+        index = cls.build(dataset_path, span, loader, chunk_rows)
+        index.save(sidecar_path)
+        return index
+
+    def __to_block_id(self, value: datetime) -> int:
+        return int(DatasetLoader.to_datetime64(value).astype('int64')) // self.__span_ns
+
+    def __select(self, time_filter: DateRange) -> list[BlockStatistics]:
+        """
+        Selects every block overlapping the time filter.
+        :param time_filter: The DateRange to resolve.
+        :return: A list of BlockStatistics, sorted by block.
+        """
+        start = 0 if time_filter.fm is None else \
+            bisect.bisect_left(self.__block_ids, self.__to_block_id(time_filter.fm))
+        stop = len(self.__blocks) if time_filter.to is None else \
+            bisect.bisect_right(self.__block_ids, self.__to_block_id(time_filter.to))
+        return self.__blocks[start:stop]
+
+    @staticmethod
+    def __resolve_rows(blocks: list[BlockStatistics], time_filter: DateRange, dataset: Dataset) -> slice:
+        """
+        Resolves a time filter into its exact range of rows, reading the index of the first and last blocks only.
+        :param blocks: The blocks overlapping the filter, as selected by BlockIndex.__select.
+        :param time_filter: The DateRange to resolve.
+        :param dataset: The dataset the index was built from.
+        :return: A slice selecting the rows within the filter.
+        """
+        first_block, last_block = blocks[0], blocks[-1]
+        first_rows = slice(first_block.FirstRow, first_block.FirstRow + first_block.Rows)
+        last_rows = slice(last_block.FirstRow, last_block.FirstRow + last_block.Rows)
+        start = first_rows.start + DatasetLoader.resolve_time_filter(dataset.Index[first_rows], time_filter).start
+        stop = last_rows.start + DatasetLoader.resolve_time_filter(dataset.Index[last_rows], time_filter).stop
+        return slice(start, max(start, stop))
+
+    @staticmethod
+    def __describe(values: numpy.ndarray) -> ColumnStatistics:
+        """
+        Computes the statistics of a set of values, ignoring missing ones.
+        :param values: The values to describe.
+        :return: A new ColumnStatistics instance.
+        """
+        values = numpy.asarray(values, dtype=numpy.float64)
+        valid = ~numpy.isnan(values)
+        count = int(valid.sum())
+        if count == 0:
+            return ColumnStatistics(Min=None, Max=None, Mean=None, Count=0)
+        return ColumnStatistics(Min=float(numpy.nanmin(values)), Max=float(numpy.nanmax(values)),
+                                Mean=float(numpy.where(valid, values, 0.0).sum() / count), Count=count)
+
+    def resolve(self, time_filter: DateRange, dataset: Optional[Dataset] = None) -> slice:
+        """
+        Resolves a time filter into a range of rows.
+        :param time_filter: The DateRange to resolve.
+        :param dataset: The dataset the index was built from (e.g. memory-mapped by a ColumnarStore);
+        if given, the range is exact, and only the index of the first and last blocks is read.
+        :return: A slice of rows containing every row within the filter; if no dataset is given,
+        the rows of every block the filter overlaps.
+        """
+        blocks = self.__select(time_filter)
+        if len(blocks) == 0:
+            return slice(0, 0)
+        if dataset is not None:
+            return self.__resolve_rows(blocks, time_filter, dataset)
+        return slice(blocks[0].FirstRow, blocks[-1].FirstRow + blocks[-1].Rows)
+
+    def count_rows(self, time_filter: DateRange) -> int:
+        """
+        Counts the rows of every block overlapping the time filter.
+        :param time_filter: The DateRange to resolve.
+        :return: An upper bound of the amount of rows within the filter.
+        """
+        return sum(block.Rows for block in self.__select(time_filter))
+
+    def statistics(self, time_filter: DateRange, dataset: Dataset) -> dict[str, ColumnStatistics]:
+        """
+        Computes the exact statistics of the rows within the time filter, as a Dataset-level computation would.
+        Precomputed statistics are used for fully covered blocks; rows are read only from the partially covered first
+        and last blocks.
+        :param time_filter: The DateRange to resolve.
+        :param dataset: The dataset the index was built from (e.g. memory-mapped by a ColumnarStore).
+        :return: A dict mapping column names to their statistics.
+        """
+        blocks = self.__select(time_filter)
+        column_names = self.__blocks[0].Columns.keys() if len(self.__blocks) > 0 else []
+        rows = self.resolve(time_filter, dataset)
+        statistics = {name: [] for name in column_names}
+        for block in blocks:
+            block_rows = slice(max(rows.start, block.FirstRow), min(rows.stop, block.FirstRow + block.Rows))
+            for name in column_names:
+                if block_rows.stop - block_rows.start == block.Rows:
+                    statistics[name].append(block.Columns[name])
+                elif name in dataset.Columns and block_rows.stop > block_rows.start:
+                    statistics[name].append(self.__describe(dataset.Columns[name][block_rows]))
+        return {name: self.combine_statistics(items) for name, items in statistics.items()}
+
+    def validate(self, time_filter: DateRange, window_width: int):
+        """
+        Rejects time filters that cannot yield a single windowed sample, i.e. whose rows do not exceed the window width.
+        Raises EmptyWindowException if so.
+        :param time_filter: The DateRange to resolve.
+        :param window_width: The amount of rows per window.
+        """
+        rows = self.count_rows(time_filter)
+        if rows <= window_width:
+            raise EmptyWindowException(f'Time filter {time_filter} holds at most {rows} rows, '
+                                       f'which is not enough for a window width of {window_width}.')
+
+    def validate_params(self, training_params: TrainingParams):
+        """
+        Rejects TrainingParams whose time filter cannot yield a single windowed sample.
+        :param training_params: A TrainingParams instance.
+        """
+        self.validate(training_params.DatasetTimeFilter, training_params.WindowWidth)
@@ -0,0 +1,264 @@
+import dataclasses
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+import keras
+import numpy
+
+from source.libs.batchSequence import BatchSequence
+from source.structs.params import TrainingParams
+from source.structs.results import Checkpoint
+
+
+class CheckpointCallback(keras.callbacks.Callback):
+    """
+    Periodically saves the state of a training run into a CheckpointStore.
+    If the data is given, its shuffling state is saved along with the model, and restored once training begins
+    (Keras shuffles the data once before that), so that resumed runs see the same batches as uninterrupted ones.
+    """
+
+    def __init__(self, store: 'CheckpointStore', hash_value: str, history: Optional[dict[str, list[float]]] = None,
+                 every_epochs: int = 1, data: Optional[BatchSequence] = None):
+        """
+        :param store: The store checkpoints are saved into.
+        :param hash_value: The Hash of the TrainingParams being trained.
+        :param history: The history of the epochs run before resuming, if any.
+        :param every_epochs: The amount of epochs between checkpoints.
+        :param data: The data the model is fed with.
+        """
+        super().__init__()
+        self.__store = store
+        self.__hash_value = hash_value
+        self.__history = {key: list(values) for key, values in (history or {}).items()}
+        self.__every_epochs = every_epochs
+        self.__data = data
+
+    @property
+    def history(self) -> dict[str, list[float]]:
+        return self.__history
+
+    def on_train_begin(self, logs: Optional[dict] = None):
+        if self.__data is not None:
+            self.__store.restore_data(self.__hash_value, self.__data)
+
+    def on_epoch_end(self, epoch: int, logs: Optional[dict] = None):
+        for key, value in (logs or {}).items():
+            self.__history.setdefault(key, []).append(float(value))
+        if (epoch + 1) % self.__every_epochs == 0:
+            self.__store.save(self.__hash_value, self.model, epoch + 1, self.__history, finished=False,
+                              data=self.__data)
+
+    def on_train_end(self, logs: Optional[dict] = None):
+        epochs = len(next(iter(self.__history.values()), []))
+        self.__store.save(self.__hash_value, self.model, epochs, self.__history, finished=True, data=self.__data)
+
+
+class ResumedEarlyStopping(keras.callbacks.EarlyStopping):
+    """
+    An EarlyStopping callback whose state is rebuilt out of the history of the epochs run before resuming.
+    """
+
+    def __init__(self, history: dict[str, list[float]], **kwargs):
+        super().__init__(**kwargs)
+        self.__history = history
+
+    def on_train_begin(self, logs: Optional[dict] = None):
+        super().on_train_begin(logs)
+        for epoch, value in enumerate(self.__history.get(self.monitor, [])):
+            self.on_epoch_end(epoch, {self.monitor: value})
+        self.model.stop_training = False
+
+
+class CheckpointStore:
+    """
+    Stores the in-flight state of a sweep, so that it can survive preemption.
+    Each combination is checkpointed under its own Hash (model weights, optimizer state and history so far),
+    while a sweep file records which combinations are pending and which are completed, along with their results.
+    Every checkpoint of a combination is written into a new version directory, and a pointer file naming the current
+    version is then replaced atomically, so that a complete checkpoint is readable at any point in time.
+    """
+
+    SWEEP_FILE_NAME = 'sweep.json'
+    CURRENT_FILE_NAME = 'current'
+
+    def __init__(self, root: Path, every_epochs: int = 1):
+        """
+        :param root: The directory holding every checkpoint.
+        :param every_epochs: The amount of epochs between checkpoints.
+        """
+        self.__root = root
+        self.__every_epochs = every_epochs
+        self.__root.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def root(self) -> Path:
+        return self.__root
+
+    def get_directory(self, hash_value: str) -> Path:
+        return self.__root / hash_value
+
+    def get_version_directory(self, hash_value: str) -> Optional[Path]:
+        """
+        Locates the current checkpoint of a training run.
+        :param hash_value: The Hash of the TrainingParams.
+        :return: The directory holding the current checkpoint, or None if no checkpoint exists.
+        """
+        current_path = self.get_directory(hash_value) / self.CURRENT_FILE_NAME
+        if not current_path.is_file():
+            return None
+        return self.get_directory(hash_value) / current_path.read_text()
+
+    @staticmethod
+    def __write_atomically(path: Path, contents: str):
+        """
+        Writes a text file through a temporary file, so that readers never observe partial contents.
+        :param path: The path to the file.
+        :param contents: The text to write.
+        """
+        temporary_path = path.with_name(f'.{path.name}.tmp')
+        temporary_path.write_text(contents)
+        os.replace(temporary_path, path)
+
+    def save(self, hash_value: str, model: keras.Model, epoch: int, history: dict[str, list[float]],
+             finished: bool = False, data: Optional[BatchSequence] = None):
+        """
+        Saves the state of a training run. The checkpoint is written into a temporary directory, renamed into a new
+        version directory, and only then made current, so that a preemption while saving leaves the previous
+        checkpoint current and intact. Older versions are removed afterwards.
+        :param hash_value: The Hash of the TrainingParams being trained.
+        :param model: The model being trained.
+        :param epoch: The amount of epochs run so far.
+        :param history: The metrics of every epoch run so far.
+        :param finished: Whether training has ended.
+        :param data: The data the model is fed with, whose shuffling state is saved as well.
+        """
+        directory = self.get_directory(hash_value)
+        directory.mkdir(exist_ok=True)
+        if not model.optimizer.built:
+            model.optimizer.build(model.trainable_variables)
+        temporary_directory = Path(tempfile.mkdtemp(dir=directory, prefix='.'))
+        numpy.savez(temporary_directory / 'weights.npz', *model.get_weights())
+        numpy.savez(temporary_directory / 'optimizer.npz',
+                    *[numpy.asarray(variable) for variable in model.optimizer.variables])
+        if data is not None:
+            data_state = data.get_state()
+            numpy.savez(temporary_directory / 'data.npz', order=data_state['Order'],
+                        random_state=numpy.array(json.dumps(data_state['RandomState'])))
+        checkpoint = Checkpoint(Hash=hash_value, Epoch=epoch, Finished=finished, History=history)
+        (temporary_directory / 'state.json').write_text(json.dumps(dataclasses.asdict(checkpoint)))
+        version = f'{epoch:06d}{temporary_directory.name}'
+        os.replace(temporary_directory, directory / version)
+        self.__write_atomically(directory / self.CURRENT_FILE_NAME, version)
+        for path in directory.iterdir():
+            if path.is_dir() and path.name != version:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def load(self, hash_value: str) -> Optional[Checkpoint]:
+        """
+        Reads the state of a training run.
+        :param hash_value: The Hash of the TrainingParams.
+        :return: The checkpoint, or None if no checkpoint exists.
+        """
+        directory = self.get_version_directory(hash_value)
+        if directory is None:
+            return None
+        return Checkpoint(**json.loads((directory / 'state.json').read_text()))
+
+    def restore(self, hash_value: str, model: keras.Model) -> Optional[Checkpoint]:
+        """
+        Restores the weights and optimizer state of a compiled model out of its checkpoint.
+        :param hash_value: The Hash of the TrainingParams.
+        :param model: A model built and compiled after the same TrainingParams.
+        :return: The checkpoint, or None if no checkpoint exists (in which case the model is left untouched).
+        """
+        checkpoint = self.load(hash_value)
+        if checkpoint is None:
+            return None
+        directory = self.get_version_directory(hash_value)
+        with numpy.load(directory / 'weights.npz') as weights:
+            model.set_weights([weights[f'arr_{position}'] for position in range(len(weights.files))])
+        if not model.optimizer.built:
+            model.optimizer.build(model.trainable_variables)
+        with numpy.load(directory / 'optimizer.npz') as optimizer_variables:
+            for position, variable in enumerate(model.optimizer.variables):
+                variable.assign(optimizer_variables[f'arr_{position}'])
+        return checkpoint
+
+    def restore_data(self, hash_value: str, data: BatchSequence) -> bool:
+        """
+        Restores the shuffling state of the data out of its checkpoint.
+        :param hash_value: The Hash of the TrainingParams.
+        :param data: The data the model is fed with.
+        :return: True if a shuffling state was restored; False otherwise (in which case the data is left untouched).
+        """
+        directory = self.get_version_directory(hash_value)
+        if directory is None or not (directory / 'data.npz').is_file():
+            return False
+        with numpy.load(directory / 'data.npz') as data_state:
+            data.set_state({'RandomState': json.loads(str(data_state['random_state'])),
+                            'Order': data_state['order']})
+        return True
+
+    def remove(self, hash_value: str):
+        shutil.rmtree(self.get_directory(hash_value), ignore_errors=True)
+
+    def get_callbacks(self, hash_value: str, checkpoint: Optional[Checkpoint], patience: int,
+                      data: Optional[BatchSequence] = None) -> list[keras.callbacks.Callback]:
+        """
+        Builds the callbacks of a resumable training run.
+        :param hash_value: The Hash of the TrainingParams being trained.
+        :param checkpoint: The checkpoint the run resumes from, if any.
+        :param patience: The amount of epochs without improvement before stopping early.
+        :param data: The data the model is fed with, whose shuffling state is checkpointed as well.
+        :return: A list holding the checkpointing and early stopping callbacks.
+        """
+        history = checkpoint.History if checkpoint is not None else {}
+        return [ResumedEarlyStopping(history, monitor='loss', patience=patience),
+                CheckpointCallback(self, hash_value, history, self.__every_epochs, data)]
+
+    def __read_sweep(self) -> dict[str, Any]:
+        sweep_path = self.__root / self.SWEEP_FILE_NAME
+        if not sweep_path.is_file():
+            return {'Pending': [], 'Completed': {}}
+        return json.loads(sweep_path.read_text())
+
+    def __write_sweep(self, sweep: dict[str, Any]):
+        self.__write_atomically(self.__root / self.SWEEP_FILE_NAME, json.dumps(sweep))
+
+    def start_sweep(self, unfolded_params: Sequence[TrainingParams]) -> list[TrainingParams]:
+        """
+        Registers the combinations of a sweep, keeping track of those completed by previous attempts.
+        :param unfolded_params: A sequence of TrainingParams, usually returned by ParamsManager.unfold.
+        :return: The TrainingParams still pending.
+        """
+        sweep = self.__read_sweep()
+        pending_params = [training_params for training_params in unfolded_params
+                          if training_params.Hash not in sweep['Completed']]
+        sweep['Pending'] = [training_params.Hash for training_params in pending_params]
+        self.__write_sweep(sweep)
+        return pending_params
+
+    def mark_completed(self, hash_value: str, result: Any = None):
+        """
+        Records a combination as completed, along with its result, and drops its checkpoint.
+        :param hash_value: The Hash of the TrainingParams.
+        :param result: The result of the combination; persisted only if it is a dataclass instance.
+        """
+        sweep = self.__read_sweep()
+        sweep['Completed'][hash_value] = dataclasses.asdict(result) if dataclasses.is_dataclass(result) else None
+        sweep['Pending'] = [pending_hash for pending_hash in sweep['Pending'] if pending_hash != hash_value]
+        self.__write_sweep(sweep)
+        self.remove(hash_value)
+
+    @property
+    def pending(self) -> list[str]:
+        return self.__read_sweep()['Pending']
+
+    @property
+    def completed(self) -> dict[str, Optional[dict[str, Any]]]:
+        return self.__read_sweep()['Completed']
@@ -0,0 +1,146 @@
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Optional
+
+import numpy
+
+from source.libs.datasetLoader import DatasetLoader
+from source.libs.helper import Helper
+from source.structs.customTypes import DateRange
+from source.structs.dataset import Dataset
+
+
+class ColumnarStore(DatasetLoader):
+    """
+    A DatasetLoader that converts each CSV file, on first use, into a columnar on-disk cache.
+    Every column is stored as a separate .npy file, next to a sorted datetime64 index and a metadata sidecar,
+    inside a directory named after the file's content hash. Later reads memory-map those files,
+    so that several processes share the same pages instead of parsing the CSV again.
+    Content hashes are recorded on disk under the path, size and modification time of each file,
+    so that reopening an unchanged file does not read it again, even in a new process.
+    """
+
+    METADATA_FILE_NAME = 'metadata.json'
+    INDEX_FILE_NAME = 'index.npy'
+    FINGERPRINTS_DIRECTORY_NAME = '.fingerprints'
+
+    def __init__(self, root: Optional[Path] = None, dtype: type = numpy.float32, **loader_kwargs):
+        """
+        :param root: The directory holding converted datasets. If None, a ".columnar" directory is created
+        next to each dataset file.
+        :param dtype: The type every numeric column is stored with.
+        :param loader_kwargs: Additional arguments for the underlying DatasetLoader.
+        """
+        super().__init__(dtype=dtype, **loader_kwargs)
+        self.__root = root
+        self.__dtype_name = numpy.dtype(dtype).name
+
+    def __get_root(self, dataset_path: Path) -> Path:
+        return self.__root if self.__root is not None else dataset_path.parent / '.columnar'
+
+    def fingerprint(self, dataset_path: Path) -> str:
+        """
+        Computes an MD5 hash of the file contents, unless already recorded for the current path, size
+        and modification time of the file. Files whose stats changed are hashed again.
+        :param dataset_path: The path to the dataset file.
+        :return: An MD5 hash string representing the file contents.
+        """
+        stats = dataset_path.stat()
+        stats_key = Helper.generate_hash({'Path': str(dataset_path.resolve()), 'Size': stats.st_size,
+                                          'ModifiedNs': stats.st_mtime_ns})
+        record_path = self.__get_root(dataset_path) / self.FINGERPRINTS_DIRECTORY_NAME / stats_key
+        if record_path.is_file():
+            return record_path.read_text()
+        fingerprint = super().fingerprint(dataset_path)
+        record_path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=record_path.parent, prefix='.')
+        with os.fdopen(file_descriptor, 'w') as record_file:
+            record_file.write(fingerprint)
+        os.replace(temporary_path, record_path)
+        return fingerprint
+
+    def get_directory(self, dataset_path: Path) -> Path:
+        """
+        Returns the directory holding the converted version of the given dataset.
+        :param dataset_path: The path to the dataset file.
+        :return: The path to the directory, whether it exists or not.
+        """
+        return self.__get_root(dataset_path) / f'{self.fingerprint(dataset_path)}-{self.__dtype_name}'
+
+    def convert(self, dataset_path: Path) -> Path:
+        """
+        Converts the given CSV file into the columnar format, unless already converted.
+        The conversion is written into a temporary directory and then renamed,
+        so that concurrent processes never observe partial results.
+        :param dataset_path: The path to the dataset file.
+        :return: The directory holding the converted dataset.
+        """
+        directory = self.get_directory(dataset_path)
+        if (directory / self.METADATA_FILE_NAME).is_file():
+            return directory
+
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        temporary_directory = Path(tempfile.mkdtemp(dir=directory.parent, prefix='.converting-'))
+        try:
+            dataset = super().read(dataset_path)
+            numpy.save(temporary_directory / self.INDEX_FILE_NAME, dataset.Index)
+            column_files = {}
+            for position, (name, values) in enumerate(dataset.Columns.items()):
+                column_files[name] = f'column_{position}.npy'
+                numpy.save(temporary_directory / column_files[name], values)
+            metadata = {'Fingerprint': self.fingerprint(dataset_path),
+                        'Source': str(dataset_path),
+                        'Rows': len(dataset.Index),
+                        'Dtype': self.__dtype_name,
+                        'Columns': column_files}
+            (temporary_directory / self.METADATA_FILE_NAME).write_text(json.dumps(metadata, indent=2))
+            os.replace(temporary_directory, directory)
+        except OSError:
+            if not (directory / self.METADATA_FILE_NAME).is_file():
+                raise
+        finally:
+            shutil.rmtree(temporary_directory, ignore_errors=True)
+        return directory
+
+    def read(self, dataset_path: Path) -> Dataset:
+        """
+        Memory-maps the converted version of the given dataset, converting it first if needed.
+        :param dataset_path: The path to the dataset file.
+        :return: An unfiltered Dataset whose arrays are read-only memory maps.
+        """
+        directory = self.convert(dataset_path)
+        metadata = json.loads((directory / self.METADATA_FILE_NAME).read_text())
+        return Dataset(Index=numpy.load(directory / self.INDEX_FILE_NAME, mmap_mode='r'),
+                       Columns={name: numpy.load(directory / file_name, mmap_mode='r')
+                                for name, file_name in metadata['Columns'].items()})
+
+    def read_chunks(self, dataset_path: Path, chunk_rows: int,
+                    time_filter: Optional[DateRange] = None) -> Iterator[Dataset]:
+        """
+        Splits the memory-mapped dataset into chunks of rows.
+        The time filter is resolved against the index up front, so rows outside of it are never touched.
+        :param dataset_path: The path to the dataset file.
+        :param chunk_rows: The amount of rows per chunk.
+        :param time_filter: The DateRange the rows must fall within; if None, every row is kept.
+        :return: An iterator over the filtered chunks, whose arrays are views of the memory maps.
+        """
+        dataset = self.read(dataset_path)
+        rows = self.resolve_time_filter(dataset.Index, time_filter or DateRange())
+        for start in range(rows.start, rows.stop, chunk_rows):
+            chunk_slice = slice(start, min(start + chunk_rows, rows.stop))
+            yield Dataset(Index=dataset.Index[chunk_slice],
+                          Columns={name: values[chunk_slice] for name, values in dataset.Columns.items()})
+
+    def load(self, dataset_path: Path, time_filter: DateRange, column_to_predict: str) -> Dataset:
+        """
+        Memory-maps the given dataset and restricts it to the time filter, without copying any rows.
+        :param dataset_path: The path to the dataset file.
+        :param time_filter: The DateRange the rows must fall within.
+        :param column_to_predict: The name of the target column.
+        :return: The filtered Dataset.
+        """
+        return self.filter(self.read(dataset_path), time_filter, column_to_predict)
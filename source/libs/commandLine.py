@@ -0,0 +1,217 @@
+import argparse
+import dataclasses
+import json
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Optional, TextIO
+
+from source.libs.configLoader import ConfigLoader, UnresolvableCallableException
+from source.libs.helper import Helper
+from source.libs.paramsManager import ParamsManager
+from source.structs.params import TrainingParams as TrainParams
+
+
+class InvalidShardException(Exception):
+    pass
+
+
+class CommandLine:
+    """
+    The command line interface of the project, run through "python -m source".
+    Keras, TensorFlow and pandas are imported by the commands needing them only (train and serve),
+    so that counting, planning and unfolding grids start without paying for their imports.
+    """
+
+    def __init__(self, output: Optional[TextIO] = None, config_loader: Optional[ConfigLoader] = None):
+        """
+        :param output: The stream commands write to; defaults to the standard output.
+        :param config_loader: The loader configs are read with.
+        """
+        self.__output = output or sys.stdout
+        self.__config_loader = config_loader or ConfigLoader()
+
+    @staticmethod
+    def parse_shard(value: str) -> tuple[int, int]:
+        """
+        Parses a shard in the "<index>/<shards>" form, with a zero-based index.
+        :param value: The shard, e.g. "0/4".
+        :return: A tuple with the index and the amount of shards.
+        """
+        try:
+            index, shards = (int(part) for part in value.split('/'))
+        except ValueError as error:
+            raise InvalidShardException(f'Shard ({value}) must be in the "<index>/<shards>" form.') from error
+        if shards < 1 or not 0 <= index < shards:
+            raise InvalidShardException(f'Shard index ({index}) must lie within [0, {shards}).')
+        return index, shards
+
+    @staticmethod
+    def select_shard(unfolded_params: list[TrainParams], shard: Optional[str]) -> list[TrainParams]:
+        """
+        Selects the TrainParams of a shard, as a contiguous slice, so that each shard keeps the locality of the order
+        combinations were unfolded in (e.g. a single factor changing between consecutive Gray code combinations).
+        Shard sizes differ by one at most, larger shards first.
+        :param unfolded_params: A list of TrainParams, usually returned by ParamsManager.unfold.
+        :param shard: The shard, in the "<index>/<shards>" form; if None, every TrainParams is selected.
+        :return: The selected TrainParams, in their original order.
+        """
+        if shard is None:
+            return unfolded_params
+        index, shards = CommandLine.parse_shard(shard)
+        size, remainder = divmod(len(unfolded_params), shards)
+        start = index * size + min(index, remainder)
+        return unfolded_params[start:start + size + (1 if index < remainder else 0)]
+
+    def __write(self, data: object):
+        self.__output.write(json.dumps(data) + '\n')
+
+    def __unfold(self, arguments: argparse.Namespace) -> list[TrainParams]:
+        params_manager = ParamsManager(ordering=arguments.ordering,
+                                       priorities=ParamsManager.DATA_PRIORITIES
+                                       if arguments.ordering == ParamsManager.GRAY else ())
+        unfolded_params = params_manager.unfold(self.__config_loader.load(arguments.config))
+        return self.select_shard(unfolded_params, arguments.shard)
+
+    def count(self, arguments: argparse.Namespace) -> int:
+        """
+        Writes the amount of combinations of a config, without unfolding it.
+        """
+        self.__write(ParamsManager().count(self.__config_loader.load(arguments.config)))
+        return 0
+
+    def plan(self, arguments: argparse.Namespace) -> int:
+        """
+        Writes the data-preparation plan of a config: the amount of combinations, loads and window builds,
+        along with the size of every group.
+        """
+        from source.libs.preparationPlanner import PreparationPlanner
+        plan = PreparationPlanner().plan(self.__unfold(arguments))
+        self.__write({'Combinations': plan.combinations, 'Loads': plan.loads, 'WindowBuilds': plan.window_builds,
+                      'Groups': [{'Key': group.Key, 'LoadKey': group.LoadKey, 'Members': len(group.Members)}
+                                 for group in plan]})
+        return 0
+
+    def unfold(self, arguments: argparse.Namespace) -> int:
+        """
+        Writes the unfolded TrainParams of a config, or of one of its shards, one JSON object per line.
+        """
+        for training_params in self.__unfold(arguments):
+            self.__write(Helper.stringify_objects(dataclasses.asdict(training_params)))
+        return 0
+
+    def train(self, arguments: argparse.Namespace) -> int:
+        """
+        Trains the combinations of a config, or of one of its shards, writing a TrainingResult per line.
+        Callables are resolved, and thus Keras imported, only here.
+        :return: 1 if any combination failed; 0 otherwise.
+        """
+        unfolded_params = []
+        failures = 0
+        for training_params in self.__unfold(arguments):
+            try:
+                unfolded_params.append(self.__config_loader.resolve(training_params))
+            except UnresolvableCallableException as error:
+                failures += 1
+                self.__write({'Hash': training_params.Hash, 'Error': repr(error)})
+        if arguments.workers > 1:
+            from source.libs.gridRunner import GridRunner
+            runner = GridRunner(arguments.workers, checkpoint_root=arguments.checkpoint_root,
+                                share_datasets=arguments.share_datasets)
+            for outcome in runner.run(unfolded_params):
+                if outcome.Error is not None:
+                    failures += 1
+                    self.__write({'Hash': outcome.Params.Hash, 'Error': repr(outcome.Error)})
+                else:
+                    self.__write(dataclasses.asdict(outcome.Result))
+            return 1 if failures else 0
+
+        from source.libs.artifactStore import ArtifactStore
+        from source.libs.checkpointStore import CheckpointStore
+        from source.libs.trainer import Trainer
+        trainer = Trainer(seed=arguments.seed,
+                          checkpoint_store=CheckpointStore(arguments.checkpoint_root)
+                          if arguments.checkpoint_root is not None else None,
+                          artifact_store=ArtifactStore(arguments.artifact_root)
+                          if arguments.artifact_root is not None else None)
+        for training_params in unfolded_params:
+            try:
+                self.__write(dataclasses.asdict(trainer.train(training_params)))
+            except Exception as error:
+                failures += 1
+                self.__write({'Hash': training_params.Hash, 'Error': repr(error)})
+        return 1 if failures else 0
+
+    def serve(self, arguments: argparse.Namespace) -> int:
+        """
+        Serves predictions of trained models over TCP, until interrupted.
+        """
+        import asyncio
+        from source.libs.artifactStore import ArtifactStore
+        from source.libs.predictionServer import PredictionServer
+        server = PredictionServer(models_root=arguments.models_root, max_batch_size=arguments.max_batch_size,
+                                  max_delay=arguments.max_delay,
+                                  artifact_store=ArtifactStore(arguments.artifact_root)
+                                  if arguments.artifact_root is not None else None)
+
+        async def serve_forever():
+            tcp_server = await server.serve(arguments.host, arguments.port)
+            self.__write({'Listening': [socket.getsockname() for socket in tcp_server.sockets]})
+            self.__output.flush()
+            try:
+                async with tcp_server:
+                    await tcp_server.serve_forever()
+            finally:
+                await server.close()
+
+        try:
+            asyncio.run(serve_forever())
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    def build_parser(self) -> argparse.ArgumentParser:
+        parser = argparse.ArgumentParser(prog='python -m source')
+        subparsers = parser.add_subparsers(dest='command', required=True)
+
+        count_parser = subparsers.add_parser('count', help='Counts the combinations of a config.')
+        count_parser.add_argument('config', type=Path)
+        count_parser.set_defaults(command_method=self.count)
+
+        for name, method, help_text in (('plan', self.plan, 'Plans the data preparation of a config.'),
+                                        ('unfold', self.unfold, 'Unfolds a config, one JSON object per line.'),
+                                        ('train', self.train, 'Trains the combinations of a config.')):
+            subparser = subparsers.add_parser(name, help=help_text)
+            subparser.add_argument('config', type=Path)
+            subparser.add_argument('--shard', help='The shard to select, as "<index>/<shards>".')
+            subparser.add_argument('--ordering', choices=ParamsManager.ORDERINGS, default=ParamsManager.LEXICOGRAPHIC,
+                                   help='The order combinations are unfolded in; "gray" changes a single factor '
+                                        'per combination, and the data factors least often.')
+            subparser.set_defaults(command_method=method)
+            if name == 'train':
+                subparser.add_argument('--workers', type=int, default=1)
+                subparser.add_argument('--seed', type=int)
+                subparser.add_argument('--checkpoint-root', type=Path)
+                subparser.add_argument('--artifact-root', type=Path,
+                                       help='The store trained models are saved into; in-process training only.')
+                subparser.add_argument('--share-datasets', action='store_true',
+                                       help='Loads each dataset once into shared memory for every worker.')
+
+        serve_parser = subparsers.add_parser('serve', help='Serves predictions of trained models.')
+        serve_parser.add_argument('--artifact-root', type=Path)
+        serve_parser.add_argument('--models-root', type=Path)
+        serve_parser.add_argument('--host', default='127.0.0.1')
+        serve_parser.add_argument('--port', type=int, default=8765)
+        serve_parser.add_argument('--max-batch-size', type=int, default=64)
+        serve_parser.add_argument('--max-delay', type=float, default=0.005)
+        serve_parser.set_defaults(command_method=self.serve)
+        return parser
+
+    def run(self, arguments: Optional[Sequence[str]] = None) -> int:
+        """
+        Parses the given arguments and runs the selected command.
+        :param arguments: The command line arguments; defaults to sys.argv.
+        :return: The exit status of the command.
+        """
+        parsed_arguments = self.build_parser().parse_args(arguments)
+        return parsed_arguments.command_method(parsed_arguments)
@@ -0,0 +1,106 @@
+import dataclasses
+import importlib
+import json
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from source.libs.helper import Helper
+from source.structs.customTypes import DateRange
+from source.structs.params import (TrainingParamsCombinations as TrainParamsCombs,
+                                   LayerParamsCombinations as LayerParamsCombs,
+                                   TrainingParams as TrainParams)
+
+
+class InvalidConfigException(Exception):
+    pass
+
+
+class UnresolvableCallableException(Exception):
+    pass
+
+
+class ConfigLoader:
+    """
+    Loads TrainParamsCombs instances out of JSON configs, whose keys are the names of their fields.
+    Callables are written as fully qualified names (e.g. "keras.src.optimizers.adam.Adam"), and are kept as such:
+    Helper hashes callables by their fully qualified names, so combinations get the same Hash whether their callables
+    are resolved or not, and the libraries defining them are only imported once they are resolved, right before
+    training. Time filters are written as {"fm": <ISO date or null>, "to": <ISO date or null>},
+    and layer stacks as objects mapping layer positions to layer combinations.
+    """
+
+    CALLABLE_FIELD_NAMES = ('CompileLossFunction', 'CompileOptimizer')
+    LAYER_CALLABLE_FIELD_NAMES = ('KernelInitializer', 'KernelRegularizer', 'Activation')
+
+    @staticmethod
+    def parse_time_filter(value: Optional[dict[str, Optional[str]]]) -> DateRange:
+        """
+        Builds a DateRange out of its config representation.
+        :param value: A dictionary holding ISO dates under "fm" and "to", either of which can be null or missing.
+        :return: A DateRange.
+        """
+        value = value or {}
+        return DateRange(**{key: datetime.fromisoformat(value[key]) for key in ('fm', 'to')
+                            if value.get(key) is not None})
+
+    def from_dict(self, config: dict[str, Any]) -> TrainParamsCombs:
+        """
+        Builds a TrainParamsCombs instance out of a decoded config.
+        :param config: A dictionary mapping TrainParamsCombs field names to lists of values.
+        :return: A TrainParamsCombs instance, whose callables are fully qualified names.
+        """
+        config = dict(config)
+        try:
+            config['DatasetPath'] = [Path(path) for path in config['DatasetPath']]
+            config['DatasetTimeFilter'] = [self.parse_time_filter(value) for value in config['DatasetTimeFilter']]
+            config['LayerStack'] = [{int(position): LayerParamsCombs(**layer_combs)
+                                     for position, layer_combs in stack_combs.items()}
+                                    for stack_combs in config['LayerStack']]
+            return TrainParamsCombs(**config)
+        except (KeyError, TypeError, ValueError) as error:
+            raise InvalidConfigException(f'Invalid config: {error!r}.') from error
+
+    def load(self, config_path: Path) -> TrainParamsCombs:
+        """
+        Reads a JSON config.
+        :param config_path: The path to the config file.
+        :return: A TrainParamsCombs instance, whose callables are fully qualified names.
+        """
+        return self.from_dict(json.loads(config_path.read_text()))
+
+    @staticmethod
+    def resolve_callable(value: Optional[str | Callable]) -> Optional[Callable]:
+        """
+        Resolves a fully qualified name into the object it refers to, importing its module first.
+        :param value: A fully qualified name; callables and None are returned unchanged.
+        :return: The resolved object.
+        """
+        if not isinstance(value, str):
+            return value
+        subpaths = value.split('.')
+        for length in range(len(subpaths) - 1, 0, -1):
+            try:
+                importlib.import_module('.'.join(subpaths[:length]))
+                break
+            except ImportError:
+                continue
+        callable_object = Helper.get_module_callable(value)
+        if callable_object is None:
+            raise UnresolvableCallableException(f'"{value}" could not be resolved.')
+        return callable_object
+
+    def resolve(self, training_params: TrainParams) -> TrainParams:
+        """
+        Resolves every callable of the given TrainParams, keeping its Hash.
+        :param training_params: A TrainParams instance, usually unfolded out of a config.
+        :return: A new TrainParams instance, ready to be trained.
+        """
+        layer_stack = {}
+        for position, layer_params in training_params.LayerStack.items():
+            layer_callables = {name: self.resolve_callable(getattr(layer_params, name))
+                               for name in self.LAYER_CALLABLE_FIELD_NAMES}
+            layer_stack[position] = dataclasses.replace(layer_params, **layer_callables)
+        callables = {name: self.resolve_callable(getattr(training_params, name)) for name in self.CALLABLE_FIELD_NAMES}
+        return dataclasses.replace(training_params, LayerStack=layer_stack, **callables)
@@ -0,0 +1,113 @@
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from source.libs.datasetLoader import DatasetLoader
+from source.libs.helper import Helper
+from source.structs.customTypes import DateRange
+from source.structs.dataset import Dataset
+from source.structs.params import TrainingParams
+
+
+class DatasetCache:
+    """
+    An in-process cache of loaded datasets, shared by every TrainingParams that relies on the same data.
+    Entries are keyed by dataset path, content fingerprint, time filter and column to predict,
+    and are evicted in least-recently-used order whenever the byte budget is exceeded.
+    """
+
+    def __init__(self, max_bytes: int = 2 ** 30, loader: Optional[DatasetLoader] = None):
+        self.__max_bytes = max_bytes
+        self.__loader = loader or DatasetLoader()
+        self.__entries: OrderedDict[str, tuple[Dataset, int]] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def size(self) -> int:
+        """
+        Getter of the "size" property.
+        :return: The total amount of bytes held by cached datasets.
+        """
+        return self.__size
+
+    @staticmethod
+    def get_size(dataset: Dataset) -> int:
+        """
+        Computes the amount of bytes held by a dataset's arrays.
+        :param dataset: The dataset to measure.
+        :return: The size in bytes.
+        """
+        return dataset.Index.nbytes + sum(values.nbytes for values in dataset.Columns.values())
+
+    @staticmethod
+    def generate_key(dataset_path: Path, fingerprint: str, time_filter: DateRange, column_to_predict: str) -> str:
+        """
+        Generates the key identifying a cache entry.
+        :param dataset_path: The path to the dataset file.
+        :param fingerprint: The content fingerprint of the dataset file.
+        :param time_filter: The DateRange the rows must fall within.
+        :param column_to_predict: The name of the target column.
+        :return: An MD5 hash string.
+        """
+        return Helper.generate_hash({'DatasetPath': dataset_path,
+                                     'Fingerprint': fingerprint,
+                                     'DatasetTimeFilter': time_filter,
+                                     'ColumnToPredict': column_to_predict})
+
+    def __evict(self):
+        """
+        Drops least recently used entries until the byte budget is met.
+        """
+        while self.__size > self.__max_bytes and len(self.__entries) > 0:
+            _, (_, entry_size) = self.__entries.popitem(last=False)
+            self.__size -= entry_size
+
+    def load(self, dataset_path: Path, time_filter: DateRange, column_to_predict: str) -> Dataset:
+        """
+        Returns the requested dataset, loading it only if no cached copy exists.
+        Datasets larger than the whole budget are returned without being cached.
+        :param dataset_path: The path to the dataset file.
+        :param time_filter: The DateRange the rows must fall within.
+        :param column_to_predict: The name of the target column.
+        :return: The filtered Dataset.
+        """
+        key = self.generate_key(dataset_path, self.__loader.fingerprint(dataset_path), time_filter, column_to_predict)
+        with self.__lock:
+            if key in self.__entries:
+                self.hits += 1
+                self.__entries.move_to_end(key)
+                return self.__entries[key][0]
+            self.misses += 1
+
+        dataset = self.__loader.load(dataset_path, time_filter, column_to_predict)
+        dataset_size = self.get_size(dataset)
+        with self.__lock:
+            if dataset_size <= self.__max_bytes and key not in self.__entries:
+                self.__entries[key] = (dataset, dataset_size)
+                self.__size += dataset_size
+                self.__evict()
+        return dataset
+
+    def get(self, training_params: TrainingParams) -> Dataset:
+        """
+        Returns the dataset described by the given TrainingParams.
+        :param training_params: A TrainingParams instance.
+        :return: The filtered Dataset.
+        """
+        return self.load(training_params.DatasetPath, training_params.DatasetTimeFilter,
+                         training_params.ColumnToPredict)
+
+    def clear(self):
+        """
+        Drops every cached entry.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
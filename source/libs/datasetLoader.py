@@ -0,0 +1,166 @@
+import hashlib
+from collections.abc import Iterator
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Optional
+
+import numpy
+import pandas
+
+from source.structs.customTypes import DateRange
+from source.structs.dataset import Dataset
+
+
+class MissingColumnException(Exception):
+    pass
+
+
+class UnsortedDatasetException(Exception):
+    pass
+
+
+class DatasetLoader:
+    """
+    Reads CSV datasets into Dataset objects.
+    Each CSV file is expected to hold one timestamp column (the index) and any number of numeric columns.
+    """
+
+    __fingerprints: dict[tuple[str, int, int], str] = {}
+
+    def __init__(self, index_column: int | str = 0, dtype: type = numpy.float64, chunk_size: int = 2 ** 20):
+        self.__index_column = index_column
+        self.__dtype = dtype
+        self.__chunk_size = chunk_size
+
+    @staticmethod
+    def to_datetime64(value: Optional[datetime]) -> Optional[numpy.datetime64]:
+        """
+        Converts a datetime into a timezone-naive numpy.datetime64, as stored in every Dataset index.
+        Offset-aware datetimes are converted to UTC first.
+        :param value: The datetime to convert; may be None.
+        :return: The converted value, or None if no value was given.
+        """
+        if value is None:
+            return None
+        if value.tzinfo is not None:
+            value = value.astimezone(UTC).replace(tzinfo=None)
+        return numpy.datetime64(value, 'ns')
+
+    @staticmethod
+    def resolve_time_filter(index: numpy.ndarray, time_filter: DateRange) -> slice:
+        """
+        Resolves a time filter into the range of rows it covers, using binary search over a sorted index.
+        Both ends of the filter are inclusive.
+        :param index: A sorted datetime64 index.
+        :param time_filter: The DateRange to resolve.
+        :return: A slice selecting the rows within the filter.
+        """
+        fm = DatasetLoader.to_datetime64(time_filter.fm)
+        to = DatasetLoader.to_datetime64(time_filter.to)
+        start = 0 if fm is None else int(numpy.searchsorted(index, fm, side='left'))
+        stop = len(index) if to is None else int(numpy.searchsorted(index, to, side='right'))
+        return slice(start, max(start, stop))
+
+    @staticmethod
+    def filter(dataset: Dataset, time_filter: DateRange, column_to_predict: str, copy: bool = False) -> Dataset:
+        """
+        Restricts a dataset to the given time filter and sets the column to predict.
+        :param dataset: The dataset to restrict.
+        :param time_filter: The DateRange the rows must fall within.
+        :param column_to_predict: The name of the target column; raises MissingColumnException if not present.
+        :param copy: If True, the filtered rows are copied, so that the source arrays can be released;
+        otherwise, the returned arrays are views of the source ones.
+        :return: A new Dataset holding the filtered rows.
+        """
+        if column_to_predict not in dataset.Columns:
+            raise MissingColumnException(f'Column "{column_to_predict}" was not found in the dataset.')
+        rows = DatasetLoader.resolve_time_filter(dataset.Index, time_filter)
+        partial = (rows.stop - rows.start) != len(dataset.Index)
+
+        def select(array: numpy.ndarray) -> numpy.ndarray:
+            return array[rows].copy() if copy and partial else array[rows]
+
+        return Dataset(Index=select(dataset.Index),
+                       Columns={name: select(values) for name, values in dataset.Columns.items()},
+                       ColumnToPredict=column_to_predict)
+
+    def fingerprint(self, dataset_path: Path) -> str:
+        """
+        Computes an MD5 hash of the file contents.
+        Results are memoized per path, size and modification time, so that each file is read only once per process.
+        :param dataset_path: The path to the dataset file.
+        :return: An MD5 hash string representing the file contents.
+        """
+        stats = dataset_path.stat()
+        memo_key = (str(dataset_path.resolve()), stats.st_size, stats.st_mtime_ns)
+        if memo_key not in DatasetLoader.__fingerprints:
+            md5_hasher = hashlib.md5()
+            with open(dataset_path, 'rb') as dataset_file:
+                while chunk := dataset_file.read(self.__chunk_size):
+                    md5_hasher.update(chunk)
+            DatasetLoader.__fingerprints[memo_key] = md5_hasher.hexdigest()
+        return DatasetLoader.__fingerprints[memo_key]
+
+    def __parse_frame(self, frame: pandas.DataFrame) -> Dataset:
+        """
+        Converts a parsed CSV frame into a Dataset, keeping only its numeric columns.
+        :param frame: A frame whose index holds the timestamps of each row.
+        :return: A Dataset holding the rows in their original order.
+        """
+        index = pandas.to_datetime(frame.index, utc=True).tz_localize(None).to_numpy(dtype='datetime64[ns]')
+        numeric_frame = frame.select_dtypes('number')
+        return Dataset(Index=index,
+                       Columns={str(name): numeric_frame[name].to_numpy(dtype=self.__dtype)
+                                for name in numeric_frame.columns})
+
+    def read(self, dataset_path: Path) -> Dataset:
+        """
+        Parses a whole CSV file, keeping only its numeric columns, sorted by timestamp.
+        :param dataset_path: The path to the dataset file.
+        :return: An unfiltered Dataset.
+        """
+        dataset = self.__parse_frame(pandas.read_csv(dataset_path, index_col=self.__index_column))
+        order = numpy.argsort(dataset.Index, kind='stable')
+        return Dataset(Index=dataset.Index[order],
+                       Columns={name: values[order] for name, values in dataset.Columns.items()})
+
+    def read_chunks(self, dataset_path: Path, chunk_rows: int,
+                    time_filter: Optional[DateRange] = None) -> Iterator[Dataset]:
+        """
+        Parses a CSV file in chunks of rows, so that it never needs to fit in memory as a whole.
+        Chunks entirely outside the time filter are skipped, and parsing stops as soon as the filter is exceeded.
+        Rows must already be sorted by timestamp; otherwise, UnsortedDatasetException is raised.
+        :param dataset_path: The path to the dataset file.
+        :param chunk_rows: The amount of rows parsed at once.
+        :param time_filter: The DateRange the rows must fall within; if None, every row is kept.
+        :return: An iterator over the filtered, non-empty chunks.
+        """
+        time_filter = time_filter or DateRange()
+        to = self.to_datetime64(time_filter.to)
+        previous_timestamp = None
+        with pandas.read_csv(dataset_path, index_col=self.__index_column, chunksize=chunk_rows) as reader:
+            for frame in reader:
+                chunk = self.__parse_frame(frame)
+                if len(chunk.Index) == 0:
+                    continue
+                if numpy.any(chunk.Index[1:] < chunk.Index[:-1]) or \
+                        (previous_timestamp is not None and chunk.Index[0] < previous_timestamp):
+                    raise UnsortedDatasetException(f'Rows of "{dataset_path}" are not sorted by timestamp.')
+                previous_timestamp = chunk.Index[-1]
+
+                rows = self.resolve_time_filter(chunk.Index, time_filter)
+                if rows.stop > rows.start:
+                    yield Dataset(Index=chunk.Index[rows],
+                                  Columns={name: values[rows] for name, values in chunk.Columns.items()})
+                if to is not None and chunk.Index[-1] > to:
+                    break
+
+    def load(self, dataset_path: Path, time_filter: DateRange, column_to_predict: str) -> Dataset:
+        """
+        Reads a CSV file and restricts it to the given time filter.
+        :param dataset_path: The path to the dataset file.
+        :param time_filter: The DateRange the rows must fall within.
+        :param column_to_predict: The name of the target column.
+        :return: The filtered Dataset.
+        """
+        return self.filter(self.read(dataset_path), time_filter, column_to_predict, copy=True)
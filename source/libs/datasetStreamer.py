@@ -0,0 +1,115 @@
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Optional
+
+import numpy
+
+from source.libs.datasetLoader import DatasetLoader, MissingColumnException
+from source.libs.slidingWindows import SlidingWindows
+from source.structs.customTypes import DateRange
+from source.structs.dataset import Dataset
+from source.structs.params import TrainingParams
+
+
+class DatasetStreamer:
+    """
+    Streams windowed batches out of datasets that do not fit in memory, reading them chunk by chunk.
+    The last WindowWidth rows of each chunk are carried over to the next one, since every sample spans
+    WindowWidth rows of features plus the following row holding its target; this way, no sample is lost
+    at chunk boundaries and none is produced twice.
+    """
+
+    def __init__(self, loader: Optional[DatasetLoader] = None, chunk_rows: int = 2 ** 16,
+                 seed: Optional[int] = None):
+        """
+        :param loader: The loader used to read chunks; either a DatasetLoader (CSV) or a ColumnarStore.
+        :param chunk_rows: The amount of rows read at once.
+        :param seed: The seed used to shuffle samples within each chunk.
+        """
+        self.__loader = loader or DatasetLoader()
+        self.__chunk_rows = chunk_rows
+        self.__seed = seed
+
+    @staticmethod
+    def __concatenate(head: Optional[Dataset], tail: Dataset) -> Dataset:
+        """
+        Appends the rows of one dataset to another.
+        :param head: The leading rows; may be None.
+        :param tail: The trailing rows.
+        :return: A Dataset holding both sets of rows.
+        """
+        if head is None:
+            return tail
+        return Dataset(Index=numpy.concatenate([head.Index, tail.Index]),
+                       Columns={name: numpy.concatenate([head.Columns[name], values])
+                                for name, values in tail.Columns.items()},
+                       ColumnToPredict=tail.ColumnToPredict)
+
+    def iterate_windows(self, dataset_path: Path, time_filter: DateRange, column_to_predict: str,
+                        window_width: int) -> Iterator[SlidingWindows]:
+        """
+        Reads the dataset chunk by chunk, yielding the windowed samples whose targets fall within each chunk.
+        :param dataset_path: The path to the dataset file.
+        :param time_filter: The DateRange the rows must fall within.
+        :param column_to_predict: The name of the target column.
+        :param window_width: The amount of rows per window.
+        :return: An iterator over the windows of each chunk.
+        """
+        carry = None
+        for chunk in self.__loader.read_chunks(dataset_path, self.__chunk_rows, time_filter):
+            if column_to_predict not in chunk.Columns:
+                raise MissingColumnException(f'Column "{column_to_predict}" was not found in the dataset.')
+            chunk.ColumnToPredict = column_to_predict
+            combined = self.__concatenate(carry, chunk)
+            yield SlidingWindows(combined, window_width)
+            carry = Dataset(Index=combined.Index[-window_width:],
+                            Columns={name: values[-window_width:] for name, values in combined.Columns.items()},
+                            ColumnToPredict=column_to_predict)
+
+    def iterate_batches(self, dataset_path: Path, time_filter: DateRange, column_to_predict: str,
+                        window_width: int, batch_size: int,
+                        shuffle: bool = False) -> Iterator[tuple[numpy.ndarray, numpy.ndarray]]:
+        """
+        Reads the dataset chunk by chunk, yielding batches of a constant size (except, possibly, the last one).
+        :param dataset_path: The path to the dataset file.
+        :param time_filter: The DateRange the rows must fall within.
+        :param column_to_predict: The name of the target column.
+        :param window_width: The amount of rows per window.
+        :param batch_size: The amount of samples per batch.
+        :param shuffle: If True, samples are shuffled within each chunk.
+        :return: An iterator over tuples of features and targets, as returned by SlidingWindows.get_batch.
+        """
+        random_generator = numpy.random.default_rng(self.__seed)
+        pending_features, pending_targets = None, None
+        for windows in self.iterate_windows(dataset_path, time_filter, column_to_predict, window_width):
+            order = random_generator.permutation(len(windows)) if shuffle else numpy.arange(len(windows))
+            start = 0
+            if pending_features is not None:
+                start = min(batch_size - len(pending_features), len(order))
+                features, targets = windows.get_batch(order[:start])
+                pending_features = numpy.concatenate([pending_features, features])
+                pending_targets = numpy.concatenate([pending_targets, targets])
+                if len(pending_features) < batch_size:
+                    continue
+                yield pending_features, pending_targets
+                pending_features, pending_targets = None, None
+
+            for batch_start in range(start, len(order), batch_size):
+                features, targets = windows.get_batch(order[batch_start:batch_start + batch_size])
+                if len(features) < batch_size:
+                    pending_features, pending_targets = features, targets
+                else:
+                    yield features, targets
+
+        if pending_features is not None and len(pending_features) > 0:
+            yield pending_features, pending_targets
+
+    def stream(self, training_params: TrainingParams) -> Iterator[tuple[numpy.ndarray, numpy.ndarray]]:
+        """
+        Streams the batches described by the given TrainingParams; intended to be consumed once per epoch.
+        :param training_params: A TrainingParams instance.
+        :return: An iterator over tuples of features and targets.
+        """
+        return self.iterate_batches(training_params.DatasetPath, training_params.DatasetTimeFilter,
+                                    training_params.ColumnToPredict, training_params.WindowWidth,
+                                    training_params.DatasetBatchSize, training_params.DatasetShuffle)
@@ -0,0 +1,154 @@
+import dataclasses
+from collections.abc import Iterator, Sequence
+from typing import Optional
+
+import keras
+
+from source.libs.artifactStore import ArtifactStore
+from source.libs.checkpointStore import CheckpointStore
+from source.libs.helper import Helper
+from source.libs.trainer import Trainer
+from source.structs.params import TrainingParams
+from source.structs.results import TrainingResult
+
+
+class EpochBudgetCallback(keras.callbacks.Callback):
+    """
+    Saves the weights and history of a training run at the end of every given epoch budget,
+    under the Hash of every TrainingParams with that budget.
+    Budgets beyond the epoch training ended at (because of early stopping) share the final state,
+    just as a run with such a budget would have stopped at the same epoch.
+    """
+
+    def __init__(self, budgets: dict[int, list[str]], checkpoint_store: Optional[CheckpointStore] = None,
+                 artifact_store: Optional[ArtifactStore] = None):
+        """
+        :param budgets: The Hash of every TrainingParams, keyed by its FitMaxEpochs.
+        :param checkpoint_store: If set, each budget is saved as a finished checkpoint under its Hash.
+        :param artifact_store: If set, the model of each budget is saved under its Hash, along with its TrainingResult.
+        """
+        super().__init__()
+        self.__budgets = budgets
+        self.__checkpoint_store = checkpoint_store
+        self.__artifact_store = artifact_store
+        self.__saved_budgets: set[int] = set()
+        self.history: dict[str, list[float]] = {}
+
+    def __save(self, budget: int, epochs: int):
+        """
+        Saves the current state of the model for the given budget.
+        :param budget: The FitMaxEpochs value being saved.
+        :param epochs: The amount of epochs run so far.
+        """
+        self.__saved_budgets.add(budget)
+        history = {key: values[:epochs] for key, values in self.history.items()}
+        for hash_value in self.__budgets[budget]:
+            if self.__checkpoint_store is not None:
+                self.__checkpoint_store.save(hash_value, self.model, epochs, history, finished=True)
+            if self.__artifact_store is not None:
+                result = TrainingResult(Hash=hash_value, Epochs=epochs, History=history)
+                self.__artifact_store.save(hash_value, self.model, dataclasses.asdict(result))
+
+    def on_train_begin(self, logs: Optional[dict] = None):
+        self.history = {}
+        self.__saved_budgets = set()
+
+    def on_epoch_end(self, epoch: int, logs: Optional[dict] = None):
+        for key, value in (logs or {}).items():
+            self.history.setdefault(key, []).append(float(value))
+        if epoch + 1 in self.__budgets:
+            self.__save(epoch + 1, epoch + 1)
+
+    def on_train_end(self, logs: Optional[dict] = None):
+        epochs = len(self.history.get('loss', []))
+        for budget in sorted(self.__budgets):
+            if budget not in self.__saved_budgets:
+                self.__save(budget, epochs)
+
+
+class EpochBudgetTrainer:
+    """
+    Trains the TrainingParams differing only in FitMaxEpochs (and thus Hash) once, up to the largest budget,
+    recording the state at every smaller budget as the result of the matching TrainingParams.
+    """
+
+    BUDGET_FIELD_NAMES = ('Hash', 'FitMaxEpochs')
+
+    def __init__(self, trainer: Optional[Trainer] = None):
+        """
+        :param trainer: The trainer data is prepared and models are built with.
+        If it holds a CheckpointStore or an ArtifactStore, the model of every budget is saved into them.
+        """
+        self.__trainer = trainer or Trainer()
+
+    @property
+    def trainer(self) -> Trainer:
+        return self.__trainer
+
+    @staticmethod
+    def generate_key(training_params: TrainingParams) -> str:
+        """
+        Generates a key shared by every TrainingParams differing only in their budget fields.
+        :param training_params: A TrainingParams instance.
+        :return: An MD5 hash string.
+        """
+        fields = {field.name: getattr(training_params, field.name) for field in dataclasses.fields(training_params)
+                  if field.name not in EpochBudgetTrainer.BUDGET_FIELD_NAMES}
+        fields['LayerStack'] = {layer_index: dataclasses.asdict(layer_params)
+                                for layer_index, layer_params in training_params.LayerStack.items()}
+        return Helper.generate_hash(fields)
+
+    def group(self, unfolded_params: Sequence[TrainingParams]) -> list[list[TrainingParams]]:
+        """
+        Groups the given TrainingParams by every field but their budget fields, keeping their first-seen order.
+        :param unfolded_params: A sequence of TrainingParams, usually returned by ParamsManager.unfold.
+        :return: A list of groups.
+        """
+        groups: dict[str, list[TrainingParams]] = {}
+        for training_params in unfolded_params:
+            groups.setdefault(self.generate_key(training_params), []).append(training_params)
+        return list(groups.values())
+
+    def train_group(self, group: Sequence[TrainingParams]) -> list[TrainingResult]:
+        """
+        Trains a group of TrainingParams in a single run, up to the largest FitMaxEpochs among them.
+        Members with a finished checkpoint are not trained again.
+        :param group: A group of TrainingParams, as returned by EpochBudgetTrainer.group.
+        :return: A list holding the TrainingResult of each TrainingParams, in group order.
+        """
+        checkpoint_store = self.__trainer.checkpoint_store
+        results: dict[str, TrainingResult] = {}
+        if checkpoint_store is not None:
+            for training_params in group:
+                checkpoint = checkpoint_store.load(training_params.Hash)
+                if checkpoint is not None and checkpoint.Finished:
+                    results[training_params.Hash] = TrainingResult(Hash=checkpoint.Hash, Epochs=checkpoint.Epoch,
+                                                                   History=checkpoint.History)
+        pending_params = [training_params for training_params in group if training_params.Hash not in results]
+        if pending_params:
+            largest_params = max(pending_params, key=lambda training_params: training_params.FitMaxEpochs)
+            budgets: dict[int, list[str]] = {}
+            for training_params in pending_params:
+                budgets.setdefault(training_params.FitMaxEpochs, []).append(training_params.Hash)
+            data = self.__trainer.prepare(largest_params)
+            model = self.__trainer.build(largest_params, data)
+            budget_callback = EpochBudgetCallback(budgets, checkpoint_store, self.__trainer.artifact_store)
+            model.fit(data, epochs=largest_params.FitMaxEpochs,
+                      callbacks=[*self.__trainer.get_callbacks(largest_params), budget_callback],
+                      shuffle=False, verbose=0)
+            epochs = len(budget_callback.history.get('loss', []))
+            for training_params in pending_params:
+                budget_epochs = min(training_params.FitMaxEpochs, epochs)
+                results[training_params.Hash] = TrainingResult(
+                    Hash=training_params.Hash, Epochs=budget_epochs,
+                    History={key: values[:budget_epochs] for key, values in budget_callback.history.items()})
+        return [results[training_params.Hash] for training_params in group]
+
+    def train(self, unfolded_params: Sequence[TrainingParams]) -> Iterator[TrainingResult]:
+        """
+        Groups and trains the given TrainingParams.
+        :param unfolded_params: A sequence of TrainingParams, usually returned by ParamsManager.unfold.
+        :return: An iterator over TrainingResult instances, in group order.
+        """
+        for group in self.group(unfolded_params):
+            yield from self.train_group(group)
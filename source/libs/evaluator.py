@@ -0,0 +1,131 @@
+import dataclasses
+from collections.abc import Callable, Sequence
+from typing import Optional
+
+import keras
+import numpy
+
+from source.libs.artifactStore import ArtifactStore
+from source.libs.instrumentation import instrumentation
+from source.libs.preparationPlanner import PreparationPlanner
+from source.libs.slidingWindows import SlidingWindows
+from source.libs.trainer import Trainer
+from source.structs.customTypes import DateRange
+from source.structs.params import TrainingParams
+from source.structs.results import EvaluationResult
+
+
+class MissingModelSourceException(Exception):
+    pass
+
+
+class MetricAccumulator:
+    """
+    Accumulates the error of a single model batch after batch, so that no prediction outlives its batch.
+    """
+
+    def __init__(self):
+        self.samples = 0
+        self.absolute_error = 0.0
+        self.squared_error = 0.0
+
+    def update(self, predictions: numpy.ndarray, targets: numpy.ndarray):
+        """
+        Adds the errors of a batch to the running sums.
+        :param predictions: The predictions of the model, shaped (batch, 1).
+        :param targets: The targets of the batch, shaped (batch, 1).
+        """
+        errors = numpy.asarray(predictions, dtype=numpy.float64).reshape(-1) - targets.reshape(-1)
+        self.samples += len(errors)
+        self.absolute_error += float(numpy.abs(errors).sum())
+        self.squared_error += float(numpy.square(errors).sum())
+
+    def result(self, hash_value: str) -> EvaluationResult:
+        """
+        Computes the mean errors accumulated so far.
+        :param hash_value: The Hash of the evaluated model.
+        :return: An EvaluationResult; its errors are NaN if no samples were accumulated (e.g. an empty hold-out),
+        rather than zero, which would rank the model as a perfect one.
+        """
+        if self.samples == 0:
+            return EvaluationResult(Hash=hash_value, Samples=0, MeanAbsoluteError=float('nan'),
+                                    MeanSquaredError=float('nan'))
+        return EvaluationResult(Hash=hash_value, Samples=self.samples,
+                                MeanAbsoluteError=self.absolute_error / self.samples,
+                                MeanSquaredError=self.squared_error / self.samples)
+
+
+class Evaluator:
+    """
+    Evaluates trained models on a hold-out period, many models at a time.
+    Models are grouped by the fields their test windows depend on; each group's windows are loaded once,
+    and every batch is streamed through all of the group's models before moving on to the next one.
+    Errors are accumulated incrementally, so that memory does not grow with the length of the hold-out period.
+    """
+
+    WINDOW_FIELD_NAMES = ('DatasetPath', 'DatasetTimeFilter', 'ColumnToPredict', 'WindowWidth')
+
+    def __init__(self, artifact_store: Optional[ArtifactStore] = None,
+                 load_model: Optional[Callable[[str], keras.Model]] = None, trainer: Optional[Trainer] = None,
+                 batch_size: int = 1024):
+        """
+        :param artifact_store: The store trained models are loaded from, by Hash.
+        :param load_model: A callable receiving a Hash and returning its trained model; overrides artifact_store.
+        :param trainer: The trainer whose DatasetCache hold-out datasets are loaded through.
+        :param batch_size: The amount of windows fed to every model at once.
+        """
+        if load_model is None and artifact_store is None:
+            raise MissingModelSourceException('Either an artifact store or a load_model callable must be given.')
+        self.__load_model = load_model or artifact_store.load_model
+        self.__trainer = trainer or Trainer()
+        self.__batch_size = batch_size
+
+    def group(self, training_params: Sequence[TrainingParams],
+              hold_out: Optional[DateRange] = None) -> list[list[TrainingParams]]:
+        """
+        Groups the given TrainingParams by the test windows they are evaluated on, keeping the first-seen order.
+        :param training_params: A sequence of TrainingParams of trained models.
+        :param hold_out: The period to evaluate on, replacing every DatasetTimeFilter;
+        if None, each model is evaluated on its own DatasetTimeFilter.
+        :return: A list of groups, each holding TrainingParams sharing their test windows.
+        """
+        groups: dict[str, list[TrainingParams]] = {}
+        for params in training_params:
+            if hold_out is not None:
+                params = dataclasses.replace(params, DatasetTimeFilter=hold_out)
+            groups.setdefault(PreparationPlanner.generate_key(params, self.WINDOW_FIELD_NAMES), []).append(params)
+        return list(groups.values())
+
+    def evaluate_group(self, group: Sequence[TrainingParams]) -> list[EvaluationResult]:
+        """
+        Evaluates a group of models sharing their test windows, in a single pass over the windows.
+        :param group: A sequence of TrainingParams sharing the fields in WINDOW_FIELD_NAMES.
+        :return: A list of EvaluationResult, in group order.
+        """
+        with instrumentation.stage('load', group[0].Hash):
+            dataset = self.__trainer.dataset_cache.get(group[0])
+        with instrumentation.stage('windowing', group[0].Hash):
+            windows = SlidingWindows(dataset, group[0].WindowWidth)
+        models = [self.__load_model(params.Hash) for params in group]
+        accumulators = [MetricAccumulator() for _ in group]
+        with instrumentation.stage('evaluate', group[0].Hash, Hashes=[params.Hash for params in group]):
+            for start in range(0, len(windows), self.__batch_size):
+                features, targets = windows.get_batch(slice(start, start + self.__batch_size))
+                targets = targets.astype(numpy.float64)
+                for model, accumulator in zip(models, accumulators):
+                    accumulator.update(model.predict_on_batch(features), targets)
+        instrumentation.count('evaluate.samples', len(windows) * len(group))
+        return [accumulator.result(params.Hash) for params, accumulator in zip(group, accumulators)]
+
+    def evaluate(self, training_params: Sequence[TrainingParams],
+                 hold_out: Optional[DateRange] = None) -> list[EvaluationResult]:
+        """
+        Evaluates the trained models of the given TrainingParams.
+        :param training_params: A sequence of TrainingParams of trained models, e.g. the top-N of a sweep.
+        :param hold_out: The period to evaluate on, replacing every DatasetTimeFilter;
+        if None, each model is evaluated on its own DatasetTimeFilter.
+        :return: A list of EvaluationResult, in the order of the given TrainingParams.
+        """
+        results = {result.Hash: result for group in self.group(training_params, hold_out)
+                   for result in self.evaluate_group(group)}
+        return [results[params.Hash] for params in training_params]
@@ -0,0 +1,164 @@
+import multiprocessing
+import os
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Optional
+
+from source.structs.dataset import Dataset, SharedDatasetHandle
+from source.structs.params import TrainingParams
+from source.structs.results import JobOutcome
+
+
+class GridRunner:
+    """
+    Runs unfolded TrainingParams on a pool of local worker processes.
+    Each worker is given its own slice of cores: intra-op and inter-op thread limits, and optionally a CPU affinity,
+    so that many narrow workers can share a large CPU box instead of one wide process scaling poorly.
+    If a checkpoint root is given, the run is resumable: completed combinations are skipped on restart,
+    and the default job resumes interrupted combinations from their last checkpoint.
+    If datasets are shared, the parent loads each distinct dataset once into shared memory, and every job attaches
+    to it instead of loading its own copy.
+    """
+
+    __worker_trainer = None
+    __worker_checkpoint_root = None
+
+    def __init__(self, workers: int, intra_op_threads: Optional[int] = None, inter_op_threads: int = 1,
+                 pin_cpus: bool = False, job: Optional[Callable[[TrainingParams], Any]] = None,
+                 checkpoint_root: Optional[Path] = None, share_datasets: bool = False):
+        """
+        :param workers: The amount of worker processes.
+        :param intra_op_threads: The amount of threads each worker may use within a single operation.
+        If None, available cores are split evenly among workers.
+        :param inter_op_threads: The amount of operations each worker may run concurrently.
+        :param pin_cpus: If True, each worker is bound to its own slice of cores.
+        :param job: A picklable callable run on each TrainingParams; if None, GridRunner.train is used.
+        :param checkpoint_root: The directory holding the checkpoints and the state of the sweep.
+        :param share_datasets: If True, datasets are published into shared memory by the parent process,
+        and the job is given the attached Dataset of each TrainingParams as its second argument.
+        """
+        self.__cpus = sorted(os.sched_getaffinity(0))
+        self.__workers = workers
+        self.__intra_op_threads = intra_op_threads or max(1, len(self.__cpus) // workers)
+        self.__inter_op_threads = inter_op_threads
+        self.__pin_cpus = pin_cpus
+        self.__job = job or GridRunner.train
+        self.__checkpoint_root = checkpoint_root
+        self.__share_datasets = share_datasets
+
+    def get_cpu_slices(self) -> list[list[int]]:
+        """
+        Splits the available cores into one slice per worker, wrapping around if there are not enough of them.
+        :return: A list holding the cores assigned to each worker.
+        """
+        return [[self.__cpus[(worker * self.__intra_op_threads + offset) % len(self.__cpus)]
+                 for offset in range(self.__intra_op_threads)]
+                for worker in range(self.__workers)]
+
+    @staticmethod
+    def initialize_worker(cpu_slices: multiprocessing.Queue, intra_op_threads: int, inter_op_threads: int,
+                          checkpoint_root: Optional[Path] = None, share_datasets: bool = False):
+        """
+        Limits the resources of the current worker process. Runs once per worker, before any job.
+        Thread limits are set through environment variables, which TensorFlow and OpenMP read on initialization.
+        :param cpu_slices: A queue holding the core slices not yet assigned to any worker, or None if not pinning.
+        :param intra_op_threads: The amount of threads the worker may use within a single operation.
+        :param inter_op_threads: The amount of operations the worker may run concurrently.
+        :param checkpoint_root: The directory the default job checkpoints into, or None if not checkpointing;
+        kept as state of the worker process, apart from the checkpoint root of any GridRunner instance.
+        """
+        GridRunner.__worker_trainer = None
+        GridRunner.__worker_checkpoint_root = checkpoint_root
+        os.environ['OMP_NUM_THREADS'] = str(intra_op_threads)
+        os.environ['TF_NUM_INTRAOP_THREADS'] = str(intra_op_threads)
+        os.environ['TF_NUM_INTEROP_THREADS'] = str(inter_op_threads)
+        if cpu_slices is not None:
+            os.sched_setaffinity(0, cpu_slices.get())
+
+    @staticmethod
+    def train(training_params: TrainingParams, dataset: Optional[Dataset] = None) -> Any:
+        """
+        The default job: trains the given TrainingParams with a Trainer shared by every job of the worker,
+        so that datasets are cached across jobs.
+        :param training_params: A TrainingParams instance.
+        :param dataset: The dataset of the TrainingParams, if already loaded (e.g. attached from shared memory).
+        :return: A TrainingResult.
+        """
+        from source.libs.checkpointStore import CheckpointStore
+        from source.libs.trainer import Trainer
+        if GridRunner.__worker_trainer is None:
+            checkpoint_root = GridRunner.__worker_checkpoint_root
+            GridRunner.__worker_trainer = Trainer(checkpoint_store=CheckpointStore(checkpoint_root)
+                                                  if checkpoint_root is not None else None)
+        if dataset is None:
+            return GridRunner.__worker_trainer.train(training_params)
+        return GridRunner.__worker_trainer.train(training_params,
+                                                 GridRunner.__worker_trainer.prepare(training_params, dataset=dataset))
+
+    @staticmethod
+    def run_attached(job: Callable[[TrainingParams, Dataset], Any], training_params: TrainingParams,
+                     handle: SharedDatasetHandle) -> Any:
+        """
+        Runs a job on a dataset published into shared memory, detaching from it once the job is done.
+        :param job: A picklable callable receiving the TrainingParams and its Dataset.
+        :param training_params: A TrainingParams instance.
+        :param handle: The handle of the dataset of the TrainingParams.
+        :return: The output of the job.
+        """
+        from source.libs.sharedDataset import SharedDatasetRegistry
+        with SharedDatasetRegistry.attached(handle) as dataset:
+            return job(training_params, dataset)
+
+    def run(self, unfolded_params: Sequence[TrainingParams]) -> Iterator[JobOutcome]:
+        """
+        Runs the job on every TrainingParams, streaming outcomes back as soon as each job completes.
+        When sharing datasets, every distinct dataset is published once, before its first job is submitted,
+        and shared memory is released once every job is done.
+        Jobs raising exceptions do not stop the run; their exceptions are reported in their outcomes,
+        as are those raised while publishing their datasets.
+        When checkpointing, combinations completed by previous runs are skipped, and every successful outcome
+        is recorded as completed as soon as it is yielded.
+        :param unfolded_params: A sequence of TrainingParams, usually returned by ParamsManager.unfold.
+        :return: An iterator over JobOutcome instances, in completion order.
+        """
+        checkpoint_store = None
+        if self.__checkpoint_root is not None:
+            from source.libs.checkpointStore import CheckpointStore
+            checkpoint_store = CheckpointStore(self.__checkpoint_root)
+            unfolded_params = checkpoint_store.start_sweep(unfolded_params)
+        context = multiprocessing.get_context('spawn')
+        cpu_slices = None
+        if self.__pin_cpus:
+            cpu_slices = context.Queue()
+            for cpu_slice in self.get_cpu_slices():
+                cpu_slices.put(cpu_slice)
+        registry = None
+        if self.__share_datasets:
+            from source.libs.sharedDataset import SharedDatasetRegistry
+            registry = SharedDatasetRegistry()
+        try:
+            with ProcessPoolExecutor(max_workers=self.__workers, mp_context=context,
+                                     initializer=GridRunner.initialize_worker,
+                                     initargs=(cpu_slices, self.__intra_op_threads, self.__inter_op_threads,
+                                               self.__checkpoint_root)) as executor:
+                futures = {}
+                for training_params in unfolded_params:
+                    if registry is None:
+                        futures[executor.submit(self.__job, training_params)] = training_params
+                        continue
+                    try:
+                        handle = registry.publish(training_params)
+                    except Exception as error:
+                        yield JobOutcome(Params=training_params, Result=None, Error=error)
+                        continue
+                    futures[executor.submit(GridRunner.run_attached, self.__job, training_params,
+                                            handle)] = training_params
+                for future in as_completed(futures):
+                    error = future.exception()
+                    if checkpoint_store is not None and error is None:
+                        checkpoint_store.mark_completed(futures[future].Hash, future.result())
+                    yield JobOutcome(Params=futures[future], Result=None if error else future.result(), Error=error)
+        finally:
+            if registry is not None:
+                registry.close()
@@ -0,0 +1,208 @@
+import contextlib
+import dataclasses
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional
+
+from source.structs.results import StageEvent, StageSummary
+
+
+class Instrumentation:
+    """
+    Times the stages of the pipeline, and counts what flows through them.
+    Stages are context managers named after the stage they wrap, optionally tagged with a TrainingParams Hash.
+    Recorded stages become events, exportable as JSON lines or as a Chrome trace (chrome://tracing, Perfetto);
+    every stage, recorded or not, is aggregated into a per-name summary.
+    When memory tracing is on, each event also holds the change of traced memory over the stage,
+    and the peak reached within it, both process-wide and measured through tracemalloc.
+    Instrumentation is disabled by default, in which case stages are a shared no-op context manager.
+    """
+
+    NULL_STAGE = contextlib.nullcontext()
+
+    def __init__(self, enabled: bool = False, trace_memory: bool = False,
+                 clock: Callable[[], float] = time.perf_counter):
+        """
+        :param enabled: Whether stages are measured.
+        :param trace_memory: Whether memory is traced along with time; only applies while enabled.
+        :param clock: The clock stages are timed with, returning seconds.
+        """
+        self.__clock = clock
+        self.__origin = clock()
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        self.__events: list[StageEvent] = []
+        self.__totals: dict[str, list[float]] = {}
+        self.__counters: dict[str, float] = {}
+        self.__enabled = False
+        self.__trace_memory = False
+        self.__started_tracemalloc = False
+        if enabled:
+            self.enable(trace_memory)
+
+    @property
+    def enabled(self) -> bool:
+        return self.__enabled
+
+    @property
+    def events(self) -> list[StageEvent]:
+        with self.__lock:
+            return list(self.__events)
+
+    @property
+    def counters(self) -> dict[str, float]:
+        with self.__lock:
+            return dict(self.__counters)
+
+    def enable(self, trace_memory: bool = False):
+        """
+        Starts measuring stages.
+        :param trace_memory: Whether memory is traced along with time; starts tracemalloc if it is not running.
+        """
+        self.__trace_memory = trace_memory
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__started_tracemalloc = True
+        self.__enabled = True
+
+    def disable(self):
+        """
+        Stops measuring stages, keeping what was measured so far.
+        Stops tracemalloc as well if it was started by Instrumentation.enable, so that its overhead ends here.
+        """
+        self.__enabled = False
+        self.__trace_memory = False
+        if self.__started_tracemalloc:
+            tracemalloc.stop()
+            self.__started_tracemalloc = False
+
+    def clear(self):
+        """
+        Drops every event, summary and counter, and restarts the clock.
+        """
+        with self.__lock:
+            self.__events.clear()
+            self.__totals.clear()
+            self.__counters.clear()
+            self.__origin = self.__clock()
+
+    def stage(self, name: str, hash_value: Optional[str] = None, record: bool = True,
+              **tags) -> contextlib.AbstractContextManager:
+        """
+        Measures the wrapped block as a stage of the pipeline.
+        :param name: The name of the stage, e.g. "load" or "train".
+        :param hash_value: The Hash of the TrainingParams the stage runs for, if any.
+        :param record: If False, the stage is only aggregated into the summary, without an event of its own;
+        meant for stages running once per combination over large grids.
+        :param tags: Additional JSON-serializable data stored along with the event.
+        :return: A context manager.
+        """
+        if not self.__enabled:
+            return self.NULL_STAGE
+        return self.__measure(name, hash_value, record, tags)
+
+    @contextmanager
+    def __measure(self, name: str, hash_value: Optional[str], record: bool, tags: dict[str, Any]) -> Iterator[None]:
+        """
+        Measures the wrapped block. Nested stages keep their parents' memory peaks intact,
+        by folding every peak they observe into the peaks of the stages they are nested in.
+        :param name: The name of the stage.
+        :param hash_value: The Hash of the TrainingParams the stage runs for, if any.
+        :param record: Whether an event is recorded for the stage.
+        :param tags: Additional data stored along with the event.
+        """
+        trace_memory = self.__trace_memory and tracemalloc.is_tracing()
+        if not hasattr(self.__local, 'peaks'):
+            self.__local.peaks = []
+        peaks = self.__local.peaks
+        start_memory = None
+        if trace_memory:
+            start_memory, peak_memory = tracemalloc.get_traced_memory()
+            if peaks:
+                peaks[-1] = max(peaks[-1], peak_memory)
+            tracemalloc.reset_peak()
+            peaks.append(start_memory)
+        start = self.__clock()
+        try:
+            yield
+        finally:
+            duration = self.__clock() - start
+            memory_delta, memory_peak = None, None
+            if trace_memory:
+                end_memory, peak_memory = tracemalloc.get_traced_memory()
+                stage_peak = max(peaks.pop(), peak_memory)
+                if peaks:
+                    peaks[-1] = max(peaks[-1], stage_peak)
+                memory_delta, memory_peak = end_memory - start_memory, stage_peak - start_memory
+            with self.__lock:
+                totals = self.__totals.setdefault(name, [0, 0.0, 0.0])
+                totals[0] += 1
+                totals[1] += duration
+                totals[2] = max(totals[2], duration)
+                if record:
+                    self.__events.append(StageEvent(Name=name, Hash=hash_value, Start=start - self.__origin,
+                                                    Duration=duration, ProcessId=os.getpid(),
+                                                    ThreadId=threading.get_ident(), MemoryDelta=memory_delta,
+                                                    MemoryPeak=memory_peak, Tags=tags))
+
+    def count(self, name: str, amount: float = 1):
+        """
+        Increments a counter, e.g. the amount of samples a stage went through.
+        :param name: The name of the counter.
+        :param amount: The amount to add.
+        """
+        if not self.__enabled:
+            return
+        with self.__lock:
+            self.__counters[name] = self.__counters.get(name, 0) + amount
+
+    def summary(self) -> list[StageSummary]:
+        """
+        Summarizes the time spent per stage, including the stages without events.
+        :return: A list of StageSummary, sorted by total time, longest first.
+        """
+        with self.__lock:
+            summaries = [StageSummary(Name=name, Count=count, Total=total, Mean=total / count, Max=maximum)
+                         for name, (count, total, maximum) in self.__totals.items()]
+        return sorted(summaries, key=lambda summary: summary.Total, reverse=True)
+
+    def export_jsonl(self, path: Path):
+        """
+        Writes every event as a JSON line, followed by a line per counter.
+        :param path: The path to the output file.
+        """
+        with path.open('w') as file:
+            for event in self.events:
+                file.write(json.dumps({'Type': 'stage', **dataclasses.asdict(event)}, default=str) + '\n')
+            for name, value in self.counters.items():
+                file.write(json.dumps({'Type': 'counter', 'Name': name, 'Value': value}) + '\n')
+
+    def export_chrome_trace(self, path: Path):
+        """
+        Writes every event in the Chrome trace event format, as complete events in microseconds,
+        followed by the final value of every counter.
+        :param path: The path to the output file.
+        """
+        trace_events = []
+        end = 0.0
+        for event in self.events:
+            arguments = {'Hash': event.Hash, **event.Tags}
+            if event.MemoryDelta is not None:
+                arguments.update(MemoryDelta=event.MemoryDelta, MemoryPeak=event.MemoryPeak)
+            trace_events.append({'name': event.Name, 'cat': 'stage', 'ph': 'X', 'ts': event.Start * 1e6,
+                                 'dur': event.Duration * 1e6, 'pid': event.ProcessId, 'tid': event.ThreadId,
+                                 'args': arguments})
+            end = max(end, event.Start + event.Duration)
+        for name, value in self.counters.items():
+            trace_events.append({'name': name, 'cat': 'counter', 'ph': 'C', 'ts': end * 1e6, 'pid': os.getpid(),
+                                 'args': {name: value}})
+        path.write_text(json.dumps({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, default=str))
+
+
+instrumentation = Instrumentation()
@@ -0,0 +1,252 @@
+import pickle
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+from source.structs.params import TrainingParams
+from source.structs.results import JobOutcome, QueuedJob
+
+
+class LeaseLostException(Exception):
+    pass
+
+
+class JobQueue:
+    """
+    A job queue of TrainingParams, keyed by Hash and backed by a single SQLite file,
+    so that workers on several machines sharing the file can claim jobs dynamically instead of splitting the grid
+    statically. Claims are atomic (write transactions are serialized by SQLite) and come with a lease:
+    workers must heartbeat while running a job, and jobs whose lease expired are handed to other workers,
+    until they run out of attempts.
+    The rollback journal is kept (rather than WAL), since WAL does not work on network file systems.
+    """
+
+    PENDING = 'pending'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+
+    def __init__(self, path: Path, lease_seconds: float = 300.0, max_attempts: int = 3, timeout: float = 60.0,
+                 clock: Callable[[], float] = time.time):
+        """
+        :param path: The path to the SQLite file; it is created if it does not exist.
+        :param lease_seconds: The amount of seconds a claim lasts without heartbeats.
+        :param max_attempts: The amount of claims a job gets before being marked as failed.
+        :param timeout: The amount of seconds to wait for other workers to release the file.
+        :param clock: The source of the current time, in seconds.
+        """
+        self.__path = path
+        self.__lease_seconds = lease_seconds
+        self.__max_attempts = max_attempts
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self.__connection.execute('CREATE TABLE IF NOT EXISTS jobs ('
+                                  'hash TEXT PRIMARY KEY, position INTEGER, params BLOB, status TEXT, '
+                                  'attempts INTEGER DEFAULT 0, worker TEXT, lease_expiry REAL, result BLOB, error TEXT)')
+        self.__connection.execute('CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, position)')
+
+    def __enter__(self) -> 'JobQueue':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    def __transaction(self, statements: Callable[[sqlite3.Connection], Any]) -> Any:
+        """
+        Runs the given statements in a write transaction, taking the database lock upfront
+        so that no other worker can interleave between reads and writes.
+        :param statements: A callable receiving the connection.
+        :return: The output of the callable.
+        """
+        with self.__lock:
+            self.__connection.execute('BEGIN IMMEDIATE')
+            try:
+                output = statements(self.__connection)
+            except BaseException:
+                self.__connection.execute('ROLLBACK')
+                raise
+            self.__connection.execute('COMMIT')
+            return output
+
+    def __expire_leases(self, connection: sqlite3.Connection):
+        """
+        Hands jobs whose lease expired back to the queue, or marks them as failed if they are out of attempts.
+        :param connection: The connection of the ongoing transaction.
+        """
+        connection.execute('UPDATE jobs SET status = CASE WHEN attempts < ? THEN ? ELSE ? END, worker = NULL, '
+                           "error = COALESCE(error, 'Lease expired.') WHERE status = ? AND lease_expiry < ?",
+                           (self.__max_attempts, self.PENDING, self.FAILED, self.RUNNING, self.__clock()))
+
+    def enqueue(self, unfolded_params: Sequence[TrainingParams]) -> int:
+        """
+        Adds the given TrainingParams to the queue, keeping their order. Jobs already queued are ignored,
+        so that every worker may feed the same grid safely.
+        :param unfolded_params: A sequence of TrainingParams, usually returned by ParamsManager.unfold.
+        :return: The amount of jobs added.
+        """
+        def insert(connection: sqlite3.Connection) -> int:
+            position = connection.execute('SELECT COALESCE(MAX(position), -1) + 1 FROM jobs').fetchone()[0]
+            cursor = connection.executemany(
+                'INSERT OR IGNORE INTO jobs (hash, position, params, status) VALUES (?, ?, ?, ?)',
+                [(training_params.Hash, position + offset, pickle.dumps(training_params), self.PENDING)
+                 for offset, training_params in enumerate(unfolded_params)])
+            return cursor.rowcount
+
+        return self.__transaction(insert)
+
+    def claim(self, worker_id: str) -> Optional[QueuedJob]:
+        """
+        Atomically claims the next pending job, handing expired jobs back to the queue first.
+        :param worker_id: The identifier of the claiming worker.
+        :return: The claimed job, or None if no job is pending.
+        """
+        def claim_next(connection: sqlite3.Connection) -> Optional[QueuedJob]:
+            self.__expire_leases(connection)
+            row = connection.execute('SELECT hash, params, attempts FROM jobs WHERE status = ? '
+                                     'ORDER BY position LIMIT 1', (self.PENDING,)).fetchone()
+            if row is None:
+                return None
+            hash_value, params, attempts = row
+            lease_expiry = self.__clock() + self.__lease_seconds
+            connection.execute('UPDATE jobs SET status = ?, worker = ?, lease_expiry = ?, attempts = ? WHERE hash = ?',
+                               (self.RUNNING, worker_id, lease_expiry, attempts + 1, hash_value))
+            return QueuedJob(Hash=hash_value, Params=pickle.loads(params), Attempts=attempts + 1, WorkerId=worker_id,
+                             LeaseExpiry=lease_expiry)
+
+        return self.__transaction(claim_next)
+
+    def __update_owned(self, job: QueuedJob, assignments: str, values: tuple):
+        """
+        Updates a job, provided that the given claim still holds its lease.
+        :param job: A job claimed through JobQueue.claim.
+        :param assignments: The SQL assignments to apply.
+        :param values: The values of the assignments.
+        """
+        def update(connection: sqlite3.Connection):
+            cursor = connection.execute(f'UPDATE jobs SET {assignments} '
+                                        'WHERE hash = ? AND worker = ? AND attempts = ? AND status = ?',
+                                        (*values, job.Hash, job.WorkerId, job.Attempts, self.RUNNING))
+            if cursor.rowcount == 0:
+                raise LeaseLostException(f'Worker "{job.WorkerId}" no longer holds the lease of job "{job.Hash}".')
+
+        self.__transaction(update)
+
+    def heartbeat(self, job: QueuedJob):
+        """
+        Extends the lease of a running job.
+        :param job: A job claimed through JobQueue.claim.
+        """
+        job.LeaseExpiry = self.__clock() + self.__lease_seconds
+        self.__update_owned(job, 'lease_expiry = ?', (job.LeaseExpiry,))
+
+    def complete(self, job: QueuedJob, result: Any = None):
+        """
+        Marks a running job as completed, storing its result.
+        :param job: A job claimed through JobQueue.claim.
+        :param result: A picklable result.
+        """
+        self.__update_owned(job, 'status = ?, result = ?, error = NULL', (self.COMPLETED, pickle.dumps(result)))
+
+    def fail(self, job: QueuedJob, error: str):
+        """
+        Hands a running job back to the queue, or marks it as failed if it is out of attempts.
+        :param job: A job claimed through JobQueue.claim.
+        :param error: A description of the failure.
+        """
+        status = self.PENDING if job.Attempts < self.__max_attempts else self.FAILED
+        self.__update_owned(job, 'status = ?, worker = NULL, error = ?', (status, error))
+
+    def expire_leases(self):
+        self.__transaction(self.__expire_leases)
+
+    def counts(self) -> dict[str, int]:
+        """
+        Counts jobs by status.
+        :return: A dictionary holding the amount of jobs of each status.
+        """
+        counts = {status: 0 for status in (self.PENDING, self.RUNNING, self.COMPLETED, self.FAILED)}
+        with self.__lock:
+            counts.update(self.__connection.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall())
+        return counts
+
+    def results(self) -> dict[str, Any]:
+        """
+        Collects the results of completed jobs.
+        :return: A dictionary holding the result of each completed job, keyed by Hash.
+        """
+        with self.__lock:
+            rows = self.__connection.execute('SELECT hash, result FROM jobs WHERE status = ? ORDER BY position',
+                                             (self.COMPLETED,)).fetchall()
+        return {hash_value: pickle.loads(result) for hash_value, result in rows}
+
+    def errors(self) -> dict[str, str]:
+        """
+        Collects the errors of failed jobs.
+        :return: A dictionary holding the last error of each failed job, keyed by Hash.
+        """
+        with self.__lock:
+            rows = self.__connection.execute('SELECT hash, error FROM jobs WHERE status = ? ORDER BY position',
+                                             (self.FAILED,)).fetchall()
+        return dict(rows)
+
+    def work(self, worker_id: str, job: Callable[[TrainingParams], Any], heartbeat_seconds: Optional[float] = None,
+             poll_seconds: Optional[float] = None) -> Iterator[JobOutcome]:
+        """
+        Claims and runs jobs until none is pending or running, heartbeating from a background thread while each job
+        runs. While other workers still run jobs, the worker keeps polling, so that the jobs of workers that died
+        are reclaimed once their lease expires.
+        Jobs raising exceptions are handed back to the queue (or failed) and do not stop the worker.
+        Jobs whose lease was lost meanwhile are reported with a LeaseLostException, as another worker may own them.
+        :param worker_id: The identifier of the worker, unique across machines.
+        :param job: A callable run on each TrainingParams, returning a picklable result.
+        :param heartbeat_seconds: The amount of seconds between heartbeats; defaults to a third of the lease.
+        :param poll_seconds: The amount of seconds between claims while no job is pending;
+        defaults to a tenth of the lease.
+        :return: An iterator over JobOutcome instances, in claim order.
+        """
+        heartbeat_seconds = heartbeat_seconds or self.__lease_seconds / 3
+        poll_seconds = poll_seconds or self.__lease_seconds / 10
+        while True:
+            queued_job = self.claim(worker_id)
+            if queued_job is None:
+                if self.counts()[self.RUNNING] == 0:
+                    return
+                time.sleep(poll_seconds)
+                continue
+            stopped = threading.Event()
+
+            def keep_alive():
+                while not stopped.wait(heartbeat_seconds):
+                    try:
+                        self.heartbeat(queued_job)
+                    except LeaseLostException:
+                        return
+
+            heartbeat_thread = threading.Thread(target=keep_alive, daemon=True)
+            heartbeat_thread.start()
+            result, error = None, None
+            try:
+                result = job(queued_job.Params)
+            except Exception as job_error:
+                error = job_error
+            stopped.set()
+            heartbeat_thread.join()
+            try:
+                if error is None:
+                    self.complete(queued_job, result)
+                else:
+                    self.fail(queued_job, repr(error))
+            except LeaseLostException as lease_error:
+                error = error or lease_error
+            yield JobOutcome(Params=queued_job.Params, Result=result, Error=error)
+
+    def close(self):
+        self.__connection.close()
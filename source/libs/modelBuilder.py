@@ -0,0 +1,152 @@
+from collections.abc import Callable, Sequence
+from typing import Any, Optional
+
+import keras
+
+from source.structs.params import TrainingParams, LayerParams
+
+
+class RegularizedLoss(keras.losses.Loss):
+    """
+    The loss of a head of a packed model, holding the regularization losses of the head's weights as well,
+    so that every head is trained, and evaluated, on the same loss as its standalone model.
+    The regularization of the last step is kept, as computed before the weights are updated,
+    since Keras computes metrics only afterwards.
+    """
+
+    def __init__(self, loss: Callable, variables: Sequence[keras.Variable], name: Optional[str] = None):
+        """
+        :param loss: The loss of the head; its regularizers are taken over by this loss.
+        :param variables: The weights of the head.
+        :param name: The name of the loss.
+        """
+        super().__init__(name=name)
+        self.__loss = getattr(loss, 'call', loss)
+        self.__regularizers = [(variable, variable.regularizer) for variable in variables
+                               if variable.regularizer is not None]
+        self.__regularization = keras.Variable(0.0, trainable=False)
+
+    def call(self, y_true, y_pred):
+        regularization = keras.ops.convert_to_tensor(0.0)
+        for variable, regularizer in self.__regularizers:
+            regularization = regularization + regularizer(variable)
+        self.__regularization.assign(regularization)
+        return self.__loss(y_true, y_pred) + regularization
+
+    def sample_loss(self, y_true, y_pred):
+        """
+        The per-sample loss of the head, using the regularization of the last step.
+        :param y_true: The targets.
+        :param y_pred: The predictions of the head.
+        :return: A tensor holding the loss of each sample.
+        """
+        return self.__loss(y_true, y_pred) + self.__regularization
+
+
+class ModelBuilder:
+    """
+    Builds and compiles Keras models out of TrainingParams.
+    Every model flattens its input window, runs it through one Dense layer per LayerStack entry (in key order),
+    and predicts a single value.
+    """
+
+    @staticmethod
+    def instantiate(obj: Optional[Callable]) -> Any:
+        """
+        Instantiates classes (such as keras.optimizers.RMSprop), leaving any other object untouched.
+        :param obj: A class, a plain callable, or None.
+        :return: An instance of the class, or the original object.
+        """
+        return obj() if isinstance(obj, type) else obj
+
+    @staticmethod
+    def build_dense(layer_params: LayerParams) -> keras.layers.Dense:
+        """
+        Builds a Dense layer out of a LayerParams instance.
+        :param layer_params: A LayerParams instance.
+        :return: A new Dense layer.
+        """
+        layer_kwargs = {'units': layer_params.Units,
+                        'kernel_initializer': ModelBuilder.instantiate(layer_params.KernelInitializer),
+                        'kernel_regularizer': ModelBuilder.instantiate(layer_params.KernelRegularizer),
+                        'activation': ModelBuilder.instantiate(layer_params.Activation)}
+        return keras.layers.Dense(**{key: value for key, value in layer_kwargs.items() if value is not None})
+
+    def build_outputs(self, training_params: TrainingParams, inputs: keras.KerasTensor, target_index: int,
+                      name: Optional[str] = None) -> keras.KerasTensor:
+        """
+        Builds the layers described by the given TrainingParams on top of an input tensor.
+        If PrependBatchNormLayer is set, the input is normalized first, and SetTrainingFlag is passed
+        as the "training" argument of that normalization layer.
+        If UseResidualWrapper is set, the model predicts the change from the last value of the target column.
+        :param training_params: A TrainingParams instance.
+        :param inputs: A tensor shaped (batch, window_width, features).
+        :param target_index: The position of the column to predict among the features.
+        :param name: The name of the output layer.
+        :return: The output tensor, shaped (batch, 1).
+        """
+        outputs = inputs
+        if training_params.PrependBatchNormLayer:
+            outputs = keras.layers.BatchNormalization()(outputs, training=training_params.SetTrainingFlag)
+        outputs = keras.layers.Flatten()(outputs)
+        for layer_index in sorted(training_params.LayerStack.keys()):
+            outputs = self.build_dense(training_params.LayerStack[layer_index])(outputs)
+        if training_params.UseResidualWrapper:
+            outputs = keras.layers.Dense(1)(outputs)
+            last_values = inputs[:, -1, target_index:target_index + 1]
+            return keras.layers.Add(name=name)([outputs, last_values])
+        return keras.layers.Dense(1, name=name)(outputs)
+
+    def build_model(self, training_params: TrainingParams, input_shape: tuple[int, int],
+                    target_index: int) -> keras.Model:
+        """
+        Builds the model described by the given TrainingParams, without compiling it.
+        :param training_params: A TrainingParams instance.
+        :param input_shape: The shape of each sample, i.e. (window_width, features).
+        :param target_index: The position of the column to predict among the features.
+        :return: An uncompiled Keras model, with freshly initialized weights.
+        """
+        inputs = keras.Input(shape=input_shape)
+        return keras.Model(inputs, self.build_outputs(training_params, inputs, target_index))
+
+    def build(self, training_params: TrainingParams, input_shape: tuple[int, int], target_index: int) -> keras.Model:
+        """
+        Builds and compiles the model described by the given TrainingParams.
+        :param training_params: A TrainingParams instance.
+        :param input_shape: The shape of each sample, i.e. (window_width, features).
+        :param target_index: The position of the column to predict among the features.
+        :return: A compiled Keras model.
+        """
+        model = self.build_model(training_params, input_shape, target_index)
+        model.compile(optimizer=self.instantiate(training_params.CompileOptimizer),
+                      loss=self.instantiate(training_params.CompileLossFunction))
+        return model
+
+    def build_packed(self, packed_params: Sequence[TrainingParams], input_shape: tuple[int, int],
+                     target_index: int) -> keras.Model:
+        """
+        Builds and compiles a single model holding one independent head per TrainingParams, all fed the same input.
+        Heads are named after their Hash, and each one is given its own loss. Since heads share no weights,
+        and optimizers update each weight on its own, every head trains as its standalone model would.
+        Regularization losses are moved out of the model into the loss of their head (see RegularizedLoss).
+        Keras averages per-output losses over batches regardless of their size, so each head also tracks
+        a "sample_loss" metric, averaged over samples like the loss of a standalone model.
+        :param packed_params: A sequence of TrainingParams sharing the same CompileOptimizer.
+        :param input_shape: The shape of each sample, i.e. (window_width, features).
+        :param target_index: The position of the column to predict among the features.
+        :return: A compiled Keras model, whose outputs and losses are keyed by Hash.
+        """
+        inputs = keras.Input(shape=input_shape)
+        outputs = {training_params.Hash: self.build_outputs(training_params, inputs, target_index,
+                                                            name=training_params.Hash)
+                   for training_params in packed_params}
+        losses = {training_params.Hash: RegularizedLoss(self.instantiate(training_params.CompileLossFunction),
+                                                        keras.Model(inputs, outputs[training_params.Hash]).weights)
+                  for training_params in packed_params}
+        model = keras.Model(inputs, outputs)
+        for variable in model.weights:
+            variable.regularizer = None
+        model.compile(optimizer=self.instantiate(packed_params[0].CompileOptimizer), loss=losses,
+                      metrics={output_name: [keras.metrics.MeanMetricWrapper(loss.sample_loss, name='sample_loss')]
+                               for output_name, loss in losses.items()})
+        return model
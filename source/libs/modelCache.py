@@ -0,0 +1,111 @@
+import dataclasses
+from collections import OrderedDict
+from typing import Optional
+
+import keras
+import numpy
+
+from source.libs.helper import Helper
+from source.libs.modelBuilder import ModelBuilder
+from source.structs.params import TrainingParams
+
+
+class ModelCache:
+    """
+    An in-process cache of built and compiled models, shared by every TrainingParams with the same architecture,
+    so that compilation and tracing run once per architecture.
+    Whenever a cached model is handed out again, its weights are initialized anew in place, by running the initializer
+    of every layer variable in building order, and its optimizer state is restored to the snapshot taken right after
+    building. Initializers draw from the global random state, so reused models start exactly where a model rebuilt
+    with the same seed would, and runs without a seed start from different weights.
+    """
+
+    ARCHITECTURE_FIELD_NAMES = ('LayerStack', 'UseResidualWrapper', 'PrependBatchNormLayer', 'SetTrainingFlag',
+                                'CompileLossFunction', 'CompileOptimizer')
+    INITIALIZED_VARIABLE_NAMES = {'kernel_initializer': 'kernel', 'recurrent_initializer': 'recurrent_kernel',
+                                  'bias_initializer': 'bias', 'gamma_initializer': 'gamma', 'beta_initializer': 'beta',
+                                  'moving_mean_initializer': 'moving_mean',
+                                  'moving_variance_initializer': 'moving_variance'}
+
+    def __init__(self, model_builder: Optional[ModelBuilder] = None, max_models: int = 32):
+        """
+        :param model_builder: The builder models are created with on cache misses.
+        :param max_models: The amount of models kept; least recently used models are evicted first.
+        """
+        self.__model_builder = model_builder or ModelBuilder()
+        self.__max_models = max_models
+        self.__entries: OrderedDict[str, tuple[keras.Model, list[numpy.ndarray]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @staticmethod
+    def generate_key(training_params: TrainingParams, input_shape: tuple[int, int], target_index: int) -> str:
+        """
+        Generates the architecture sub-hash of the given TrainingParams, i.e. a key ignoring data and fit settings.
+        :param training_params: A TrainingParams instance.
+        :param input_shape: The shape of each sample, i.e. (window_width, features).
+        :param target_index: The position of the column to predict among the features.
+        :return: An MD5 hash string.
+        """
+        architecture = {name: getattr(training_params, name) for name in ModelCache.ARCHITECTURE_FIELD_NAMES}
+        architecture['LayerStack'] = {layer_index: dataclasses.asdict(layer_params)
+                                      for layer_index, layer_params in training_params.LayerStack.items()}
+        architecture['InputShape'] = list(input_shape)
+        architecture['TargetIndex'] = target_index
+        return Helper.generate_hash(architecture)
+
+    @staticmethod
+    def initialize(model: keras.Model):
+        """
+        Initializes the weights of a model anew, in place, with the initializers of its own layers.
+        Unseeded initializers draw their seed from the global random state once created, so each one is created again
+        out of its config, in the order a new model would create it.
+        :param model: A built model.
+        """
+        for layer in model.layers:
+            for initializer_name, variable_name in ModelCache.INITIALIZED_VARIABLE_NAMES.items():
+                initializer = getattr(layer, initializer_name, None)
+                variable = getattr(layer, variable_name, None)
+                if initializer is not None and isinstance(variable, keras.Variable):
+                    initializer = type(initializer).from_config(initializer.get_config())
+                    variable.assign(initializer(variable.shape, dtype=variable.dtype))
+
+    @staticmethod
+    def __reset(model: keras.Model, optimizer_variables: list[numpy.ndarray]):
+        """
+        Initializes the weights of a cached model anew, and restores its optimizer state.
+        :param model: A cached model.
+        :param optimizer_variables: The initial values of the optimizer variables.
+        """
+        ModelCache.initialize(model)
+        for variable, value in zip(model.optimizer.variables, optimizer_variables):
+            variable.assign(value)
+
+    def get(self, training_params: TrainingParams, input_shape: tuple[int, int], target_index: int) -> keras.Model:
+        """
+        Retrieves a compiled model with freshly initialized weights, compiling it only if its architecture is not cached.
+        :param training_params: A TrainingParams instance.
+        :param input_shape: The shape of each sample, i.e. (window_width, features).
+        :param target_index: The position of the column to predict among the features.
+        :return: A compiled Keras model.
+        """
+        key = self.generate_key(training_params, input_shape, target_index)
+        if key in self.__entries:
+            self.hits += 1
+            self.__entries.move_to_end(key)
+            model, optimizer_variables = self.__entries[key]
+            self.__reset(model, optimizer_variables)
+            return model
+        self.misses += 1
+        model = self.__model_builder.build(training_params, input_shape, target_index)
+        model.optimizer.build(model.trainable_variables)
+        self.__entries[key] = (model, [variable.numpy() for variable in model.optimizer.variables])
+        while len(self.__entries) > self.__max_models:
+            self.__entries.popitem(last=False)
+        return model
+
+    def clear(self):
+        self.__entries.clear()
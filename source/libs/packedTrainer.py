@@ -0,0 +1,127 @@
+from collections.abc import Iterator, Sequence
+from typing import Optional
+
+import keras
+
+from source.libs.preparationPlanner import PreparationFieldNames, PreparationPlanner
+from source.libs.trainer import Trainer
+from source.structs.params import TrainingParams
+from source.structs.results import TrainingResult
+
+
+class PackedEarlyStopping(keras.callbacks.Callback):
+    """
+    Applies early stopping to each head of a packed model on its own, following keras.callbacks.EarlyStopping
+    on the head's loss. Stopped heads keep training along with the others, but their history is cut
+    at the epoch they stopped at; training ends once every head has stopped.
+    """
+
+    def __init__(self, monitors: dict[str, str], patience: int):
+        """
+        :param monitors: The name of the loss logged for each head, keyed by head name.
+        :param patience: The amount of epochs without improvement before a head stops.
+        """
+        super().__init__()
+        self.__monitors = monitors
+        self.__output_names = list(monitors)
+        self.__patience = patience
+        self.__best: dict[str, Optional[float]] = {}
+        self.__wait: dict[str, int] = {}
+        self.stopped_epochs: dict[str, int] = {}
+
+    def on_train_begin(self, logs: Optional[dict] = None):
+        self.__best = {output_name: None for output_name in self.__output_names}
+        self.__wait = {output_name: 0 for output_name in self.__output_names}
+        self.stopped_epochs = {}
+
+    def on_epoch_end(self, epoch: int, logs: Optional[dict] = None):
+        for output_name in self.__output_names:
+            if output_name in self.stopped_epochs:
+                continue
+            current = (logs or {}).get(self.__monitors[output_name])
+            if current is None:
+                continue
+            self.__wait[output_name] += 1
+            if self.__best[output_name] is None or current < self.__best[output_name]:
+                self.__best[output_name] = current
+                self.__wait[output_name] = 0
+            elif self.__wait[output_name] >= self.__patience and epoch > 0:
+                self.stopped_epochs[output_name] = epoch + 1
+        if len(self.stopped_epochs) == len(self.__output_names):
+            self.model.stop_training = True
+
+
+class PackedTrainer:
+    """
+    Trains many small models at once, by packing the TrainingParams sharing their data, optimizer and fit settings
+    into a single model with one independent head per TrainingParams.
+    One pass over the data then trains every head, amortizing the input pipeline and per-step overhead.
+    """
+
+    PACK_FIELD_NAMES = (*PreparationFieldNames.Preparation, 'CompileOptimizer', 'FitMaxEpochs', 'FitPatience')
+
+    def __init__(self, trainer: Optional[Trainer] = None, max_heads: int = 16):
+        """
+        :param trainer: The trainer data is prepared and packed models are built with.
+        :param max_heads: The maximum amount of heads per packed model.
+        """
+        self.__trainer = trainer or Trainer()
+        self.__max_heads = max_heads
+
+    @property
+    def trainer(self) -> Trainer:
+        return self.__trainer
+
+    @staticmethod
+    def get_monitors(output_names: Sequence[str]) -> dict[str, str]:
+        """
+        Maps each head to the name of its per-sample loss metric (see ModelBuilder.build_packed) in the training logs.
+        Keras only prefixes metrics with output names for models with more than one output.
+        :param output_names: The names of the heads.
+        :return: A dictionary holding the name of the loss of each head, keyed by head name.
+        """
+        if len(output_names) == 1:
+            return {output_names[0]: 'sample_loss'}
+        return {output_name: f'{output_name}_sample_loss' for output_name in output_names}
+
+    def pack(self, unfolded_params: Sequence[TrainingParams]) -> list[list[TrainingParams]]:
+        """
+        Groups the given TrainingParams into packs, keeping their first-seen order.
+        :param unfolded_params: A sequence of TrainingParams, usually returned by ParamsManager.unfold.
+        :return: A list of packs, each holding up to max_heads TrainingParams.
+        """
+        groups: dict[str, list[TrainingParams]] = {}
+        for training_params in unfolded_params:
+            groups.setdefault(PreparationPlanner.generate_key(training_params, self.PACK_FIELD_NAMES),
+                              []).append(training_params)
+        return [members[start:start + self.__max_heads]
+                for members in groups.values() for start in range(0, len(members), self.__max_heads)]
+
+    def train_pack(self, packed_params: Sequence[TrainingParams]) -> list[TrainingResult]:
+        """
+        Trains a pack of TrainingParams as a single model.
+        :param packed_params: A pack of TrainingParams, as returned by PackedTrainer.pack.
+        :return: A list holding the TrainingResult of each TrainingParams, in pack order.
+        """
+        output_names = [training_params.Hash for training_params in packed_params]
+        data = self.__trainer.prepare(packed_params[0], output_names=output_names)
+        model = self.__trainer.build_packed(packed_params, data)
+        monitors = self.get_monitors(output_names)
+        early_stopping = PackedEarlyStopping(monitors, packed_params[0].FitPatience)
+        history = model.fit(data, epochs=packed_params[0].FitMaxEpochs, callbacks=[early_stopping],
+                            shuffle=False, verbose=0).history
+        results = []
+        for output_name in output_names:
+            losses = [float(value) for value in history[monitors[output_name]]]
+            epochs = early_stopping.stopped_epochs.get(output_name, len(losses))
+            results.append(TrainingResult(Hash=output_name, Epochs=epochs, History={'loss': losses[:epochs]}))
+        return results
+
+    def train(self, unfolded_params: Sequence[TrainingParams]) -> Iterator[TrainingResult]:
+        """
+        Packs and trains the given TrainingParams.
+        :param unfolded_params: A sequence of TrainingParams, usually returned by ParamsManager.unfold.
+        :return: An iterator over TrainingResult instances, in pack order.
+        """
+        for packed_params in self.pack(unfolded_params):
+            yield from self.train_pack(packed_params)
@@ -1,29 +1,60 @@
 import copy
 import dataclasses
-from collections.abc import Sized
+from collections.abc import Hashable, Sequence, Sized
 from dataclasses import dataclass
 from functools import reduce
 from typing import Any, Type
 
 from source.libs.helper import Helper
+from source.libs.instrumentation import instrumentation
 from source.structs.params import (TrainingParamsCombinations as TrainParamsCombs,
                                    TrainingParams as TrainParams, LayerParams)
 
 
+class InvalidTieException(Exception):
+    pass
+
+
+class InvalidOrderingException(Exception):
+    pass
+
+
 @dataclass
 class FieldNames:
     Hash: str = 'Hash'
     LayerStack: str = 'LayerStack'
+    Units: str = 'Units'
+    Ties: str = 'Ties'
+    UnitsScale: str = 'UnitsScale'
 
 
 class ParamsManager:
     """
     A utility class that provides common functionality for parameter-related objects,
     such as TrainingParamsCombinations, LayerParamsCombinations, TrainingParams, and LayerParams.
+    Combinations are unfolded either in lexicographic order, where the first factor varies fastest,
+    or in (mixed-radix, reflected) Gray code order, where consecutive combinations differ in a single factor.
     """
 
-    def __init__(self, field_names: Type[FieldNames] = FieldNames):
+    LEXICOGRAPHIC = 'lexicographic'
+    GRAY = 'gray'
+    ORDERINGS = (LEXICOGRAPHIC, GRAY)
+    DATA_PRIORITIES = ('DatasetPath', 'DatasetTimeFilter', 'ColumnToPredict', 'WindowWidth', 'DatasetShuffle',
+                       'DatasetBatchSize')
+
+    def __init__(self, field_names: Type[FieldNames] = FieldNames, ordering: str = LEXICOGRAPHIC,
+                 priorities: Sequence[str] = ()):
+        """
+        :param field_names: The names of the fields handled specially.
+        :param ordering: One of ParamsManager.ORDERINGS.
+        :param priorities: The names of the TrainingParamsCombinations fields to vary slowest, slowest first,
+        e.g. ParamsManager.DATA_PRIORITIES, so that the data caches are hit by consecutive combinations.
+        """
+        if ordering not in self.ORDERINGS:
+            raise InvalidOrderingException(f'Unknown ordering ({ordering}); expected one of {self.ORDERINGS}.')
         self.__field_name = field_names
+        self.__gray = ordering == self.GRAY
+        self.__priorities = tuple(priorities)
 
     @staticmethod
     def __clear_empty_keys(dictionary: dict) -> dict:
@@ -39,11 +70,16 @@ class ParamsManager:
         return mutable_dict
 
     @staticmethod
-    def __generate_cartesian_product(factors: dict[str | int, list[Any]]) -> list[dict[str | int, Any]]:
+    def __generate_cartesian_product(factors: dict[Hashable, list[Any]],
+                                     gray: bool = False) -> list[dict[Hashable, Any]]:
         """
         Computes the Cartesian product of the provided factors, transforming a dict of value lists
         into a list of dicts, each containing one possible combination of values.
+        Combinations are counted in mixed radix, with the first factor as the least significant digit.
+        In Gray code order, each digit runs backwards whenever the number made of the more significant digits is odd,
+        so that every step changes a single digit.
         :param factors: A dict mapping keys to lists of values.
+        :param gray: If True, combinations are ordered as a Gray code; otherwise, lexicographically.
         :return: A list of dicts, each representing a unique combination of values.
         """
         total_combs = reduce(lambda aggregation, item: (aggregation * len(item)), factors.values(), 1)
@@ -53,10 +89,90 @@ class ParamsManager:
             element = {}
             for key, values in zip(factors.keys(), factors.values()):
                 quotient, remainder = divmod(quotient, len(values))
+                if gray and quotient % 2 == 1:
+                    remainder = len(values) - 1 - remainder
                 element[key] = values[remainder]
             product.append(element)
         return product
 
+    def __prioritize(self, factors: dict[str, list[Any]]) -> dict[str, list[Any]]:
+        """
+        Reorders the given factors so that prioritized ones become the most significant digits.
+        :param factors: A dict mapping field names to lists of values.
+        :return: A reordered copy of the dict.
+        """
+        unknown_names = [name for name in self.__priorities if name not in factors]
+        if unknown_names:
+            raise InvalidOrderingException(f'Prioritized fields {unknown_names} are not combination fields.')
+        prioritized_factors = {key: values for key, values in factors.items() if key not in self.__priorities}
+        for name in reversed(self.__priorities):
+            prioritized_factors[name] = factors[name]
+        return prioritized_factors
+
+    def __build_stack_factors(self, plain_stack_combs: dict[int, dict[str, Any]]) -> tuple[
+            dict[tuple[int, str], list[Any]], dict[tuple[int, str], tuple[int, str]], dict[int, float]]:
+        """
+        Lists the factors of a stack of layer combinations: one per layer field, except for tied fields.
+        Layers tying a field to the same group share a single factor, taken from the first of them, which must declare
+        values for that field, so that the product runs over groups instead of layers.
+        :param plain_stack_combs: A plain stack where each key is an index and each value is a dict representing
+        a LayerParamsCombinations.
+        :return: A tuple with the factors, keyed by (layer index, field name); the key of the factor every
+        layer field takes its value from, in stack order; and the scale of every layer whose Units are tied.
+        """
+        factors = {}
+        sources = {}
+        scales = {}
+        leaders = {}
+        for layer_index in range(len(plain_stack_combs)):
+            plain_layer_combs = dict(plain_stack_combs[layer_index])
+            ties = plain_layer_combs.pop(self.__field_name.Ties, None) or {}
+            units_scale = plain_layer_combs.pop(self.__field_name.UnitsScale, None)
+            for name in ties:
+                if name not in plain_layer_combs:
+                    raise InvalidTieException(f'Layer {layer_index} ties an unknown field ("{name}").')
+            if units_scale is not None and units_scale <= 0:
+                raise InvalidTieException(f'Layer {layer_index} scales its Units by a non-positive factor '
+                                          f'({units_scale}).')
+            sanitized_layer_combs = self.__clear_empty_keys(plain_layer_combs)
+            names = list(sanitized_layer_combs) + [name for name in ties if name not in sanitized_layer_combs]
+            for name in names:
+                key = (layer_index, name)
+                group = (name, ties[name]) if name in ties else None
+                if group in leaders:
+                    sources[key] = leaders[group]
+                elif name in sanitized_layer_combs:
+                    if group is not None:
+                        leaders[group] = key
+                    factors[key] = sanitized_layer_combs[name]
+                    sources[key] = key
+                else:
+                    raise InvalidTieException(f'Layer {layer_index} ties field "{name}" to group "{ties[name]}" '
+                                              f'before any layer declares values for it.')
+                if name == self.__field_name.Units and group is not None and units_scale is not None:
+                    scales[layer_index] = units_scale
+        return factors, sources, scales
+
+    def __unfold_stack(self, plain_stack_combs: dict[int, dict[str, Any]]) -> list[dict[int, dict[str, Any]]]:
+        """
+        Expands a stack of layer combinations into every stack it describes.
+        Without ties, this is the Cartesian product of every layer's own Cartesian product.
+        :param plain_stack_combs: A plain stack where each key is an index and each value is a dict representing
+        a LayerParamsCombinations.
+        :return: A list of plain stacks, where each key is an index and each value is a dict representing a layer.
+        """
+        factors, sources, scales = self.__build_stack_factors(plain_stack_combs)
+        unfolded_stacks = []
+        for chosen_values in self.__generate_cartesian_product(factors, self.__gray):
+            stack = {layer_index: {} for layer_index in range(len(plain_stack_combs))}
+            for (layer_index, name), source in sources.items():
+                value = chosen_values[source]
+                if name == self.__field_name.Units and layer_index in scales:
+                    value = max(1, round(value * scales[layer_index]))
+                stack[layer_index][name] = value
+            unfolded_stacks.append(stack)
+        return unfolded_stacks
+
     @staticmethod
     def __build_stack(stack: dict[int, dict[str, Any]]) -> dict[int, LayerParams]:
         """
@@ -77,17 +193,51 @@ class ParamsManager:
         """
         built_objects = []
         for plain_params in unfolded_params:
-            plain_params[self.__field_name.Hash] = Helper.generate_hash(plain_params)
-            plain_params[self.__field_name.LayerStack] = self.__build_stack(plain_params[self.__field_name.LayerStack])
-            built_objects.append(TrainParams(**plain_params))
+            with instrumentation.stage('hash', record=False):
+                plain_params[self.__field_name.Hash] = Helper.generate_hash(plain_params)
+            with instrumentation.stage('build_objects', record=False):
+                plain_params[self.__field_name.LayerStack] = self.__build_stack(
+                    plain_params[self.__field_name.LayerStack])
+                built_objects.append(TrainParams(**plain_params))
         return built_objects
 
+    def count(self, training_combs: TrainParamsCombs) -> int:
+        """
+        Computes the amount of TrainParams the given TrainParamsCombs instance unfolds into, without unfolding it.
+        :param training_combs: A TrainParamsCombs instance.
+        :return: The amount of combinations.
+        """
+        total_combs = 1
+        for field in dataclasses.fields(training_combs):
+            values = getattr(training_combs, field.name)
+            if field.name == self.__field_name.LayerStack:
+                total_stacks = 0
+                for stack_combs in values:
+                    plain_stack_combs = {index: dataclasses.asdict(layer_combs)
+                                         for index, layer_combs in stack_combs.items()}
+                    factors, _, _ = self.__build_stack_factors(plain_stack_combs)
+                    total_stacks += reduce(lambda aggregation, item: (aggregation * len(item)), factors.values(), 1)
+                total_combs *= total_stacks
+            else:
+                total_combs *= len(values)
+        return total_combs
+
     def unfold(self, training_combs: TrainParamsCombs) -> list[TrainParams]:
         """
         Expands a TrainParamsCombs instance into a Cartesian product of TrainParams combinations.
         :param training_combs: A TrainParamsCombs instance.
         :return: A list of TrainParams instances, each representing a unique combination of parameter values.
         """
+        with instrumentation.stage('unfold'):
+            return self.__unfold(training_combs)
+
+    def __unfold(self, training_combs: TrainParamsCombs) -> list[TrainParams]:
+        """
+        For internal use only.
+        Expands a TrainParamsCombs instance, as described in ParamsManager.unfold.
+        :param training_combs: A TrainParamsCombs instance.
+        :return: A list of TrainParams instances.
+        """
         plain_combs = dataclasses.asdict(training_combs)
         mutable_combs = copy.deepcopy(plain_combs)
         for key, values in zip(plain_combs.keys(), plain_combs.values()):
@@ -95,14 +245,9 @@ class ParamsManager:
                 case self.__field_name.LayerStack:
                     unfolded_stacks = []
                     for plain_stack_combs in values:
-                        unfolded_layers_stack = {}
-                        for layer_index in range(len(plain_stack_combs)):
-                            plain_layer_combs = plain_stack_combs[layer_index]
-                            sanitized_layer_combs = self.__clear_empty_keys(plain_layer_combs)
-                            unfolded_layer = self.__generate_cartesian_product(sanitized_layer_combs)
-                            unfolded_layers_stack[layer_index] = unfolded_layer
-                        unfolded_stacks.extend(self.__generate_cartesian_product(unfolded_layers_stack))
+                        unfolded_stacks.extend(self.__unfold_stack(plain_stack_combs))
                     mutable_combs[key] = unfolded_stacks
                     break
-        unfolded_params = self.__generate_cartesian_product(mutable_combs)
+        unfolded_params = self.__generate_cartesian_product(self.__prioritize(mutable_combs), self.__gray)
+        instrumentation.count('unfold.combinations', len(unfolded_params))
         return self.__build_objects(unfolded_params)
@@ -0,0 +1,268 @@
+import asyncio
+import dataclasses
+import json
+import re
+import time
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional
+
+import keras
+import numpy
+
+from source.libs.artifactStore import ArtifactStore
+from source.structs.results import ServingStatistics
+
+
+class InvalidSampleException(Exception):
+    pass
+
+
+class InvalidHashException(Exception):
+    pass
+
+
+class MicroBatcher:
+    """
+    Collects concurrent prediction requests for a single model into micro-batches,
+    running one prediction per batch instead of one per request.
+    A batch is closed as soon as it holds max_batch_size requests, or max_delay seconds after its first request.
+    Predictions run on a worker thread, so that requests keep being collected meanwhile.
+    Samples not matching the model input shape are rejected before being batched, and a failing batch
+    fails every request it holds, without stopping the batching loop.
+    """
+
+    def __init__(self, model: keras.Model, max_batch_size: int = 64, max_delay: float = 0.005,
+                 latency_samples: int = 10000):
+        """
+        :param model: The model serving predictions.
+        :param max_batch_size: The maximum amount of requests per batch.
+        :param max_delay: The maximum amount of seconds the first request of a batch waits for others.
+        :param latency_samples: The amount of most recent latencies kept for statistics.
+        """
+        self.__model = model
+        self.__max_batch_size = max_batch_size
+        self.__max_delay = max_delay
+        self.__queue: Optional[asyncio.Queue] = None
+        self.__task: Optional[asyncio.Task] = None
+        self.__latencies: deque[float] = deque(maxlen=latency_samples)
+        self.__requests = 0
+        self.__batches = 0
+        self.__first_request_time: Optional[float] = None
+        self.__last_response_time: Optional[float] = None
+
+    @property
+    def model(self) -> keras.Model:
+        return self.__model
+
+    def __start(self):
+        """
+        Starts the batching loop on the running event loop, on first use.
+        """
+        if self.__task is None:
+            self.__queue = asyncio.Queue()
+            self.__task = asyncio.get_running_loop().create_task(self.__run())
+
+    async def __collect(self) -> list[tuple[numpy.ndarray, asyncio.Future, float]]:
+        """
+        Waits for a request, then keeps collecting requests until the batch is full or its deadline is reached.
+        :return: A list of tuples holding the sample, the future and the arrival time of each request.
+        """
+        batch = [await self.__queue.get()]
+        deadline = batch[0][2] + self.__max_delay
+        while len(batch) < self.__max_batch_size:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.__queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def __run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self.__collect()
+            try:
+                samples = numpy.stack([sample for sample, _, _ in batch])
+                predictions = await loop.run_in_executor(None, self.__model.predict_on_batch, samples)
+            except Exception as error:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            response_time = time.perf_counter()
+            self.__batches += 1
+            self.__last_response_time = response_time
+            for (_, future, arrival_time), prediction in zip(batch, numpy.asarray(predictions)):
+                self.__latencies.append(response_time - arrival_time)
+                if not future.done():
+                    future.set_result(prediction)
+
+    async def predict(self, sample: numpy.ndarray) -> numpy.ndarray:
+        """
+        Predicts a single sample, batched along with any concurrent request.
+        :param sample: A sample shaped as the model input, without the batch dimension.
+        :return: The prediction of the sample.
+        """
+        sample = numpy.asarray(sample, dtype=numpy.float32)
+        input_shape = tuple(self.__model.input_shape[1:])
+        if len(sample.shape) != len(input_shape) or any(
+                expected is not None and size != expected for size, expected in zip(sample.shape, input_shape)):
+            raise InvalidSampleException(f'Sample shape {sample.shape} does not match model input shape {input_shape}.')
+        self.__start()
+        arrival_time = time.perf_counter()
+        if self.__first_request_time is None:
+            self.__first_request_time = arrival_time
+        self.__requests += 1
+        future = asyncio.get_running_loop().create_future()
+        await self.__queue.put((sample, future, arrival_time))
+        return await future
+
+    def statistics(self) -> ServingStatistics:
+        """
+        Summarizes the requests served so far.
+        :return: A ServingStatistics instance; latencies are in seconds, and throughput in requests per second.
+        """
+        latencies = numpy.array(self.__latencies)
+        served = len(latencies) > 0
+        elapsed = (self.__last_response_time - self.__first_request_time) if served else 0.0
+        return ServingStatistics(Requests=self.__requests, Batches=self.__batches,
+                                 MeanBatchSize=self.__requests / self.__batches if self.__batches else 0.0,
+                                 LatencyP50=float(numpy.percentile(latencies, 50)) if served else 0.0,
+                                 LatencyP99=float(numpy.percentile(latencies, 99)) if served else 0.0,
+                                 Throughput=len(latencies) / elapsed if elapsed > 0 else 0.0)
+
+    async def close(self):
+        if self.__task is not None:
+            self.__task.cancel()
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+            self.__task = None
+
+
+class PredictionServer:
+    """
+    Serves predictions of trained models, identified by the Hash of their TrainingParams.
+    Models are loaded on first request, and each one gets its own MicroBatcher.
+    Over TCP, requests and responses are JSON objects, one per line:
+    {"Hash": ..., "Window": [[...], ...]} is answered with {"Prediction": [...]},
+    {"Statistics": <Hash>} with the ServingStatistics of that model, and failures with {"Error": ...}.
+    """
+
+    MODEL_FILE_SUFFIX = '.keras'
+    HASH_PATTERN = re.compile(r'[0-9a-f]{32}')
+
+    def __init__(self, models_root: Optional[Path] = None, load_model: Optional[Callable[[str], keras.Model]] = None,
+                 max_batch_size: int = 64, max_delay: float = 0.005, artifact_store: Optional[ArtifactStore] = None):
+        """
+        :param models_root: The directory holding one "<Hash>.keras" file per model;
+        used if neither load_model nor artifact_store are set.
+        :param load_model: A callable loading the model of the given Hash.
+        :param max_batch_size: The maximum amount of requests per batch.
+        :param max_delay: The maximum amount of seconds the first request of a batch waits for others.
+        :param artifact_store: The store models are loaded from (memory-mapped) if load_model is not set.
+        """
+        self.__models_root = models_root
+        self.__load_model = load_model or (artifact_store.load_model if artifact_store is not None
+                                           else self.__load_model_file)
+        self.__max_batch_size = max_batch_size
+        self.__max_delay = max_delay
+        self.__batchers: dict[str, MicroBatcher] = {}
+        self.__loading: dict[str, asyncio.Future] = {}
+
+    def __load_model_file(self, hash_value: str) -> keras.Model:
+        return keras.saving.load_model(self.__models_root / f'{hash_value}{self.MODEL_FILE_SUFFIX}')
+
+    async def get_batcher(self, hash_value: str) -> MicroBatcher:
+        """
+        Retrieves the batcher of the given model, loading the model on a worker thread if needed.
+        Concurrent requests for a model being loaded wait for the same load.
+        :param hash_value: The Hash of the TrainingParams the model was trained with.
+        :return: A MicroBatcher.
+        """
+        if not isinstance(hash_value, str) or self.HASH_PATTERN.fullmatch(hash_value) is None:
+            raise InvalidHashException(f'Hash ({hash_value!r}) must be 32 lowercase hexadecimal characters.')
+        if hash_value not in self.__batchers:
+            if hash_value not in self.__loading:
+                self.__loading[hash_value] = asyncio.get_running_loop().run_in_executor(None, self.__load_model,
+                                                                                         hash_value)
+            try:
+                model = await self.__loading[hash_value]
+            finally:
+                self.__loading.pop(hash_value, None)
+            if hash_value not in self.__batchers:
+                self.__batchers[hash_value] = MicroBatcher(model, self.__max_batch_size, self.__max_delay)
+        return self.__batchers[hash_value]
+
+    async def predict(self, hash_value: str, sample: numpy.ndarray) -> numpy.ndarray:
+        """
+        Predicts a single sample with the given model.
+        :param hash_value: The Hash of the TrainingParams the model was trained with.
+        :param sample: A sample shaped as the model input, without the batch dimension.
+        :return: The prediction of the sample.
+        """
+        return await (await self.get_batcher(hash_value)).predict(sample)
+
+    def statistics(self) -> dict[str, ServingStatistics]:
+        return {hash_value: batcher.statistics() for hash_value, batcher in self.__batchers.items()}
+
+    async def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Answers a single decoded request.
+        :param request: A dictionary holding either "Hash" and "Window", or "Statistics".
+        :return: The response, as a JSON-serializable dictionary.
+        """
+        try:
+            if 'Statistics' in request:
+                return dataclasses.asdict((await self.get_batcher(request['Statistics'])).statistics())
+            prediction = await self.predict(request['Hash'], numpy.array(request['Window'], dtype=numpy.float32))
+            return {'Prediction': numpy.asarray(prediction).tolist()}
+        except Exception as error:
+            return {'Error': repr(error)}
+
+    async def __answer(self, line: bytes) -> dict[str, Any]:
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as error:
+            return {'Error': repr(error)}
+        return await self.handle_request(request)
+
+    async def __handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Answers the requests of a connection concurrently, so that they can be batched with each other,
+        writing responses back in request order.
+        """
+        responses: asyncio.Queue[Optional[asyncio.Future]] = asyncio.Queue()
+
+        async def write_responses():
+            while (response := await responses.get()) is not None:
+                writer.write(json.dumps(await response).encode() + b'\n')
+                await writer.drain()
+
+        writer_task = asyncio.ensure_future(write_responses())
+        try:
+            while line := await reader.readline():
+                responses.put_nowait(asyncio.ensure_future(self.__answer(line)))
+            responses.put_nowait(None)
+            await writer_task
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 8765) -> asyncio.Server:
+        """
+        Starts serving requests over TCP.
+        :param host: The address to listen on.
+        :param port: The port to listen on; 0 picks any free port.
+        :return: The running asyncio.Server.
+        """
+        return await asyncio.start_server(self.__handle_connection, host, port)
+
+    async def close(self):
+        for batcher in self.__batchers.values():
+            await batcher.close()
+        self.__batchers.clear()
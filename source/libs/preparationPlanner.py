@@ -0,0 +1,130 @@
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Type
+
+from source.libs.helper import Helper
+from source.structs.params import TrainingParams as TrainParams
+
+
+@dataclass
+class PreparationFieldNames:
+    Load: tuple[str, ...] = ('DatasetPath', 'DatasetTimeFilter', 'ColumnToPredict')
+    Preparation: tuple[str, ...] = ('DatasetPath', 'DatasetTimeFilter', 'ColumnToPredict',
+                                    'WindowWidth', 'DatasetShuffle', 'DatasetBatchSize')
+
+
+@dataclass
+class PreparationGroup:
+    Key: str
+    LoadKey: str
+    Members: list[TrainParams] = field(default_factory=list)
+
+
+class PreparationPlan:
+    """
+    The outcome of grouping TrainParams by their data-affecting fields.
+    Each distinct dataset is meant to be loaded once, and shared by every group built out of it;
+    each group's window build is meant to run once, and be shared by every model-only variation within the group.
+    """
+
+    def __init__(self, groups: list[PreparationGroup]):
+        self.__groups = groups
+
+    def __len__(self) -> int:
+        return len(self.__groups)
+
+    def __iter__(self) -> Iterator[PreparationGroup]:
+        return iter(self.__groups)
+
+    @property
+    def groups(self) -> list[PreparationGroup]:
+        return self.__groups
+
+    @property
+    def combinations(self) -> int:
+        """
+        Getter of the "combinations" property.
+        :return: The total amount of planned TrainParams, which equals the amount of loads and window builds
+        required by naive per-combination processing.
+        """
+        return sum(len(group.Members) for group in self.__groups)
+
+    @property
+    def loads(self) -> int:
+        """
+        Getter of the "loads" property.
+        :return: The amount of distinct datasets to load.
+        """
+        return len({group.LoadKey for group in self.__groups})
+
+    @property
+    def window_builds(self) -> int:
+        """
+        Getter of the "window_builds" property.
+        :return: The amount of distinct data preparations (windowing and batching) to build.
+        """
+        return len(self.__groups)
+
+    @property
+    def saved_loads(self) -> int:
+        return self.combinations - self.loads
+
+    @property
+    def saved_window_builds(self) -> int:
+        return self.combinations - self.window_builds
+
+    def run(self, load: Callable[[TrainParams], Any], prepare: Callable[[TrainParams, Any], Any],
+            job: Callable[[TrainParams, Any], Any]) -> Iterator[tuple[TrainParams, Any]]:
+        """
+        Runs the plan, loading data once per distinct dataset, preparing it once per group,
+        and running the job on every member of the group. Groups sharing a dataset run one after another,
+        so that each loaded dataset is released as soon as its last group is done.
+        :param load: A callable receiving the first member of a group and returning its loaded dataset.
+        :param prepare: A callable receiving the first member of a group and its loaded dataset,
+        and returning its prepared data.
+        :param job: A callable receiving a member and its group's prepared data.
+        :return: An iterator over tuples of each member and the output of its job, in plan order within each dataset.
+        """
+        groups_by_load_key: dict[str, list[PreparationGroup]] = {}
+        for group in self.__groups:
+            groups_by_load_key.setdefault(group.LoadKey, []).append(group)
+        for groups in groups_by_load_key.values():
+            loaded_data = load(groups[0].Members[0])
+            for group in groups:
+                prepared_data = prepare(group.Members[0], loaded_data)
+                for member in group.Members:
+                    yield member, job(member, prepared_data)
+
+
+class PreparationPlanner:
+    """
+    Groups unfolded TrainParams by the fields that affect data preparation.
+    """
+
+    def __init__(self, field_names: Type[PreparationFieldNames] = PreparationFieldNames):
+        self.__field_names = field_names
+
+    @staticmethod
+    def generate_key(training_params: TrainParams, field_names: Sequence[str]) -> str:
+        """
+        Generates a key shared by every TrainParams with equal values in the given fields.
+        :param training_params: A TrainParams instance.
+        :param field_names: The names of the fields making up the key.
+        :return: An MD5 hash string.
+        """
+        return Helper.generate_hash({name: getattr(training_params, name) for name in field_names})
+
+    def plan(self, unfolded_params: Sequence[TrainParams]) -> PreparationPlan:
+        """
+        Groups the given TrainParams, keeping both groups and members in their first-seen order.
+        :param unfolded_params: A sequence of TrainParams, usually returned by ParamsManager.unfold.
+        :return: A PreparationPlan.
+        """
+        groups: dict[str, PreparationGroup] = {}
+        for training_params in unfolded_params:
+            key = self.generate_key(training_params, self.__field_names.Preparation)
+            if key not in groups:
+                groups[key] = PreparationGroup(Key=key,
+                                               LoadKey=self.generate_key(training_params, self.__field_names.Load))
+            groups[key].Members.append(training_params)
+        return PreparationPlan(list(groups.values()))
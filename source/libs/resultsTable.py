@@ -0,0 +1,223 @@
+import dataclasses
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy
+import pandas
+
+from source.libs.helper import Helper
+from source.structs.params import TrainingParams
+
+
+class MissingColumnException(Exception):
+    pass
+
+
+class ResultsTable:
+    """
+    A columnar table joining the metrics of runs to their flattened TrainingParams, indexed by Hash.
+    Every field becomes a column; each layer of the LayerStack contributes "LayerStack.<position>.<field>" columns,
+    along with a "LayerStack.Depth" column. Callables, paths and date ranges are kept as their string forms,
+    and every textual column is stored as a categorical, so that grouping and filtering run on integer codes.
+    The table is persisted as one .npy file per column next to a metadata sidecar, and is loaded memory-mapped.
+    Every save writes a new version directory, made current by atomically replacing a pointer file.
+    """
+
+    METADATA_FILE_NAME = 'metadata.json'
+    INDEX_FILE_NAME = 'index.npy'
+    CURRENT_FILE_NAME = 'current'
+    INDEX_NAME = 'Hash'
+
+    def __init__(self, frame: Optional[pandas.DataFrame] = None):
+        """
+        :param frame: A DataFrame indexed by Hash, usually returned by a previous ResultsTable.
+        """
+        self.__frames = [] if frame is None else [frame]
+        self.__rows: list[dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def __contains__(self, hash_value: str) -> bool:
+        return hash_value in self.frame.index
+
+    @staticmethod
+    def flatten(training_params: TrainingParams) -> dict[str, Any]:
+        """
+        Flattens a TrainingParams instance into a single-level dictionary of plain values.
+        :param training_params: A TrainingParams instance.
+        :return: A dictionary mapping column names to values, excluding the Hash.
+        """
+        row = {}
+        for field in dataclasses.fields(training_params):
+            value = getattr(training_params, field.name)
+            if field.name == 'Hash':
+                continue
+            elif field.name == 'LayerStack':
+                row['LayerStack.Depth'] = len(value)
+                for position, key in enumerate(sorted(value)):
+                    for name, layer_value in dataclasses.asdict(value[key]).items():
+                        row[f'LayerStack.{position}.{name}'] = Helper.stringify_objects(layer_value)
+            else:
+                row[field.name] = Helper.stringify_objects(value)
+        return row
+
+    def add(self, training_params: TrainingParams, metrics: Mapping[str, Any]):
+        """
+        Adds the outcome of a run to the table. Rows are buffered, and consolidated on the next read.
+        If a row with the same Hash already exists, the new one replaces it.
+        :param training_params: The TrainingParams the run was made with.
+        :param metrics: The metrics of the run, e.g. the fields of its EvaluationResult.
+        """
+        self.__rows.append({self.INDEX_NAME: training_params.Hash, **self.flatten(training_params),
+                            **{name: value for name, value in metrics.items() if name != self.INDEX_NAME}})
+
+    @staticmethod
+    def __categorize(frame: pandas.DataFrame) -> pandas.DataFrame:
+        """
+        Converts every textual column of the given frame into a categorical one.
+        :param frame: A DataFrame.
+        :return: The same DataFrame, with categorical textual columns.
+        """
+        for name in frame.columns:
+            column = frame[name]
+            if not (pandas.api.types.is_numeric_dtype(column) or pandas.api.types.is_bool_dtype(column)
+                    or isinstance(column.dtype, pandas.CategoricalDtype)):
+                frame[name] = column.map(lambda value: value if value is None or isinstance(value, str)
+                                         else str(value)).astype('category')
+        return frame
+
+    @property
+    def frame(self) -> pandas.DataFrame:
+        """
+        Getter of the "frame" property, consolidating buffered rows first.
+        :return: A DataFrame indexed by Hash, holding a single row per Hash.
+        """
+        if self.__rows:
+            rows = pandas.DataFrame.from_records(self.__rows).set_index(self.INDEX_NAME)
+            self.__frames.append(self.__categorize(rows))
+            self.__rows = []
+        if len(self.__frames) != 1:
+            frame = pandas.concat(self.__frames) if self.__frames else pandas.DataFrame(
+                index=pandas.Index([], name=self.INDEX_NAME))
+            frame = frame[~frame.index.duplicated(keep='last')]
+            self.__frames = [self.__categorize(frame)]
+        return self.__frames[0]
+
+    def get(self, hash_value: str) -> pandas.Series:
+        return self.frame.loc[hash_value]
+
+    def __check_columns(self, names: Sequence[str]):
+        missing_names = [name for name in names if name not in self.frame.columns]
+        if missing_names:
+            raise MissingColumnException(f'Columns {missing_names} were not found in the results table.')
+
+    def top_k(self, metric: str, k: int = 10, ascending: bool = True) -> pandas.DataFrame:
+        """
+        Selects the best runs by the given metric, without sorting the whole table.
+        :param metric: The name of the metric column.
+        :param k: The amount of runs to select.
+        :param ascending: If True, lower values are better; otherwise, higher values are.
+        :return: A DataFrame holding the selected runs, best first.
+        """
+        self.__check_columns([metric])
+        return self.frame.nsmallest(k, metric) if ascending else self.frame.nlargest(k, metric)
+
+    def marginals(self, factors: str | Sequence[str], metric: str,
+                  statistics: Sequence[str] = ('count', 'mean', 'std', 'min', 'max')) -> pandas.DataFrame:
+        """
+        Summarizes a metric across the values of one or more factors, marginalizing every other field.
+        :param factors: The name, or names, of the columns to group by.
+        :param metric: The name of the metric column.
+        :param statistics: The aggregations computed per group.
+        :return: A DataFrame indexed by the values of the factors, with one column per statistic.
+        """
+        factors = [factors] if isinstance(factors, str) else list(factors)
+        self.__check_columns([*factors, metric])
+        return self.frame.groupby(factors, observed=True, dropna=False)[metric].agg(list(statistics))
+
+    def query(self, conditions: Mapping[str, Any]) -> pandas.DataFrame:
+        """
+        Selects the runs matching every given condition.
+        :param conditions: A mapping of column names to either a value, a sequence of accepted values,
+        or a slice of accepted bounds (inclusive, either of which can be None). Callables can be given as values,
+        and are matched by their fully qualified name.
+        :return: A DataFrame holding the matching runs.
+        """
+        self.__check_columns(list(conditions))
+        frame = self.frame
+        mask = numpy.ones(len(frame), dtype=bool)
+        for name, condition in conditions.items():
+            column = frame[name]
+            if isinstance(condition, slice):
+                if condition.start is not None:
+                    mask &= (column >= condition.start).to_numpy()
+                if condition.stop is not None:
+                    mask &= (column <= condition.stop).to_numpy()
+            elif isinstance(condition, Sequence) and not isinstance(condition, str):
+                mask &= column.isin(Helper.stringify_objects(list(condition))).to_numpy()
+            else:
+                mask &= (column == Helper.stringify_objects(condition)).to_numpy(dtype=bool, na_value=False)
+        return frame[mask]
+
+    def save(self, directory: Path):
+        """
+        Persists the table, one .npy file per column; textual columns are stored as their categorical codes.
+        The table is written into a temporary directory, renamed into a new version directory, and only then made
+        current, so that readers never observe partial results, and a crash while saving leaves the previous version
+        current and intact. Older versions are removed afterwards.
+        :param directory: The directory the table is saved into.
+        """
+        frame = self.frame
+        directory.mkdir(parents=True, exist_ok=True)
+        temporary_directory = Path(tempfile.mkdtemp(dir=directory, prefix='.'))
+        try:
+            numpy.save(temporary_directory / self.INDEX_FILE_NAME, frame.index.to_numpy(dtype=str))
+            columns = []
+            for position, name in enumerate(frame.columns):
+                column = frame[name]
+                file_name = f'column_{position}.npy'
+                if isinstance(column.dtype, pandas.CategoricalDtype):
+                    numpy.save(temporary_directory / file_name, column.cat.codes.to_numpy())
+                    categories = column.cat.categories.tolist()
+                else:
+                    numpy.save(temporary_directory / file_name, column.to_numpy())
+                    categories = None
+                columns.append({'Name': name, 'File': file_name, 'Categories': categories})
+            metadata = {'Rows': len(frame), 'Columns': columns}
+            (temporary_directory / self.METADATA_FILE_NAME).write_text(json.dumps(metadata, indent=2))
+            version = temporary_directory.name[1:]
+            os.replace(temporary_directory, directory / version)
+        finally:
+            shutil.rmtree(temporary_directory, ignore_errors=True)
+        temporary_path = directory / f'.{self.CURRENT_FILE_NAME}.tmp'
+        temporary_path.write_text(version)
+        os.replace(temporary_path, directory / self.CURRENT_FILE_NAME)
+        for path in directory.iterdir():
+            if path.is_dir() and path.name != version:
+                shutil.rmtree(path, ignore_errors=True)
+
+    @classmethod
+    def load(cls, directory: Path) -> 'ResultsTable':
+        """
+        Loads the current version of a table saved by ResultsTable.save, memory-mapping its columns:
+        numeric columns and the codes of textual ones are backed by their files, without being copied into memory.
+        :param directory: The directory the table was saved into.
+        :return: A ResultsTable.
+        """
+        directory = directory / (directory / cls.CURRENT_FILE_NAME).read_text()
+        metadata = json.loads((directory / cls.METADATA_FILE_NAME).read_text())
+        columns = {}
+        for column in metadata['Columns']:
+            values = numpy.load(directory / column['File'], mmap_mode='r').view(numpy.ndarray)
+            if column['Categories'] is None:
+                columns[column['Name']] = values
+            else:
+                columns[column['Name']] = pandas.Categorical.from_codes(values, column['Categories'])
+        index = pandas.Index(numpy.load(directory / cls.INDEX_FILE_NAME), name=cls.INDEX_NAME)
+        return cls(pandas.DataFrame(columns, index=index, copy=False))
@@ -0,0 +1,137 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import numpy
+
+from source.libs.datasetCache import DatasetCache
+from source.libs.datasetLoader import DatasetLoader
+from source.structs.dataset import Dataset, SharedArray, SharedDatasetHandle
+from source.structs.params import TrainingParams
+
+
+class SharedBlock:
+    """
+    An attached shared memory block, exposed as a read-only NumPy array.
+    Arrays built out of it hold it as their base, as do their own views, so that the block is closed only
+    once the last of them is gone.
+    """
+
+    def __init__(self, description: SharedArray):
+        """
+        :param description: The description of the shared array.
+        """
+        self.block = SharedMemory(name=description.Name)
+        self.__array_interface__ = {'shape': tuple(description.Shape), 'typestr': description.Dtype, 'version': 3,
+                                    'data': (numpy.frombuffer(self.block.buf, dtype=numpy.uint8).ctypes.data, True)}
+
+
+class SharedDatasetRegistry:
+    """
+    Publishes datasets into shared memory blocks, so that parallel worker processes can use them without copies.
+    The parent process loads each filtered dataset once and passes the resulting (picklable) handle to its workers,
+    which attach read-only NumPy views by block name. Blocks live until the registry is closed.
+    Workers detach from a dataset once done with it (e.g. at the end of each job or group of combinations),
+    so that long-lived workers do not keep a mapping of every dataset they ever used.
+    """
+
+    __attached: dict[str, Dataset] = {}
+
+    def __init__(self, loader: Optional[DatasetLoader] = None):
+        self.__loader = loader or DatasetLoader()
+        self.__blocks: list[SharedMemory] = []
+        self.__handles: dict[str, SharedDatasetHandle] = {}
+
+    def __enter__(self) -> 'SharedDatasetRegistry':
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __share_array(self, values: numpy.ndarray) -> SharedArray:
+        """
+        Copies an array into a new shared memory block.
+        :param values: The array to share.
+        :return: The description needed to attach to the block.
+        """
+        block = SharedMemory(create=True, size=max(values.nbytes, 1))
+        self.__blocks.append(block)
+        shared_values = numpy.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)
+        shared_values[...] = values
+        return SharedArray(Name=block.name, Shape=tuple(values.shape), Dtype=values.dtype.str)
+
+    def share(self, dataset: Dataset) -> SharedDatasetHandle:
+        """
+        Copies every array of a dataset into shared memory.
+        :param dataset: The dataset to share.
+        :return: A handle to be passed to worker processes.
+        """
+        return SharedDatasetHandle(Index=self.__share_array(dataset.Index),
+                                   Columns={name: self.__share_array(values)
+                                            for name, values in dataset.Columns.items()},
+                                   ColumnToPredict=dataset.ColumnToPredict)
+
+    def publish(self, training_params: TrainingParams) -> SharedDatasetHandle:
+        """
+        Shares the dataset described by the given TrainingParams, loading it only once per registry.
+        :param training_params: A TrainingParams instance.
+        :return: A handle to be passed to worker processes.
+        """
+        key = DatasetCache.generate_key(training_params.DatasetPath,
+                                        self.__loader.fingerprint(training_params.DatasetPath),
+                                        training_params.DatasetTimeFilter, training_params.ColumnToPredict)
+        if key not in self.__handles:
+            dataset = self.__loader.load(training_params.DatasetPath, training_params.DatasetTimeFilter,
+                                         training_params.ColumnToPredict)
+            self.__handles[key] = self.share(dataset)
+        return self.__handles[key]
+
+    @staticmethod
+    def attach(handle: SharedDatasetHandle) -> Dataset:
+        """
+        Builds a dataset out of zero-copy views of shared memory blocks.
+        Attachments are memoized per process, so attaching the same handle twice returns the same dataset.
+        :param handle: A handle created by a registry, usually in another process.
+        :return: A Dataset whose arrays are read-only views of the shared blocks.
+        """
+        if handle.Index.Name not in SharedDatasetRegistry.__attached:
+            SharedDatasetRegistry.__attached[handle.Index.Name] = Dataset(
+                Index=numpy.asarray(SharedBlock(handle.Index)),
+                Columns={name: numpy.asarray(SharedBlock(description)) for name, description in handle.Columns.items()},
+                ColumnToPredict=handle.ColumnToPredict)
+        return SharedDatasetRegistry.__attached[handle.Index.Name]
+
+    @staticmethod
+    def detach(handle: SharedDatasetHandle):
+        """
+        Forgets the attachment of the given handle in this process, if any.
+        Its blocks are closed as soon as no view of them remains, so views still in use stay valid.
+        :param handle: A handle previously attached to.
+        """
+        SharedDatasetRegistry.__attached.pop(handle.Index.Name, None)
+
+    @staticmethod
+    @contextmanager
+    def attached(handle: SharedDatasetHandle) -> Iterator[Dataset]:
+        """
+        Attaches to a shared dataset for the duration of a block, e.g. while a worker runs a group of combinations,
+        and detaches afterwards.
+        :param handle: A handle created by a registry, usually in another process.
+        :return: A context manager yielding the attached Dataset.
+        """
+        try:
+            yield SharedDatasetRegistry.attach(handle)
+        finally:
+            SharedDatasetRegistry.detach(handle)
+
+    def close(self):
+        """
+        Releases and destroys every block created by this registry.
+        Workers must be done with their views before this is called.
+        """
+        for block in self.__blocks:
+            block.close()
+            block.unlink()
+        self.__blocks.clear()
+        self.__handles.clear()
@@ -0,0 +1,83 @@
+from collections.abc import Sequence
+
+import numpy
+from numpy.lib.stride_tricks import sliding_window_view
+
+from source.libs.datasetLoader import MissingColumnException
+from source.structs.dataset import Dataset
+
+
+class InvalidWindowWidthException(Exception):
+    pass
+
+
+class SlidingWindows:
+    """
+    Exposes the windowed samples of a dataset as strided views over its columns.
+    Each sample pairs WindowWidth consecutive rows of every column (the features)
+    with the value of the column to predict in the row right after them (the target).
+    No rows are copied until a batch is requested.
+    """
+
+    def __init__(self, dataset: Dataset, window_width: int):
+        if not isinstance(window_width, int) or window_width < 1:
+            raise InvalidWindowWidthException(f'Window width ({window_width}) must be a positive integer.')
+        if dataset.ColumnToPredict not in dataset.Columns:
+            raise MissingColumnException(f'Column "{dataset.ColumnToPredict}" was not found in the dataset.')
+
+        self.__window_width = window_width
+        self.__feature_names = list(dataset.Columns.keys())
+        self.__target_index = self.__feature_names.index(dataset.ColumnToPredict)
+        self.__views = [self.__build_view(values, window_width) for values in dataset.Columns.values()]
+        self.__targets = dataset.Columns[dataset.ColumnToPredict][window_width:]
+
+    @staticmethod
+    def __build_view(values: numpy.ndarray, window_width: int) -> numpy.ndarray:
+        """
+        Builds a read-only view holding every window of the given column, excluding the last row,
+        which has no following row to take a target from.
+        :param values: A single column.
+        :param window_width: The amount of rows per window.
+        :return: A view shaped (samples, window_width).
+        """
+        if len(values) <= window_width:
+            return numpy.empty((0, window_width), dtype=values.dtype)
+        return sliding_window_view(values[:-1], window_width)
+
+    def __len__(self) -> int:
+        return len(self.__targets)
+
+    @property
+    def window_width(self) -> int:
+        return self.__window_width
+
+    @property
+    def feature_names(self) -> list[str]:
+        return self.__feature_names
+
+    @property
+    def target_index(self) -> int:
+        """
+        Getter of the "target_index" property.
+        :return: The position of the column to predict among the features.
+        """
+        return self.__target_index
+
+    @property
+    def views(self) -> list[numpy.ndarray]:
+        """
+        Getter of the "views" property.
+        :return: One view per feature, each shaped (samples, window_width).
+        """
+        return self.__views
+
+    def get_batch(self, indices: Sequence[int] | numpy.ndarray | slice) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Copies the selected samples into contiguous arrays ready to be fed to a model.
+        :param indices: The positions of the samples to copy, either as a sequence or as a slice.
+        :return: A tuple with the features, shaped (batch, window_width, features),
+        and the targets, shaped (batch, 1).
+        """
+        features = numpy.stack([view[indices] for view in self.__views], axis=-1)
+        targets = numpy.asarray(self.__targets[indices]).reshape(-1, 1)
+        return features, targets
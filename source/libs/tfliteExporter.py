@@ -0,0 +1,145 @@
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Optional
+
+import keras
+import numpy
+import tensorflow
+
+from source.libs.artifactStore import ArtifactStore
+from source.libs.slidingWindows import SlidingWindows
+from source.libs.trainer import Trainer
+from source.structs.params import TrainingParams
+from source.structs.results import ExportReport
+
+try:
+    from ai_edge_litert.interpreter import Interpreter
+except ImportError:
+    Interpreter = tensorflow.lite.Interpreter
+
+
+class UnknownQuantizationException(Exception):
+    pass
+
+
+class EmptyEvaluationSetException(Exception):
+    pass
+
+
+class TFLiteExporter:
+    """
+    Exports trained models (read from an ArtifactStore by Hash) as TFLite flatbuffers for CPU-only deployments,
+    optionally applying post-training quantization:
+    "dynamic" stores weights as int8 and quantizes activations on the fly,
+    while "int8" also quantizes activations, calibrated on windows of the model's own DatasetTimeFilter.
+    Every export is checked against the Keras model on a separate sample of windows.
+    """
+
+    NONE = 'none'
+    DYNAMIC = 'dynamic'
+    INT8 = 'int8'
+    QUANTIZATION_MODES = (NONE, DYNAMIC, INT8)
+
+    def __init__(self, artifact_store: ArtifactStore, trainer: Optional[Trainer] = None,
+                 calibration_samples: int = 128, evaluation_samples: int = 512, seed: Optional[int] = None):
+        """
+        :param artifact_store: The store trained models are read from, and exports are written into.
+        :param trainer: The trainer whose DatasetCache windows are loaded through.
+        :param calibration_samples: The amount of windows int8 quantization is calibrated on.
+        :param evaluation_samples: The amount of windows exports are checked on.
+        :param seed: The seed of window sampling.
+        """
+        self.__artifact_store = artifact_store
+        self.__trainer = trainer or Trainer()
+        self.__calibration_samples = calibration_samples
+        self.__evaluation_samples = evaluation_samples
+        self.__seed = seed
+
+    def sample_positions(self, windows: SlidingWindows) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Draws disjoint window positions for calibration and evaluation;
+        if there are not enough windows for both, evaluation reuses calibration windows.
+        :param windows: The windows of the model's dataset.
+        :return: A tuple with the sorted calibration positions and the sorted evaluation positions.
+        """
+        permutation = numpy.random.default_rng(self.__seed).permutation(len(windows))
+        calibration_positions = permutation[:self.__calibration_samples]
+        evaluation_positions = permutation[self.__calibration_samples:
+                                           self.__calibration_samples + self.__evaluation_samples]
+        if len(evaluation_positions) == 0:
+            evaluation_positions = permutation[:self.__evaluation_samples]
+        return numpy.sort(calibration_positions), numpy.sort(evaluation_positions)
+
+    @staticmethod
+    def convert(model: keras.Model, quantization: str = NONE,
+                calibration_features: Optional[numpy.ndarray] = None) -> bytes:
+        """
+        Converts a Keras model into a TFLite flatbuffer. Inputs and outputs are kept as float32 in every mode.
+        :param model: A Keras model.
+        :param quantization: One of TFLiteExporter.QUANTIZATION_MODES.
+        :param calibration_features: The samples int8 quantization is calibrated on, shaped (samples, width, features).
+        :return: The flatbuffer contents.
+        """
+        if quantization not in TFLiteExporter.QUANTIZATION_MODES:
+            raise UnknownQuantizationException(f'Unknown quantization mode ({quantization}); '
+                                               f'expected one of {TFLiteExporter.QUANTIZATION_MODES}.')
+        converter = tensorflow.lite.TFLiteConverter.from_keras_model(model)
+        if quantization != TFLiteExporter.NONE:
+            converter.optimizations = [tensorflow.lite.Optimize.DEFAULT]
+        if quantization == TFLiteExporter.INT8:
+            def representative_dataset() -> Iterator[list[numpy.ndarray]]:
+                for sample in calibration_features:
+                    yield [sample[numpy.newaxis].astype(numpy.float32)]
+
+            converter.representative_dataset = representative_dataset
+        return converter.convert()
+
+    @staticmethod
+    def predict(flatbuffer: bytes, features: numpy.ndarray) -> numpy.ndarray:
+        """
+        Runs a TFLite flatbuffer on a batch of samples, in a single invocation.
+        :param flatbuffer: The flatbuffer contents.
+        :param features: The samples, shaped (samples, width, features).
+        :return: The predictions, shaped (samples, 1).
+        """
+        interpreter = Interpreter(model_content=flatbuffer)
+        input_index = interpreter.get_input_details()[0]['index']
+        interpreter.resize_tensor_input(input_index, features.shape)
+        interpreter.allocate_tensors()
+        interpreter.set_tensor(input_index, features.astype(numpy.float32))
+        interpreter.invoke()
+        return interpreter.get_tensor(interpreter.get_output_details()[0]['index'])
+
+    def get_export_path(self, hash_value: str, quantization: str) -> Path:
+        return self.__artifact_store.get_model_directory(hash_value) / f'model-{quantization}.tflite'
+
+    def export(self, training_params: TrainingParams, quantization: str = DYNAMIC,
+               path: Optional[Path] = None) -> ExportReport:
+        """
+        Exports the trained model of the given TrainingParams, and reports how far its predictions drift.
+        :param training_params: The TrainingParams the model was trained with.
+        :param quantization: One of TFLiteExporter.QUANTIZATION_MODES.
+        :param path: The path the flatbuffer is written to; defaults to the model's directory in the ArtifactStore.
+        :return: An ExportReport comparing the export with the Keras model on the evaluation windows.
+        """
+        windows = SlidingWindows(self.__trainer.dataset_cache.get(training_params), training_params.WindowWidth)
+        if len(windows) == 0:
+            raise EmptyEvaluationSetException(f'DatasetTimeFilter ({training_params.DatasetTimeFilter}) of '
+                                              f'{training_params.Hash} yields no windows of width '
+                                              f'{training_params.WindowWidth} to calibrate and check the export on.')
+        model = self.__artifact_store.load_model(training_params.Hash)
+        calibration_positions, evaluation_positions = self.sample_positions(windows)
+        calibration_features, _ = windows.get_batch(calibration_positions)
+        flatbuffer = self.convert(model, quantization, calibration_features)
+        path = path or self.get_export_path(training_params.Hash, quantization)
+        path.write_bytes(flatbuffer)
+
+        features, targets = windows.get_batch(evaluation_positions)
+        keras_predictions = numpy.asarray(model.predict_on_batch(features), dtype=numpy.float64)
+        exported_predictions = self.predict(flatbuffer, features).astype(numpy.float64)
+        deltas = numpy.abs(exported_predictions - keras_predictions)
+        return ExportReport(Hash=training_params.Hash, Quantization=quantization, Path=str(path),
+                            Size=len(flatbuffer), Samples=len(features),
+                            MeanAbsoluteDelta=float(deltas.mean()), MaxAbsoluteDelta=float(deltas.max()),
+                            KerasMeanAbsoluteError=float(numpy.abs(keras_predictions - targets).mean()),
+                            ExportedMeanAbsoluteError=float(numpy.abs(exported_predictions - targets).mean()))
@@ -0,0 +1,158 @@
+import dataclasses
+from collections.abc import Sequence
+from typing import Optional
+
+import keras
+
+from source.libs.artifactStore import ArtifactStore
+from source.libs.batchSequence import BatchSequence
+from source.libs.checkpointStore import CheckpointStore
+from source.libs.datasetCache import DatasetCache
+from source.libs.instrumentation import instrumentation
+from source.libs.modelBuilder import ModelBuilder
+from source.libs.modelCache import ModelCache
+from source.libs.slidingWindows import SlidingWindows
+from source.structs.dataset import Dataset
+from source.structs.params import TrainingParams
+from source.structs.results import TrainingResult
+
+
+class Trainer:
+    """
+    Trains the model described by a TrainingParams instance on its own dataset.
+    Datasets are shared across trainings through a DatasetCache.
+    If a CheckpointStore is given, runs are checkpointed under their Hash and resumed from their last checkpoint.
+    """
+
+    def __init__(self, dataset_cache: Optional[DatasetCache] = None, model_builder: Optional[ModelBuilder] = None,
+                 seed: Optional[int] = None, workers: int = BatchSequence.DEFAULT_WORKERS,
+                 checkpoint_store: Optional[CheckpointStore] = None, model_cache: Optional[ModelCache] = None,
+                 artifact_store: Optional[ArtifactStore] = None):
+        """
+        :param dataset_cache: The cache datasets are loaded through.
+        :param model_builder: The builder models are created with.
+        :param seed: The seed used for weight initialization and shuffling; if None, runs are not deterministic.
+        :param workers: The amount of threads assembling batches in the background.
+        :param checkpoint_store: The store runs are checkpointed into; if None, runs are not checkpointed.
+        :param model_cache: The cache compiled models are reused through; if None, every run builds its own model.
+        :param artifact_store: The store trained models are saved into, along with their TrainingResult;
+        if None, trained models are discarded.
+        """
+        self.__dataset_cache = dataset_cache or DatasetCache()
+        self.__model_builder = model_builder or ModelBuilder()
+        self.__seed = seed
+        self.__workers = workers
+        self.__checkpoint_store = checkpoint_store
+        self.__model_cache = model_cache
+        self.__artifact_store = artifact_store
+
+    @property
+    def dataset_cache(self) -> DatasetCache:
+        return self.__dataset_cache
+
+    @property
+    def model_builder(self) -> ModelBuilder:
+        return self.__model_builder
+
+    @property
+    def checkpoint_store(self) -> Optional[CheckpointStore]:
+        return self.__checkpoint_store
+
+    @property
+    def model_cache(self) -> Optional[ModelCache]:
+        return self.__model_cache
+
+    @property
+    def artifact_store(self) -> Optional[ArtifactStore]:
+        return self.__artifact_store
+
+    def prepare(self, training_params: TrainingParams, output_names: Optional[Sequence[str]] = None,
+                dataset: Optional[Dataset] = None) -> BatchSequence:
+        """
+        Loads and windows the dataset described by the given TrainingParams.
+        :param training_params: A TrainingParams instance.
+        :param output_names: The names of the outputs of a packed model, if the data is meant for one.
+        :param dataset: The dataset already loaded for these TrainingParams (e.g. attached from shared memory);
+        if None, it is loaded through the DatasetCache.
+        :return: A BatchSequence ready to be fed to a model.
+        """
+        with instrumentation.stage('load', training_params.Hash):
+            if dataset is None:
+                dataset = self.__dataset_cache.get(training_params)
+        with instrumentation.stage('windowing', training_params.Hash):
+            windows = SlidingWindows(dataset, training_params.WindowWidth)
+            return BatchSequence.from_params(windows, training_params, seed=self.__seed, workers=self.__workers,
+                                             output_names=output_names)
+
+    def build(self, training_params: TrainingParams, data: BatchSequence) -> keras.Model:
+        """
+        Builds and compiles the model described by the given TrainingParams, shaped after its data.
+        If a ModelCache is set, a cached model with the same architecture is reset and reused instead.
+        :param training_params: A TrainingParams instance.
+        :param data: The data the model will be fed with.
+        :return: A compiled Keras model.
+        """
+        if self.__seed is not None:
+            keras.utils.set_random_seed(self.__seed)
+        input_shape = (data.windows.window_width, len(data.windows.feature_names))
+        with instrumentation.stage('build_model', training_params.Hash):
+            if self.__model_cache is not None:
+                return self.__model_cache.get(training_params, input_shape, data.windows.target_index)
+            return self.__model_builder.build(training_params, input_shape, data.windows.target_index)
+
+    def build_packed(self, packed_params: Sequence[TrainingParams], data: BatchSequence) -> keras.Model:
+        """
+        Builds and compiles a packed model holding one head per TrainingParams, shaped after their shared data.
+        :param packed_params: A sequence of TrainingParams sharing their data and CompileOptimizer.
+        :param data: The data the model will be fed with.
+        :return: A compiled Keras model, whose outputs are keyed by Hash.
+        """
+        if self.__seed is not None:
+            keras.utils.set_random_seed(self.__seed)
+        input_shape = (data.windows.window_width, len(data.windows.feature_names))
+        return self.__model_builder.build_packed(packed_params, input_shape, data.windows.target_index)
+
+    @staticmethod
+    def get_callbacks(training_params: TrainingParams) -> list[keras.callbacks.Callback]:
+        """
+        Builds the callbacks every training run relies on.
+        :param training_params: A TrainingParams instance.
+        :return: A list of Keras callbacks.
+        """
+        return [keras.callbacks.EarlyStopping(monitor='loss', patience=training_params.FitPatience)]
+
+    def train(self, training_params: TrainingParams, data: Optional[BatchSequence] = None) -> TrainingResult:
+        """
+        Trains the model described by the given TrainingParams for up to FitMaxEpochs epochs,
+        stopping early once the loss has not improved for FitPatience epochs.
+        When checkpointing, a run with a checkpoint resumes from its last saved epoch, with its weights, optimizer state,
+        early stopping state and shuffling state restored; a run whose checkpoint is marked as finished is not trained again.
+        :param training_params: A TrainingParams instance.
+        :param data: Data already prepared for these TrainingParams; if None, it is prepared here.
+        :return: A TrainingResult.
+        """
+        checkpoint = None
+        if self.__checkpoint_store is not None:
+            checkpoint = self.__checkpoint_store.load(training_params.Hash)
+            if checkpoint is not None and checkpoint.Finished:
+                return TrainingResult(Hash=training_params.Hash, Epochs=checkpoint.Epoch, History=checkpoint.History)
+        if data is None:
+            data = self.prepare(training_params)
+        model = self.build(training_params, data)
+        callbacks = self.get_callbacks(training_params)
+        if self.__checkpoint_store is not None:
+            checkpoint = self.__checkpoint_store.restore(training_params.Hash, model)
+            callbacks = self.__checkpoint_store.get_callbacks(training_params.Hash, checkpoint,
+                                                              training_params.FitPatience, data)
+        history = {key: list(values) for key, values in checkpoint.History.items()} if checkpoint else {}
+        with instrumentation.stage('train', training_params.Hash):
+            fit_history = model.fit(data, epochs=training_params.FitMaxEpochs,
+                                    initial_epoch=checkpoint.Epoch if checkpoint else 0, callbacks=callbacks,
+                                    shuffle=False, verbose=0)
+        instrumentation.count('train.epochs', len(fit_history.epoch))
+        for key, values in fit_history.history.items():
+            history.setdefault(key, []).extend(float(value) for value in values)
+        result = TrainingResult(Hash=training_params.Hash, Epochs=len(history.get('loss', [])), History=history)
+        if self.__artifact_store is not None:
+            self.__artifact_store.save(training_params.Hash, model, dataclasses.asdict(result))
+        return result
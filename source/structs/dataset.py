@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy
+
+
+@dataclass
+class Dataset:
+    Index: numpy.ndarray
+    Columns: dict[str, numpy.ndarray]
+    ColumnToPredict: Optional[str] = None
+
+
+@dataclass
+class SharedArray:
+    Name: str
+    Shape: tuple[int, ...]
+    Dtype: str
+
+
+@dataclass
+class SharedDatasetHandle:
+    Index: SharedArray
+    Columns: dict[str, SharedArray]
+    ColumnToPredict: Optional[str] = None
+
+
+@dataclass
+class ColumnStatistics:
+    Min: Optional[float]
+    Max: Optional[float]
+    Mean: Optional[float]
+    Count: int
+
+
+@dataclass
+class BlockStatistics:
+    Id: int
+    FirstRow: int
+    Rows: int
+    Columns: dict[str, ColumnStatistics]
@@ -39,6 +39,8 @@ class LayerParamsCombinations:
     KernelInitializer: Optional[Sequence[Optional[Callable]]] = None
     KernelRegularizer: Optional[Sequence[Optional[Callable]]] = None
     Activation: Optional[Sequence[Optional[Callable]]] = None
+    Ties: Optional[dict[str, str]] = None
+    UnitsScale: Optional[float] = None
 
 
 @dataclass
@@ -0,0 +1,88 @@
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from source.structs.params import TrainingParams
+
+
+@dataclass
+class TrainingResult:
+    Hash: str
+    Epochs: int
+    History: dict[str, list[float]] = field(default_factory=dict)
+
+
+@dataclass
+class JobOutcome:
+    Params: TrainingParams
+    Result: Optional[Any] = None
+    Error: Optional[BaseException] = None
+
+
+@dataclass
+class Checkpoint:
+    Hash: str
+    Epoch: int
+    Finished: bool
+    History: dict[str, list[float]] = field(default_factory=dict)
+
+
+@dataclass
+class QueuedJob:
+    Hash: str
+    Params: TrainingParams
+    Attempts: int
+    WorkerId: str
+    LeaseExpiry: float
+
+
+@dataclass
+class ServingStatistics:
+    Requests: int
+    Batches: int
+    MeanBatchSize: float
+    LatencyP50: float
+    LatencyP99: float
+    Throughput: float
+
+
+@dataclass
+class ExportReport:
+    Hash: str
+    Quantization: str
+    Path: str
+    Size: int
+    Samples: int
+    MeanAbsoluteDelta: float
+    MaxAbsoluteDelta: float
+    KerasMeanAbsoluteError: float
+    ExportedMeanAbsoluteError: float
+
+
+@dataclass
+class EvaluationResult:
+    Hash: str
+    Samples: int
+    MeanAbsoluteError: float
+    MeanSquaredError: float
+
+
+@dataclass
+class StageEvent:
+    Name: str
+    Hash: Optional[str]
+    Start: float
+    Duration: float
+    ProcessId: int
+    ThreadId: int
+    MemoryDelta: Optional[int] = None
+    MemoryPeak: Optional[int] = None
+    Tags: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class StageSummary:
+    Name: str
+    Count: int
+    Total: float
+    Mean: float
+    Max: float
@@ -0,0 +1,64 @@
+import dataclasses
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.paramsBenchmark import BASELINE_PATH, BenchmarkResult, ParamsBenchmark, Regression, compare, main
+
+
+def build_result(**overrides) -> BenchmarkResult:
+    fields = dict(Benchmark='DateRange', Size=100, Depth=1, WallTime=1.0, TimePerCombination=0.01, PeakMemory=1000,
+                  PeakMemoryPerCombination=10.0, AllocatedBlocks=300, BlocksPerCombination=3.0)
+    fields.update(overrides)
+    return BenchmarkResult(**fields)
+
+
+@pytest.fixture
+def new_instance() -> ParamsBenchmark:
+    return ParamsBenchmark(repeat=1)
+
+
+def test_instantiation_success(new_instance: ParamsBenchmark):
+    assert isinstance(new_instance, ParamsBenchmark)
+
+
+@pytest.mark.parametrize('result,expected_output', [
+    pytest.param(build_result(), [], id='unchanged'),
+    pytest.param(build_result(TimePerCombination=0.012), [], id='within tolerance'),
+    pytest.param(build_result(TimePerCombination=0.005, BlocksPerCombination=1.0), [], id='improved'),
+    pytest.param(build_result(Size=1000, TimePerCombination=1.0), [], id='missing from baseline'),
+    pytest.param(build_result(TimePerCombination=0.02, PeakMemoryPerCombination=20.0),
+                 [Regression(Benchmark='DateRange', Size=100, Depth=1, Metric='TimePerCombination', Baseline=0.01,
+                             Current=0.02, Ratio=2.0),
+                  Regression(Benchmark='DateRange', Size=100, Depth=1, Metric='PeakMemoryPerCombination',
+                             Baseline=10.0, Current=20.0, Ratio=2.0)], id='regressed'),
+])
+def test_compare_success(result: BenchmarkResult, expected_output: list[Regression]):
+    baseline = [dataclasses.asdict(build_result()), dataclasses.asdict(build_result(Depth=4, BlocksPerCombination=0.0))]
+    assert compare([result], baseline, tolerance=1.25) == expected_output
+    assert compare([build_result(Depth=4, BlocksPerCombination=5.0)], baseline, tolerance=1.25) == []
+
+
+def test_baseline_success(new_instance: ParamsBenchmark):
+    baseline = json.loads(BASELINE_PATH.read_text())
+    computed_output = {(result['Benchmark'], result['Size'], result['Depth']) for result in baseline['Results']}
+    expected_output = {(name, size, depth) for depth in (1, 4, 16) for size in (100, 1000, 10000)
+                       for name in new_instance.get_benchmarks(size, depth, depth == 1)}
+    assert computed_output == expected_output
+
+
+@pytest.mark.parametrize('time_per_combination,expected_output', [
+    pytest.param(1.0, 0, id='no regressions'),
+    pytest.param(1e-12, 1, id='regressions'),
+])
+def test_main_success(tmp_path: Path, time_per_combination: float, expected_output: int):
+    baseline_path = tmp_path / 'baseline.json'
+    baseline_path.write_text(json.dumps({'Results': [dataclasses.asdict(build_result(
+        TimePerCombination=time_per_combination, PeakMemoryPerCombination=1e9, BlocksPerCombination=1e9))]}))
+    output_path = tmp_path / 'results.json'
+    assert main(['--max-size', '100', '--depths', '1', '--benchmarks', 'DateRange', '--repeat', '1',
+                 '--baseline', str(baseline_path), '--output', str(output_path)]) == expected_output
+    output = json.loads(output_path.read_text())
+    assert [(result['Benchmark'], result['Size']) for result in output['Results']] == [('DateRange', 100)]
+    assert len(output['Regressions']) == expected_output
@@ -0,0 +1,111 @@
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import keras
+import numpy
+import pytest
+
+from source.libs.artifactStore import ArtifactStore, MissingArtifactException
+from source.libs.modelBuilder import ModelBuilder
+from source.libs.predictionServer import PredictionServer
+from source.libs.trainer import Trainer
+from source.structs.customTypes import DateRange
+from source.structs.params import TrainingParams as TrainParams, LayerParams
+
+
+def build_training_params(dataset_path: Path = None, **overrides) -> TrainParams:
+    fields = dict(Hash='aaa', ColumnToPredict='Close', WindowWidth=5, SetTrainingFlag=False, UseResidualWrapper=True,
+                  PrependBatchNormLayer=True, FitMaxEpochs=2, FitPatience=10,
+                  CompileLossFunction=keras.losses.MeanAbsoluteError, CompileOptimizer=keras.optimizers.Adam,
+                  LayerStack={0: LayerParams(Units=4, Activation=keras.activations.relu)}, DatasetPath=dataset_path,
+                  DatasetTimeFilter=DateRange(), DatasetShuffle=False, DatasetBatchSize=8)
+    fields.update(overrides)
+    return TrainParams(**fields)
+
+
+@pytest.fixture
+def new_instance(tmp_path: Path) -> ArtifactStore:
+    return ArtifactStore(tmp_path / 'artifacts')
+
+
+@pytest.fixture
+def model() -> keras.Model:
+    keras.utils.set_random_seed(1)
+    return ModelBuilder().build(build_training_params(), (5, 2), 1)
+
+
+def test_instantiation_success(new_instance: ArtifactStore):
+    assert isinstance(new_instance, ArtifactStore)
+    assert new_instance.hashes() == []
+    assert 'aaa' not in new_instance
+
+
+@pytest.mark.parametrize('first_array,second_array,expected_output', [
+    pytest.param(numpy.zeros(4, dtype=numpy.float32), numpy.zeros(4, dtype=numpy.float32), True),
+    pytest.param(numpy.zeros(4, dtype=numpy.float32), numpy.zeros(4, dtype=numpy.float64), False),
+    pytest.param(numpy.zeros(4, dtype=numpy.float32), numpy.zeros((2, 2), dtype=numpy.float32), False),
+    pytest.param(numpy.arange(6.0).reshape(3, 2).T, numpy.arange(6.0).reshape(3, 2).T.copy(), True),
+])
+def test_get_digest_success(first_array: numpy.ndarray, second_array: numpy.ndarray, expected_output: bool):
+    assert (ArtifactStore.get_digest(first_array) == ArtifactStore.get_digest(second_array)) == expected_output
+
+
+def test_save_load_success(new_instance: ArtifactStore, model: keras.Model):
+    new_instance.save('aaa', model, {'Epochs': 2})
+    assert 'aaa' in new_instance
+    assert new_instance.hashes() == ['aaa']
+    assert new_instance.load_metadata('aaa') == {'Epochs': 2}
+
+    weights = new_instance.load_weights('aaa')
+    assert all(isinstance(array, numpy.memmap) and not array.flags.writeable for array in weights)
+    for expected, computed in zip(model.get_weights(), weights):
+        numpy.testing.assert_array_equal(computed, expected)
+
+    computed_output = new_instance.load_model('aaa')
+    samples = numpy.random.default_rng(0).normal(size=(3, 5, 2)).astype(numpy.float32)
+    numpy.testing.assert_allclose(computed_output.predict_on_batch(samples), model.predict_on_batch(samples),
+                                  rtol=1e-6)
+
+
+def test_save_deduplication_success(new_instance: ArtifactStore, model: keras.Model):
+    new_instance.save('aaa', model)
+    blobs = sorted(new_instance.root.glob('blobs/*.npy'))
+    assert len(blobs) == len({ArtifactStore.get_digest(weights) for weights in model.get_weights()})
+    new_instance.save('bbb', model)
+    assert sorted(new_instance.root.glob('blobs/*.npy')) == blobs
+
+    model.layers[-2].set_weights([weights + 1 for weights in model.layers[-2].get_weights()])
+    new_instance.save('ccc', model)
+    assert len(list(new_instance.root.glob('blobs/*.npy'))) > len(blobs)
+    new_instance.remove('ccc')
+    assert new_instance.collect_garbage() > 0
+    assert sorted(new_instance.root.glob('blobs/*.npy')) == blobs
+    new_instance.remove('aaa')
+    assert new_instance.collect_garbage() == 0
+
+
+def test_load_missing_failure(new_instance: ArtifactStore):
+    with pytest.raises(MissingArtifactException):
+        new_instance.load_model('aaa')
+
+
+def test_trainer_and_server_success(new_instance: ArtifactStore, tmp_path: Path):
+    hash_value = 'a' * 32
+    dataset_path = tmp_path / 'dataset.csv'
+    lines = ['Date,Open,Close'] + [f'{datetime(2025, 1, 1) + timedelta(days=row)},{row % 7}.0,{row % 5}.0'
+                                   for row in range(40)]
+    dataset_path.write_text('\n'.join(lines) + '\n')
+    result = Trainer(seed=1, artifact_store=new_instance).train(build_training_params(dataset_path, Hash=hash_value))
+    assert new_instance.load_metadata(hash_value) == {'Hash': hash_value, 'Epochs': 2, 'History': result.History}
+
+    sample = numpy.zeros((5, 2), dtype=numpy.float32)
+
+    async def run() -> numpy.ndarray:
+        server = PredictionServer(artifact_store=new_instance)
+        prediction = await server.predict(hash_value, sample)
+        await server.close()
+        return prediction
+
+    expected_output = new_instance.load_model(hash_value).predict_on_batch(sample[numpy.newaxis])[0]
+    numpy.testing.assert_allclose(asyncio.run(run()), expected_output, rtol=1e-6)
@@ -1,8 +1,9 @@
-from typing import Optional, Type
+from dataclasses import dataclass
+from typing import Any, Optional, Type
 
 import pytest
 
-from source.libs.baseTestCase import BaseTestCase
+from source.libs.baseTestCase import BaseTestCase, Lazy
 
 
 @pytest.fixture
@@ -49,3 +50,47 @@ def test_expected_exception_success(input_value: Optional[Type[Exception]],
                                     expected_output: Optional[Type[Exception]]):
     instance = BaseTestCase(expected_exception=input_value)
     assert instance.expected_exception is expected_output
+
+
+@dataclass
+class LazyTestCase(BaseTestCase):
+    input_object: Any
+    expected_output: Any = None
+
+
+class CountingFactory:
+
+    def __init__(self, value: Any):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self) -> Any:
+        self.calls += 1
+        return self.value
+
+
+def test_lazy_success():
+    factory = CountingFactory([1, 2])
+    lazy_value = Lazy(factory)
+    assert not lazy_value.built
+    assert repr(lazy_value) == 'Lazy(...)'
+    assert lazy_value.get() is lazy_value.get()
+    assert lazy_value.built
+    assert repr(lazy_value) == 'Lazy([1, 2])'
+    assert factory.calls == 1
+
+
+def test_lazy_field_success():
+    input_factory, output_factory = CountingFactory([1, 2]), CountingFactory(3)
+    shared_value = Lazy(output_factory)
+    test_cases = [LazyTestCase(id='first', input_object=Lazy(input_factory), expected_output=shared_value),
+                  LazyTestCase(id='second', input_object=4, expected_output=shared_value)]
+    assert [test_case.id for test_case in test_cases] == ['--- FIRST ---', '--- SECOND ---']
+    assert (input_factory.calls, output_factory.calls) == (0, 0)
+
+    assert test_cases[0].input_object == [1, 2]
+    assert test_cases[0].input_object is input_factory.value
+    assert (input_factory.calls, output_factory.calls) == (1, 0)
+    assert test_cases[0].expected_output == test_cases[1].expected_output == 3
+    assert (input_factory.calls, output_factory.calls) == (1, 1)
+    assert test_cases[0] == LazyTestCase(id='first', input_object=[1, 2], expected_output=3)
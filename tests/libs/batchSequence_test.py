@@ -0,0 +1,137 @@
+import threading
+import time
+from dataclasses import dataclass
+
+import keras
+import numpy
+import pytest
+
+from source.libs.baseTestCase import BaseTestCase
+from source.libs.batchSequence import BatchSequence
+from source.libs.slidingWindows import SlidingWindows
+from source.structs.customTypes import DateRange
+from source.structs.dataset import Dataset
+from source.structs.params import TrainingParams as TrainParams, LayerParams
+
+
+def build_windows(rows: int = 30, window_width: int = 3) -> SlidingWindows:
+    dataset = Dataset(Index=numpy.arange(rows).astype('datetime64[ns]'),
+                      Columns={'Open': numpy.arange(rows, dtype=numpy.float32),
+                               'Close': numpy.arange(rows, dtype=numpy.float32) * 10},
+                      ColumnToPredict='Close')
+    return SlidingWindows(dataset, window_width)
+
+
+def collect_targets(instance: BatchSequence) -> list[list[float]]:
+    return [instance[index][1].ravel().tolist() for index in range(len(instance))]
+
+
+def test_instantiation_success():
+    instance = BatchSequence(build_windows(), 4)
+    assert isinstance(instance, BatchSequence)
+    assert isinstance(instance, keras.utils.PyDataset)
+
+
+@dataclass
+class BatchSequenceTestCase(BaseTestCase):
+    rows: int = 30
+    batch_size: int = 4
+    expected_output: list[int] = None
+
+
+BSequenceTC = BatchSequenceTestCase
+
+
+@pytest.mark.parametrize('test_case', [pytest.param(test_case, id=test_case.id) for test_case in [
+    BSequenceTC(id='complete batches only',
+                rows=11, batch_size=4, expected_output=[4, 4]),
+    BSequenceTC(rows=4, batch_size=1, expected_output=[1]),
+    BSequenceTC(id='incomplete last batch',
+                rows=30, batch_size=4, expected_output=[4, 4, 4, 4, 4, 4, 3]),
+    BSequenceTC(rows=10, batch_size=64, expected_output=[7]),
+    BSequenceTC(id='no samples',
+                rows=3, batch_size=4, expected_output=[]),
+]])
+def test_batches_success(test_case: BatchSequenceTestCase):
+    instance = BatchSequence(build_windows(test_case.rows), test_case.batch_size)
+    assert len(instance) == instance.num_batches == len(test_case.expected_output)
+    assert [len(instance[index][0]) for index in range(len(instance))] == test_case.expected_output
+    expected_targets = [float(row * 10) for row in range(3, test_case.rows)]
+    assert sum(collect_targets(instance), []) == expected_targets
+
+
+def test_getitem_out_of_range_failure():
+    instance = BatchSequence(build_windows(), 4)
+    with pytest.raises(IndexError):
+        instance[len(instance)]
+
+
+def test_shuffle_success():
+    ordered_targets = collect_targets(BatchSequence(build_windows(), 4))
+    first_instance = BatchSequence(build_windows(), 4, shuffle=True, seed=7)
+    second_instance = BatchSequence(build_windows(), 4, shuffle=True, seed=7)
+    first_targets = collect_targets(first_instance)
+    assert first_targets == collect_targets(second_instance)
+    assert first_targets != ordered_targets
+    assert sorted(sum(first_targets, [])) == sum(ordered_targets, [])
+    assert all(batch == sorted(batch) for batch in first_targets)
+
+    first_instance.on_epoch_end()
+    second_instance.on_epoch_end()
+    assert collect_targets(first_instance) != first_targets
+    assert collect_targets(first_instance) == collect_targets(second_instance)
+
+
+def test_from_params_success():
+    training_params = TrainParams(Hash='', ColumnToPredict='Close', WindowWidth=3, SetTrainingFlag=True,
+                                  UseResidualWrapper=False, PrependBatchNormLayer=False, FitMaxEpochs=1,
+                                  FitPatience=1, CompileLossFunction=min, CompileOptimizer=max,
+                                  LayerStack={0: LayerParams(Units=1)}, DatasetPath=None,
+                                  DatasetTimeFilter=DateRange(), DatasetShuffle=True, DatasetBatchSize=5)
+    instance = BatchSequence.from_params(build_windows(), training_params, seed=1)
+    assert len(instance) == 6
+    assert collect_targets(instance) != collect_targets(BatchSequence(build_windows(), 5))
+
+
+class ConcurrencyProbe(BatchSequence):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def __getitem__(self, index: int):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.02)
+        with self.lock:
+            self.running -= 1
+        return super().__getitem__(index)
+
+
+def test_prefetch_success():
+    assert BatchSequence.DEFAULT_WORKERS >= 2
+    instance = ConcurrencyProbe(build_windows(), 4)
+    model = keras.Sequential([keras.Input((3, 2)), keras.layers.Flatten(), keras.layers.Dense(1)])
+    model.compile(optimizer='sgd', loss='mae')
+    model.fit(instance, epochs=1, verbose=0)
+    assert instance.max_running > 1
+
+
+def test_fit_success():
+    instance = BatchSequence(build_windows(), 4, shuffle=True, seed=1, workers=2, max_queue_size=2)
+    model = keras.Sequential([keras.Input((3, 2)), keras.layers.Flatten(), keras.layers.Dense(1)])
+    model.compile(optimizer='sgd', loss='mae')
+    history = model.fit(instance, epochs=2, verbose=0)
+    assert len(history.history['loss']) == 2
+
+
+def test_output_names_success():
+    instance = BatchSequence(build_windows(), 4, output_names=['a', 'b'])
+    features, targets = instance[0]
+    assert features.shape == (4, 3, 2)
+    assert list(targets) == ['a', 'b']
+    assert targets['a'] is targets['b']
+    assert targets['a'].ravel().tolist() == [30.0, 40.0, 50.0, 60.0]
@@ -0,0 +1,181 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy
+import pytest
+
+from source.libs.baseTestCase import BaseTestCase
+from source.libs.blockIndex import BlockIndex, EmptyWindowException
+from source.libs.columnarStore import ColumnarStore
+from source.libs.datasetLoader import DatasetLoader
+from source.structs.customTypes import DateRange
+from source.structs.dataset import ColumnStatistics
+
+START_DATE = datetime(2025, 1, 1)
+ROWS = 48  # four rows per day, during 12 days
+
+
+@pytest.fixture
+def dataset_path(tmp_path: Path) -> Path:
+    path = tmp_path / 'dataset.csv'
+    lines = ['Date,Open,Close']
+    for row in range(ROWS):
+        close = '' if row == 5 else f'{row * 10}.0'
+        lines.append(f'{START_DATE + timedelta(hours=6 * row)},{row}.0,{close}')
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+@pytest.fixture
+def new_instance(dataset_path: Path) -> BlockIndex:
+    return BlockIndex.build(dataset_path, chunk_rows=5)
+
+
+def test_instantiation_success(new_instance: BlockIndex):
+    assert isinstance(new_instance, BlockIndex)
+    assert len(new_instance.blocks) == 12
+    assert [block.Rows for block in new_instance.blocks] == [4] * 12
+    assert [block.FirstRow for block in new_instance.blocks] == list(range(0, ROWS, 4))
+    assert new_instance.blocks[1].Columns['Close'] == ColumnStatistics(Min=40.0, Max=70.0, Mean=170.0 / 3, Count=3)
+    assert new_instance.blocks[1].Columns['Open'] == ColumnStatistics(Min=4.0, Max=7.0, Mean=5.5, Count=4)
+
+
+@pytest.mark.parametrize('chunk_rows', [1, 3, 4, 7, 100])
+def test_build_chunk_independence_success(dataset_path: Path, new_instance: BlockIndex, chunk_rows: int):
+    computed_output = BlockIndex.build(dataset_path, chunk_rows=chunk_rows)
+    assert computed_output.blocks == new_instance.blocks
+    in_memory_output = BlockIndex.from_dataset(DatasetLoader().read(dataset_path))
+    assert in_memory_output.blocks == new_instance.blocks
+
+
+def test_build_columnar_success(dataset_path: Path, tmp_path: Path, new_instance: BlockIndex):
+    computed_output = BlockIndex.build(dataset_path, loader=ColumnarStore(root=tmp_path / 'cache', dtype=numpy.float64))
+    assert computed_output.blocks == new_instance.blocks
+
+
+@pytest.mark.parametrize('chunk_rows', [3, 4])
+def test_build_mixed_dtypes_success(tmp_path: Path, chunk_rows: int):
+    dataset_path = tmp_path / 'dataset.csv'
+    lines = ['Date,Open,Volume'] + [f'{START_DATE + timedelta(hours=6 * row)},{row}.0,{"unknown" if row == 5 else row}'
+                                    for row in range(12)]
+    dataset_path.write_text('\n'.join(lines) + '\n')
+    computed_output = BlockIndex.build(dataset_path, chunk_rows=chunk_rows)
+    assert all(list(block.Columns) == ['Open', 'Volume'] for block in computed_output.blocks)
+    assert computed_output.blocks[1].Columns['Open'] == ColumnStatistics(Min=4.0, Max=7.0, Mean=5.5, Count=4)
+    assert computed_output.blocks[2].Columns['Volume'] == ColumnStatistics(Min=8.0, Max=11.0, Mean=9.5, Count=4)
+    assert computed_output.statistics(DateRange(), DatasetLoader().read(dataset_path))['Volume'].Count < 12
+
+
+def test_build_span_success(dataset_path: Path):
+    computed_output = BlockIndex.build(dataset_path, span=timedelta(days=3))  # blocks are aligned to the epoch
+    assert [block.Rows for block in computed_output.blocks] == [8, 12, 12, 12, 4]
+
+
+@dataclass
+class QueryMethodsTestCase(BaseTestCase):
+    time_filter: DateRange = None
+    expected_rows: slice = None
+    expected_exact_rows: slice = None
+    expected_statistics: ColumnStatistics = None
+
+
+QMethodsTC = QueryMethodsTestCase
+
+
+@pytest.mark.parametrize('test_case', [pytest.param(test_case, id=test_case.id) for test_case in [
+    QMethodsTC(id='unbounded filter',
+               time_filter=DateRange(), expected_rows=slice(0, 48), expected_exact_rows=slice(0, 48),
+               expected_statistics=ColumnStatistics(Min=0.0, Max=47.0, Mean=23.5, Count=48)),
+    QMethodsTC(id='aligned filters',
+               time_filter=DateRange(fm=START_DATE + timedelta(days=2)), expected_rows=slice(8, 48),
+               expected_exact_rows=slice(8, 48), expected_statistics=ColumnStatistics(Min=8.0, Max=47.0, Mean=27.5, Count=40)),
+    QMethodsTC(time_filter=DateRange(fm=START_DATE + timedelta(days=1), to=START_DATE + timedelta(days=1, hours=23)),
+               expected_rows=slice(4, 8), expected_exact_rows=slice(4, 8),
+               expected_statistics=ColumnStatistics(Min=4.0, Max=7.0, Mean=5.5, Count=4)),
+    QMethodsTC(id='unaligned filters',
+               time_filter=DateRange(fm=START_DATE + timedelta(days=1, hours=12),
+                                     to=START_DATE + timedelta(days=2, hours=1)),
+               expected_rows=slice(4, 12), expected_exact_rows=slice(6, 9),
+               expected_statistics=ColumnStatistics(Min=6.0, Max=8.0, Mean=7.0, Count=3)),
+    QMethodsTC(id='filters outside the dataset',
+               time_filter=DateRange(fm=datetime(2030, 1, 1)), expected_rows=slice(0, 0),
+               expected_exact_rows=slice(0, 0),
+               expected_statistics=ColumnStatistics(Min=None, Max=None, Mean=None, Count=0)),
+    QMethodsTC(time_filter=DateRange(to=datetime(2024, 1, 1)), expected_rows=slice(0, 0),
+               expected_exact_rows=slice(0, 0), expected_statistics=ColumnStatistics(Min=None, Max=None, Mean=None, Count=0)),
+]])
+def test_query_methods_success(new_instance: BlockIndex, dataset_path: Path, test_case: QueryMethodsTestCase):
+    dataset = DatasetLoader().read(dataset_path)
+    assert new_instance.resolve(test_case.time_filter) == test_case.expected_rows
+    assert new_instance.resolve(test_case.time_filter, dataset) == test_case.expected_exact_rows
+    assert new_instance.count_rows(test_case.time_filter) == \
+           test_case.expected_rows.stop - test_case.expected_rows.start
+    assert new_instance.statistics(test_case.time_filter, dataset)['Open'] == test_case.expected_statistics
+
+
+def test_statistics_missing_values_success(new_instance: BlockIndex, dataset_path: Path):
+    computed_output = new_instance.statistics(DateRange(to=START_DATE + timedelta(days=1, hours=23)),
+                                              DatasetLoader().read(dataset_path))['Close']
+    assert computed_output == ColumnStatistics(Min=0.0, Max=70.0, Mean=(280.0 - 50.0) / 7, Count=7)
+
+
+@pytest.mark.parametrize('time_filter', [
+    pytest.param(DateRange(fm=START_DATE + timedelta(hours=3), to=START_DATE + timedelta(days=3, hours=7))),
+    pytest.param(DateRange(fm=START_DATE + timedelta(days=4, hours=11), to=START_DATE + timedelta(days=4, hours=19))),
+    pytest.param(DateRange(fm=START_DATE + timedelta(hours=30))),
+    pytest.param(DateRange(to=START_DATE + timedelta(hours=1))),
+])
+def test_statistics_exact_success(new_instance: BlockIndex, dataset_path: Path, tmp_path: Path,
+                                  time_filter: DateRange):
+    for dataset in [DatasetLoader().read(dataset_path),
+                    ColumnarStore(root=tmp_path / 'cache', dtype=numpy.float64).read(dataset_path)]:
+        filtered_dataset = DatasetLoader.filter(dataset, time_filter, 'Close')
+        computed_output = new_instance.statistics(time_filter, dataset)
+        for name, values in filtered_dataset.Columns.items():
+            valid_values = values[~numpy.isnan(values)]
+            assert computed_output[name].Count == len(valid_values)
+            assert computed_output[name].Min == valid_values.min()
+            assert computed_output[name].Max == valid_values.max()
+            assert computed_output[name].Mean == pytest.approx(valid_values.mean())
+
+
+@pytest.mark.parametrize('time_filter,window_width,expected_exception', [
+    pytest.param(DateRange(), 47, None),
+    pytest.param(DateRange(), 48, EmptyWindowException),
+    pytest.param(DateRange(fm=START_DATE + timedelta(days=11)), 3, None),
+    pytest.param(DateRange(fm=START_DATE + timedelta(days=11)), 4, EmptyWindowException),
+    pytest.param(DateRange(fm=datetime(2030, 1, 1)), 1, EmptyWindowException),
+])
+def test_validate(new_instance: BlockIndex, time_filter: DateRange, window_width: int, expected_exception):
+    if expected_exception is None:
+        new_instance.validate(time_filter, window_width)
+    else:
+        with pytest.raises(expected_exception):
+            new_instance.validate(time_filter, window_width)
+
+
+def test_save_load_success(new_instance: BlockIndex, tmp_path: Path):
+    path = tmp_path / 'index.json'
+    new_instance.save(path)
+    computed_output = BlockIndex.load(path)
+    assert computed_output.blocks == new_instance.blocks
+    assert computed_output.span == new_instance.span
+    assert computed_output.fingerprint == new_instance.fingerprint
+    assert not list(tmp_path.glob(".*"))
+
+
+def test_load_or_build_success(dataset_path: Path):
+    sidecar_path = BlockIndex.get_sidecar_path(dataset_path)
+    assert sidecar_path == dataset_path.parent / 'dataset.csv.blocks.json'
+    first_output = BlockIndex.load_or_build(dataset_path)
+    assert sidecar_path.is_file()
+    assert BlockIndex.load_or_build(dataset_path).blocks == first_output.blocks
+
+    dataset_path.write_text(dataset_path.read_text().replace('470.0', '471.0'))
+    changed_output = BlockIndex.load_or_build(dataset_path)
+    assert changed_output.fingerprint != first_output.fingerprint
+    assert changed_output.blocks[-1].Columns['Close'].Max == 471.0
+
+    rebuilt_output = BlockIndex.load_or_build(dataset_path, span=timedelta(days=2))
+    assert len(rebuilt_output.blocks) == 7
@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import keras
+import numpy
+import pytest
+
+from source.libs.checkpointStore import CheckpointStore
+from source.libs.gridRunner import GridRunner
+from source.libs.trainer import Trainer
+from source.structs.customTypes import DateRange
+from source.structs.params import TrainingParams as TrainParams, LayerParams
+from source.structs.results import Checkpoint, TrainingResult
+
+
+@pytest.fixture
+def dataset_path(tmp_path: Path) -> Path:
+    path = tmp_path / 'dataset.csv'
+    lines = ['Date,Open,Close'] + [f'{datetime(2025, 1, 1) + timedelta(days=row)},{row % 7}.0,{row % 5}.0'
+                                   for row in range(40)]
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+def build_training_params(dataset_path: Path, **overrides) -> TrainParams:
+    fields = dict(Hash='aaa', ColumnToPredict='Close', WindowWidth=5, SetTrainingFlag=False, UseResidualWrapper=False,
+                  PrependBatchNormLayer=False, FitMaxEpochs=4, FitPatience=10,
+                  CompileLossFunction=keras.losses.MeanAbsoluteError, CompileOptimizer=keras.optimizers.Adam,
+                  LayerStack={0: LayerParams(Units=4)}, DatasetPath=dataset_path, DatasetTimeFilter=DateRange(),
+                  DatasetShuffle=False, DatasetBatchSize=8)
+    fields.update(overrides)
+    return TrainParams(**fields)
+
+
+@pytest.fixture
+def new_instance(tmp_path: Path) -> CheckpointStore:
+    return CheckpointStore(tmp_path / 'checkpoints')
+
+
+def test_instantiation_success(new_instance: CheckpointStore):
+    assert isinstance(new_instance, CheckpointStore)
+    assert new_instance.root.is_dir()
+    assert new_instance.load('aaa') is None
+    assert new_instance.pending == []
+    assert new_instance.completed == {}
+
+
+def test_save_restore_success(new_instance: CheckpointStore, dataset_path: Path):
+    trainer = Trainer(seed=1)
+    training_params = build_training_params(dataset_path)
+    data = trainer.prepare(training_params)
+    model = trainer.build(training_params, data)
+    model.fit(data, epochs=2, verbose=0)
+    new_instance.save('aaa', model, 2, {'loss': [2.0, 1.0]})
+
+    restored_model = trainer.build(training_params, data)
+    computed_output = new_instance.restore('aaa', restored_model)
+    assert computed_output == Checkpoint(Hash='aaa', Epoch=2, Finished=False, History={'loss': [2.0, 1.0]})
+    for expected, computed in zip(model.get_weights(), restored_model.get_weights()):
+        numpy.testing.assert_array_equal(computed, expected)
+    for expected, computed in zip(model.optimizer.variables, restored_model.optimizer.variables):
+        numpy.testing.assert_array_equal(numpy.asarray(computed), numpy.asarray(expected))
+    assert {path.name for path in new_instance.get_directory('aaa').iterdir()} == {
+        'current', new_instance.get_version_directory('aaa').name}
+
+    new_instance.remove('aaa')
+    assert new_instance.load('aaa') is None
+
+
+
+
+def test_save_interrupted_success(new_instance: CheckpointStore, dataset_path: Path, monkeypatch):
+    trainer = Trainer(seed=1)
+    training_params = build_training_params(dataset_path)
+    model = trainer.build(training_params, trainer.prepare(training_params))
+    new_instance.save('aaa', model, 1, {'loss': [1.0]})
+
+    def interrupt(path: Path, contents: str):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(CheckpointStore, '_CheckpointStore__write_atomically', staticmethod(interrupt))
+    with pytest.raises(KeyboardInterrupt):
+        new_instance.save('aaa', model, 2, {'loss': [1.0, 0.5]})
+    assert new_instance.load('aaa') == Checkpoint(Hash='aaa', Epoch=1, Finished=False, History={'loss': [1.0]})
+    assert new_instance.restore('aaa', trainer.build(training_params, trainer.prepare(training_params))) is not None
+def test_train_resume_success(new_instance: CheckpointStore, dataset_path: Path):
+    training_params = build_training_params(dataset_path)
+    expected_output = Trainer(seed=1).train(training_params).History['loss']
+
+    trainer = Trainer(seed=1, checkpoint_store=new_instance)
+    trainer.train(build_training_params(dataset_path, FitMaxEpochs=2))
+    checkpoint = new_instance.load('aaa')
+    assert checkpoint.Epoch == 2 and checkpoint.Finished
+    model = trainer.build(training_params, trainer.prepare(training_params))
+    new_instance.restore('aaa', model)
+    new_instance.save('aaa', model, checkpoint.Epoch, checkpoint.History, finished=False)  # as if interrupted
+
+    computed_output = trainer.train(training_params)
+    assert isinstance(computed_output, TrainingResult)
+    assert computed_output.Epochs == 4
+    assert computed_output.History['loss'][:2] == checkpoint.History['loss']
+    numpy.testing.assert_allclose(computed_output.History['loss'], expected_output, rtol=1e-5)
+    assert new_instance.load('aaa') == Checkpoint(Hash='aaa', Epoch=4, Finished=True, History=computed_output.History)
+    assert trainer.train(training_params) == computed_output
+
+
+
+
+class InterruptingCheckpointStore(CheckpointStore):
+
+    def save(self, hash_value: str, model: keras.Model, epoch: int, history: dict[str, list[float]],
+             finished: bool = False, data=None):
+        super().save(hash_value, model, epoch, history, finished, data)
+        if epoch == 2 and not finished:
+            raise KeyboardInterrupt
+
+
+@pytest.mark.parametrize('shuffle', [False, True])
+def test_train_interrupted_resume_success(new_instance: CheckpointStore, dataset_path: Path, shuffle: bool):
+    training_params = build_training_params(dataset_path, DatasetShuffle=shuffle)
+    expected_output = Trainer(seed=1).train(training_params).History['loss']
+
+    with pytest.raises(KeyboardInterrupt):
+        Trainer(seed=1, checkpoint_store=InterruptingCheckpointStore(new_instance.root)).train(training_params)
+    assert new_instance.load('aaa').Epoch == 2
+    computed_output = Trainer(seed=1, checkpoint_store=new_instance).train(training_params)
+    assert computed_output.Epochs == 4
+    numpy.testing.assert_allclose(computed_output.History['loss'], expected_output, rtol=1e-5)
+def test_train_resume_early_stopping_success(new_instance: CheckpointStore, dataset_path: Path):
+    training_params = build_training_params(dataset_path, FitMaxEpochs=10, FitPatience=2)
+    trainer = Trainer(seed=1, checkpoint_store=new_instance)
+    model = trainer.build(training_params, trainer.prepare(training_params))
+    new_instance.save('aaa', model, 3, {'loss': [0.5, 0.6, 0.7]})  # no improvement during the last two epochs
+    computed_output = trainer.train(training_params)
+    assert computed_output.Epochs == 4
+
+
+def test_sweep_success(new_instance: CheckpointStore, dataset_path: Path):
+    unfolded_params = [build_training_params(dataset_path, Hash=hash_value) for hash_value in ['a', 'b', 'c']]
+    assert new_instance.start_sweep(unfolded_params) == unfolded_params
+    assert new_instance.pending == ['a', 'b', 'c']
+    new_instance.mark_completed('b', TrainingResult(Hash='b', Epochs=1, History={'loss': [1.0]}))
+    assert new_instance.pending == ['a', 'c']
+    assert new_instance.completed == {'b': {'Hash': 'b', 'Epochs': 1, 'History': {'loss': [1.0]}}}
+    assert [params.Hash for params in CheckpointStore(new_instance.root).start_sweep(unfolded_params)] == ['a', 'c']
+
+
+def test_grid_runner_resume_success(tmp_path: Path, dataset_path: Path):
+    checkpoint_root = tmp_path / 'checkpoints'
+    CheckpointStore(checkpoint_root).mark_completed('a')
+    unfolded_params = [build_training_params(dataset_path, Hash=hash_value, FitMaxEpochs=2)
+                       for hash_value in ['a', 'b']]
+    computed_output = list(GridRunner(workers=1, checkpoint_root=checkpoint_root).run(unfolded_params))
+    assert [outcome.Params.Hash for outcome in computed_output] == ['b']
+    assert computed_output[0].Error is None
+    assert set(CheckpointStore(checkpoint_root).completed) == {'a', 'b'}
+    assert not (checkpoint_root / 'b').exists()
@@ -0,0 +1,140 @@
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import numpy
+import pytest
+
+from source.libs.baseTestCase import BaseTestCase
+from source.libs.columnarStore import ColumnarStore
+from source.libs.datasetCache import DatasetCache
+from source.libs.datasetLoader import DatasetLoader, MissingColumnException
+from source.structs.customTypes import DateRange
+
+CSV_CONTENTS = ('Date,Open,Close\n'
+                '2025-01-03,3.0,30.0\n'
+                '2025-01-01,1.0,10.0\n'
+                '2025-01-02,2.0,20.0\n'
+                '2025-01-04,4.0,40.0\n')
+
+
+@pytest.fixture
+def dataset_path(tmp_path: Path) -> Path:
+    path = tmp_path / 'dataset.csv'
+    path.write_text(CSV_CONTENTS)
+    return path
+
+
+@pytest.fixture
+def new_instance(tmp_path: Path) -> ColumnarStore:
+    return ColumnarStore(root=tmp_path / 'cache')
+
+
+def test_instantiation_success(new_instance: ColumnarStore):
+    assert isinstance(new_instance, ColumnarStore)
+
+
+def test_convert_success(new_instance: ColumnarStore, dataset_path: Path, tmp_path: Path):
+    directory = new_instance.convert(dataset_path)
+    assert directory.parent == tmp_path / 'cache'
+    assert directory.name == f'{new_instance.fingerprint(dataset_path)}-float32'
+    metadata = json.loads((directory / ColumnarStore.METADATA_FILE_NAME).read_text())
+    assert metadata['Fingerprint'] == new_instance.fingerprint(dataset_path)
+    assert metadata['Rows'] == 4
+    assert list(metadata['Columns'].keys()) == ['Open', 'Close']
+    assert new_instance.convert(dataset_path) == directory
+
+
+def test_convert_default_root_success(dataset_path: Path):
+    directory = ColumnarStore().convert(dataset_path)
+    assert directory.parent == dataset_path.parent / '.columnar'
+
+
+def test_convert_content_change_success(new_instance: ColumnarStore, dataset_path: Path):
+    first_directory = new_instance.convert(dataset_path)
+    dataset_path.write_text(CSV_CONTENTS.replace('40.0', '41.0'))
+    second_directory = new_instance.convert(dataset_path)
+    assert first_directory != second_directory
+    assert new_instance.read(dataset_path).Columns['Close'][-1] == 41.0
+
+
+def test_fingerprint_success(new_instance: ColumnarStore, dataset_path: Path, tmp_path: Path,
+                            monkeypatch: pytest.MonkeyPatch):
+    expected_output = DatasetLoader().fingerprint(dataset_path)
+    assert new_instance.fingerprint(dataset_path) == expected_output
+    assert len(list((tmp_path / 'cache' / ColumnarStore.FINGERPRINTS_DIRECTORY_NAME).iterdir())) == 1
+
+    hashed_paths = []
+    monkeypatch.setattr(DatasetLoader, 'fingerprint', lambda self, path: hashed_paths.append(path) or 'aaa')
+    assert ColumnarStore(root=tmp_path / 'cache').fingerprint(dataset_path) == expected_output
+    assert ColumnarStore(root=tmp_path / 'cache').get_directory(dataset_path).name == f'{expected_output}-float32'
+    assert hashed_paths == []
+
+    stats = dataset_path.stat()
+    os.utime(dataset_path, ns=(stats.st_atime_ns, stats.st_mtime_ns + 1))
+    assert ColumnarStore(root=tmp_path / 'cache').fingerprint(dataset_path) == 'aaa'
+    assert hashed_paths == [dataset_path]
+
+
+def test_read_success(new_instance: ColumnarStore, dataset_path: Path):
+    computed_output = new_instance.read(dataset_path)
+    assert isinstance(computed_output.Index, numpy.memmap)
+    assert computed_output.Index.dtype == numpy.dtype('datetime64[ns]')
+    assert numpy.all(computed_output.Index[:-1] <= computed_output.Index[1:])
+    for values in computed_output.Columns.values():
+        assert isinstance(values, numpy.memmap)
+        assert values.dtype == numpy.float32
+        assert not values.flags.writeable
+    assert computed_output.Columns['Open'].tolist() == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_read_dtype_success(dataset_path: Path, tmp_path: Path):
+    computed_output = ColumnarStore(root=tmp_path, dtype=numpy.float64).read(dataset_path)
+    assert computed_output.Columns['Open'].dtype == numpy.float64
+
+
+@dataclass
+class LoadMethodTestCase(BaseTestCase):
+    time_filter: DateRange
+    column_to_predict: str = 'Close'
+    expected_output: list[float] = None
+
+
+LoadMethTC = LoadMethodTestCase
+
+
+@pytest.mark.parametrize('test_case', [pytest.param(test_case, id=test_case.id) for test_case in [
+    LoadMethTC(id='unbounded filter',
+               time_filter=DateRange(), expected_output=[10.0, 20.0, 30.0, 40.0]),
+    LoadMethTC(id='bounded filter',
+               time_filter=DateRange(fm=datetime(2025, 1, 2), to=datetime(2025, 1, 3)),
+               expected_output=[20.0, 30.0]),
+    LoadMethTC(id='empty results',
+               time_filter=DateRange(fm=datetime(2026, 1, 1)), expected_output=[]),
+    LoadMethTC(id='missing columns',
+               time_filter=DateRange(), column_to_predict='aaa', expected_exception=MissingColumnException),
+]])
+def test_load(new_instance: ColumnarStore, dataset_path: Path, test_case: LoadMethodTestCase):
+    if test_case.expected_exception is None:
+        computed_output = new_instance.load(dataset_path, test_case.time_filter, test_case.column_to_predict)
+        assert computed_output.Columns[test_case.column_to_predict].tolist() == test_case.expected_output
+        assert not computed_output.Columns[test_case.column_to_predict].flags.owndata
+    else:
+        with pytest.raises(test_case.expected_exception):
+            new_instance.load(dataset_path, test_case.time_filter, test_case.column_to_predict)
+
+
+def test_dataset_cache_integration_success(new_instance: ColumnarStore, dataset_path: Path):
+    cache = DatasetCache(loader=new_instance)
+    computed_output = cache.load(dataset_path, DateRange(), 'Close')
+    assert isinstance(computed_output.Columns['Close'], numpy.memmap)
+    assert cache.load(dataset_path, DateRange(), 'Close') is computed_output
+
+
+def test_read_chunks_success(new_instance: ColumnarStore, dataset_path: Path):
+    time_filter = DateRange(fm=datetime(2025, 1, 2))
+    computed_output = list(new_instance.read_chunks(dataset_path, 2, time_filter))
+    assert [chunk.Columns['Close'].tolist() for chunk in computed_output] == [[20.0, 30.0], [40.0]]
+    assert all(isinstance(chunk.Columns['Close'], numpy.memmap) for chunk in computed_output)
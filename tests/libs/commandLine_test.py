@@ -0,0 +1,155 @@
+import io
+import json
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from source.libs.artifactStore import ArtifactStore
+from source.libs.commandLine import CommandLine, InvalidShardException
+
+CONFIG = {'ColumnToPredict': ['Close'], 'WindowWidth': [3, 5], 'SetTrainingFlag': [False],
+          'UseResidualWrapper': [True], 'PrependBatchNormLayer': [True], 'FitMaxEpochs': [2], 'FitPatience': [10],
+          'CompileLossFunction': ['keras.src.losses.losses.MeanAbsoluteError'],
+          'CompileOptimizer': ['keras.src.optimizers.adam.Adam'],
+          'LayerStack': [{'0': {'Units': [4, 8], 'Activation': ['keras.src.activations.activations.relu']}}],
+          'DatasetPath': [], 'DatasetTimeFilter': [{'fm': '2025-01-05'}, None],
+          'DatasetShuffle': [False], 'DatasetBatchSize': [8]}
+
+
+@pytest.fixture
+def config_path(tmp_path: Path) -> Path:
+    dataset_path = tmp_path / 'dataset.csv'
+    lines = ['Date,Open,Close'] + [f'{datetime(2025, 1, 1) + timedelta(days=row)},{row % 7}.0,{row % 5}.0'
+                                   for row in range(30)]
+    dataset_path.write_text('\n'.join(lines) + '\n')
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps({**CONFIG, 'DatasetPath': [str(dataset_path)]}))
+    return path
+
+
+@pytest.fixture
+def output() -> io.StringIO:
+    return io.StringIO()
+
+
+@pytest.fixture
+def new_instance(output: io.StringIO) -> CommandLine:
+    return CommandLine(output=output)
+
+
+def read_lines(output: io.StringIO) -> list:
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def test_instantiation_success(new_instance: CommandLine):
+    assert isinstance(new_instance, CommandLine)
+
+
+@pytest.mark.parametrize('value,expected_output', [
+    pytest.param('0/1', (0, 1)),
+    pytest.param('3/4', (3, 4)),
+])
+def test_parse_shard_success(value: str, expected_output: tuple[int, int]):
+    assert CommandLine.parse_shard(value) == expected_output
+
+
+@pytest.mark.parametrize('value', ['1', '1/2/3', 'a/b', '4/4', '-1/4', '0/0'])
+def test_parse_shard_failure(value: str):
+    with pytest.raises(InvalidShardException):
+        CommandLine.parse_shard(value)
+
+
+@pytest.mark.parametrize('size,shards,expected_output', [
+    pytest.param(8, 3, [[0, 1, 2], [3, 4, 5], [6, 7]]),
+    pytest.param(2, 3, [[0], [1], []]),
+    pytest.param(6, 2, [[0, 1, 2], [3, 4, 5]]),
+])
+def test_select_shard_success(size: int, shards: int, expected_output: list[list[int]]):
+    computed_output = [CommandLine.select_shard(list(range(size)), f'{index}/{shards}') for index in range(shards)]
+    assert computed_output == expected_output
+    assert CommandLine.select_shard(list(range(size)), None) == list(range(size))
+
+
+def test_count_success(new_instance: CommandLine, output: io.StringIO, config_path: Path):
+    assert new_instance.run(['count', str(config_path)]) == 0
+    assert read_lines(output) == [8]
+
+
+def test_plan_success(new_instance: CommandLine, output: io.StringIO, config_path: Path):
+    assert new_instance.run(['plan', str(config_path)]) == 0
+    computed_output = read_lines(output)[0]
+    assert (computed_output['Combinations'], computed_output['Loads'], computed_output['WindowBuilds']) == (8, 2, 4)
+    assert [group['Members'] for group in computed_output['Groups']] == [2, 2, 2, 2]
+
+
+def test_unfold_success(new_instance: CommandLine, output: io.StringIO, config_path: Path):
+    assert new_instance.run(['unfold', str(config_path)]) == 0
+    unfolded_params = read_lines(output)
+    assert len(unfolded_params) == 8
+    assert unfolded_params[0]['CompileOptimizer'] == 'keras.src.optimizers.adam.Adam'
+
+    shards = []
+    for index in range(3):
+        shard_output = io.StringIO()
+        CommandLine(output=shard_output).run(['unfold', str(config_path), '--shard', f'{index}/3'])
+        shards.append([params['Hash'] for params in read_lines(shard_output)])
+    assert [len(shard) for shard in shards] == [3, 3, 2]
+    assert sorted(sum(shards, [])) == sorted(params['Hash'] for params in unfolded_params)
+
+
+def test_unfold_gray_success(new_instance: CommandLine, output: io.StringIO, config_path: Path):
+    assert new_instance.run(['unfold', str(config_path), '--ordering', 'gray']) == 0
+    unfolded_params = read_lines(output)
+    lexicographic_output = io.StringIO()
+    CommandLine(output=lexicographic_output).run(['unfold', str(config_path)])
+    assert sorted(params['Hash'] for params in unfolded_params) == sorted(
+        params['Hash'] for params in read_lines(lexicographic_output))
+    changes = [[key for key in current if key != 'Hash' and current[key] != following[key]]
+               for current, following in zip(unfolded_params, unfolded_params[1:])]
+    assert all(len(field_names) == 1 for field_names in changes)
+    assert changes.count(['DatasetTimeFilter']) == 1
+
+    for index in range(3):
+        shard_output = io.StringIO()
+        CommandLine(output=shard_output).run(['unfold', str(config_path), '--ordering', 'gray', '--shard', f'{index}/3'])
+        shard_params = read_lines(shard_output)
+        assert shard_params == unfolded_params[[0, 3, 6][index]:[3, 6, 8][index]]
+        for current, following in zip(shard_params, shard_params[1:]):
+            assert len([key for key in current if key != 'Hash' and current[key] != following[key]]) == 1
+
+
+def test_train_success(new_instance: CommandLine, output: io.StringIO, config_path: Path, tmp_path: Path):
+    unfold_output = io.StringIO()
+    CommandLine(output=unfold_output).run(['unfold', str(config_path), '--shard', '1/4'])
+    assert new_instance.run(['train', str(config_path), '--shard', '1/4', '--seed', '1',
+                             '--artifact-root', str(tmp_path / 'artifacts')]) == 0
+    computed_output = read_lines(output)
+    assert [result['Hash'] for result in computed_output] == [params['Hash'] for params in read_lines(unfold_output)]
+    assert all(result['Epochs'] == 2 for result in computed_output)
+    assert ArtifactStore(tmp_path / 'artifacts').hashes() == sorted(result['Hash'] for result in computed_output)
+
+
+def test_train_shared_datasets_success(new_instance: CommandLine, output: io.StringIO, config_path: Path):
+    assert new_instance.run(['train', str(config_path), '--shard', '0/4', '--workers', '2', '--share-datasets']) == 0
+    computed_output = read_lines(output)
+    assert len(computed_output) == 2
+    assert all(result['Epochs'] == 2 for result in computed_output)
+
+
+def test_train_failure(new_instance: CommandLine, output: io.StringIO, config_path: Path):
+    config = json.loads(config_path.read_text())
+    config_path.write_text(json.dumps({**config, 'CompileOptimizer': ['keras.optimizers.Missing']}))
+    assert new_instance.run(['train', str(config_path), '--shard', '0/8']) == 1
+    assert 'Error' in read_lines(output)[0]
+
+
+def test_lazy_imports_success(config_path: Path):
+    script = ('import sys; from source.libs.commandLine import CommandLine; '
+              f'CommandLine().run(["plan", {str(config_path)!r}]); '
+              'print(sorted(name for name in ("keras", "tensorflow", "pandas") if name in sys.modules))')
+    completed_process = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True,
+                                       cwd=Path(__file__).parents[2])
+    assert completed_process.stdout.splitlines()[-1] == '[]'
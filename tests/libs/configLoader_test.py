@@ -0,0 +1,99 @@
+import json
+from datetime import datetime
+from pathlib import Path
+
+import keras
+import pytest
+
+from source.libs.configLoader import ConfigLoader, InvalidConfigException, UnresolvableCallableException
+from source.libs.paramsManager import ParamsManager
+from source.structs.customTypes import DateRange
+from source.structs.params import (TrainingParamsCombinations as TrainParamsCombs,
+                                   LayerParamsCombinations as LayerParamsCombs)
+
+CONFIG = {'ColumnToPredict': ['Close'], 'WindowWidth': [3, 5], 'SetTrainingFlag': [False],
+          'UseResidualWrapper': [True], 'PrependBatchNormLayer': [True], 'FitMaxEpochs': [2], 'FitPatience': [10],
+          'CompileLossFunction': ['keras.src.losses.losses.MeanAbsoluteError'],
+          'CompileOptimizer': ['keras.src.optimizers.adam.Adam', 'keras.src.optimizers.sgd.SGD'],
+          'LayerStack': [{'0': {'Units': [4, 8], 'Activation': ['keras.src.activations.activations.relu']}},
+                         {'0': {'Units': [4]}, '1': {'Units': [2]}}],
+          'DatasetPath': ['dataset.csv'], 'DatasetTimeFilter': [{'fm': '2025-01-05'}, None],
+          'DatasetShuffle': [False], 'DatasetBatchSize': [8]}
+
+EQUIVALENT_COMBINATIONS = TrainParamsCombs(
+    ColumnToPredict=['Close'], WindowWidth=[3, 5], SetTrainingFlag=[False], UseResidualWrapper=[True],
+    PrependBatchNormLayer=[True], FitMaxEpochs=[2], FitPatience=[10],
+    CompileLossFunction=[keras.losses.MeanAbsoluteError],
+    CompileOptimizer=[keras.optimizers.Adam, keras.optimizers.SGD],
+    LayerStack=[{0: LayerParamsCombs(Units=[4, 8], Activation=[keras.activations.relu])},
+                {0: LayerParamsCombs(Units=[4]), 1: LayerParamsCombs(Units=[2])}],
+    DatasetPath=[Path('dataset.csv')], DatasetTimeFilter=[DateRange(fm=datetime(2025, 1, 5)), DateRange()],
+    DatasetShuffle=[False], DatasetBatchSize=[8])
+
+
+@pytest.fixture
+def new_instance() -> ConfigLoader:
+    return ConfigLoader()
+
+
+def test_instantiation_success(new_instance: ConfigLoader):
+    assert isinstance(new_instance, ConfigLoader)
+
+
+@pytest.mark.parametrize('value,expected_output', [
+    pytest.param(None, DateRange()),
+    pytest.param({}, DateRange()),
+    pytest.param({'fm': '2025-01-05', 'to': None}, DateRange(fm=datetime(2025, 1, 5))),
+    pytest.param({'fm': '2025-01-05', 'to': '2025-02-01T12:00'},
+                 DateRange(fm=datetime(2025, 1, 5), to=datetime(2025, 2, 1, 12))),
+])
+def test_parse_time_filter_success(value: dict, expected_output: DateRange):
+    assert ConfigLoader.parse_time_filter(value) == expected_output
+
+
+def test_load_success(new_instance: ConfigLoader, tmp_path: Path):
+    (tmp_path / 'config.json').write_text(json.dumps(CONFIG))
+    computed_output = new_instance.load(tmp_path / 'config.json')
+    assert computed_output.CompileOptimizer == ['keras.src.optimizers.adam.Adam', 'keras.src.optimizers.sgd.SGD']
+    assert computed_output.LayerStack[1] == {0: LayerParamsCombs(Units=[4]), 1: LayerParamsCombs(Units=[2])}
+    assert computed_output.DatasetPath == [Path('dataset.csv')]
+
+
+@pytest.mark.parametrize('config', [
+    pytest.param({key: value for key, value in CONFIG.items() if key != 'WindowWidth'}, id='missing field'),
+    pytest.param({**CONFIG, 'Unknown': [1]}, id='unknown field'),
+    pytest.param({**CONFIG, 'LayerStack': [{'0': {'Units': [4], 'Unknown': [1]}}]}, id='unknown layer field'),
+    pytest.param({**CONFIG, 'DatasetTimeFilter': [{'fm': 'yesterday'}]}, id='invalid date'),
+])
+def test_from_dict_failure(new_instance: ConfigLoader, config: dict):
+    with pytest.raises(InvalidConfigException):
+        new_instance.from_dict(config)
+
+
+def test_hash_success(new_instance: ConfigLoader):
+    computed_output = ParamsManager().unfold(new_instance.from_dict(CONFIG))
+    expected_output = ParamsManager().unfold(EQUIVALENT_COMBINATIONS)
+    assert len(computed_output) == 24
+    assert [params.Hash for params in computed_output] == [params.Hash for params in expected_output]
+
+
+def test_resolve_success(new_instance: ConfigLoader):
+    computed_output = [new_instance.resolve(params) for params in ParamsManager().unfold(new_instance.from_dict(CONFIG))]
+    assert computed_output == ParamsManager().unfold(EQUIVALENT_COMBINATIONS)
+
+
+@pytest.mark.parametrize('value,expected_output', [
+    pytest.param(None, None),
+    pytest.param(keras.optimizers.Adam, keras.optimizers.Adam),
+    pytest.param('keras.src.optimizers.adam.Adam', keras.optimizers.Adam),
+    pytest.param('keras.optimizers.Adam', keras.optimizers.Adam),
+    pytest.param('json.dumps', json.dumps),
+])
+def test_resolve_callable_success(value, expected_output):
+    assert ConfigLoader.resolve_callable(value) is expected_output
+
+
+@pytest.mark.parametrize('value', ['keras.optimizers.Missing', 'missing_module.function'])
+def test_resolve_callable_failure(value: str):
+    with pytest.raises(UnresolvableCallableException):
+        ConfigLoader.resolve_callable(value)
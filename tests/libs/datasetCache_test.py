@@ -0,0 +1,118 @@
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from source.libs.baseTestCase import BaseTestCase
+from source.libs.datasetCache import DatasetCache
+from source.structs.customTypes import DateRange
+from source.structs.params import TrainingParams as TrainParams, LayerParams
+
+CSV_CONTENTS = ('Date,Open,Close\n'
+                '2025-01-01,1.0,10.0\n'
+                '2025-01-02,2.0,20.0\n'
+                '2025-01-03,3.0,30.0\n'
+                '2025-01-04,4.0,40.0\n')
+FULL_SIZE = 4 * 8 * 3  # 4 rows, 8 bytes per value, 3 arrays (index and 2 columns)
+
+
+@pytest.fixture
+def dataset_path(tmp_path: Path) -> Path:
+    path = tmp_path / 'dataset.csv'
+    path.write_text(CSV_CONTENTS)
+    return path
+
+
+@pytest.fixture
+def new_instance() -> DatasetCache:
+    return DatasetCache()
+
+
+def test_instantiation_success(new_instance: DatasetCache):
+    assert isinstance(new_instance, DatasetCache)
+    assert len(new_instance) == 0
+    assert new_instance.size == 0
+
+
+def test_load_reuse_success(new_instance: DatasetCache, dataset_path: Path):
+    first_output = new_instance.load(dataset_path, DateRange(), 'Close')
+    second_output = new_instance.load(dataset_path, DateRange(), 'Close')
+    assert first_output is second_output
+    assert (new_instance.hits, new_instance.misses) == (1, 1)
+    assert new_instance.size == FULL_SIZE
+
+
+@dataclass
+class LoadMethodTestCase(BaseTestCase):
+    first_filter: DateRange
+    second_filter: DateRange
+    first_column: str = 'Close'
+    second_column: str = 'Close'
+    expected_output: bool = True
+
+
+LoadMethTC = LoadMethodTestCase
+
+
+@pytest.mark.parametrize('test_case', [pytest.param(test_case, id=test_case.id) for test_case in [
+    LoadMethTC(id='equal keys',
+               first_filter=DateRange(), second_filter=DateRange(), expected_output=True),
+    LoadMethTC(first_filter=DateRange(fm=datetime(2025, 1, 2)), second_filter=DateRange(fm=datetime(2025, 1, 2)),
+               expected_output=True),
+    LoadMethTC(id='different time filters',
+               first_filter=DateRange(), second_filter=DateRange(fm=datetime(2025, 1, 2)), expected_output=False),
+    LoadMethTC(first_filter=DateRange(to=datetime(2025, 1, 2)), second_filter=DateRange(fm=datetime(2025, 1, 2)),
+               expected_output=False),
+    LoadMethTC(id='different columns',
+               first_filter=DateRange(), second_filter=DateRange(), second_column='Open', expected_output=False),
+]])
+def test_load_keys_success(new_instance: DatasetCache, dataset_path: Path, test_case: LoadMethodTestCase):
+    first_output = new_instance.load(dataset_path, test_case.first_filter, test_case.first_column)
+    second_output = new_instance.load(dataset_path, test_case.second_filter, test_case.second_column)
+    assert (first_output is second_output) == test_case.expected_output
+
+
+def test_load_content_change_success(new_instance: DatasetCache, dataset_path: Path):
+    first_output = new_instance.load(dataset_path, DateRange(), 'Close')
+    dataset_path.write_text(CSV_CONTENTS.replace('40.0', '41.0'))
+    second_output = new_instance.load(dataset_path, DateRange(), 'Close')
+    assert first_output is not second_output
+    assert second_output.Columns['Close'][-1] == 41.0
+
+
+def test_load_eviction_success(dataset_path: Path):
+    instance = DatasetCache(max_bytes=FULL_SIZE * 2)
+    first_output = instance.load(dataset_path, DateRange(), 'Close')
+    instance.load(dataset_path, DateRange(), 'Open')
+    instance.load(dataset_path, DateRange(), 'Close')  # refreshes the first entry
+    instance.load(dataset_path, DateRange(fm=datetime(2025, 1, 1)), 'Open')  # evicts the "Open" entry
+    assert len(instance) == 2
+    assert instance.size == FULL_SIZE * 2
+    assert instance.load(dataset_path, DateRange(), 'Close') is first_output
+    assert (instance.hits, instance.misses) == (2, 3)
+
+
+def test_load_oversized_success(dataset_path: Path):
+    instance = DatasetCache(max_bytes=FULL_SIZE - 1)
+    instance.load(dataset_path, DateRange(), 'Close')
+    assert len(instance) == 0
+    assert instance.size == 0
+
+
+def test_clear_success(new_instance: DatasetCache, dataset_path: Path):
+    new_instance.load(dataset_path, DateRange(), 'Close')
+    new_instance.clear()
+    assert len(new_instance) == 0
+    assert new_instance.size == 0
+
+
+def test_get_success(new_instance: DatasetCache, dataset_path: Path):
+    training_params = TrainParams(Hash='', ColumnToPredict='Open', WindowWidth=2, SetTrainingFlag=True,
+                                  UseResidualWrapper=False, PrependBatchNormLayer=False, FitMaxEpochs=1,
+                                  FitPatience=1, CompileLossFunction=min, CompileOptimizer=max,
+                                  LayerStack={0: LayerParams(Units=1)}, DatasetPath=dataset_path,
+                                  DatasetTimeFilter=DateRange(), DatasetShuffle=False, DatasetBatchSize=1)
+    computed_output = new_instance.get(training_params)
+    assert computed_output is new_instance.load(dataset_path, DateRange(), 'Open')
+    assert computed_output.ColumnToPredict == 'Open'
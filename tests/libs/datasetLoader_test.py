@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from pathlib import Path
+
+import numpy
+import pytest
+
+from source.libs.baseTestCase import BaseTestCase
+from source.libs.datasetLoader import DatasetLoader, MissingColumnException, UnsortedDatasetException
+from source.structs.customTypes import DateRange
+
+CSV_CONTENTS = ('Date,Open,Close,Label\n'
+                '2025-01-03,3.0,30.0,c\n'
+                '2025-01-01,1.0,10.0,a\n'
+                '2025-01-02,2.0,20.0,b\n'
+                '2025-01-04,4.0,40.0,d\n')
+
+
+@pytest.fixture
+def dataset_path(tmp_path: Path) -> Path:
+    path = tmp_path / 'dataset.csv'
+    path.write_text(CSV_CONTENTS)
+    return path
+
+
+@pytest.fixture
+def new_instance() -> DatasetLoader:
+    return DatasetLoader()
+
+
+def test_instantiation_success(new_instance: DatasetLoader):
+    assert isinstance(new_instance, DatasetLoader)
+
+
+def test_read_success(new_instance: DatasetLoader, dataset_path: Path):
+    computed_output = new_instance.read(dataset_path)
+    assert list(computed_output.Columns.keys()) == ['Open', 'Close']
+    assert computed_output.Index.dtype == numpy.dtype('datetime64[ns]')
+    assert numpy.all(computed_output.Index[:-1] <= computed_output.Index[1:])
+    assert computed_output.Columns['Open'].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert computed_output.Columns['Close'].tolist() == [10.0, 20.0, 30.0, 40.0]
+    assert computed_output.ColumnToPredict is None
+
+
+def test_read_dtype_success(dataset_path: Path):
+    computed_output = DatasetLoader(dtype=numpy.float32).read(dataset_path)
+    assert computed_output.Columns['Open'].dtype == numpy.float32
+
+
+@dataclass
+class LoadMethodTestCase(BaseTestCase):
+    time_filter: DateRange
+    column_to_predict: str = 'Close'
+    expected_output: list[float] = None
+
+
+LoadMethTC = LoadMethodTestCase
+
+
+@pytest.mark.parametrize('test_case', [pytest.param(test_case, id=test_case.id) for test_case in [
+    LoadMethTC(id='unbounded filter',
+               time_filter=DateRange(), expected_output=[10.0, 20.0, 30.0, 40.0]),
+    LoadMethTC(id='"from" value only',
+               time_filter=DateRange(fm=datetime(2025, 1, 2)), expected_output=[20.0, 30.0, 40.0]),
+    LoadMethTC(id='"to" value only',
+               time_filter=DateRange(to=datetime(2025, 1, 2)), expected_output=[10.0, 20.0]),
+    LoadMethTC(id='both values',
+               time_filter=DateRange(fm=datetime(2025, 1, 2), to=datetime(2025, 1, 3)),
+               expected_output=[20.0, 30.0]),
+    LoadMethTC(time_filter=DateRange(fm=datetime(2025, 1, 2), to=datetime(2025, 1, 2)),
+               expected_output=[20.0]),
+    LoadMethTC(time_filter=DateRange(fm=datetime(2025, 1, 1, 12), to=datetime(2025, 1, 3, 12)),
+               expected_output=[20.0, 30.0]),
+    LoadMethTC(id='offset-aware datetimes',
+               time_filter=DateRange(fm=datetime(2025, 1, 3, tzinfo=UTC)), expected_output=[30.0, 40.0]),
+    LoadMethTC(id='empty results',
+               time_filter=DateRange(fm=datetime(2026, 1, 1)), expected_output=[]),
+    LoadMethTC(time_filter=DateRange(to=datetime(2024, 1, 1)), expected_output=[]),
+    LoadMethTC(id='missing columns',
+               time_filter=DateRange(), column_to_predict='Label', expected_exception=MissingColumnException),
+    LoadMethTC(time_filter=DateRange(), column_to_predict='aaa', expected_exception=MissingColumnException),
+]])
+def test_load(new_instance: DatasetLoader, dataset_path: Path, test_case: LoadMethodTestCase):
+    if test_case.expected_exception is None:
+        computed_output = new_instance.load(dataset_path, test_case.time_filter, test_case.column_to_predict)
+        assert computed_output.ColumnToPredict == test_case.column_to_predict
+        assert computed_output.Columns[test_case.column_to_predict].tolist() == test_case.expected_output
+        assert len(computed_output.Index) == len(test_case.expected_output)
+    else:
+        with pytest.raises(test_case.expected_exception):
+            new_instance.load(dataset_path, test_case.time_filter, test_case.column_to_predict)
+
+
+def test_filter_views_success(new_instance: DatasetLoader, dataset_path: Path):
+    dataset = new_instance.read(dataset_path)
+    viewed_output = DatasetLoader.filter(dataset, DateRange(fm=datetime(2025, 1, 2)), 'Close')
+    copied_output = DatasetLoader.filter(dataset, DateRange(fm=datetime(2025, 1, 2)), 'Close', copy=True)
+    assert numpy.shares_memory(viewed_output.Columns['Close'], dataset.Columns['Close'])
+    assert not numpy.shares_memory(copied_output.Columns['Close'], dataset.Columns['Close'])
+
+
+def test_fingerprint_success(new_instance: DatasetLoader, dataset_path: Path, tmp_path: Path):
+    same_contents_path = tmp_path / 'same.csv'
+    same_contents_path.write_text(CSV_CONTENTS)
+    other_contents_path = tmp_path / 'other.csv'
+    other_contents_path.write_text(CSV_CONTENTS.replace('40.0', '41.0'))
+    assert new_instance.fingerprint(dataset_path) == new_instance.fingerprint(dataset_path)
+    assert new_instance.fingerprint(dataset_path) == new_instance.fingerprint(same_contents_path)
+    assert new_instance.fingerprint(dataset_path) != new_instance.fingerprint(other_contents_path)
+
+
+@pytest.mark.parametrize('chunk_rows,time_filter,expected_output', [
+    pytest.param(1, DateRange(), [[10.0], [20.0], [30.0], [40.0]]),
+    pytest.param(3, DateRange(), [[10.0, 20.0, 30.0], [40.0]]),
+    pytest.param(2, DateRange(fm=datetime(2025, 1, 2)), [[20.0], [30.0, 40.0]]),
+    pytest.param(2, DateRange(to=datetime(2025, 1, 2)), [[10.0, 20.0]]),
+    pytest.param(1, DateRange(fm=datetime(2025, 1, 3), to=datetime(2025, 1, 3)), [[30.0]]),
+    pytest.param(2, DateRange(fm=datetime(2026, 1, 1)), []),
+])
+def test_read_chunks_success(new_instance: DatasetLoader, tmp_path: Path, chunk_rows: int, time_filter: DateRange,
+                             expected_output: list[list[float]]):
+    path = tmp_path / 'sorted.csv'
+    path.write_text('Date,Close\n2025-01-01,10.0\n2025-01-02,20.0\n2025-01-03,30.0\n2025-01-04,40.0\n')
+    computed_output = [chunk.Columns['Close'].tolist()
+                       for chunk in new_instance.read_chunks(path, chunk_rows, time_filter)]
+    assert computed_output == expected_output
+
+
+def test_read_chunks_unsorted_failure(new_instance: DatasetLoader, dataset_path: Path):
+    with pytest.raises(UnsortedDatasetException):
+        list(new_instance.read_chunks(dataset_path, 2))
@@ -0,0 +1,121 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy
+import pytest
+
+from source.libs.baseTestCase import BaseTestCase
+from source.libs.columnarStore import ColumnarStore
+from source.libs.datasetLoader import DatasetLoader, MissingColumnException, UnsortedDatasetException
+from source.libs.datasetStreamer import DatasetStreamer
+from source.libs.slidingWindows import SlidingWindows
+from source.structs.customTypes import DateRange
+from source.structs.params import TrainingParams as TrainParams, LayerParams
+
+ROWS = 50
+START_DATE = datetime(2025, 1, 1)
+
+
+@pytest.fixture
+def dataset_path(tmp_path: Path) -> Path:
+    path = tmp_path / 'dataset.csv'
+    lines = ['Date,Open,Close'] + [f'{START_DATE + timedelta(days=row)},{row}.0,{row * 10}.0' for row in range(ROWS)]
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+def test_instantiation_success():
+    assert isinstance(DatasetStreamer(), DatasetStreamer)
+
+
+def collect(batches) -> tuple[numpy.ndarray, numpy.ndarray, list[int]]:
+    features, targets = zip(*batches)
+    return numpy.concatenate(features), numpy.concatenate(targets), [len(batch) for batch in targets]
+
+
+@dataclass
+class IterateBatchesMethodTestCase(BaseTestCase):
+    chunk_rows: int = 7
+    time_filter: DateRange = None
+    window_width: int = 3
+    batch_size: int = 4
+    columnar: bool = False
+
+
+IBatchesMethTC = IterateBatchesMethodTestCase
+
+
+@pytest.mark.parametrize('test_case', [pytest.param(test_case, id=test_case.id) for test_case in [
+    IBatchesMethTC(id='chunks smaller than windows',
+                   chunk_rows=2, window_width=5),
+    IBatchesMethTC(chunk_rows=1, window_width=3, batch_size=1),
+    IBatchesMethTC(id='chunks larger than windows',
+                   chunk_rows=7, window_width=3),
+    IBatchesMethTC(chunk_rows=16, window_width=3, batch_size=5),
+    IBatchesMethTC(chunk_rows=100, window_width=10, batch_size=64),
+    IBatchesMethTC(id='time filters',
+                   chunk_rows=6, time_filter=DateRange(fm=START_DATE + timedelta(days=20))),
+    IBatchesMethTC(chunk_rows=6, time_filter=DateRange(to=START_DATE + timedelta(days=20))),
+    IBatchesMethTC(chunk_rows=6, time_filter=DateRange(fm=START_DATE + timedelta(days=11),
+                                                       to=START_DATE + timedelta(days=33))),
+    IBatchesMethTC(id='columnar store',
+                   chunk_rows=7, columnar=True),
+    IBatchesMethTC(chunk_rows=6, columnar=True, time_filter=DateRange(fm=START_DATE + timedelta(days=11),
+                                                                      to=START_DATE + timedelta(days=33))),
+]])
+def test_iterate_batches_success(dataset_path: Path, tmp_path: Path, test_case: IterateBatchesMethodTestCase):
+    time_filter = test_case.time_filter or DateRange()
+    loader = ColumnarStore(root=tmp_path / 'cache') if test_case.columnar else DatasetLoader()
+    instance = DatasetStreamer(loader=loader, chunk_rows=test_case.chunk_rows)
+    batches = instance.iterate_batches(dataset_path, time_filter, 'Close', test_case.window_width,
+                                       test_case.batch_size)
+    computed_features, computed_targets, batch_sizes = collect(batches)
+
+    reference = SlidingWindows(loader.load(dataset_path, time_filter, 'Close'), test_case.window_width)
+    expected_features, expected_targets = reference.get_batch(slice(None))
+    assert numpy.array_equal(computed_features, expected_features)
+    assert numpy.array_equal(computed_targets, expected_targets)
+    assert all(size == test_case.batch_size for size in batch_sizes[:-1])
+    assert 0 < batch_sizes[-1] <= test_case.batch_size
+
+
+def test_iterate_batches_shuffle_success(dataset_path: Path):
+    ordered_features, ordered_targets, _ = collect(
+        DatasetStreamer(chunk_rows=8).iterate_batches(dataset_path, DateRange(), 'Close', 3, 4))
+    first_features, first_targets, _ = collect(
+        DatasetStreamer(chunk_rows=8, seed=1).iterate_batches(dataset_path, DateRange(), 'Close', 3, 4, True))
+    second_features, second_targets, _ = collect(
+        DatasetStreamer(chunk_rows=8, seed=1).iterate_batches(dataset_path, DateRange(), 'Close', 3, 4, True))
+    assert numpy.array_equal(first_targets, second_targets)
+    assert not numpy.array_equal(first_targets, ordered_targets)
+    assert sorted(first_targets.ravel().tolist()) == ordered_targets.ravel().tolist()
+
+
+def test_iterate_batches_empty_success(dataset_path: Path):
+    batches = DatasetStreamer().iterate_batches(dataset_path, DateRange(fm=datetime(2030, 1, 1)), 'Close', 3, 4)
+    assert list(batches) == []
+
+
+def test_iterate_batches_missing_column_failure(dataset_path: Path):
+    with pytest.raises(MissingColumnException):
+        list(DatasetStreamer().iterate_batches(dataset_path, DateRange(), 'aaa', 3, 4))
+
+
+def test_iterate_batches_unsorted_failure(tmp_path: Path):
+    path = tmp_path / 'unsorted.csv'
+    path.write_text('Date,Close\n2025-01-02,1.0\n2025-01-03,2.0\n2025-01-01,3.0\n')
+    with pytest.raises(UnsortedDatasetException):
+        list(DatasetStreamer(chunk_rows=2).iterate_batches(path, DateRange(), 'Close', 1, 4))
+
+
+def test_stream_success(dataset_path: Path):
+    training_params = TrainParams(Hash='', ColumnToPredict='Open', WindowWidth=5, SetTrainingFlag=True,
+                                  UseResidualWrapper=False, PrependBatchNormLayer=False, FitMaxEpochs=1,
+                                  FitPatience=1, CompileLossFunction=min, CompileOptimizer=max,
+                                  LayerStack={0: LayerParams(Units=1)}, DatasetPath=dataset_path,
+                                  DatasetTimeFilter=DateRange(), DatasetShuffle=False, DatasetBatchSize=8)
+    computed_features, computed_targets, batch_sizes = collect(DatasetStreamer(chunk_rows=9).stream(training_params))
+    assert computed_features.shape == (ROWS - 5, 5, 2)
+    assert computed_targets.ravel().tolist() == [float(row) for row in range(5, ROWS)]
+    assert batch_sizes[0] == 8
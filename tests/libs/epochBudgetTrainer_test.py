@@ -0,0 +1,118 @@
+import dataclasses
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import keras
+import numpy
+import pytest
+
+from source.libs.artifactStore import ArtifactStore
+from source.libs.checkpointStore import CheckpointStore
+from source.libs.epochBudgetTrainer import EpochBudgetTrainer
+from source.libs.trainer import Trainer
+from source.structs.customTypes import DateRange
+from source.structs.params import TrainingParams as TrainParams, LayerParams
+from source.structs.results import TrainingResult
+
+
+@pytest.fixture
+def dataset_path(tmp_path: Path) -> Path:
+    path = tmp_path / 'dataset.csv'
+    lines = ['Date,Open,Close'] + [f'{datetime(2025, 1, 1) + timedelta(days=row)},{row % 7}.0,{row % 5}.0'
+                                   for row in range(40)]
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+def build_training_params(dataset_path: Path = None, **overrides) -> TrainParams:
+    fields = dict(Hash='aaa', ColumnToPredict='Close', WindowWidth=5, SetTrainingFlag=False, UseResidualWrapper=False,
+                  PrependBatchNormLayer=False, FitMaxEpochs=3, FitPatience=10,
+                  CompileLossFunction=keras.losses.MeanAbsoluteError, CompileOptimizer=keras.optimizers.Adam,
+                  LayerStack={0: LayerParams(Units=4)}, DatasetPath=dataset_path, DatasetTimeFilter=DateRange(),
+                  DatasetShuffle=False, DatasetBatchSize=8)
+    fields.update(overrides)
+    return TrainParams(**fields)
+
+
+@pytest.fixture
+def new_instance() -> EpochBudgetTrainer:
+    return EpochBudgetTrainer(Trainer(seed=1))
+
+
+def test_instantiation_success(new_instance: EpochBudgetTrainer):
+    assert isinstance(new_instance, EpochBudgetTrainer)
+    assert isinstance(new_instance.trainer, Trainer)
+
+
+def test_group_success(new_instance: EpochBudgetTrainer):
+    unfolded_params = [
+        build_training_params(Hash='a', FitMaxEpochs=1),
+        build_training_params(Hash='b', FitMaxEpochs=5),
+        build_training_params(Hash='c', FitPatience=1),
+        build_training_params(Hash='d', FitMaxEpochs=2, LayerStack={0: LayerParams(Units=4)}),
+        build_training_params(Hash='e', LayerStack={0: LayerParams(Units=5)}),
+        build_training_params(Hash='f', FitMaxEpochs=9, FitPatience=1),
+    ]
+    computed_output = [[training_params.Hash for training_params in group]
+                       for group in new_instance.group(unfolded_params)]
+    assert computed_output == [['a', 'b', 'd'], ['c', 'f'], ['e']]
+
+
+def test_train_success(new_instance: EpochBudgetTrainer, dataset_path: Path):
+    unfolded_params = [build_training_params(dataset_path, Hash=f'budget-{budget}', FitMaxEpochs=budget)
+                       for budget in [2, 4, 1]]
+    computed_output = list(new_instance.train(unfolded_params))
+    assert all(isinstance(result, TrainingResult) for result in computed_output)
+    assert [(result.Hash, result.Epochs) for result in computed_output] == [('budget-2', 2), ('budget-4', 4),
+                                                                           ('budget-1', 1)]
+    for training_params, result in zip(unfolded_params, computed_output):
+        expected_output = Trainer(seed=1).train(training_params)
+        numpy.testing.assert_allclose(result.History['loss'], expected_output.History['loss'], rtol=1e-6)
+
+
+def test_train_early_stopping_success(new_instance: EpochBudgetTrainer, dataset_path: Path):
+    unfolded_params = [build_training_params(dataset_path, Hash=f'budget-{budget}', FitMaxEpochs=budget,
+                                             FitPatience=0, CompileOptimizer=keras.optimizers.SGD)
+                       for budget in [1, 200]]
+    short_output, long_output = new_instance.train_group(unfolded_params)
+    assert short_output.Epochs == 1
+    assert 1 < long_output.Epochs < 200
+    assert len(long_output.History['loss']) == long_output.Epochs
+
+
+def test_train_checkpoint_success(dataset_path: Path, tmp_path: Path):
+    checkpoint_store = CheckpointStore(tmp_path / 'checkpoints')
+    instance = EpochBudgetTrainer(Trainer(seed=1, checkpoint_store=checkpoint_store))
+    unfolded_params = [build_training_params(dataset_path, Hash=f'budget-{budget}', FitMaxEpochs=budget)
+                       for budget in [1, 3]]
+    computed_output = instance.train_group(unfolded_params)
+    for result in computed_output:
+        checkpoint = checkpoint_store.load(result.Hash)
+        assert checkpoint.Finished and checkpoint.Epoch == result.Epochs
+        assert checkpoint.History == result.History
+
+    trainer = Trainer(seed=1)
+    training_params = unfolded_params[0]
+    model = trainer.build(training_params, trainer.prepare(training_params))
+    checkpoint_store.restore(training_params.Hash, model)
+    expected_model = trainer.build(training_params, trainer.prepare(training_params))
+    expected_model.fit(trainer.prepare(training_params), epochs=1, shuffle=False, verbose=0)
+    for expected, computed in zip(expected_model.get_weights(), model.get_weights()):
+        numpy.testing.assert_allclose(computed, expected, rtol=1e-6)
+    assert instance.train_group(unfolded_params) == computed_output
+
+
+def test_train_artifact_success(dataset_path: Path, tmp_path: Path):
+    artifact_store = ArtifactStore(tmp_path / 'artifacts')
+    instance = EpochBudgetTrainer(Trainer(seed=1, artifact_store=artifact_store))
+    unfolded_params = [build_training_params(dataset_path, Hash=f'budget-{budget}', FitMaxEpochs=budget)
+                       for budget in [1, 3]]
+    computed_output = instance.train_group(unfolded_params)
+    assert artifact_store.hashes() == ['budget-1', 'budget-3']
+    for training_params, result in zip(unfolded_params, computed_output):
+        assert artifact_store.load_metadata(result.Hash) == dataclasses.asdict(result)
+        expected_store = ArtifactStore(tmp_path / f'expected-{training_params.Hash}')
+        Trainer(seed=1, artifact_store=expected_store).train(training_params)
+        for expected, computed in zip(expected_store.load_weights(training_params.Hash),
+                                      artifact_store.load_weights(result.Hash)):
+            numpy.testing.assert_allclose(computed, expected, rtol=1e-6)
@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import keras
+import numpy
+import pytest
+
+from source.libs.artifactStore import ArtifactStore
+from source.libs.evaluator import Evaluator, MetricAccumulator, MissingModelSourceException
+from source.libs.slidingWindows import SlidingWindows
+from source.libs.trainer import Trainer
+from source.structs.customTypes import DateRange
+from source.structs.params import TrainingParams as TrainParams, LayerParams
+from source.structs.results import EvaluationResult
+
+HOLD_OUT = DateRange(fm=datetime(2025, 2, 10))
+
+
+@pytest.fixture
+def dataset_path(tmp_path: Path) -> Path:
+    path = tmp_path / 'dataset.csv'
+    lines = ['Date,Open,Close'] + [f'{datetime(2025, 1, 1) + timedelta(days=row)},{row % 7}.0,{row % 5}.0'
+                                   for row in range(80)]
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+def build_training_params(dataset_path: Path, **overrides) -> TrainParams:
+    fields = dict(Hash='aaa', ColumnToPredict='Close', WindowWidth=5, SetTrainingFlag=False, UseResidualWrapper=True,
+                  PrependBatchNormLayer=True, FitMaxEpochs=2, FitPatience=10,
+                  CompileLossFunction=keras.losses.MeanAbsoluteError, CompileOptimizer=keras.optimizers.Adam,
+                  LayerStack={0: LayerParams(Units=4, Activation=keras.activations.relu)}, DatasetPath=dataset_path,
+                  DatasetTimeFilter=DateRange(to=datetime(2025, 2, 10)), DatasetShuffle=False, DatasetBatchSize=8)
+    fields.update(overrides)
+    return TrainParams(**fields)
+
+
+@pytest.fixture
+def training_params(dataset_path: Path) -> list[TrainParams]:
+    return [build_training_params(dataset_path),
+            build_training_params(dataset_path, Hash='bbb', WindowWidth=3),
+            build_training_params(dataset_path, Hash='ccc', LayerStack={0: LayerParams(Units=8)})]
+
+
+@pytest.fixture
+def artifact_store(tmp_path: Path, training_params: list[TrainParams]) -> ArtifactStore:
+    artifact_store = ArtifactStore(tmp_path / 'artifacts')
+    trainer = Trainer(seed=1, artifact_store=artifact_store)
+    for params in training_params:
+        trainer.train(params)
+    return artifact_store
+
+
+@pytest.fixture
+def new_instance(artifact_store: ArtifactStore) -> Evaluator:
+    return Evaluator(artifact_store, batch_size=7)
+
+
+def test_instantiation_success(new_instance: Evaluator):
+    assert isinstance(new_instance, Evaluator)
+
+
+def test_instantiation_failure():
+    with pytest.raises(MissingModelSourceException):
+        Evaluator()
+
+
+def test_metric_accumulator_success():
+    accumulator = MetricAccumulator()
+    accumulator.update(numpy.array([[1.0], [2.0]]), numpy.array([[0.0], [0.0]]))
+    accumulator.update(numpy.array([[-3.0]]), numpy.array([[0.0]]))
+    assert accumulator.result('aaa') == EvaluationResult(Hash='aaa', Samples=3, MeanAbsoluteError=2.0,
+                                                         MeanSquaredError=14 / 3)
+    empty_output = MetricAccumulator().result('bbb')
+    assert empty_output.Samples == 0
+    assert numpy.isnan(empty_output.MeanAbsoluteError) and numpy.isnan(empty_output.MeanSquaredError)
+
+
+def test_group_success(new_instance: Evaluator, training_params: list[TrainParams]):
+    computed_output = new_instance.group(training_params, HOLD_OUT)
+    assert [[params.Hash for params in group] for group in computed_output] == [['aaa', 'ccc'], ['bbb']]
+    assert all(params.DatasetTimeFilter == HOLD_OUT for group in computed_output for params in group)
+    assert len(new_instance.group(training_params)) == 2
+
+
+def test_evaluate_success(artifact_store: ArtifactStore, training_params: list[TrainParams]):
+    trainer = Trainer()
+    instance = Evaluator(artifact_store, trainer=trainer, batch_size=7)
+    computed_output = instance.evaluate(training_params, HOLD_OUT)
+    assert [result.Hash for result in computed_output] == ['aaa', 'bbb', 'ccc']
+    assert trainer.dataset_cache.misses == 1
+
+    for params, result in zip(training_params, computed_output):
+        dataset = Trainer().dataset_cache.get(build_training_params(params.DatasetPath, DatasetTimeFilter=HOLD_OUT))
+        windows = SlidingWindows(dataset, params.WindowWidth)
+        features, targets = windows.get_batch(slice(None))
+        errors = artifact_store.load_model(params.Hash).predict_on_batch(features) - targets
+        assert result.Samples == len(windows)
+        assert result.MeanAbsoluteError == pytest.approx(float(numpy.abs(errors).mean()), rel=1e-5)
+        assert result.MeanSquaredError == pytest.approx(float(numpy.square(errors).mean()), rel=1e-5)
+
+
+def test_evaluate_load_model_success(training_params: list[TrainParams]):
+    loaded_hashes = []
+
+    def load_model(hash_value: str) -> keras.Model:
+        loaded_hashes.append(hash_value)
+        return keras.Sequential([keras.layers.Flatten(), keras.layers.Dense(1, kernel_initializer='zeros')])
+
+    computed_output = Evaluator(load_model=load_model).evaluate(training_params[:1], HOLD_OUT)
+    assert loaded_hashes == ['aaa']
+    assert computed_output[0].MeanAbsoluteError == pytest.approx(2.0, abs=0.2)
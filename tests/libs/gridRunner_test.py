@@ -0,0 +1,111 @@
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import keras
+import pytest
+
+from source.libs.gridRunner import GridRunner
+from source.structs.customTypes import DateRange
+from source.structs.dataset import Dataset
+from source.structs.params import TrainingParams as TrainParams, LayerParams
+from source.structs.results import JobOutcome, TrainingResult
+
+
+def build_training_params(hash_value: str, dataset_path: Path = None, **overrides) -> TrainParams:
+    fields = dict(Hash=hash_value, ColumnToPredict='Close', WindowWidth=3, SetTrainingFlag=False,
+                  UseResidualWrapper=False, PrependBatchNormLayer=False, FitMaxEpochs=2, FitPatience=10,
+                  CompileLossFunction=keras.losses.MeanAbsoluteError, CompileOptimizer=keras.optimizers.RMSprop,
+                  LayerStack={0: LayerParams(Units=2)}, DatasetPath=dataset_path, DatasetTimeFilter=DateRange(),
+                  DatasetShuffle=False, DatasetBatchSize=4)
+    fields.update(overrides)
+    return TrainParams(**fields)
+
+
+def report_resources(training_params: TrainParams) -> tuple[str, str, list[int]]:
+    if training_params.Hash == 'failing':
+        raise ValueError('Failing job.')
+    return training_params.Hash, os.environ['TF_NUM_INTRAOP_THREADS'], sorted(os.sched_getaffinity(0))
+
+
+def report_dataset(training_params: TrainParams, dataset: Dataset) -> tuple[str, float, bool]:
+    values = dataset.Columns[dataset.ColumnToPredict]
+    return training_params.Hash, float(values.sum()), values.flags.owndata
+
+
+def test_instantiation_success():
+    assert isinstance(GridRunner(workers=2), GridRunner)
+
+
+@pytest.mark.parametrize('workers,intra_op_threads', [
+    pytest.param(1, 1),
+    pytest.param(2, 1),
+    pytest.param(3, 2),
+    pytest.param(64, 4),
+])
+def test_get_cpu_slices_success(workers: int, intra_op_threads: int):
+    cpus = sorted(os.sched_getaffinity(0))
+    computed_output = GridRunner(workers=workers, intra_op_threads=intra_op_threads).get_cpu_slices()
+    assert len(computed_output) == workers
+    assert all(len(cpu_slice) == intra_op_threads for cpu_slice in computed_output)
+    assert all(cpu in cpus for cpu_slice in computed_output for cpu in cpu_slice)
+    if workers * intra_op_threads <= len(cpus):
+        assert len({cpu for cpu_slice in computed_output for cpu in cpu_slice}) == workers * intra_op_threads
+
+
+def test_run_success():
+    instance = GridRunner(workers=2, intra_op_threads=1, pin_cpus=True, job=report_resources)
+    unfolded_params = [build_training_params(hash_value) for hash_value in ['a', 'b', 'c', 'failing']]
+    computed_output = list(instance.run(unfolded_params))
+    assert all(isinstance(outcome, JobOutcome) for outcome in computed_output)
+    assert sorted(outcome.Params.Hash for outcome in computed_output) == ['a', 'b', 'c', 'failing']
+
+    failed_outcomes = [outcome for outcome in computed_output if outcome.Error is not None]
+    assert [outcome.Params.Hash for outcome in failed_outcomes] == ['failing']
+    assert isinstance(failed_outcomes[0].Error, ValueError)
+
+    cpus = sorted(os.sched_getaffinity(0))
+    for outcome in computed_output:
+        if outcome.Error is None:
+            hash_value, intra_op_threads, affinity = outcome.Result
+            assert hash_value == outcome.Params.Hash
+            assert intra_op_threads == '1'
+            assert len(affinity) == 1 and affinity[0] in cpus
+
+
+def test_run_default_job_success(tmp_path: Path):
+    dataset_path = tmp_path / 'dataset.csv'
+    lines = ['Date,Close'] + [f'{datetime(2025, 1, 1) + timedelta(days=row)},{row % 5}.0' for row in range(20)]
+    dataset_path.write_text('\n'.join(lines) + '\n')
+    unfolded_params = [build_training_params('a', dataset_path), build_training_params('b', dataset_path,
+                                                                                        FitMaxEpochs=3)]
+    computed_output = list(GridRunner(workers=1).run(unfolded_params))
+    assert all(outcome.Error is None for outcome in computed_output)
+    assert all(isinstance(outcome.Result, TrainingResult) for outcome in computed_output)
+    assert sorted(outcome.Result.Epochs for outcome in computed_output) == [2, 3]
+
+
+@pytest.fixture
+def dataset_path(tmp_path: Path) -> Path:
+    path = tmp_path / 'dataset.csv'
+    lines = ['Date,Close'] + [f'{datetime(2025, 1, 1) + timedelta(days=row)},{row % 5}.0' for row in range(20)]
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+def test_run_shared_datasets_success(dataset_path: Path, tmp_path: Path):
+    unfolded_params = [build_training_params(hash_value, dataset_path) for hash_value in ['a', 'b', 'c']]
+    unfolded_params.append(build_training_params('missing', tmp_path / 'missing.csv'))
+    computed_output = list(GridRunner(workers=2, job=report_dataset, share_datasets=True).run(unfolded_params))
+    assert sorted(outcome.Result for outcome in computed_output if outcome.Error is None) == \
+           [('a', 40.0, False), ('b', 40.0, False), ('c', 40.0, False)]
+    assert [(outcome.Params.Hash, type(outcome.Error)) for outcome in computed_output if outcome.Error is not None] == \
+           [('missing', FileNotFoundError)]
+
+
+def test_run_shared_datasets_default_job_success(dataset_path: Path):
+    unfolded_params = [build_training_params('a', dataset_path), build_training_params('b', dataset_path,
+                                                                                        FitMaxEpochs=3)]
+    computed_output = list(GridRunner(workers=1, share_datasets=True).run(unfolded_params))
+    assert all(outcome.Error is None for outcome in computed_output)
+    assert sorted(outcome.Result.Epochs for outcome in computed_output) == [2, 3]
@@ -0,0 +1,155 @@
+import json
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import keras
+import pytest
+
+from source.libs.instrumentation import Instrumentation, instrumentation
+from source.libs.paramsManager import ParamsManager
+from source.libs.trainer import Trainer
+from source.structs.customTypes import DateRange
+from source.structs.params import (TrainingParamsCombinations as TrainParamsCombs,
+                                   LayerParamsCombinations as LayerParamsCombs)
+from source.structs.results import StageSummary
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def new_instance(clock: FakeClock) -> Instrumentation:
+    return Instrumentation(enabled=True, clock=clock)
+
+
+@pytest.fixture
+def global_instrumentation() -> Instrumentation:
+    instrumentation.clear()
+    instrumentation.enable()
+    yield instrumentation
+    instrumentation.disable()
+    instrumentation.clear()
+
+
+def test_instantiation_success(new_instance: Instrumentation):
+    assert isinstance(new_instance, Instrumentation)
+    assert new_instance.enabled
+    assert not instrumentation.enabled
+
+
+def test_stage_success(new_instance: Instrumentation, clock: FakeClock):
+    with new_instance.stage('train', 'aaa', Epochs=2):
+        clock.now += 1.5
+        with new_instance.stage('hash', record=False):
+            clock.now += 0.25
+    with new_instance.stage('train', 'bbb'):
+        clock.now += 0.5
+    new_instance.count('train.epochs', 2)
+    new_instance.count('train.epochs')
+
+    assert [(event.Name, event.Hash, event.Start, event.Duration, event.Tags) for event in new_instance.events] == [
+        ('train', 'aaa', 0.0, 1.75, {'Epochs': 2}), ('train', 'bbb', 1.75, 0.5, {})]
+    assert new_instance.events[0].MemoryDelta is None
+    assert new_instance.summary() == [StageSummary(Name='train', Count=2, Total=2.25, Mean=1.125, Max=1.75),
+                                      StageSummary(Name='hash', Count=1, Total=0.25, Mean=0.25, Max=0.25)]
+    assert new_instance.counters == {'train.epochs': 3}
+
+
+def test_stage_failure(new_instance: Instrumentation, clock: FakeClock):
+    with pytest.raises(ZeroDivisionError):
+        with new_instance.stage('load', 'aaa'):
+            clock.now += 1.0
+            _ = 1 / 0
+    assert new_instance.events[0].Duration == 1.0
+
+
+def test_stage_disabled_success(clock: FakeClock):
+    instance = Instrumentation(clock=clock)
+    with instance.stage('train', 'aaa'):
+        clock.now += 1.0
+    instance.count('train.epochs')
+    assert instance.stage('load') is instance.stage('train')
+    assert instance.events == []
+    assert instance.summary() == []
+    assert instance.counters == {}
+
+
+def test_stage_memory_success():
+    instance = Instrumentation(enabled=True, trace_memory=True)
+    with instance.stage('outer'):
+        with instance.stage('inner'):
+            buffer = bytearray(2 ** 20)
+            del buffer
+        kept = bytearray(2 ** 18)
+    events = {event.Name: event for event in instance.events}
+    assert events['inner'].MemoryPeak >= 2 ** 20
+    assert events['outer'].MemoryPeak >= 2 ** 20
+    assert events['outer'].MemoryDelta >= 2 ** 18
+    assert len(kept) == 2 ** 18
+    instance.disable()
+    assert not tracemalloc.is_tracing()
+
+
+def test_disable_tracemalloc_success():
+    tracemalloc.start()
+    try:
+        instance = Instrumentation(enabled=True, trace_memory=True)
+        instance.disable()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_export_success(new_instance: Instrumentation, clock: FakeClock, tmp_path: Path):
+    with new_instance.stage('load', 'aaa', Path=Path('dataset.csv')):
+        clock.now += 0.002
+    new_instance.count('evaluate.samples', 10)
+
+    new_instance.export_jsonl(tmp_path / 'trace.jsonl')
+    lines = [json.loads(line) for line in (tmp_path / 'trace.jsonl').read_text().splitlines()]
+    assert lines[0]['Type'] == 'stage'
+    assert (lines[0]['Name'], lines[0]['Hash'], lines[0]['Duration']) == ('load', 'aaa', 0.002)
+    assert lines[0]['Tags'] == {'Path': 'dataset.csv'}
+    assert lines[1] == {'Type': 'counter', 'Name': 'evaluate.samples', 'Value': 10}
+
+    new_instance.export_chrome_trace(tmp_path / 'trace.json')
+    trace_events = json.loads((tmp_path / 'trace.json').read_text())['traceEvents']
+    assert trace_events[0]['ph'] == 'X'
+    assert trace_events[0]['dur'] == pytest.approx(2000)
+    assert trace_events[0]['args']['Hash'] == 'aaa'
+    assert trace_events[1]['ph'] == 'C'
+    assert trace_events[1]['args'] == {'evaluate.samples': 10}
+
+
+def test_pipeline_success(global_instrumentation: Instrumentation, tmp_path: Path):
+    dataset_path = tmp_path / 'dataset.csv'
+    lines = ['Date,Open,Close'] + [f'{datetime(2025, 1, 1) + timedelta(days=row)},{row % 7}.0,{row % 5}.0'
+                                   for row in range(30)]
+    dataset_path.write_text('\n'.join(lines) + '\n')
+    unfolded_params = ParamsManager().unfold(TrainParamsCombs(
+        ColumnToPredict=['Close'], WindowWidth=[3, 5], SetTrainingFlag=[False], UseResidualWrapper=[True],
+        PrependBatchNormLayer=[True], FitMaxEpochs=[2], FitPatience=[10],
+        CompileLossFunction=[keras.losses.MeanAbsoluteError], CompileOptimizer=[keras.optimizers.Adam],
+        LayerStack=[{0: LayerParamsCombs(Units=[4])}], DatasetPath=[dataset_path], DatasetTimeFilter=[DateRange()],
+        DatasetShuffle=[False], DatasetBatchSize=[8]))
+    Trainer(seed=1).train(unfolded_params[0])
+
+    names = {summary.Name: summary.Count for summary in global_instrumentation.summary()}
+    assert names == {'unfold': 1, 'hash': 2, 'build_objects': 2, 'load': 1, 'windowing': 1, 'build_model': 1,
+                     'train': 1}
+    assert [event.Name for event in global_instrumentation.events] == ['unfold', 'load', 'windowing', 'build_model',
+                                                                       'train']
+    assert {event.Hash for event in global_instrumentation.events[1:]} == {unfolded_params[0].Hash}
+    assert global_instrumentation.counters == {'unfold.combinations': 2, 'train.epochs': 2}
@@ -0,0 +1,141 @@
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from source.libs.jobQueue import JobQueue, LeaseLostException
+from source.structs.customTypes import DateRange
+from source.structs.params import TrainingParams as TrainParams, LayerParams
+from source.structs.results import QueuedJob
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def build_training_params(hash_value: str) -> TrainParams:
+    return TrainParams(Hash=hash_value, ColumnToPredict='Close', WindowWidth=3, SetTrainingFlag=False,
+                       UseResidualWrapper=False, PrependBatchNormLayer=False, FitMaxEpochs=1, FitPatience=1,
+                       CompileLossFunction=min, CompileOptimizer=max, LayerStack={0: LayerParams(Units=1)},
+                       DatasetPath=None, DatasetTimeFilter=DateRange(), DatasetShuffle=False, DatasetBatchSize=4)
+
+
+def report_hash(training_params: TrainParams) -> str:
+    if training_params.Hash == 'failing':
+        raise ValueError('Failing job.')
+    return training_params.Hash.upper()
+
+
+def drain(path: Path, worker_id: str) -> list[str]:
+    with JobQueue(path) as queue:
+        return [outcome.Params.Hash for outcome in queue.work(worker_id, report_hash)]
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def new_instance(tmp_path: Path, clock: FakeClock) -> JobQueue:
+    with JobQueue(tmp_path / 'queue.sqlite', lease_seconds=10.0, max_attempts=2, clock=clock) as queue:
+        yield queue
+
+
+def test_instantiation_success(new_instance: JobQueue):
+    assert isinstance(new_instance, JobQueue)
+    assert new_instance.path.is_file()
+    assert new_instance.counts() == {'pending': 0, 'running': 0, 'completed': 0, 'failed': 0}
+
+
+def test_enqueue_success(new_instance: JobQueue):
+    assert new_instance.enqueue([build_training_params(hash_value) for hash_value in ['a', 'b']]) == 2
+    assert new_instance.enqueue([build_training_params(hash_value) for hash_value in ['b', 'c']]) == 1
+    assert new_instance.counts()['pending'] == 3
+    assert [new_instance.claim('worker').Hash for _ in range(3)] == ['a', 'b', 'c']
+    assert new_instance.claim('worker') is None
+
+
+def test_claim_complete_success(new_instance: JobQueue, clock: FakeClock):
+    new_instance.enqueue([build_training_params('a')])
+    computed_output = new_instance.claim('worker')
+    assert isinstance(computed_output, QueuedJob)
+    assert computed_output.Params == build_training_params('a')
+    assert (computed_output.Attempts, computed_output.WorkerId, computed_output.LeaseExpiry) == (1, 'worker', 1010.0)
+
+    clock.now += 8
+    new_instance.heartbeat(computed_output)
+    assert computed_output.LeaseExpiry == 1018.0
+    clock.now += 8
+    assert new_instance.claim('other') is None
+    new_instance.complete(computed_output, {'loss': 1.0})
+    assert new_instance.results() == {'a': {'loss': 1.0}}
+    assert new_instance.counts()['completed'] == 1
+
+
+def test_lease_expiry_success(new_instance: JobQueue, clock: FakeClock):
+    new_instance.enqueue([build_training_params('a')])
+    first_job = new_instance.claim('dead')
+    clock.now += 11
+    second_job = new_instance.claim('alive')
+    assert (second_job.Hash, second_job.Attempts) == ('a', 2)
+    with pytest.raises(LeaseLostException):
+        new_instance.complete(first_job)
+    with pytest.raises(LeaseLostException):
+        new_instance.heartbeat(first_job)
+
+    clock.now += 11
+    new_instance.expire_leases()
+    assert new_instance.counts()['failed'] == 1
+    assert new_instance.errors() == {'a': 'Lease expired.'}
+    with pytest.raises(LeaseLostException):
+        new_instance.complete(second_job)
+
+
+def test_fail_success(new_instance: JobQueue):
+    new_instance.enqueue([build_training_params('a')])
+    new_instance.fail(new_instance.claim('worker'), 'First failure.')
+    assert new_instance.counts()['pending'] == 1
+    new_instance.fail(new_instance.claim('worker'), 'Second failure.')
+    assert new_instance.counts()['failed'] == 1
+    assert new_instance.errors() == {'a': 'Second failure.'}
+    assert new_instance.claim('worker') is None
+
+
+def test_work_success(new_instance: JobQueue):
+    new_instance.enqueue([build_training_params(hash_value) for hash_value in ['a', 'failing', 'b']])
+    computed_output = list(new_instance.work('worker', report_hash, heartbeat_seconds=0.01))
+    assert [outcome.Params.Hash for outcome in computed_output] == ['a', 'failing', 'failing', 'b']
+    assert [outcome.Result for outcome in computed_output] == ['A', None, None, 'B']
+    assert all(isinstance(outcome.Error, ValueError) for outcome in computed_output[1:3])
+    assert new_instance.results() == {'a': 'A', 'b': 'B'}
+    assert new_instance.errors() == {'failing': "ValueError('Failing job.')"}
+
+
+
+
+def test_work_dead_worker_success(tmp_path: Path):
+    with JobQueue(tmp_path / 'queue.sqlite', lease_seconds=0.5) as queue:
+        queue.enqueue([build_training_params(hash_value) for hash_value in ['a', 'b']])
+        dead_job = queue.claim('dead')
+        computed_output = list(queue.work('alive', report_hash, heartbeat_seconds=0.1, poll_seconds=0.05))
+        assert [outcome.Params.Hash for outcome in computed_output] == ['b', dead_job.Hash]
+        assert queue.results() == {'a': 'A', 'b': 'B'}
+        assert queue.counts()['running'] == 0
+        with pytest.raises(LeaseLostException):
+            queue.complete(dead_job)
+def test_work_multiple_processes_success(tmp_path: Path):
+    path = tmp_path / 'queue.sqlite'
+    hashes = [f'job-{index}' for index in range(40)]
+    with JobQueue(path) as queue:
+        queue.enqueue([build_training_params(hash_value) for hash_value in hashes])
+    with multiprocessing.get_context('spawn').Pool(3) as pool:
+        claimed_hashes = pool.starmap(drain, [(path, f'worker-{index}') for index in range(3)])
+    assert sorted(sum(claimed_hashes, [])) == sorted(hashes)
+    with JobQueue(path) as queue:
+        assert queue.results() == {hash_value: hash_value.upper() for hash_value in hashes}
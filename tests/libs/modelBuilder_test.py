@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+
+import keras
+import numpy
+import pytest
+
+from source.libs.baseTestCase import BaseTestCase
+from source.libs.modelBuilder import ModelBuilder
+from source.structs.customTypes import DateRange
+from source.structs.params import TrainingParams as TrainParams, LayerParams
+
+
+def build_training_params(**overrides) -> TrainParams:
+    fields = dict(Hash='', ColumnToPredict='Close', WindowWidth=5, SetTrainingFlag=False, UseResidualWrapper=False,
+                  PrependBatchNormLayer=False, FitMaxEpochs=1, FitPatience=1,
+                  CompileLossFunction=keras.losses.MeanAbsoluteError, CompileOptimizer=keras.optimizers.RMSprop,
+                  LayerStack={0: LayerParams(Units=8)}, DatasetPath=None, DatasetTimeFilter=DateRange(),
+                  DatasetShuffle=False, DatasetBatchSize=4)
+    fields.update(overrides)
+    return TrainParams(**fields)
+
+
+@pytest.fixture
+def new_instance() -> ModelBuilder:
+    return ModelBuilder()
+
+
+def test_instantiation_success(new_instance: ModelBuilder):
+    assert isinstance(new_instance, ModelBuilder)
+
+
+@pytest.mark.parametrize('input_value,expected_type', [
+    pytest.param(keras.optimizers.RMSprop, keras.optimizers.RMSprop),
+    pytest.param(keras.losses.MeanAbsoluteError, keras.losses.MeanAbsoluteError),
+    pytest.param(keras.activations.relu, type(keras.activations.relu)),
+    pytest.param(None, type(None)),
+])
+def test_instantiate_success(input_value, expected_type):
+    assert isinstance(ModelBuilder.instantiate(input_value), expected_type)
+
+
+@dataclass
+class BuildMethodTestCase(BaseTestCase):
+    training_params: TrainParams = None
+    expected_dense_units: list[int] = None
+    expected_batch_norm: bool = False
+
+
+BuildMethTC = BuildMethodTestCase
+
+
+@pytest.mark.parametrize('test_case', [pytest.param(test_case, id=test_case.id) for test_case in [
+    BuildMethTC(id='single layers',
+                training_params=build_training_params(), expected_dense_units=[8, 1]),
+    BuildMethTC(id='layer stacks, sorted by key',
+                training_params=build_training_params(LayerStack={1: LayerParams(Units=4),
+                                                                  0: LayerParams(Units=16, Activation='relu')}),
+                expected_dense_units=[16, 4, 1]),
+    BuildMethTC(training_params=build_training_params(
+        LayerStack={0: LayerParams(Units=3, KernelInitializer=keras.initializers.Zeros,
+                                   KernelRegularizer=keras.regularizers.L2,
+                                   Activation=keras.activations.tanh)}),
+        expected_dense_units=[3, 1]),
+    BuildMethTC(id='batch normalization',
+                training_params=build_training_params(PrependBatchNormLayer=True), expected_dense_units=[8, 1],
+                expected_batch_norm=True),
+    BuildMethTC(id='residual wrapper',
+                training_params=build_training_params(UseResidualWrapper=True), expected_dense_units=[8, 1]),
+]])
+def test_build_success(new_instance: ModelBuilder, test_case: BuildMethodTestCase):
+    computed_output = new_instance.build(test_case.training_params, (5, 2), 1)
+    dense_units = [layer.units for layer in computed_output.layers if isinstance(layer, keras.layers.Dense)]
+    has_batch_norm = any(isinstance(layer, keras.layers.BatchNormalization) for layer in computed_output.layers)
+    assert dense_units == test_case.expected_dense_units
+    assert has_batch_norm == test_case.expected_batch_norm
+    assert isinstance(computed_output.optimizer, keras.optimizers.RMSprop)
+    assert computed_output.predict(numpy.zeros((3, 5, 2)), verbose=0).shape == (3, 1)
+
+
+def test_build_residual_success(new_instance: ModelBuilder):
+    training_params = build_training_params(UseResidualWrapper=True,
+                                            LayerStack={0: LayerParams(Units=4,
+                                                                       KernelInitializer=keras.initializers.Zeros)})
+    model = new_instance.build(training_params, (3, 2), 1)
+    for layer in model.layers:
+        if isinstance(layer, keras.layers.Dense):
+            layer.set_weights([numpy.zeros_like(weights) for weights in layer.get_weights()])
+    inputs = numpy.array([[[1.0, 10.0], [2.0, 20.0], [3.0, 30.0]]])
+    assert model.predict(inputs, verbose=0).tolist() == [[30.0]]
+
+
+def test_build_packed_success(new_instance: ModelBuilder):
+    packed_params = [build_training_params(Hash='aaa'),
+                     build_training_params(Hash='bbb', UseResidualWrapper=True, PrependBatchNormLayer=True,
+                                           CompileLossFunction=keras.losses.MeanSquaredError,
+                                           LayerStack={0: LayerParams(Units=3), 1: LayerParams(Units=2)})]
+    model = new_instance.build_packed(packed_params, (5, 2), 1)
+    assert isinstance(model.optimizer, keras.optimizers.RMSprop)
+    assert model.output_names == ['aaa', 'bbb']
+    computed_output = model.predict(numpy.zeros((3, 5, 2)), verbose=0)
+    assert {name: outputs.shape for name, outputs in computed_output.items()} == {'aaa': (3, 1), 'bbb': (3, 1)}
+    standalone_weights = [new_instance.build(training_params, (5, 2), 1).count_params()
+                          for training_params in packed_params]
+    assert model.count_params() == sum(standalone_weights)
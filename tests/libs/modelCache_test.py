@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import keras
+import numpy
+import pytest
+
+from source.libs.modelBuilder import ModelBuilder
+from source.libs.modelCache import ModelCache
+from source.libs.trainer import Trainer
+from source.structs.customTypes import DateRange
+from source.structs.params import TrainingParams as TrainParams, LayerParams
+
+INPUT_SHAPE = (5, 2)
+
+
+def build_training_params(**overrides) -> TrainParams:
+    fields = dict(Hash='aaa', ColumnToPredict='Close', WindowWidth=5, SetTrainingFlag=False, UseResidualWrapper=False,
+                  PrependBatchNormLayer=False, FitMaxEpochs=3, FitPatience=10,
+                  CompileLossFunction=keras.losses.MeanAbsoluteError, CompileOptimizer=keras.optimizers.Adam,
+                  LayerStack={0: LayerParams(Units=4, Activation=keras.activations.relu)}, DatasetPath=None,
+                  DatasetTimeFilter=DateRange(), DatasetShuffle=False, DatasetBatchSize=8)
+    fields.update(overrides)
+    return TrainParams(**fields)
+
+
+@pytest.fixture
+def new_instance() -> ModelCache:
+    return ModelCache(max_models=2)
+
+
+def test_instantiation_success(new_instance: ModelCache):
+    assert isinstance(new_instance, ModelCache)
+    assert len(new_instance) == 0
+
+
+@pytest.mark.parametrize('overrides,expected_output', [
+    pytest.param({'Hash': 'bbb', 'FitMaxEpochs': 9, 'DatasetBatchSize': 2, 'DatasetTimeFilter': DateRange(to=datetime(
+        2025, 1, 1))}, True, id='data and fit settings'),
+    pytest.param({'LayerStack': {0: LayerParams(Units=4, Activation=keras.activations.relu)}}, True,
+                 id='equal layer stack'),
+    pytest.param({'LayerStack': {0: LayerParams(Units=5, Activation=keras.activations.relu)}}, False, id='units'),
+    pytest.param({'UseResidualWrapper': True}, False, id='residual wrapper'),
+    pytest.param({'PrependBatchNormLayer': True}, False, id='batch normalization'),
+    pytest.param({'CompileOptimizer': keras.optimizers.SGD}, False, id='optimizer'),
+    pytest.param({'CompileLossFunction': keras.losses.MeanSquaredError}, False, id='loss function'),
+])
+def test_generate_key_success(overrides: dict, expected_output: bool):
+    computed_output = ModelCache.generate_key(build_training_params(**overrides), INPUT_SHAPE, 1)
+    assert (computed_output == ModelCache.generate_key(build_training_params(), INPUT_SHAPE, 1)) == expected_output
+
+
+def test_generate_key_shape_success():
+    key = ModelCache.generate_key(build_training_params(), INPUT_SHAPE, 1)
+    assert ModelCache.generate_key(build_training_params(), (6, 2), 1) != key
+    assert ModelCache.generate_key(build_training_params(), INPUT_SHAPE, 0) != key
+
+
+def test_get_success(new_instance: ModelCache):
+    keras.utils.set_random_seed(1)
+    model = new_instance.get(build_training_params(), INPUT_SHAPE, 1)
+    initial_weights = model.get_weights()
+    features = numpy.random.default_rng(0).normal(size=(16, *INPUT_SHAPE)).astype('float32')
+    model.fit(features, features[:, -1, 1:], epochs=2, verbose=0)
+    assert int(model.optimizer.iterations) > 0
+
+    keras.utils.set_random_seed(1)
+    computed_output = new_instance.get(build_training_params(Hash='bbb', FitMaxEpochs=9), INPUT_SHAPE, 1)
+    assert computed_output is model
+    assert int(computed_output.optimizer.iterations) == 0
+    assert all(numpy.all(variable == 0) for variable in computed_output.optimizer.variables[2:])
+    for expected, computed in zip(initial_weights, computed_output.get_weights()):
+        numpy.testing.assert_array_equal(computed, expected)
+    assert (new_instance.hits, new_instance.misses) == (1, 1)
+
+
+def test_get_initialization_success(new_instance: ModelCache):
+    new_instance.get(build_training_params(), INPUT_SHAPE, 1)
+    keras.utils.set_random_seed(2)
+    computed_output = new_instance.get(build_training_params(), INPUT_SHAPE, 1).get_weights()
+    keras.utils.set_random_seed(2)
+    expected_output = ModelBuilder().build(build_training_params(), INPUT_SHAPE, 1).get_weights()
+    for expected, computed in zip(expected_output, computed_output):
+        numpy.testing.assert_array_equal(computed, expected)
+
+    unseeded_output = new_instance.get(build_training_params(), INPUT_SHAPE, 1).get_weights()
+    assert not numpy.array_equal(unseeded_output[0], computed_output[0])
+    assert not numpy.array_equal(new_instance.get(build_training_params(), INPUT_SHAPE, 1).get_weights()[0],
+                                 unseeded_output[0])
+
+
+def test_get_no_rebuild_success(monkeypatch: pytest.MonkeyPatch):
+    model_builder = ModelBuilder()
+    built_models = []
+    build_model = model_builder.build_model
+    monkeypatch.setattr(model_builder, 'build_model', lambda *arguments: built_models.append(arguments) or
+                        build_model(*arguments))
+    instance = ModelCache(model_builder=model_builder)
+    training_params = build_training_params(UseResidualWrapper=True, PrependBatchNormLayer=True,
+                                            LayerStack={0: LayerParams(Units=4), 1: LayerParams(Units=3)})
+    model = instance.get(training_params, INPUT_SHAPE, 1)
+    model.fit(numpy.ones((8, *INPUT_SHAPE)), numpy.ones((8, 1)), epochs=1, verbose=0)
+    keras.utils.set_random_seed(3)
+    computed_output = instance.get(training_params, INPUT_SHAPE, 1).get_weights()
+    assert len(built_models) == 1
+    keras.utils.set_random_seed(3)
+    expected_output = ModelBuilder().build(training_params, INPUT_SHAPE, 1).get_weights()
+    for expected, computed in zip(expected_output, computed_output):
+        numpy.testing.assert_array_equal(computed, expected)
+
+
+def test_get_eviction_success(new_instance: ModelCache):
+    first_model = new_instance.get(build_training_params(), INPUT_SHAPE, 1)
+    new_instance.get(build_training_params(UseResidualWrapper=True), INPUT_SHAPE, 1)
+    new_instance.get(build_training_params(), INPUT_SHAPE, 1)
+    new_instance.get(build_training_params(PrependBatchNormLayer=True), INPUT_SHAPE, 1)
+    assert len(new_instance) == 2
+    assert new_instance.get(build_training_params(), INPUT_SHAPE, 1) is first_model
+    assert (new_instance.hits, new_instance.misses) == (2, 3)
+    new_instance.clear()
+    assert len(new_instance) == 0
+
+
+def test_trainer_success(new_instance: ModelCache, tmp_path: Path):
+    dataset_path = tmp_path / 'dataset.csv'
+    lines = ['Date,Open,Close'] + [f'{datetime(2025, 1, 1) + timedelta(days=row)},{row % 7}.0,{row % 5}.0'
+                                   for row in range(40)]
+    dataset_path.write_text('\n'.join(lines) + '\n')
+    expected_output = Trainer(seed=1).train(build_training_params(DatasetPath=dataset_path))
+
+    trainer = Trainer(seed=1, model_cache=new_instance)
+    trainer.train(build_training_params(DatasetPath=dataset_path, FitMaxEpochs=2))
+    computed_output = trainer.train(build_training_params(DatasetPath=dataset_path))
+    assert new_instance.hits == 1
+    numpy.testing.assert_allclose(computed_output.History['loss'], expected_output.History['loss'], rtol=1e-6)
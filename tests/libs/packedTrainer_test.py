@@ -0,0 +1,146 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import keras
+import numpy
+import pytest
+
+from source.libs.modelBuilder import ModelBuilder
+from source.libs.packedTrainer import PackedEarlyStopping, PackedTrainer
+from source.libs.trainer import Trainer
+from source.structs.customTypes import DateRange
+from source.structs.params import TrainingParams as TrainParams, LayerParams
+from source.structs.results import TrainingResult
+
+
+@pytest.fixture
+def dataset_path(tmp_path: Path) -> Path:
+    path = tmp_path / 'dataset.csv'
+    lines = ['Date,Open,Close'] + [f'{datetime(2025, 1, 1) + timedelta(days=row)},{row % 7}.0,{row % 5}.0'
+                                   for row in range(40)]
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+def build_training_params(dataset_path: Path = None, **overrides) -> TrainParams:
+    fields = dict(Hash='aaa', ColumnToPredict='Close', WindowWidth=5, SetTrainingFlag=False, UseResidualWrapper=False,
+                  PrependBatchNormLayer=False, FitMaxEpochs=3, FitPatience=10,
+                  CompileLossFunction=keras.losses.MeanAbsoluteError, CompileOptimizer=keras.optimizers.Adam,
+                  LayerStack={0: LayerParams(Units=4)}, DatasetPath=dataset_path, DatasetTimeFilter=DateRange(),
+                  DatasetShuffle=False, DatasetBatchSize=8)
+    fields.update(overrides)
+    return TrainParams(**fields)
+
+
+@pytest.fixture
+def new_instance() -> PackedTrainer:
+    return PackedTrainer(Trainer(seed=1), max_heads=2)
+
+
+def test_instantiation_success(new_instance: PackedTrainer):
+    assert isinstance(new_instance, PackedTrainer)
+    assert isinstance(new_instance.trainer, Trainer)
+
+
+def test_pack_success(new_instance: PackedTrainer):
+    unfolded_params = [
+        build_training_params(Hash='a'),
+        build_training_params(Hash='b', LayerStack={0: LayerParams(Units=8)}),
+        build_training_params(Hash='c', WindowWidth=3),
+        build_training_params(Hash='d', CompileLossFunction=keras.losses.MeanSquaredError, UseResidualWrapper=True),
+        build_training_params(Hash='e', CompileOptimizer=keras.optimizers.SGD),
+        build_training_params(Hash='f', FitPatience=1),
+        build_training_params(Hash='g', FitMaxEpochs=5),
+        build_training_params(Hash='h', PrependBatchNormLayer=True),
+    ]
+    computed_output = [[training_params.Hash for training_params in packed_params]
+                       for packed_params in new_instance.pack(unfolded_params)]
+    assert computed_output == [['a', 'b'], ['d', 'h'], ['c'], ['e'], ['f'], ['g']]
+
+
+def test_train_success(new_instance: PackedTrainer, dataset_path: Path):
+    unfolded_params = [build_training_params(dataset_path, Hash=hash_value, LayerStack={0: LayerParams(Units=units)})
+                       for hash_value, units in [('a', 2), ('b', 4), ('c', 8)]]
+    computed_output = list(new_instance.train(unfolded_params))
+    assert all(isinstance(result, TrainingResult) for result in computed_output)
+    assert [result.Hash for result in computed_output] == ['a', 'b', 'c']
+    assert all(result.Epochs == 3 and len(result.History['loss']) == 3 for result in computed_output)
+    assert new_instance.trainer.dataset_cache.misses == 1
+
+
+def test_train_pack_equivalence_success(new_instance: PackedTrainer, dataset_path: Path):
+    packed_params = [build_training_params(dataset_path, Hash='a'),
+                     build_training_params(dataset_path, Hash='b', CompileLossFunction=keras.losses.MeanSquaredError,
+                                           LayerStack={0: LayerParams(Units=3), 1: LayerParams(Units=2)})]
+    trainer = new_instance.trainer
+    data = trainer.prepare(packed_params[0], output_names=['a', 'b'])
+    packed_model = trainer.build_packed(packed_params, data)
+    head_weights = {training_params.Hash: keras.Model(packed_model.inputs,
+                                                      packed_model.get_layer(training_params.Hash).output).get_weights()
+                    for training_params in packed_params}
+    packed_history = packed_model.fit(data, epochs=3, shuffle=False, verbose=0).history
+
+    for training_params in packed_params:
+        standalone_data = trainer.prepare(training_params)
+        standalone_model = ModelBuilder().build(training_params, (5, 2), standalone_data.windows.target_index)
+        standalone_model.set_weights(head_weights[training_params.Hash])
+        standalone_history = standalone_model.fit(standalone_data, epochs=3, shuffle=False, verbose=0).history
+        numpy.testing.assert_allclose(packed_history[f'{training_params.Hash}_sample_loss'], standalone_history['loss'],
+                                      rtol=1e-5)
+
+
+def test_train_pack_regularizer_equivalence_success(new_instance: PackedTrainer, dataset_path: Path):
+    packed_params = [build_training_params(dataset_path, Hash='a', LayerStack={0: LayerParams(
+                         Units=4, KernelRegularizer=keras.regularizers.L2)}),
+                     build_training_params(dataset_path, Hash='b', FitPatience=0, LayerStack={0: LayerParams(
+                         Units=3, KernelRegularizer=keras.regularizers.L1), 1: LayerParams(Units=2)})]
+    trainer = new_instance.trainer
+    data = trainer.prepare(packed_params[0], output_names=['a', 'b'])
+    packed_model = trainer.build_packed(packed_params, data)
+    assert packed_model.losses == []
+    head_weights = {training_params.Hash: keras.Model(packed_model.inputs,
+                                                      packed_model.get_layer(training_params.Hash).output).get_weights()
+                    for training_params in packed_params}
+    early_stopping = PackedEarlyStopping(PackedTrainer.get_monitors(['a', 'b']), patience=0)
+    packed_history = packed_model.fit(data, epochs=3, callbacks=[early_stopping], shuffle=False, verbose=0).history
+
+    for training_params in packed_params:
+        standalone_data = trainer.prepare(training_params)
+        standalone_model = ModelBuilder().build(training_params, (5, 2), standalone_data.windows.target_index)
+        assert len(standalone_model.losses) == 1
+        standalone_model.set_weights(head_weights[training_params.Hash])
+        standalone_history = standalone_model.fit(standalone_data, epochs=3, shuffle=False, verbose=0,
+                                                  callbacks=[keras.callbacks.EarlyStopping(
+                                                      monitor='loss', patience=0)]).history
+        stopped_epochs = early_stopping.stopped_epochs.get(training_params.Hash, 3)
+        assert stopped_epochs == len(standalone_history['loss'])
+        numpy.testing.assert_allclose(packed_history[f'{training_params.Hash}_sample_loss'][:stopped_epochs],
+                                      standalone_history['loss'], rtol=1e-5)
+
+
+@pytest.mark.parametrize('output_names,expected_output', [
+    pytest.param(['a'], {'a': 'sample_loss'}),
+    pytest.param(['a', 'b'], {'a': 'a_sample_loss', 'b': 'b_sample_loss'}),
+])
+def test_get_monitors_success(output_names: list[str], expected_output: dict[str, str]):
+    assert PackedTrainer.get_monitors(output_names) == expected_output
+
+
+def test_packed_early_stopping_success():
+    model = keras.Sequential([keras.Input((1,)), keras.layers.Dense(1)])
+    callback = PackedEarlyStopping({'a': 'a_loss', 'b': 'b_loss'}, patience=1)
+    callback.set_model(model)
+    callback.on_train_begin()
+    for epoch, (a_loss, b_loss) in enumerate([(5.0, 5.0), (4.0, 5.0), (3.0, 6.0), (3.0, 4.0), (3.0, 3.0)]):
+        model.stop_training = False
+        callback.on_epoch_end(epoch, {'a_loss': a_loss, 'b_loss': b_loss, 'loss': a_loss + b_loss})
+    assert callback.stopped_epochs == {'b': 2, 'a': 4}
+    assert model.stop_training
+
+
+def test_train_pack_early_stopping_success(new_instance: PackedTrainer, dataset_path: Path):
+    packed_params = [build_training_params(dataset_path, Hash=hash_value, FitMaxEpochs=20, FitPatience=0,
+                                           CompileOptimizer=keras.optimizers.SGD) for hash_value in ['a', 'b']]
+    computed_output = new_instance.train_pack(packed_params)
+    assert all(0 < result.Epochs <= 20 for result in computed_output)
+    assert all(len(result.History['loss']) == result.Epochs for result in computed_output)
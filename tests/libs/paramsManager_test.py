@@ -1,3 +1,4 @@
+import dataclasses
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -5,8 +6,8 @@ from pathlib import Path
 import keras
 import pytest
 
-from source.libs.baseTestCase import BaseTestCase
-from source.libs.paramsManager import ParamsManager
+from source.libs.baseTestCase import BaseTestCase, Lazy
+from source.libs.paramsManager import ParamsManager, InvalidTieException, InvalidOrderingException
 from source.structs.customTypes import DateRange
 from source.structs.params import (TrainingParamsCombinations as TrainParamsCombs,
                                    LayerParamsCombinations as LayerParamsCombs,
@@ -33,265 +34,416 @@ UnfoldMethTC = UnfoldMethodTestCase
 
 @pytest.mark.parametrize('test_case', [pytest.param(test_case, id=test_case.id) for test_case in [
     UnfoldMethTC(id='one combination only',
-                 input_object=TrainParamsCombs(ColumnToPredict=['Oracle'],
-                                               WindowWidth=[300],
-                                               SetTrainingFlag=[True],
-                                               UseResidualWrapper=[False],
-                                               PrependBatchNormLayer=[True],
-                                               FitMaxEpochs=[2],
-                                               FitPatience=[50],
-                                               CompileLossFunction=[keras.losses.MeanAbsoluteError],
-                                               CompileOptimizer=[keras.optimizers.RMSprop],
-                                               LayerStack=[{0: LayerParamsCombs(Units=[8])}],
-                                               DatasetPath=[Path('dataset.csv')],
-                                               DatasetTimeFilter=[DateRange()],
-                                               DatasetShuffle=[True],
-                                               DatasetBatchSize=[16]),
-                 expected_output=[TrainParams(ColumnToPredict='Oracle',
-                                              WindowWidth=300,
-                                              SetTrainingFlag=True,
-                                              UseResidualWrapper=False,
-                                              PrependBatchNormLayer=True,
-                                              FitMaxEpochs=2,
-                                              FitPatience=50,
-                                              CompileLossFunction=keras.losses.MeanAbsoluteError,
-                                              CompileOptimizer=keras.optimizers.RMSprop,
-                                              LayerStack={0: LayerParams(Units=8)},
-                                              DatasetPath=Path('dataset.csv'),
-                                              DatasetTimeFilter=DateRange(),
-                                              DatasetShuffle=True,
-                                              DatasetBatchSize=16,
-                                              Hash='e8f35b867ef7f0be3a142b2b1be0b8a3')]),
-    UnfoldMethTC(input_object=TrainParamsCombs(ColumnToPredict=['Oracle'],
-                                               WindowWidth=[300],
-                                               SetTrainingFlag=[True],
-                                               UseResidualWrapper=[False],
-                                               PrependBatchNormLayer=[True],
-                                               FitMaxEpochs=[2],
-                                               FitPatience=[50],
-                                               CompileLossFunction=[keras.losses.MeanAbsoluteError],
-                                               CompileOptimizer=[keras.optimizers.RMSprop],
-                                               LayerStack=[{0: LayerParamsCombs(Units=[8])}],
-                                               DatasetPath=[Path('dataset.csv')],
-                                               DatasetTimeFilter=[DateRange(fm=datetime(2025, 1, 1),
-                                                                            to=datetime(2025, 1, 2))],
-                                               DatasetShuffle=[True],
-                                               DatasetBatchSize=[16]),
-                 expected_output=[TrainParams(ColumnToPredict='Oracle',
-                                              WindowWidth=300,
-                                              SetTrainingFlag=True,
-                                              UseResidualWrapper=False,
-                                              PrependBatchNormLayer=True,
-                                              FitMaxEpochs=2,
-                                              FitPatience=50,
-                                              CompileLossFunction=keras.losses.MeanAbsoluteError,
-                                              CompileOptimizer=keras.optimizers.RMSprop,
-                                              LayerStack={0: LayerParams(Units=8)},
-                                              DatasetPath=Path('dataset.csv'),
-                                              DatasetTimeFilter=DateRange(fm=datetime(2025, 1, 1),
-                                                                          to=datetime(2025, 1, 2)),
-                                              DatasetShuffle=True,
-                                              DatasetBatchSize=16,
-                                              Hash='076279deaff47201174e8a01524e3ce3')]),
+                 input_object=Lazy(lambda: TrainParamsCombs(ColumnToPredict=['Oracle'],
+                                                            WindowWidth=[300],
+                                                            SetTrainingFlag=[True],
+                                                            UseResidualWrapper=[False],
+                                                            PrependBatchNormLayer=[True],
+                                                            FitMaxEpochs=[2],
+                                                            FitPatience=[50],
+                                                            CompileLossFunction=[keras.losses.MeanAbsoluteError],
+                                                            CompileOptimizer=[keras.optimizers.RMSprop],
+                                                            LayerStack=[{0: LayerParamsCombs(Units=[8])}],
+                                                            DatasetPath=[Path('dataset.csv')],
+                                                            DatasetTimeFilter=[DateRange()],
+                                                            DatasetShuffle=[True],
+                                                            DatasetBatchSize=[16])),
+                 expected_output=Lazy(lambda: [TrainParams(ColumnToPredict='Oracle',
+                                                           WindowWidth=300,
+                                                           SetTrainingFlag=True,
+                                                           UseResidualWrapper=False,
+                                                           PrependBatchNormLayer=True,
+                                                           FitMaxEpochs=2,
+                                                           FitPatience=50,
+                                                           CompileLossFunction=keras.losses.MeanAbsoluteError,
+                                                           CompileOptimizer=keras.optimizers.RMSprop,
+                                                           LayerStack={0: LayerParams(Units=8)},
+                                                           DatasetPath=Path('dataset.csv'),
+                                                           DatasetTimeFilter=DateRange(),
+                                                           DatasetShuffle=True,
+                                                           DatasetBatchSize=16,
+                                                           Hash='e8f35b867ef7f0be3a142b2b1be0b8a3')])),
+    UnfoldMethTC(input_object=Lazy(lambda: TrainParamsCombs(ColumnToPredict=['Oracle'],
+                                                            WindowWidth=[300],
+                                                            SetTrainingFlag=[True],
+                                                            UseResidualWrapper=[False],
+                                                            PrependBatchNormLayer=[True],
+                                                            FitMaxEpochs=[2],
+                                                            FitPatience=[50],
+                                                            CompileLossFunction=[keras.losses.MeanAbsoluteError],
+                                                            CompileOptimizer=[keras.optimizers.RMSprop],
+                                                            LayerStack=[{0: LayerParamsCombs(Units=[8])}],
+                                                            DatasetPath=[Path('dataset.csv')],
+                                                            DatasetTimeFilter=[DateRange(fm=datetime(2025, 1, 1),
+                                                                                         to=datetime(2025, 1, 2))],
+                                                            DatasetShuffle=[True],
+                                                            DatasetBatchSize=[16])),
+                 expected_output=Lazy(lambda: [TrainParams(ColumnToPredict='Oracle',
+                                                           WindowWidth=300,
+                                                           SetTrainingFlag=True,
+                                                           UseResidualWrapper=False,
+                                                           PrependBatchNormLayer=True,
+                                                           FitMaxEpochs=2,
+                                                           FitPatience=50,
+                                                           CompileLossFunction=keras.losses.MeanAbsoluteError,
+                                                           CompileOptimizer=keras.optimizers.RMSprop,
+                                                           LayerStack={0: LayerParams(Units=8)},
+                                                           DatasetPath=Path('dataset.csv'),
+                                                           DatasetTimeFilter=DateRange(fm=datetime(2025, 1, 1),
+                                                                                       to=datetime(2025, 1, 2)),
+                                                           DatasetShuffle=True,
+                                                           DatasetBatchSize=16,
+                                                           Hash='076279deaff47201174e8a01524e3ce3')])),
     UnfoldMethTC(id='two combinations',
-                 input_object=TrainParamsCombs(ColumnToPredict=['Oracle', 'Close'],
-                                               WindowWidth=[300],
-                                               SetTrainingFlag=[True],
-                                               UseResidualWrapper=[False],
-                                               PrependBatchNormLayer=[True],
-                                               FitMaxEpochs=[2],
-                                               FitPatience=[50],
-                                               CompileLossFunction=[keras.losses.MeanAbsoluteError],
-                                               CompileOptimizer=[keras.optimizers.RMSprop],
-                                               LayerStack=[{0: LayerParamsCombs(Units=[8])}],
-                                               DatasetPath=[Path('dataset.csv')],
-                                               DatasetTimeFilter=[DateRange()],
-                                               DatasetShuffle=[True],
-                                               DatasetBatchSize=[16]),
-                 expected_output=[TrainParams(ColumnToPredict='Oracle',
-                                              WindowWidth=300,
-                                              SetTrainingFlag=True,
-                                              UseResidualWrapper=False,
-                                              PrependBatchNormLayer=True,
-                                              FitMaxEpochs=2,
-                                              FitPatience=50,
-                                              CompileLossFunction=keras.losses.MeanAbsoluteError,
-                                              CompileOptimizer=keras.optimizers.RMSprop,
-                                              LayerStack={0: LayerParams(Units=8)},
-                                              DatasetPath=Path('dataset.csv'),
-                                              DatasetTimeFilter=DateRange(),
-                                              DatasetShuffle=True,
-                                              DatasetBatchSize=16,
-                                              Hash='e8f35b867ef7f0be3a142b2b1be0b8a3'),
-                                  TrainParams(ColumnToPredict='Close',
-                                              WindowWidth=300,
-                                              SetTrainingFlag=True,
-                                              UseResidualWrapper=False,
-                                              PrependBatchNormLayer=True,
-                                              FitMaxEpochs=2,
-                                              FitPatience=50,
-                                              CompileLossFunction=keras.losses.MeanAbsoluteError,
-                                              CompileOptimizer=keras.optimizers.RMSprop,
-                                              LayerStack={0: LayerParams(Units=8)},
-                                              DatasetPath=Path('dataset.csv'),
-                                              DatasetTimeFilter=DateRange(),
-                                              DatasetShuffle=True,
-                                              DatasetBatchSize=16,
-                                              Hash='e60694f0f9a3fe809730c8a2341fdc06')]),
-    UnfoldMethTC(input_object=TrainParamsCombs(ColumnToPredict=['Oracle'],
-                                               WindowWidth=[300],
-                                               SetTrainingFlag=[True],
-                                               UseResidualWrapper=[False],
-                                               PrependBatchNormLayer=[True],
-                                               FitMaxEpochs=[2],
-                                               FitPatience=[50],
-                                               CompileLossFunction=[keras.losses.MeanAbsoluteError],
-                                               CompileOptimizer=[keras.optimizers.RMSprop],
-                                               LayerStack=[{0: LayerParamsCombs(Units=[8])}],
-                                               DatasetPath=[Path('dataset.csv')],
-                                               DatasetTimeFilter=[DateRange(fm=datetime(2025, 1, 1),
-                                                                            to=datetime(2025, 1, 2)),
-                                                                  DateRange(fm=datetime(2025, 2, 1),
-                                                                            to=datetime(2025, 2, 2))],
-                                               DatasetShuffle=[True],
-                                               DatasetBatchSize=[16]),
-                 expected_output=[TrainParams(ColumnToPredict='Oracle',
-                                              WindowWidth=300,
-                                              SetTrainingFlag=True,
-                                              UseResidualWrapper=False,
-                                              PrependBatchNormLayer=True,
-                                              FitMaxEpochs=2,
-                                              FitPatience=50,
-                                              CompileLossFunction=keras.losses.MeanAbsoluteError,
-                                              CompileOptimizer=keras.optimizers.RMSprop,
-                                              LayerStack={0: LayerParams(Units=8)},
-                                              DatasetPath=Path('dataset.csv'),
-                                              DatasetTimeFilter=DateRange(fm=datetime(2025, 1, 1),
-                                                                          to=datetime(2025, 1, 2)),
-                                              DatasetShuffle=True,
-                                              DatasetBatchSize=16,
-                                              Hash='076279deaff47201174e8a01524e3ce3'),
-                                  TrainParams(ColumnToPredict='Oracle',
-                                              WindowWidth=300,
-                                              SetTrainingFlag=True,
-                                              UseResidualWrapper=False,
-                                              PrependBatchNormLayer=True,
-                                              FitMaxEpochs=2,
-                                              FitPatience=50,
-                                              CompileLossFunction=keras.losses.MeanAbsoluteError,
-                                              CompileOptimizer=keras.optimizers.RMSprop,
-                                              LayerStack={0: LayerParams(Units=8)},
-                                              DatasetPath=Path('dataset.csv'),
-                                              DatasetTimeFilter=DateRange(fm=datetime(2025, 2, 1),
-                                                                          to=datetime(2025, 2, 2)),
-                                              DatasetShuffle=True,
-                                              DatasetBatchSize=16,
-                                              Hash='940d02e333c87fbeaa48e7a38be46cfa')]),
+                 input_object=Lazy(lambda: TrainParamsCombs(ColumnToPredict=['Oracle', 'Close'],
+                                                            WindowWidth=[300],
+                                                            SetTrainingFlag=[True],
+                                                            UseResidualWrapper=[False],
+                                                            PrependBatchNormLayer=[True],
+                                                            FitMaxEpochs=[2],
+                                                            FitPatience=[50],
+                                                            CompileLossFunction=[keras.losses.MeanAbsoluteError],
+                                                            CompileOptimizer=[keras.optimizers.RMSprop],
+                                                            LayerStack=[{0: LayerParamsCombs(Units=[8])}],
+                                                            DatasetPath=[Path('dataset.csv')],
+                                                            DatasetTimeFilter=[DateRange()],
+                                                            DatasetShuffle=[True],
+                                                            DatasetBatchSize=[16])),
+                 expected_output=Lazy(lambda: [TrainParams(ColumnToPredict='Oracle',
+                                                           WindowWidth=300,
+                                                           SetTrainingFlag=True,
+                                                           UseResidualWrapper=False,
+                                                           PrependBatchNormLayer=True,
+                                                           FitMaxEpochs=2,
+                                                           FitPatience=50,
+                                                           CompileLossFunction=keras.losses.MeanAbsoluteError,
+                                                           CompileOptimizer=keras.optimizers.RMSprop,
+                                                           LayerStack={0: LayerParams(Units=8)},
+                                                           DatasetPath=Path('dataset.csv'),
+                                                           DatasetTimeFilter=DateRange(),
+                                                           DatasetShuffle=True,
+                                                           DatasetBatchSize=16,
+                                                           Hash='e8f35b867ef7f0be3a142b2b1be0b8a3'),
+                                               TrainParams(ColumnToPredict='Close',
+                                                           WindowWidth=300,
+                                                           SetTrainingFlag=True,
+                                                           UseResidualWrapper=False,
+                                                           PrependBatchNormLayer=True,
+                                                           FitMaxEpochs=2,
+                                                           FitPatience=50,
+                                                           CompileLossFunction=keras.losses.MeanAbsoluteError,
+                                                           CompileOptimizer=keras.optimizers.RMSprop,
+                                                           LayerStack={0: LayerParams(Units=8)},
+                                                           DatasetPath=Path('dataset.csv'),
+                                                           DatasetTimeFilter=DateRange(),
+                                                           DatasetShuffle=True,
+                                                           DatasetBatchSize=16,
+                                                           Hash='e60694f0f9a3fe809730c8a2341fdc06')])),
+    UnfoldMethTC(input_object=Lazy(lambda: TrainParamsCombs(ColumnToPredict=['Oracle'],
+                                                            WindowWidth=[300],
+                                                            SetTrainingFlag=[True],
+                                                            UseResidualWrapper=[False],
+                                                            PrependBatchNormLayer=[True],
+                                                            FitMaxEpochs=[2],
+                                                            FitPatience=[50],
+                                                            CompileLossFunction=[keras.losses.MeanAbsoluteError],
+                                                            CompileOptimizer=[keras.optimizers.RMSprop],
+                                                            LayerStack=[{0: LayerParamsCombs(Units=[8])}],
+                                                            DatasetPath=[Path('dataset.csv')],
+                                                            DatasetTimeFilter=[DateRange(fm=datetime(2025, 1, 1),
+                                                                                         to=datetime(2025, 1, 2)),
+                                                                               DateRange(fm=datetime(2025, 2, 1),
+                                                                                         to=datetime(2025, 2, 2))],
+                                                            DatasetShuffle=[True],
+                                                            DatasetBatchSize=[16])),
+                 expected_output=Lazy(lambda: [TrainParams(ColumnToPredict='Oracle',
+                                                           WindowWidth=300,
+                                                           SetTrainingFlag=True,
+                                                           UseResidualWrapper=False,
+                                                           PrependBatchNormLayer=True,
+                                                           FitMaxEpochs=2,
+                                                           FitPatience=50,
+                                                           CompileLossFunction=keras.losses.MeanAbsoluteError,
+                                                           CompileOptimizer=keras.optimizers.RMSprop,
+                                                           LayerStack={0: LayerParams(Units=8)},
+                                                           DatasetPath=Path('dataset.csv'),
+                                                           DatasetTimeFilter=DateRange(fm=datetime(2025, 1, 1),
+                                                                                       to=datetime(2025, 1, 2)),
+                                                           DatasetShuffle=True,
+                                                           DatasetBatchSize=16,
+                                                           Hash='076279deaff47201174e8a01524e3ce3'),
+                                               TrainParams(ColumnToPredict='Oracle',
+                                                           WindowWidth=300,
+                                                           SetTrainingFlag=True,
+                                                           UseResidualWrapper=False,
+                                                           PrependBatchNormLayer=True,
+                                                           FitMaxEpochs=2,
+                                                           FitPatience=50,
+                                                           CompileLossFunction=keras.losses.MeanAbsoluteError,
+                                                           CompileOptimizer=keras.optimizers.RMSprop,
+                                                           LayerStack={0: LayerParams(Units=8)},
+                                                           DatasetPath=Path('dataset.csv'),
+                                                           DatasetTimeFilter=DateRange(fm=datetime(2025, 2, 1),
+                                                                                       to=datetime(2025, 2, 2)),
+                                                           DatasetShuffle=True,
+                                                           DatasetBatchSize=16,
+                                                           Hash='940d02e333c87fbeaa48e7a38be46cfa')])),
     UnfoldMethTC(id='multiple layer stacks',
-                 input_object=TrainParamsCombs(ColumnToPredict=['Oracle'],
-                                               WindowWidth=[300],
-                                               SetTrainingFlag=[True],
-                                               UseResidualWrapper=[False],
-                                               PrependBatchNormLayer=[True],
-                                               FitMaxEpochs=[2],
-                                               FitPatience=[50],
-                                               CompileLossFunction=[keras.losses.MeanAbsoluteError],
-                                               CompileOptimizer=[keras.optimizers.RMSprop],
-                                               LayerStack=[{0: LayerParamsCombs(Units=[32])},
-                                                           {0: LayerParamsCombs(Units=[0]),
-                                                            1: LayerParamsCombs(Units=[8],
-                                                                                KernelInitializer=[keras.initializers.Zeros,
-                                                                                                   keras.initializers.Ones])},
-                                                           {0: LayerParamsCombs(Units=[0]),
-                                                            1: LayerParamsCombs(Units=[8, 16])}],
-                                               DatasetPath=[Path('dataset.csv')],
-                                               DatasetTimeFilter=[DateRange()],
-                                               DatasetShuffle=[True],
-                                               DatasetBatchSize=[16]),
-                 expected_output=[TrainParams(ColumnToPredict='Oracle',
-                                              WindowWidth=300,
-                                              SetTrainingFlag=True,
-                                              UseResidualWrapper=False,
-                                              PrependBatchNormLayer=True,
-                                              FitMaxEpochs=2,
-                                              FitPatience=50,
-                                              CompileLossFunction=keras.losses.MeanAbsoluteError,
-                                              CompileOptimizer=keras.optimizers.RMSprop,
-                                              LayerStack={0: LayerParams(Units=32)},
-                                              DatasetPath=Path('dataset.csv'),
-                                              DatasetTimeFilter=DateRange(),
-                                              DatasetShuffle=True,
-                                              DatasetBatchSize=16,
-                                              Hash='62ffd59ca111561847cb325e2684e1a5'),
-                                  TrainParams(ColumnToPredict='Oracle',
-                                              WindowWidth=300,
-                                              SetTrainingFlag=True,
-                                              UseResidualWrapper=False,
-                                              PrependBatchNormLayer=True,
-                                              FitMaxEpochs=2,
-                                              FitPatience=50,
-                                              CompileLossFunction=keras.losses.MeanAbsoluteError,
-                                              CompileOptimizer=keras.optimizers.RMSprop,
-                                              LayerStack={0: LayerParams(Units=0),
-                                                          1: LayerParams(Units=8,
-                                                                         KernelInitializer=keras.initializers.Zeros)},
-                                              DatasetPath=Path('dataset.csv'),
-                                              DatasetTimeFilter=DateRange(),
-                                              DatasetShuffle=True,
-                                              DatasetBatchSize=16,
-                                              Hash='a6296cd057933c96c028d423e0cad491'),
-                                  TrainParams(ColumnToPredict='Oracle',
-                                              WindowWidth=300,
-                                              SetTrainingFlag=True,
-                                              UseResidualWrapper=False,
-                                              PrependBatchNormLayer=True,
-                                              FitMaxEpochs=2,
-                                              FitPatience=50,
-                                              CompileLossFunction=keras.losses.MeanAbsoluteError,
-                                              CompileOptimizer=keras.optimizers.RMSprop,
-                                              LayerStack={0: LayerParams(Units=0),
-                                                          1: LayerParams(Units=8,
-                                                                         KernelInitializer=keras.initializers.Ones)},
-                                              DatasetPath=Path('dataset.csv'),
-                                              DatasetTimeFilter=DateRange(),
-                                              DatasetShuffle=True,
-                                              DatasetBatchSize=16,
-                                              Hash='bd4995cea945e9f17c9a7940ab39bc4b'),
-                                  TrainParams(ColumnToPredict='Oracle',
-                                              WindowWidth=300,
-                                              SetTrainingFlag=True,
-                                              UseResidualWrapper=False,
-                                              PrependBatchNormLayer=True,
-                                              FitMaxEpochs=2,
-                                              FitPatience=50,
-                                              CompileLossFunction=keras.losses.MeanAbsoluteError,
-                                              CompileOptimizer=keras.optimizers.RMSprop,
-                                              LayerStack={0: LayerParams(Units=0),
-                                                          1: LayerParams(Units=8)},
-                                              DatasetPath=Path('dataset.csv'),
-                                              DatasetTimeFilter=DateRange(),
-                                              DatasetShuffle=True,
-                                              DatasetBatchSize=16,
-                                              Hash='9d010b25d30c4efbb3901d64491813ac'),
-                                  TrainParams(ColumnToPredict='Oracle',
-                                              WindowWidth=300,
-                                              SetTrainingFlag=True,
-                                              UseResidualWrapper=False,
-                                              PrependBatchNormLayer=True,
-                                              FitMaxEpochs=2,
-                                              FitPatience=50,
-                                              CompileLossFunction=keras.losses.MeanAbsoluteError,
-                                              CompileOptimizer=keras.optimizers.RMSprop,
-                                              LayerStack={0: LayerParams(Units=0),
-                                                          1: LayerParams(Units=16)},
-                                              DatasetPath=Path('dataset.csv'),
-                                              DatasetTimeFilter=DateRange(),
-                                              DatasetShuffle=True,
-                                              DatasetBatchSize=16,
-                                              Hash='042d837ee2b3242d1e4c2e86348bd0e8')]),
+                 input_object=Lazy(lambda: TrainParamsCombs(ColumnToPredict=['Oracle'],
+                                                            WindowWidth=[300],
+                                                            SetTrainingFlag=[True],
+                                                            UseResidualWrapper=[False],
+                                                            PrependBatchNormLayer=[True],
+                                                            FitMaxEpochs=[2],
+                                                            FitPatience=[50],
+                                                            CompileLossFunction=[keras.losses.MeanAbsoluteError],
+                                                            CompileOptimizer=[keras.optimizers.RMSprop],
+                                                            LayerStack=[{0: LayerParamsCombs(Units=[32])},
+                                                                        {0: LayerParamsCombs(Units=[0]),
+                                                                         1: LayerParamsCombs(
+                                                                             Units=[8],
+                                                                             KernelInitializer=[
+                                                                                 keras.initializers.Zeros,
+                                                                                 keras.initializers.Ones])},
+                                                                        {0: LayerParamsCombs(Units=[0]),
+                                                                         1: LayerParamsCombs(Units=[8, 16])}],
+                                                            DatasetPath=[Path('dataset.csv')],
+                                                            DatasetTimeFilter=[DateRange()],
+                                                            DatasetShuffle=[True],
+                                                            DatasetBatchSize=[16])),
+                 expected_output=Lazy(lambda: [TrainParams(ColumnToPredict='Oracle',
+                                                           WindowWidth=300,
+                                                           SetTrainingFlag=True,
+                                                           UseResidualWrapper=False,
+                                                           PrependBatchNormLayer=True,
+                                                           FitMaxEpochs=2,
+                                                           FitPatience=50,
+                                                           CompileLossFunction=keras.losses.MeanAbsoluteError,
+                                                           CompileOptimizer=keras.optimizers.RMSprop,
+                                                           LayerStack={0: LayerParams(Units=32)},
+                                                           DatasetPath=Path('dataset.csv'),
+                                                           DatasetTimeFilter=DateRange(),
+                                                           DatasetShuffle=True,
+                                                           DatasetBatchSize=16,
+                                                           Hash='62ffd59ca111561847cb325e2684e1a5'),
+                                               TrainParams(ColumnToPredict='Oracle',
+                                                           WindowWidth=300,
+                                                           SetTrainingFlag=True,
+                                                           UseResidualWrapper=False,
+                                                           PrependBatchNormLayer=True,
+                                                           FitMaxEpochs=2,
+                                                           FitPatience=50,
+                                                           CompileLossFunction=keras.losses.MeanAbsoluteError,
+                                                           CompileOptimizer=keras.optimizers.RMSprop,
+                                                           LayerStack={0: LayerParams(Units=0),
+                                                                       1: LayerParams(Units=8,
+                                                                                      KernelInitializer=(
+                                                                                          keras.initializers.Zeros))},
+                                                           DatasetPath=Path('dataset.csv'),
+                                                           DatasetTimeFilter=DateRange(),
+                                                           DatasetShuffle=True,
+                                                           DatasetBatchSize=16,
+                                                           Hash='a6296cd057933c96c028d423e0cad491'),
+                                               TrainParams(ColumnToPredict='Oracle',
+                                                           WindowWidth=300,
+                                                           SetTrainingFlag=True,
+                                                           UseResidualWrapper=False,
+                                                           PrependBatchNormLayer=True,
+                                                           FitMaxEpochs=2,
+                                                           FitPatience=50,
+                                                           CompileLossFunction=keras.losses.MeanAbsoluteError,
+                                                           CompileOptimizer=keras.optimizers.RMSprop,
+                                                           LayerStack={0: LayerParams(Units=0),
+                                                                       1: LayerParams(Units=8,
+                                                                                      KernelInitializer=(
+                                                                                          keras.initializers.Ones))},
+                                                           DatasetPath=Path('dataset.csv'),
+                                                           DatasetTimeFilter=DateRange(),
+                                                           DatasetShuffle=True,
+                                                           DatasetBatchSize=16,
+                                                           Hash='bd4995cea945e9f17c9a7940ab39bc4b'),
+                                               TrainParams(ColumnToPredict='Oracle',
+                                                           WindowWidth=300,
+                                                           SetTrainingFlag=True,
+                                                           UseResidualWrapper=False,
+                                                           PrependBatchNormLayer=True,
+                                                           FitMaxEpochs=2,
+                                                           FitPatience=50,
+                                                           CompileLossFunction=keras.losses.MeanAbsoluteError,
+                                                           CompileOptimizer=keras.optimizers.RMSprop,
+                                                           LayerStack={0: LayerParams(Units=0),
+                                                                       1: LayerParams(Units=8)},
+                                                           DatasetPath=Path('dataset.csv'),
+                                                           DatasetTimeFilter=DateRange(),
+                                                           DatasetShuffle=True,
+                                                           DatasetBatchSize=16,
+                                                           Hash='9d010b25d30c4efbb3901d64491813ac'),
+                                               TrainParams(ColumnToPredict='Oracle',
+                                                           WindowWidth=300,
+                                                           SetTrainingFlag=True,
+                                                           UseResidualWrapper=False,
+                                                           PrependBatchNormLayer=True,
+                                                           FitMaxEpochs=2,
+                                                           FitPatience=50,
+                                                           CompileLossFunction=keras.losses.MeanAbsoluteError,
+                                                           CompileOptimizer=keras.optimizers.RMSprop,
+                                                           LayerStack={0: LayerParams(Units=0),
+                                                                       1: LayerParams(Units=16)},
+                                                           DatasetPath=Path('dataset.csv'),
+                                                           DatasetTimeFilter=DateRange(),
+                                                           DatasetShuffle=True,
+                                                           DatasetBatchSize=16,
+                                                           Hash='042d837ee2b3242d1e4c2e86348bd0e8')])),
 ]])
 def test_unfold_success(new_instance: ParamsManager, test_case: UnfoldMethodTestCase):
     computed_output = new_instance.unfold(test_case.input_object)
     assert len(computed_output) == len(test_case.expected_output)
     for computed_item, expected_item in zip(computed_output, test_case.expected_output):
         assert computed_item == expected_item
+
+
+def build_combinations(**overrides) -> TrainParamsCombs:
+    fields = dict(ColumnToPredict=['Oracle'], WindowWidth=[300], SetTrainingFlag=[True], UseResidualWrapper=[False],
+                  PrependBatchNormLayer=[True], FitMaxEpochs=[2], FitPatience=[50],
+                  CompileLossFunction=[keras.losses.MeanAbsoluteError], CompileOptimizer=[keras.optimizers.RMSprop],
+                  LayerStack=[{0: LayerParamsCombs(Units=[8])}], DatasetPath=[Path('dataset.csv')],
+                  DatasetTimeFilter=[DateRange()], DatasetShuffle=[True], DatasetBatchSize=[16])
+    fields.update(overrides)
+    return TrainParamsCombs(**fields)
+
+
+@pytest.mark.parametrize('input_object,expected_output', [
+    pytest.param(build_combinations(), 1),
+    pytest.param(build_combinations(WindowWidth=[10, 20, 30], DatasetShuffle=[True, False]), 6),
+    pytest.param(build_combinations(WindowWidth=[]), 0),
+    pytest.param(build_combinations(LayerStack=[{0: LayerParamsCombs(Units=[8, 16], Activation=[]),
+                                                 1: LayerParamsCombs(Units=[4], KernelInitializer=[None, None])}],
+                                    FitPatience=[1, 2]), 8),
+    pytest.param(build_combinations(LayerStack=[{0: LayerParamsCombs(Units=[8, 16])},
+                                                {0: LayerParamsCombs(Units=[8]), 1: LayerParamsCombs(Units=[4, 2])}]),
+                 4),
+])
+def test_count_success(new_instance: ParamsManager, input_object: TrainParamsCombs, expected_output: int):
+    assert new_instance.count(input_object) == expected_output
+    assert len(new_instance.unfold(input_object)) == expected_output
+
+
+def get_stacks(unfolded_params: list[TrainParams]) -> list[list[tuple]]:
+    return [[(layer.Units, layer.Activation) for layer in params.LayerStack.values()] for params in unfolded_params]
+
+
+def test_unfold_ties_success(new_instance: ParamsManager):
+    relu, tanh = keras.activations.relu, keras.activations.tanh
+    computed_output = new_instance.unfold(build_combinations(LayerStack=[{
+        0: LayerParamsCombs(Units=[8, 16], Activation=[relu, tanh], Ties={'Units': 'width', 'Activation': 'all'}),
+        1: LayerParamsCombs(Units=[1], Ties={'Units': 'width', 'Activation': 'all'}, UnitsScale=0.5),
+        2: LayerParamsCombs(Units=[2, 3], Activation=[relu], Ties={'Activation': 'all'})}]))
+    assert get_stacks(computed_output) == [
+        [(8, relu), (4, relu), (2, relu)], [(16, relu), (8, relu), (2, relu)],
+        [(8, tanh), (4, tanh), (2, tanh)], [(16, tanh), (8, tanh), (2, tanh)],
+        [(8, relu), (4, relu), (3, relu)], [(16, relu), (8, relu), (3, relu)],
+        [(8, tanh), (4, tanh), (3, tanh)], [(16, tanh), (8, tanh), (3, tanh)]]
+
+    untied_output = new_instance.unfold(build_combinations(LayerStack=[{
+        0: LayerParamsCombs(Units=[16], Activation=[tanh]), 1: LayerParamsCombs(Units=[8], Activation=[tanh]),
+        2: LayerParamsCombs(Units=[3], Activation=[tanh])}]))
+    assert computed_output[-1] == untied_output[0]
+
+
+def test_unfold_ties_leader_success(new_instance: ParamsManager):
+    computed_output = new_instance.unfold(build_combinations(LayerStack=[{
+        0: LayerParamsCombs(Units=[4]),
+        1: LayerParamsCombs(Units=[4], KernelInitializer=[keras.initializers.Zeros, keras.initializers.Ones],
+                            Ties={'KernelInitializer': 'init'}),
+        2: LayerParamsCombs(Units=[4], KernelInitializer=[keras.initializers.HeNormal],
+                            Ties={'KernelInitializer': 'init'}),
+        3: LayerParamsCombs(Units=[4], Ties={'KernelInitializer': 'init'})}]))
+    assert [[layer.KernelInitializer for layer in params.LayerStack.values()] for params in computed_output] == [
+        [None, keras.initializers.Zeros, keras.initializers.Zeros, keras.initializers.Zeros],
+        [None, keras.initializers.Ones, keras.initializers.Ones, keras.initializers.Ones]]
+
+
+def test_unfold_ties_scale_success(new_instance: ParamsManager):
+    computed_output = new_instance.unfold(build_combinations(LayerStack=[{
+        0: LayerParamsCombs(Units=[1, 4], Ties={'Units': 'width'}),
+        1: LayerParamsCombs(Units=[1], Ties={'Units': 'width'}, UnitsScale=0.1)}]))
+    assert [[layer.Units for layer in params.LayerStack.values()] for params in computed_output] == [[1, 1], [4, 1]]
+
+
+@pytest.mark.parametrize('depth,ties,expected_output', [
+    pytest.param(4, None, 4 ** 4 * 2 ** 4),
+    pytest.param(5, {'Activation': 'all'}, 4 ** 5 * 2),
+    pytest.param(5, {'Units': 'all', 'Activation': 'all'}, 4 * 2),
+    pytest.param(3, {'Units': 'width'}, 4 * 2 ** 3),
+])
+def test_count_ties_success(new_instance: ParamsManager, depth: int, ties: dict, expected_output: int):
+    input_object = build_combinations(LayerStack=[{
+        index: LayerParamsCombs(Units=[2, 4, 8, 16], Activation=[keras.activations.relu, keras.activations.tanh],
+                                Ties=ties, UnitsScale=0.5 ** index) for index in range(depth)}])
+    assert new_instance.count(input_object) == expected_output
+    assert len(new_instance.unfold(input_object)) == expected_output
+
+
+@pytest.mark.parametrize('layer_stack,expected_message', [
+    pytest.param({0: LayerParamsCombs(Units=[4], Ties={'Width': 'all'})}, 'Layer 0 ties an unknown field',
+                 id='unknown field'),
+    pytest.param({0: LayerParamsCombs(Units=[4], Ties={'KernelInitializer': 'init'}),
+                  1: LayerParamsCombs(Units=[4], KernelInitializer=[keras.initializers.Zeros],
+                                      Ties={'KernelInitializer': 'init'})},
+                 'Layer 0 ties field "KernelInitializer" to group "init" before', id='undeclared leader'),
+    pytest.param({0: LayerParamsCombs(Units=[4], Ties={'Units': 'width'}),
+                  1: LayerParamsCombs(Units=[1], Ties={'Units': 'width'}, UnitsScale=0.0)},
+                 'Layer 1 scales its Units by a non-positive factor', id='non-positive scale'),
+])
+def test_unfold_ties_failure(new_instance: ParamsManager, layer_stack: dict, expected_message: str):
+    with pytest.raises(InvalidTieException, match=expected_message):
+        new_instance.unfold(build_combinations(LayerStack=[layer_stack]))
+    with pytest.raises(InvalidTieException, match=expected_message):
+        new_instance.count(build_combinations(LayerStack=[layer_stack]))
+
+
+def get_changes(unfolded_params: list[TrainParams]) -> list[set[str]]:
+    plain_params = [{key: value for key, value in dataclasses.asdict(params).items() if key != 'Hash'}
+                    for params in unfolded_params]
+    return [{key for key in current if current[key] != following[key]}
+            for current, following in zip(plain_params, plain_params[1:])]
+
+
+def build_grid() -> TrainParamsCombs:
+    return build_combinations(DatasetPath=[Path('first.csv'), Path('second.csv')], WindowWidth=[10, 20, 30],
+                              DatasetShuffle=[True, False], FitMaxEpochs=[1, 2, 3],
+                              LayerStack=[{0: LayerParamsCombs(Units=[4, 8], Activation=[keras.activations.relu,
+                                                                                          keras.activations.tanh])},
+                                          {0: LayerParamsCombs(Units=[2]), 1: LayerParamsCombs(Units=[1, 3])}])
+
+
+def test_unfold_gray_success():
+    input_object = build_grid()
+    computed_output = ParamsManager(ordering=ParamsManager.GRAY).unfold(input_object)
+    lexicographic_output = ParamsManager().unfold(input_object)
+    assert sorted(params.Hash for params in computed_output) == sorted(params.Hash for params in lexicographic_output)
+    assert all(len(changes) == 1 for changes in get_changes(computed_output))
+    assert any(len(changes) > 1 for changes in get_changes(lexicographic_output))
+
+
+@pytest.mark.parametrize('ordering,window_changes', [
+    pytest.param(ParamsManager.LEXICOGRAPHIC, 5),
+    pytest.param(ParamsManager.GRAY, 4),
+])
+def test_unfold_priorities_success(ordering: str, window_changes: int):
+    input_object = build_grid()
+    computed_output = ParamsManager(ordering=ordering, priorities=ParamsManager.DATA_PRIORITIES).unfold(input_object)
+    changes = get_changes(computed_output)
+    assert sum('DatasetPath' in field_names for field_names in changes) == 1
+    assert sum('WindowWidth' in field_names for field_names in changes) == window_changes
+    assert sorted(params.Hash for params in computed_output) == sorted(
+        params.Hash for params in ParamsManager().unfold(input_object))
+
+
+@pytest.mark.parametrize('arguments', [
+    pytest.param(dict(ordering='random')),
+    pytest.param(dict(priorities=['DatasetName'])),
+])
+def test_unfold_ordering_failure(arguments: dict):
+    with pytest.raises(InvalidOrderingException):
+        ParamsManager(**arguments).unfold(build_combinations())
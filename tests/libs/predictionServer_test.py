@@ -0,0 +1,183 @@
+import asyncio
+import json
+from pathlib import Path
+
+import keras
+import numpy
+import pytest
+
+from source.libs.predictionServer import (MicroBatcher, PredictionServer, InvalidSampleException,
+                                          InvalidHashException)
+from source.structs.results import ServingStatistics
+
+INPUT_SHAPE = (4, 2)
+HASH_A = 'a' * 32
+HASH_B = 'b' * 32
+
+
+class CountingModel:
+
+    def __init__(self, model: keras.Model):
+        self.model = model
+        self.batch_sizes = []
+
+    @property
+    def input_shape(self) -> tuple:
+        return self.model.input_shape
+
+    def predict_on_batch(self, samples: numpy.ndarray) -> numpy.ndarray:
+        self.batch_sizes.append(len(samples))
+        return self.model.predict_on_batch(samples)
+
+
+def build_model(seed: int = 1) -> keras.Model:
+    keras.utils.set_random_seed(seed)
+    return keras.Sequential([keras.Input(INPUT_SHAPE), keras.layers.Flatten(), keras.layers.Dense(1)])
+
+
+def build_samples(amount: int) -> numpy.ndarray:
+    return numpy.random.default_rng(0).normal(size=(amount, *INPUT_SHAPE)).astype(numpy.float32)
+
+
+def test_instantiation_success():
+    model = build_model()
+    instance = MicroBatcher(model)
+    assert isinstance(instance, MicroBatcher)
+    assert instance.model is model
+    assert instance.statistics() == ServingStatistics(Requests=0, Batches=0, MeanBatchSize=0.0, LatencyP50=0.0,
+                                                      LatencyP99=0.0, Throughput=0.0)
+
+
+def test_predict_success():
+    model = CountingModel(build_model())
+    samples = build_samples(50)
+
+    async def run() -> list[numpy.ndarray]:
+        instance = MicroBatcher(model, max_batch_size=16, max_delay=0.05)
+        predictions = await asyncio.gather(*[instance.predict(sample) for sample in samples])
+        statistics = instance.statistics()
+        await instance.close()
+        assert statistics.Requests == 50
+        assert statistics.Batches == len(model.batch_sizes)
+        assert 0 < statistics.LatencyP50 <= statistics.LatencyP99
+        assert statistics.Throughput > 0
+        return predictions
+
+    computed_output = asyncio.run(run())
+    assert max(model.batch_sizes) == 16
+    assert len(model.batch_sizes) < 50
+    assert sum(model.batch_sizes) == 50
+    numpy.testing.assert_allclose(numpy.array(computed_output), model.model.predict_on_batch(samples), rtol=1e-5)
+
+
+def test_predict_deadline_success():
+    model = CountingModel(build_model())
+
+    async def run():
+        instance = MicroBatcher(model, max_batch_size=16, max_delay=0.01)
+        first_prediction = await instance.predict(build_samples(1)[0])
+        second_prediction = await asyncio.wait_for(instance.predict(build_samples(1)[0]), timeout=5)
+        await instance.close()
+        return first_prediction, second_prediction
+
+    first_output, second_output = asyncio.run(run())
+    assert model.batch_sizes == [1, 1]
+    numpy.testing.assert_array_equal(first_output, second_output)
+
+
+def test_predict_failure():
+    async def run():
+        instance = MicroBatcher(build_model(), max_delay=0.001)
+        with pytest.raises(InvalidSampleException):
+            await instance.predict(numpy.zeros((3, 3)))
+        prediction = await instance.predict(build_samples(1)[0])
+        await instance.close()
+        return prediction
+
+    assert asyncio.run(run()).shape == (1,)
+
+
+def test_predict_batch_failure():
+    keras.utils.set_random_seed(1)
+    model = keras.Sequential([keras.Input((None, 2)), keras.layers.GlobalAveragePooling1D(), keras.layers.Dense(1)])
+
+    async def run():
+        instance = MicroBatcher(model, max_batch_size=4, max_delay=0.05)
+        outcomes = await asyncio.wait_for(asyncio.gather(instance.predict(numpy.zeros((3, 2))),
+                                                         instance.predict(numpy.zeros((4, 2))),
+                                                         return_exceptions=True), timeout=5)
+        prediction = await asyncio.wait_for(instance.predict(numpy.zeros((3, 2))), timeout=5)
+        await instance.close()
+        return outcomes, prediction
+
+    outcomes, prediction = asyncio.run(run())
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+    assert prediction.shape == (1,)
+
+
+def test_server_success(tmp_path: Path):
+    models = {HASH_A: build_model(1), HASH_B: build_model(2)}
+    for hash_value, model in models.items():
+        model.save(tmp_path / f'{hash_value}.keras')
+    samples = build_samples(10)
+
+    async def run() -> list[dict]:
+        server = PredictionServer(models_root=tmp_path, max_delay=0.01)
+        tcp_server = await server.serve(port=0)
+        port = tcp_server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        requests = [{'Hash': HASH_A if index % 2 else HASH_B, 'Window': sample.tolist()}
+                    for index, sample in enumerate(samples)]
+        requests += [{'Hash': 'c' * 32, 'Window': samples[0].tolist()}, {'Statistics': HASH_A}]
+        writer.write(b''.join(json.dumps(request).encode() + b'\n' for request in requests) + b'not json\n')
+        await writer.drain()
+        writer.write_eof()
+        responses = [json.loads(line) async for line in reader]
+        writer.close()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+        assert set(server.statistics()) == {HASH_A, HASH_B}
+        await server.close()
+        return responses
+
+    computed_output = asyncio.run(run())
+    assert len(computed_output) == 13
+    for index, sample in enumerate(samples):
+        expected_output = models[HASH_A if index % 2 else HASH_B].predict_on_batch(sample[numpy.newaxis])[0]
+        numpy.testing.assert_allclose(computed_output[index]['Prediction'], expected_output, rtol=1e-5)
+    assert 'Error' in computed_output[10]
+    assert computed_output[11]['Requests'] == 5
+    assert 'Error' in computed_output[12]
+
+
+def test_server_load_model_success():
+    loaded_hashes = []
+
+    def load_model(hash_value: str) -> keras.Model:
+        loaded_hashes.append(hash_value)
+        return build_model()
+
+    async def run():
+        server = PredictionServer(load_model=load_model)
+        predictions = await asyncio.gather(*[server.predict(HASH_A, sample) for sample in build_samples(8)])
+        await server.close()
+        return predictions
+
+    assert len(asyncio.run(run())) == 8
+    assert loaded_hashes == [HASH_A]
+
+
+@pytest.mark.parametrize('hash_value', ['../outside', 'a' * 31, 'A' * 32, '/tmp/' + 'a' * 27, None])
+def test_server_hash_failure(tmp_path: Path, hash_value):
+    (tmp_path / 'models').mkdir()
+    build_model().save(tmp_path / 'outside.keras')
+
+    async def run():
+        server = PredictionServer(models_root=tmp_path / 'models')
+        with pytest.raises(InvalidHashException):
+            await server.predict(hash_value, build_samples(1)[0])
+        response = await server.handle_request({'Hash': hash_value, 'Window': build_samples(1)[0].tolist()})
+        await server.close()
+        return response
+
+    assert 'InvalidHashException' in asyncio.run(run())['Error']
@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from source.libs.baseTestCase import BaseTestCase
+from source.libs.paramsManager import ParamsManager
+from source.libs.preparationPlanner import PreparationPlanner, PreparationPlan
+from source.structs.customTypes import DateRange
+from source.structs.params import (TrainingParamsCombinations as TrainParamsCombs,
+                                   LayerParamsCombinations as LayerParamsCombs)
+
+
+def build_combinations(**overrides) -> TrainParamsCombs:
+    fields = dict(ColumnToPredict=['Close'],
+                  WindowWidth=[300],
+                  SetTrainingFlag=[True],
+                  UseResidualWrapper=[False],
+                  PrependBatchNormLayer=[True],
+                  FitMaxEpochs=[2],
+                  FitPatience=[50],
+                  CompileLossFunction=[min],
+                  CompileOptimizer=[max],
+                  LayerStack=[{0: LayerParamsCombs(Units=[8])}],
+                  DatasetPath=[Path('dataset.csv')],
+                  DatasetTimeFilter=[DateRange()],
+                  DatasetShuffle=[True],
+                  DatasetBatchSize=[16])
+    fields.update(overrides)
+    return TrainParamsCombs(**fields)
+
+
+@pytest.fixture
+def new_instance() -> PreparationPlanner:
+    return PreparationPlanner()
+
+
+def test_instantiation_success(new_instance: PreparationPlanner):
+    assert isinstance(new_instance, PreparationPlanner)
+
+
+@dataclass
+class PlanMethodTestCase(BaseTestCase):
+    input_object: TrainParamsCombs
+    expected_combinations: int = 0
+    expected_loads: int = 0
+    expected_window_builds: int = 0
+
+
+PlanMethTC = PlanMethodTestCase
+
+
+@pytest.mark.parametrize('test_case', [pytest.param(test_case, id=test_case.id) for test_case in [
+    PlanMethTC(id='one combination only',
+               input_object=build_combinations(),
+               expected_combinations=1, expected_loads=1, expected_window_builds=1),
+    PlanMethTC(id='model-only variations',
+               input_object=build_combinations(FitMaxEpochs=[1, 2, 3],
+                                               LayerStack=[{0: LayerParamsCombs(Units=[4, 8])}]),
+               expected_combinations=6, expected_loads=1, expected_window_builds=1),
+    PlanMethTC(input_object=build_combinations(UseResidualWrapper=[True, False], CompileLossFunction=[min, max]),
+               expected_combinations=4, expected_loads=1, expected_window_builds=1),
+    PlanMethTC(id='window-only variations',
+               input_object=build_combinations(WindowWidth=[10, 20], DatasetBatchSize=[16, 32],
+                                               DatasetShuffle=[True, False]),
+               expected_combinations=8, expected_loads=1, expected_window_builds=8),
+    PlanMethTC(id='load variations',
+               input_object=build_combinations(ColumnToPredict=['Open', 'Close'],
+                                               DatasetTimeFilter=[DateRange(), DateRange(fm=datetime(2025, 1, 1))]),
+               expected_combinations=4, expected_loads=4, expected_window_builds=4),
+    PlanMethTC(id='mixed variations',
+               input_object=build_combinations(ColumnToPredict=['Open', 'Close'], WindowWidth=[10, 20],
+                                               FitPatience=[1, 2, 3]),
+               expected_combinations=12, expected_loads=2, expected_window_builds=4),
+]])
+def test_plan_success(new_instance: PreparationPlanner, test_case: PlanMethodTestCase):
+    unfolded_params = ParamsManager().unfold(test_case.input_object)
+    computed_output = new_instance.plan(unfolded_params)
+    assert isinstance(computed_output, PreparationPlan)
+    assert computed_output.combinations == test_case.expected_combinations
+    assert computed_output.loads == test_case.expected_loads
+    assert computed_output.window_builds == test_case.expected_window_builds == len(computed_output)
+    assert computed_output.saved_loads == test_case.expected_combinations - test_case.expected_loads
+    assert computed_output.saved_window_builds == test_case.expected_combinations - test_case.expected_window_builds
+    assert sorted(member.Hash for group in computed_output for member in group.Members) == \
+           sorted(training_params.Hash for training_params in unfolded_params)
+    for group in computed_output:
+        assert len({(member.ColumnToPredict, member.WindowWidth) for member in group.Members}) == 1
+
+
+def test_plan_empty_success(new_instance: PreparationPlanner):
+    computed_output = new_instance.plan([])
+    assert (computed_output.combinations, computed_output.loads, computed_output.window_builds) == (0, 0, 0)
+
+
+def test_run_success(new_instance: PreparationPlanner):
+    unfolded_params = ParamsManager().unfold(build_combinations(WindowWidth=[10, 20], FitPatience=[1, 2, 3]))
+    prepared_widths = []
+
+    def prepare(training_params, loaded_data):
+        prepared_widths.append(training_params.WindowWidth)
+        return training_params.WindowWidth
+
+    computed_output = list(new_instance.plan(unfolded_params).run(
+        lambda training_params: None, prepare,
+        lambda training_params, prepared_data: (prepared_data, training_params.FitPatience)))
+    assert prepared_widths == [10, 20]
+    assert sorted(result for _, result in computed_output) == [(10, 1), (10, 2), (10, 3), (20, 1), (20, 2), (20, 3)]
+    assert all(training_params.WindowWidth == result[0] for training_params, result in computed_output)
+
+
+def test_run_loads_success(new_instance: PreparationPlanner):
+    unfolded_params = ParamsManager().unfold(build_combinations(WindowWidth=[10, 20], ColumnToPredict=['Open', 'Close'],
+                                                                FitPatience=[1, 2]))
+    plan = new_instance.plan(sorted(unfolded_params, key=lambda training_params: training_params.WindowWidth))
+    assert [group.Members[0].ColumnToPredict for group in plan] == ['Open', 'Close', 'Open', 'Close']
+    loaded_columns = []
+
+    def load(training_params):
+        loaded_columns.append(training_params.ColumnToPredict)
+        return training_params.ColumnToPredict
+
+    computed_output = list(plan.run(load, lambda training_params, loaded_data: (loaded_data,
+                                                                                training_params.WindowWidth),
+                                    lambda training_params, prepared_data: prepared_data))
+    assert loaded_columns == ['Open', 'Close']
+    assert len(loaded_columns) == plan.loads
+    assert [result for _, result in computed_output] == [('Open', 10)] * 2 + [('Open', 20)] * 2 + \
+           [('Close', 10)] * 2 + [('Close', 20)] * 2
+    assert all((training_params.ColumnToPredict, training_params.WindowWidth) == result
+               for training_params, result in computed_output)
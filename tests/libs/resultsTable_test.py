@@ -0,0 +1,125 @@
+import mmap
+from datetime import datetime
+from pathlib import Path
+
+import keras
+import numpy
+import pandas
+import pytest
+
+from source.libs.resultsTable import ResultsTable, MissingColumnException
+from source.structs.customTypes import DateRange
+from source.structs.params import TrainingParams as TrainParams, LayerParams
+
+
+def build_training_params(**overrides) -> TrainParams:
+    fields = dict(Hash='aaa', ColumnToPredict='Close', WindowWidth=5, SetTrainingFlag=False, UseResidualWrapper=True,
+                  PrependBatchNormLayer=True, FitMaxEpochs=2, FitPatience=10,
+                  CompileLossFunction=keras.losses.MeanAbsoluteError, CompileOptimizer=keras.optimizers.Adam,
+                  LayerStack={0: LayerParams(Units=4, Activation=keras.activations.relu)},
+                  DatasetPath=Path('dataset.csv'), DatasetTimeFilter=DateRange(fm=datetime(2025, 1, 1)),
+                  DatasetShuffle=False, DatasetBatchSize=8)
+    fields.update(overrides)
+    return TrainParams(**fields)
+
+
+@pytest.fixture
+def new_instance() -> ResultsTable:
+    instance = ResultsTable()
+    for position in range(12):
+        layer_stack = {index: LayerParams(Units=4 * (index + 1), Activation=keras.activations.relu)
+                       for index in range(1 + position % 2)}
+        optimizer = keras.optimizers.Adam if position % 3 else keras.optimizers.SGD
+        instance.add(build_training_params(Hash=f'h{position:02}', WindowWidth=3 + position % 4,
+                                           CompileOptimizer=optimizer, LayerStack=layer_stack),
+                     {'MeanAbsoluteError': float((position * 7) % 12), 'Epochs': position})
+    return instance
+
+
+def test_instantiation_success():
+    instance = ResultsTable()
+    assert isinstance(instance, ResultsTable)
+    assert len(instance) == 0
+
+
+def test_flatten_success():
+    computed_output = ResultsTable.flatten(build_training_params(LayerStack={2: LayerParams(Units=8),
+                                                                             0: LayerParams(Units=4)}))
+    assert 'Hash' not in computed_output
+    assert computed_output['CompileOptimizer'] == 'keras.src.optimizers.adam.Adam'
+    assert computed_output['DatasetPath'] == 'dataset.csv'
+    assert computed_output['DatasetTimeFilter'] == str(DateRange(fm=datetime(2025, 1, 1)))
+    assert computed_output['LayerStack.Depth'] == 2
+    assert computed_output['LayerStack.0.Units'] == 4
+    assert computed_output['LayerStack.1.Units'] == 8
+    assert computed_output['LayerStack.1.Activation'] is None
+
+
+def test_add_success(new_instance: ResultsTable):
+    assert len(new_instance) == 12
+    assert 'h03' in new_instance
+    assert new_instance.frame.index.name == 'Hash'
+    assert isinstance(new_instance.frame['CompileOptimizer'].dtype, pandas.CategoricalDtype)
+    assert pandas.isna(new_instance.get('h00')['LayerStack.1.Units'])
+    assert new_instance.get('h01')['LayerStack.1.Units'] == 8
+
+    new_instance.add(build_training_params(Hash='h03'), {'MeanAbsoluteError': -1.0, 'Epochs': 0})
+    new_instance.add(build_training_params(Hash='h12'), {'MeanAbsoluteError': 0.5, 'Epochs': 0})
+    assert len(new_instance) == 13
+    assert new_instance.get('h03')['MeanAbsoluteError'] == -1.0
+
+
+def test_top_k_success(new_instance: ResultsTable):
+    assert list(new_instance.top_k('MeanAbsoluteError', 3).index) == ['h00', 'h07', 'h02']
+    assert list(new_instance.top_k('MeanAbsoluteError', 2, ascending=False).index) == ['h05', 'h10']
+
+
+def test_marginals_success(new_instance: ResultsTable):
+    computed_output = new_instance.marginals('LayerStack.Depth', 'Epochs')
+    assert list(computed_output.index) == [1, 2]
+    assert list(computed_output['count']) == [6, 6]
+    assert list(computed_output['mean']) == [5.0, 6.0]
+
+    computed_output = new_instance.marginals(['WindowWidth', 'CompileOptimizer'], 'Epochs', ('count',))
+    assert computed_output['count'].sum() == 12
+    assert computed_output.loc[(3, 'keras.src.optimizers.sgd.SGD'), 'count'] == 1
+
+
+@pytest.mark.parametrize('conditions,expected_output', [
+    pytest.param({'WindowWidth': 3}, ['h00', 'h04', 'h08']),
+    pytest.param({'WindowWidth': [3, 4], 'LayerStack.Depth': 2}, ['h01', 'h05', 'h09']),
+    pytest.param({'CompileOptimizer': keras.optimizers.SGD}, ['h00', 'h03', 'h06', 'h09']),
+    pytest.param({'Epochs': slice(4, 6)}, ['h04', 'h05', 'h06']),
+    pytest.param({'Epochs': slice(None, 1), 'LayerStack.1.Units': 8}, ['h01']),
+    pytest.param({'LayerStack.1.Activation': keras.activations.relu}, ['h01', 'h03', 'h05', 'h07', 'h09', 'h11']),
+])
+def test_query_success(new_instance: ResultsTable, conditions: dict, expected_output: list[str]):
+    assert list(new_instance.query(conditions).index) == expected_output
+
+
+def test_query_failure(new_instance: ResultsTable):
+    with pytest.raises(MissingColumnException):
+        new_instance.query({'Missing': 1})
+    with pytest.raises(MissingColumnException):
+        new_instance.top_k('Missing')
+
+
+def is_memory_mapped(array: numpy.ndarray) -> bool:
+    while array is not None:
+        if isinstance(array, (numpy.memmap, mmap.mmap)):
+            return True
+        array = getattr(array, 'base', None)
+    return False
+
+
+def test_save_load_success(new_instance: ResultsTable, tmp_path: Path):
+    new_instance.save(tmp_path / 'results')
+    new_instance.save(tmp_path / 'results')
+    assert len([path for path in (tmp_path / 'results').iterdir() if path.is_dir()]) == 1
+    computed_output = ResultsTable.load(tmp_path / 'results')
+    pandas.testing.assert_frame_equal(computed_output.frame, new_instance.frame)
+    assert is_memory_mapped(computed_output.frame['MeanAbsoluteError'].to_numpy())
+    assert is_memory_mapped(computed_output.frame['ColumnToPredict'].array.codes)
+    assert list(computed_output.top_k('MeanAbsoluteError', 3).index) == ['h00', 'h07', 'h02']
+    computed_output.add(build_training_params(Hash='h12'), {'MeanAbsoluteError': 0.5, 'Epochs': 0})
+    assert len(computed_output) == 13
@@ -0,0 +1,121 @@
+import gc
+import multiprocessing
+import weakref
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+import numpy
+import pytest
+
+from source.libs.sharedDataset import SharedBlock, SharedDatasetRegistry
+from source.structs.customTypes import DateRange
+from source.structs.dataset import Dataset, SharedDatasetHandle
+from source.structs.params import TrainingParams as TrainParams, LayerParams
+
+CSV_CONTENTS = ('Date,Open,Close\n'
+                '2025-01-01,1.0,10.0\n'
+                '2025-01-02,2.0,20.0\n'
+                '2025-01-03,3.0,30.0\n'
+                '2025-01-04,4.0,40.0\n')
+
+
+@pytest.fixture
+def dataset_path(tmp_path: Path) -> Path:
+    path = tmp_path / 'dataset.csv'
+    path.write_text(CSV_CONTENTS)
+    return path
+
+
+@pytest.fixture
+def new_instance() -> SharedDatasetRegistry:
+    with SharedDatasetRegistry() as registry:
+        yield registry
+
+
+def build_training_params(dataset_path: Path, column_to_predict: str = 'Close') -> TrainParams:
+    return TrainParams(Hash='', ColumnToPredict=column_to_predict, WindowWidth=2, SetTrainingFlag=True,
+                       UseResidualWrapper=False, PrependBatchNormLayer=False, FitMaxEpochs=1, FitPatience=1,
+                       CompileLossFunction=min, CompileOptimizer=max, LayerStack={0: LayerParams(Units=1)},
+                       DatasetPath=dataset_path, DatasetTimeFilter=DateRange(), DatasetShuffle=False,
+                       DatasetBatchSize=1)
+
+
+def summarize(handle: SharedDatasetHandle) -> tuple[float, bool]:
+    with SharedDatasetRegistry.attached(handle) as dataset:
+        return float(dataset.Columns[dataset.ColumnToPredict].sum()), dataset.Columns['Open'].flags.owndata
+
+
+def test_instantiation_success(new_instance: SharedDatasetRegistry):
+    assert isinstance(new_instance, SharedDatasetRegistry)
+
+
+def test_share_success(new_instance: SharedDatasetRegistry):
+    dataset = Dataset(Index=numpy.arange(3).astype('datetime64[ns]'),
+                      Columns={'Close': numpy.array([1.0, 2.0, 3.0], dtype=numpy.float32),
+                               'Empty': numpy.array([], dtype=numpy.float64)},
+                      ColumnToPredict='Close')
+    handle = new_instance.share(dataset)
+    computed_output = SharedDatasetRegistry.attach(handle)
+    assert computed_output.ColumnToPredict == 'Close'
+    assert numpy.array_equal(computed_output.Index, dataset.Index)
+    assert computed_output.Columns['Close'].dtype == numpy.float32
+    assert computed_output.Columns['Close'].tolist() == [1.0, 2.0, 3.0]
+    assert computed_output.Columns['Empty'].shape == (0,)
+    assert not computed_output.Columns['Close'].flags.writeable
+    assert SharedDatasetRegistry.attach(handle) is computed_output
+
+
+def test_publish_success(new_instance: SharedDatasetRegistry, dataset_path: Path):
+    first_handle = new_instance.publish(build_training_params(dataset_path))
+    second_handle = new_instance.publish(build_training_params(dataset_path))
+    other_handle = new_instance.publish(build_training_params(dataset_path, 'Open'))
+    assert first_handle is second_handle
+    assert first_handle is not other_handle
+    assert SharedDatasetRegistry.attach(other_handle).ColumnToPredict == 'Open'
+
+
+def test_publish_workers_success(new_instance: SharedDatasetRegistry, dataset_path: Path):
+    handle = new_instance.publish(build_training_params(dataset_path))
+    with multiprocessing.get_context('spawn').Pool(2) as pool:
+        computed_output = pool.map(summarize, [handle] * 4)
+    assert computed_output == [(100.0, False)] * 4
+
+
+def test_detach_success(new_instance: SharedDatasetRegistry, dataset_path: Path):
+    handle = new_instance.publish(build_training_params(dataset_path))
+    first_output = SharedDatasetRegistry.attach(handle)
+    SharedDatasetRegistry.detach(handle)
+    assert handle.Index.Name not in SharedDatasetRegistry._SharedDatasetRegistry__attached
+    SharedDatasetRegistry.detach(handle)
+
+    with SharedDatasetRegistry.attached(handle) as computed_output:
+        assert computed_output is not first_output
+        assert computed_output.Columns['Close'].tolist() == [10.0, 20.0, 30.0, 40.0]
+        assert handle.Index.Name in SharedDatasetRegistry._SharedDatasetRegistry__attached
+    assert handle.Index.Name not in SharedDatasetRegistry._SharedDatasetRegistry__attached
+
+
+def test_detach_views_success(new_instance: SharedDatasetRegistry, dataset_path: Path):
+    handle = new_instance.publish(build_training_params(dataset_path))
+    with SharedDatasetRegistry.attached(handle) as dataset:
+        computed_output = dataset.Columns['Close'][1:]
+    del dataset
+    gc.collect()
+    assert computed_output.tolist() == [20.0, 30.0, 40.0]
+    assert float(computed_output.sum()) == 90.0
+
+    owner = computed_output
+    while not isinstance(owner, SharedBlock):
+        owner = owner.base
+    block_reference = weakref.ref(owner.block)
+    del owner, computed_output
+    gc.collect()
+    assert block_reference() is None
+
+
+def test_close_success(dataset_path: Path):
+    registry = SharedDatasetRegistry()
+    handle = registry.publish(build_training_params(dataset_path))
+    registry.close()
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=handle.Index.Name)
@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+
+import numpy
+import pytest
+
+from source.libs.baseTestCase import BaseTestCase
+from source.libs.datasetLoader import MissingColumnException
+from source.libs.slidingWindows import SlidingWindows, InvalidWindowWidthException
+from source.structs.dataset import Dataset
+
+
+def build_dataset(rows: int, column_to_predict: str = 'Close') -> Dataset:
+    return Dataset(Index=numpy.arange(rows).astype('datetime64[D]').astype('datetime64[ns]'),
+                   Columns={'Open': numpy.arange(rows, dtype=numpy.float32),
+                            'Close': numpy.arange(rows, dtype=numpy.float32) * 10},
+                   ColumnToPredict=column_to_predict)
+
+
+def materialize(dataset: Dataset, window_width: int) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Builds every sample by copying, as a reference for the strided views.
+    :param dataset: The dataset to window.
+    :param window_width: The amount of rows per window.
+    :return: The features and targets of every sample.
+    """
+    matrix = numpy.stack(list(dataset.Columns.values()), axis=-1)
+    target = dataset.Columns[dataset.ColumnToPredict]
+    samples = max(0, len(target) - window_width)
+    features = numpy.array([matrix[start:start + window_width] for start in range(samples)])
+    targets = numpy.array([[target[start + window_width]] for start in range(samples)])
+    return features.reshape(samples, window_width, matrix.shape[1]), targets.reshape(samples, 1)
+
+
+@dataclass
+class SlidingWindowsTestCase(BaseTestCase):
+    rows: int = 10
+    window_width: int = 3
+    column_to_predict: str = 'Close'
+    expected_output: int = None
+
+
+SWindowsTC = SlidingWindowsTestCase
+
+
+@pytest.mark.parametrize('test_case', [pytest.param(test_case, id=test_case.id) for test_case in [
+    SWindowsTC(id='several samples',
+               rows=10, window_width=3, expected_output=7),
+    SWindowsTC(rows=10, window_width=1, expected_output=9),
+    SWindowsTC(rows=10, window_width=9, expected_output=1),
+    SWindowsTC(rows=400, window_width=300, expected_output=100),
+    SWindowsTC(id='no samples',
+               rows=10, window_width=10, expected_output=0),
+    SWindowsTC(rows=10, window_width=20, expected_output=0),
+    SWindowsTC(rows=0, window_width=3, expected_output=0),
+    SWindowsTC(id='invalid window widths',
+               window_width=0, expected_exception=InvalidWindowWidthException),
+    SWindowsTC(window_width=-1, expected_exception=InvalidWindowWidthException),
+    SWindowsTC(id='missing columns',
+               column_to_predict='aaa', expected_exception=MissingColumnException),
+]])
+def test_instantiation(test_case: SlidingWindowsTestCase):
+    dataset = build_dataset(test_case.rows, test_case.column_to_predict)
+    if test_case.expected_exception is None:
+        computed_output = SlidingWindows(dataset, test_case.window_width)
+        assert len(computed_output) == test_case.expected_output
+        assert computed_output.feature_names == ['Open', 'Close']
+        assert computed_output.target_index == 1
+        expected_features, expected_targets = materialize(dataset, test_case.window_width)
+        computed_features, computed_targets = computed_output.get_batch(slice(None))
+        assert numpy.array_equal(computed_features, expected_features)
+        assert numpy.array_equal(computed_targets, expected_targets)
+    else:
+        with pytest.raises(test_case.expected_exception):
+            SlidingWindows(dataset, test_case.window_width)
+
+
+def test_views_success():
+    dataset = build_dataset(400)
+    instance = SlidingWindows(dataset, 300)
+    for view, values in zip(instance.views, dataset.Columns.values()):
+        assert view.shape == (100, 300)
+        assert numpy.shares_memory(view, values)
+        assert not view.flags.writeable
+
+
+def test_get_batch_success():
+    dataset = build_dataset(20)
+    instance = SlidingWindows(dataset, 4)
+    expected_features, expected_targets = materialize(dataset, 4)
+    indices = numpy.array([7, 0, 15, 3])
+    computed_features, computed_targets = instance.get_batch(indices)
+    assert computed_features.shape == (4, 4, 2)
+    assert computed_features.flags.c_contiguous
+    assert numpy.array_equal(computed_features, expected_features[indices])
+    assert numpy.array_equal(computed_targets, expected_targets[indices])
+    assert not numpy.shares_memory(computed_features, dataset.Columns['Open'])
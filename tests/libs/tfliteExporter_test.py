@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import keras
+import numpy
+import pytest
+
+from source.libs.artifactStore import ArtifactStore
+from source.libs.slidingWindows import SlidingWindows
+from source.libs.tfliteExporter import TFLiteExporter, EmptyEvaluationSetException, UnknownQuantizationException
+from source.libs.trainer import Trainer
+from source.structs.customTypes import DateRange
+from source.structs.params import TrainingParams as TrainParams, LayerParams
+from source.structs.results import ExportReport
+
+
+@pytest.fixture
+def dataset_path(tmp_path: Path) -> Path:
+    path = tmp_path / 'dataset.csv'
+    lines = ['Date,Open,Close'] + [f'{datetime(2025, 1, 1) + timedelta(days=row)},{row % 7}.0,{row % 5}.0'
+                                   for row in range(60)]
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+def build_training_params(dataset_path: Path, **overrides) -> TrainParams:
+    fields = dict(Hash='aaa', ColumnToPredict='Close', WindowWidth=5, SetTrainingFlag=False, UseResidualWrapper=True,
+                  PrependBatchNormLayer=True, FitMaxEpochs=3, FitPatience=10,
+                  CompileLossFunction=keras.losses.MeanAbsoluteError, CompileOptimizer=keras.optimizers.Adam,
+                  LayerStack={0: LayerParams(Units=8, Activation=keras.activations.relu)}, DatasetPath=dataset_path,
+                  DatasetTimeFilter=DateRange(fm=datetime(2025, 1, 11)), DatasetShuffle=False, DatasetBatchSize=8)
+    fields.update(overrides)
+    return TrainParams(**fields)
+
+
+@pytest.fixture
+def artifact_store(tmp_path: Path, dataset_path: Path) -> ArtifactStore:
+    artifact_store = ArtifactStore(tmp_path / 'artifacts')
+    Trainer(seed=1, artifact_store=artifact_store).train(build_training_params(dataset_path))
+    return artifact_store
+
+
+@pytest.fixture
+def new_instance(artifact_store: ArtifactStore) -> TFLiteExporter:
+    return TFLiteExporter(artifact_store, calibration_samples=16, evaluation_samples=20, seed=1)
+
+
+def test_instantiation_success(new_instance: TFLiteExporter):
+    assert isinstance(new_instance, TFLiteExporter)
+
+
+def test_sample_positions_success(new_instance: TFLiteExporter, dataset_path: Path):
+    windows = SlidingWindows(Trainer().dataset_cache.get(build_training_params(dataset_path)), 5)
+    calibration_positions, evaluation_positions = new_instance.sample_positions(windows)
+    assert len(calibration_positions) == 16
+    assert len(evaluation_positions) == 20
+    assert not set(calibration_positions) & set(evaluation_positions)
+    assert list(calibration_positions) == sorted(calibration_positions)
+
+    small_windows = SlidingWindows(Trainer().dataset_cache.get(build_training_params(dataset_path)), 40)
+    calibration_positions, evaluation_positions = new_instance.sample_positions(small_windows)
+    assert len(calibration_positions) == 10
+    assert set(evaluation_positions) == set(calibration_positions)
+
+
+@pytest.mark.parametrize('quantization,max_delta', [
+    pytest.param(TFLiteExporter.NONE, 1e-4),
+    pytest.param(TFLiteExporter.DYNAMIC, 0.5),
+    pytest.param(TFLiteExporter.INT8, 0.5),
+])
+def test_export_success(new_instance: TFLiteExporter, artifact_store: ArtifactStore, dataset_path: Path,
+                        quantization: str, max_delta: float):
+    computed_output = new_instance.export(build_training_params(dataset_path), quantization)
+    assert isinstance(computed_output, ExportReport)
+    assert (computed_output.Hash, computed_output.Quantization) == ('aaa', quantization)
+    export_path = artifact_store.get_model_directory('aaa') / f'model-{quantization}.tflite'
+    assert computed_output.Path == str(export_path)
+    assert export_path.stat().st_size == computed_output.Size
+    assert computed_output.Samples == 20
+    assert computed_output.MaxAbsoluteDelta < max_delta
+    assert computed_output.MeanAbsoluteDelta <= computed_output.MaxAbsoluteDelta
+    assert abs(computed_output.ExportedMeanAbsoluteError - computed_output.KerasMeanAbsoluteError) <= \
+           computed_output.MeanAbsoluteDelta + 1e-6
+
+
+def test_export_size_success(new_instance: TFLiteExporter, dataset_path: Path, tmp_path: Path):
+    training_params = build_training_params(dataset_path, LayerStack={0: LayerParams(Units=256)})
+    Trainer(seed=1, artifact_store=new_instance._TFLiteExporter__artifact_store).train(training_params)
+    sizes = {quantization: new_instance.export(training_params, quantization, tmp_path / f'{quantization}.tflite').Size
+             for quantization in TFLiteExporter.QUANTIZATION_MODES}
+    assert sizes[TFLiteExporter.DYNAMIC] < sizes[TFLiteExporter.NONE]
+    assert sizes[TFLiteExporter.INT8] < sizes[TFLiteExporter.NONE]
+
+
+@pytest.mark.parametrize('time_filter', [
+    pytest.param(DateRange(fm=datetime(2030, 1, 1)), id='no rows'),
+    pytest.param(DateRange(fm=datetime(2025, 2, 27)), id='fewer rows than the window width'),
+])
+def test_export_failure(new_instance: TFLiteExporter, artifact_store: ArtifactStore, dataset_path: Path,
+                        time_filter: DateRange):
+    with pytest.raises(EmptyEvaluationSetException):
+        new_instance.export(build_training_params(dataset_path, DatasetTimeFilter=time_filter))
+    assert not list(artifact_store.get_model_directory('aaa').glob('*.tflite'))
+
+
+def test_convert_failure():
+    model = keras.Sequential([keras.Input((5, 2)), keras.layers.Flatten(), keras.layers.Dense(1)])
+    with pytest.raises(UnknownQuantizationException):
+        TFLiteExporter.convert(model, 'float16')
+
+
+def test_predict_success():
+    model = keras.Sequential([keras.Input((5, 2)), keras.layers.Flatten(), keras.layers.Dense(1)])
+    features = numpy.random.default_rng(0).normal(size=(7, 5, 2)).astype(numpy.float32)
+    computed_output = TFLiteExporter.predict(TFLiteExporter.convert(model), features)
+    numpy.testing.assert_allclose(computed_output, model.predict_on_batch(features), rtol=1e-5, atol=1e-6)
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import keras
+import pytest
+
+from source.libs.batchSequence import BatchSequence
+from source.libs.datasetCache import DatasetCache
+from source.libs.slidingWindows import SlidingWindows
+from source.libs.trainer import Trainer
+from source.structs.customTypes import DateRange
+from source.structs.params import TrainingParams as TrainParams, LayerParams
+from source.structs.results import TrainingResult
+
+
+@pytest.fixture
+def dataset_path(tmp_path: Path) -> Path:
+    path = tmp_path / 'dataset.csv'
+    lines = ['Date,Open,Close'] + [f'{datetime(2025, 1, 1) + timedelta(days=row)},{row % 7}.0,{row % 5}.0'
+                                   for row in range(40)]
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+def build_training_params(dataset_path: Path, **overrides) -> TrainParams:
+    fields = dict(Hash='aaa', ColumnToPredict='Close', WindowWidth=5, SetTrainingFlag=False, UseResidualWrapper=False,
+                  PrependBatchNormLayer=False, FitMaxEpochs=3, FitPatience=10,
+                  CompileLossFunction=keras.losses.MeanAbsoluteError, CompileOptimizer=keras.optimizers.RMSprop,
+                  LayerStack={0: LayerParams(Units=4)}, DatasetPath=dataset_path, DatasetTimeFilter=DateRange(),
+                  DatasetShuffle=True, DatasetBatchSize=8)
+    fields.update(overrides)
+    return TrainParams(**fields)
+
+
+class RecordingBatchSequence(BatchSequence):
+
+    def __init__(self, windows: SlidingWindows, batch_size: int, **kwargs):
+        super().__init__(windows, batch_size, **kwargs)
+        self.indices = []
+
+    def __getitem__(self, index: int):
+        self.indices.append(index)
+        return super().__getitem__(index)
+
+
+@pytest.fixture
+def new_instance() -> Trainer:
+    return Trainer(seed=1)
+
+
+def test_instantiation_success(new_instance: Trainer):
+    assert isinstance(new_instance, Trainer)
+    assert isinstance(new_instance.dataset_cache, DatasetCache)
+
+
+def test_prepare_success(new_instance: Trainer, dataset_path: Path):
+    computed_output = new_instance.prepare(build_training_params(dataset_path))
+    assert isinstance(computed_output, BatchSequence)
+    assert len(computed_output.windows) == 35
+    assert len(computed_output) == 5
+    new_instance.prepare(build_training_params(dataset_path, WindowWidth=3))
+    assert new_instance.dataset_cache.hits == 1
+
+
+def test_train_success(new_instance: Trainer, dataset_path: Path):
+    computed_output = new_instance.train(build_training_params(dataset_path))
+    assert isinstance(computed_output, TrainingResult)
+    assert computed_output.Hash == 'aaa'
+    assert computed_output.Epochs == 3
+    assert len(computed_output.History['loss']) == 3
+
+
+def test_train_early_stopping_success(new_instance: Trainer, dataset_path: Path):
+    training_params = build_training_params(dataset_path, FitMaxEpochs=50, FitPatience=0,
+                                            CompileOptimizer=keras.optimizers.SGD,
+                                            LayerStack={0: LayerParams(Units=1,
+                                                                       KernelInitializer=keras.initializers.Zeros)})
+    computed_output = new_instance.train(training_params)
+    assert computed_output.Epochs < 50
+
+
+def test_train_determinism_success(dataset_path: Path):
+    training_params = build_training_params(dataset_path)
+    first_output = Trainer(seed=3).train(training_params)
+    second_output = Trainer(seed=3).train(training_params)
+    assert first_output.History == second_output.History
+
+
+def test_train_batch_order_success(new_instance: Trainer, dataset_path: Path):
+    training_params = build_training_params(dataset_path, DatasetShuffle=False)
+    windows = new_instance.prepare(training_params).windows
+    data = RecordingBatchSequence(windows, training_params.DatasetBatchSize, workers=1)
+    new_instance.train(training_params, data)
+    epoch_indices = list(range(len(data))) * training_params.FitMaxEpochs
+    assert data.indices[-len(epoch_indices):] == epoch_indices